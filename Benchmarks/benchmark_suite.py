@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Calculator Benchmark Suite
+Throughput, latency percentiles and peak memory per calculator on seeded
+synthetic inputs at realistic scales, with a regression report against a
+previous run.
+
+Benchmarks (full-scale size):
+- ifrs16: calculate_ifrs16() per lease, 10,000 leases
+- eff-rent: BAFCalculator.calculate_all() per deal, 10,000 deals
+- paired-sales: PairedSalesAnalyzer.analyze_all(), 2,000 transactions
+- relative-valuation: run_analysis(), 5,000 properties
+- monte-carlo: simulate_rollover(), 1,000,000 iterations
+
+Usage:
+    python Benchmarks/benchmark_suite.py --output results.json
+    python Benchmarks/benchmark_suite.py --scale 0.05 --only ifrs16 eff-rent
+    python Benchmarks/benchmark_suite.py --output new.json --compare results.json --fail-on-regression
+
+--scale shrinks every size for quick runs (paired sales is quadratic in
+the number of transactions, so the full-scale run takes minutes).
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(REPO_ROOT), str(REPO_ROOT / 'Rollover_Analysis')]
+
+from Shared_Utils.benchmark_utils import (
+    REGRESSION_THRESHOLD, BenchmarkResult, compare_results, format_comparison, format_results,
+    load_results, run_benchmark, save_results
+)
+from Shared_Utils.synthetic_data import generate_ifrs16_leases, generate_rollover_portfolios
+
+
+DEFAULT_SEED = 42
+ANALYSIS_DATE = date(2025, 1, 1)
+
+CONDITIONS = ['poor', 'fair', 'average', 'good', 'excellent']
+CLEAR_HEIGHTS_FT = [20, 24, 28, 32, 36, 40]
+
+
+def _day(rng: np.random.Generator, start: date, days: int) -> str:
+    return (start + timedelta(days=int(rng.integers(0, days)))).isoformat()
+
+
+# ============================================================================
+# SYNTHETIC INPUTS
+# ============================================================================
+
+def generate_baf_deals(n: int, rng: np.random.Generator) -> List[Dict]:
+    """Effective rent input documents (eff_rent_calculator layout), 5-15 year industrial deals"""
+    deals = []
+    for i in range(n):
+        years = int(rng.integers(5, 16))
+        rent = float(rng.uniform(8, 18))
+        deals.append({
+            'deal_name': f'Deal {i}',
+            'property_info': {'unit_number': str(i), 'area_sf': float(rng.integers(5, 200) * 1000),
+                              'property_type': 'industrial'},
+            'tenant_info': {'tenant_name': f'Tenant {i}'},
+            'lease_terms': {'lease_term_months': years * 12, 'operating_costs_psf': round(float(rng.uniform(3, 7)), 2),
+                            'fixturing_term_months': int(rng.integers(0, 4))},
+            'rent_schedule': {'rent_psf_by_year': [round(rent * 1.03 ** year, 2) for year in range(years)],
+                              'months_per_period': [12] * years},
+            'incentives': {'tenant_cash_allowance_psf': round(float(rng.uniform(0, 15)), 2),
+                           'net_free_rent_months': float(rng.integers(0, 6))},
+            'leasing_costs': {'listing_agent_year1_pct': 0.06, 'listing_agent_subsequent_pct': 0.025,
+                              'tenant_rep_year1_pct': 0.06, 'tenant_rep_subsequent_pct': 0.025},
+            'financial_assumptions': {'nominal_discount_rate': round(float(rng.uniform(0.06, 0.12)), 4)}
+        })
+    return deals
+
+
+def generate_paired_sales(n: int, rng: np.random.Generator) -> Dict:
+    """Paired sales input (subject_property, comparable_sales, market_parameters) with n industrial sales"""
+    subject = {
+        'address': '1 Subject Road', 'property_type': 'industrial', 'property_rights': 'fee_simple',
+        'size_sf': 50000, 'lot_size_acres': 5.0, 'clear_height_feet': 28, 'loading_docks_dock_high': 4,
+        'loading_docks_grade_level': 2, 'year_built': 2005, 'condition': 'average',
+        'location_submarket': 'Submarket 0', 'highway_frontage': True, 'zoning': 'M2'
+    }
+    sales = []
+    for i in range(n):
+        size = float(rng.integers(20, 120) * 1000)
+        sales.append({
+            'id': f'COMP_{i}', 'address': f'{i} Industrial Road',
+            'sale_price': float(round(size * rng.uniform(80, 140), -3)),
+            'sale_date': _day(rng, date(2023, 1, 1), 730),
+            'property_rights': 'fee_simple', 'financing': {'type': 'cash'},
+            'conditions_of_sale': {'arms_length': True},
+            'size_sf': size, 'lot_size_acres': round(size / 10000 * rng.uniform(0.8, 1.3), 2),
+            'clear_height_feet': int(rng.choice(CLEAR_HEIGHTS_FT)),
+            'loading_docks_dock_high': int(rng.integers(1, 12)),
+            'loading_docks_grade_level': int(rng.integers(0, 4)),
+            'year_built': int(rng.integers(1975, 2024)), 'condition': str(rng.choice(CONDITIONS)),
+            'location_submarket': f'Submarket {int(rng.integers(0, 4))}',
+            'highway_frontage': bool(rng.random() < 0.3), 'zoning': 'M2'
+        })
+    return {'subject_property': subject, 'comparable_sales': sales,
+            'market_parameters': {'valuation_date': ANALYSIS_DATE.isoformat()}}
+
+
+def generate_relative_valuation(n: int, rng: np.random.Generator) -> Dict:
+    """Relative valuation input (relative_valuation_calculator layout) with n industrial comparables"""
+    def building(address, is_subject=False):
+        return {
+            'address': address, 'unit': '', 'year_built': int(rng.integers(1970, 2025)),
+            'clear_height_ft': float(rng.choice(CLEAR_HEIGHTS_FT)),
+            'pct_office_space': round(float(rng.uniform(0.02, 0.30)), 3),
+            'parking_ratio': round(float(rng.uniform(0.5, 3.0)), 2),
+            'available_sf': float(rng.integers(10, 200) * 1000),
+            'distance_km': 0.0 if is_subject else round(float(rng.uniform(0.5, 40)), 1),
+            'net_asking_rent': round(float(rng.uniform(6, 18)), 2), 'tmi': round(float(rng.uniform(3, 7)), 2),
+            'class': int(rng.integers(1, 4)), 'is_subject': is_subject, 'landlord': f'Landlord {address}',
+            'shipping_doors_tl': int(rng.integers(0, 20)), 'shipping_doors_di': int(rng.integers(0, 4)),
+            'power_amps': int(rng.choice([200, 400, 600, 800, 1200])),
+            'bay_depth_ft': float(rng.choice([40, 50, 54, 56, 60]))
+        }
+
+    return {
+        'analysis_date': ANALYSIS_DATE.isoformat(), 'market': 'Synthetic Industrial Market',
+        'subject_property': building('1 Subject Road', is_subject=True),
+        'comparables': [building(f'{i} Comparable Road') for i in range(n)],
+        'filters': {}, 'weights': {}
+    }
+
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+MONTE_CARLO_LEASES = 25
+
+
+def _ifrs16(size: int, rng: np.random.Generator) -> Dict:
+    from IFRS16_Calculator.ifrs16_calculator import calculate_ifrs16
+    from IFRS16_Calculator.run_ifrs16_analysis import lease_inputs_from_dict
+    cases = [lease_inputs_from_dict(lease) for lease in generate_ifrs16_leases(size, rng)]
+    return {'function': calculate_ifrs16, 'cases': cases, 'repeat': 1}
+
+
+def _eff_rent(size: int, rng: np.random.Generator) -> Dict:
+    from Eff_Rent_Calculator.eff_rent_calculator import BAFCalculator, lease_terms_from_dict
+    cases = [lease_terms_from_dict(deal) for deal in generate_baf_deals(size, rng)]
+    return {'function': lambda terms: BAFCalculator(terms).calculate_all(), 'cases': cases, 'repeat': 1}
+
+
+def _paired_sales(size: int, rng: np.random.Generator) -> Dict:
+    from Comparable_Sales_Analysis.paired_sales_analyzer import PairedSalesAnalyzer
+    data = generate_paired_sales(size, rng)
+
+    def analyze(data):
+        PairedSalesAnalyzer(
+            comparables=data['comparable_sales'], subject=data['subject_property'],
+            property_type='industrial', strict_mode=True,
+            valuation_date=data['market_parameters']['valuation_date']
+        ).analyze_all()
+
+    return {'function': analyze, 'cases': [data], 'items': size, 'repeat': 1, 'warmup': 0}
+
+
+def _relative_valuation(size: int, rng: np.random.Generator) -> Dict:
+    from Relative_Valuation.relative_valuation_calculator import prepare_comparable_data, run_analysis
+    data = prepare_comparable_data(generate_relative_valuation(size, rng))
+    return {'function': run_analysis, 'cases': [data], 'items': size, 'repeat': 5}
+
+
+def _monte_carlo(size: int, rng: np.random.Generator) -> Dict:
+    from rollover_calculator import portfolio_from_dict
+    from rollover_simulation import SimulationSettings, simulate_rollover
+    portfolio = portfolio_from_dict(generate_rollover_portfolios(1, rng, leases_per_portfolio=MONTE_CARLO_LEASES)[0])
+    settings = SimulationSettings(n_simulations=size, seed=int(rng.integers(2**31)))
+    return {'function': lambda portfolio: simulate_rollover(portfolio, settings), 'cases': [portfolio],
+            'items': size, 'repeat': 1, 'warmup': 0}
+
+
+class Benchmark(NamedTuple):
+    setup: Callable[[int, np.random.Generator], Dict]   # (size, rng) -> run_benchmark() keyword arguments
+    full_size: int
+    unit: str
+
+
+BENCHMARKS: Dict[str, Benchmark] = {
+    'ifrs16': Benchmark(_ifrs16, 10_000, 'leases'),
+    'eff-rent': Benchmark(_eff_rent, 10_000, 'deals'),
+    'paired-sales': Benchmark(_paired_sales, 2_000, 'transactions'),
+    'relative-valuation': Benchmark(_relative_valuation, 5_000, 'properties'),
+    'monte-carlo': Benchmark(_monte_carlo, 1_000_000, 'iterations')
+}
+
+
+def run_suite(
+    names: Optional[List[str]] = None,
+    scale: float = 1.0,
+    seed: int = DEFAULT_SEED,
+    memory: bool = True
+) -> List[BenchmarkResult]:
+    """
+    Run the benchmark suite.
+
+    Args:
+        names: Benchmarks to run (default all, in BENCHMARKS order)
+        scale: Multiplier on every full-scale size (at least 2 items each)
+        seed: Seed for the synthetic inputs (each benchmark gets its own stream)
+        memory: Measure peak memory (one extra pass per benchmark)
+
+    Returns:
+        BenchmarkResult per benchmark
+    """
+    names = list(BENCHMARKS) if names is None else names
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmark(s): {', '.join(unknown)}")
+
+    results = []
+    for name in names:
+        benchmark = BENCHMARKS[name]
+        size = max(2, int(round(benchmark.full_size * scale)))
+        rng = np.random.default_rng([seed, list(BENCHMARKS).index(name)])
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            spec = benchmark.setup(size, rng)
+        results.append(run_benchmark(
+            name, memory=memory, parameters={'size': size, 'unit': benchmark.unit, 'scale': scale, 'seed': seed},
+            **spec
+        ))
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line interface; exit code 1 on a regression with --fail-on-regression"""
+    parser = argparse.ArgumentParser(description='Calculator benchmark suite')
+    parser.add_argument('--only', nargs='+', choices=list(BENCHMARKS), help='Benchmarks to run (default all)')
+    parser.add_argument('--scale', type=float, default=1.0, help='Size multiplier (default 1.0 = full scale)')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='Synthetic data seed')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the peak memory pass')
+    parser.add_argument('--output', '-o', help='Save results JSON')
+    parser.add_argument('--compare', help='Baseline results JSON for a regression report')
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                        help='Relative change counted as a regression (default 0.10)')
+    parser.add_argument('--fail-on-regression', action='store_true', help='Exit 1 if any benchmark regressed')
+    args = parser.parse_args(argv)
+
+    results = []
+    for name in args.only or list(BENCHMARKS):
+        print(f"Running {name}...", flush=True)
+        results.extend(run_suite([name], scale=args.scale, seed=args.seed, memory=not args.no_memory))
+    print()
+    print(format_results(results))
+
+    if args.output:
+        current = save_results(results, args.output)
+        print(f"\n✓ Results saved to: {args.output}")
+    else:
+        current = {'benchmarks': {result.name: result.to_dict() for result in results}}
+
+    if args.compare:
+        comparison = compare_results(load_results(args.compare), current, threshold=args.threshold)
+        print(f"\nComparison with {args.compare}:\n")
+        print(format_comparison(comparison))
+        if args.fail_on_regression and (comparison['status'] == 'regression').any():
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
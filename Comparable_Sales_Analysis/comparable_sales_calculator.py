@@ -35,8 +35,11 @@ logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
 # Add Shared_Utils to path (one level up from Comparable_Sales_Analysis to repo root)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 sys.path.insert(0, str(Path(__file__).parent.parent / "Shared_Utils"))
 from financial_utils import pv_annuity, npv, descriptive_statistics
+from Shared_Utils.progress import INFO, WARNING, emit, enabled
+from Shared_Utils.tracing import span, traced
 
 # Import adjustment modules
 from adjustments import (
@@ -129,6 +132,7 @@ class ComparableSalesCalculator:
         self.derived_factors = derived_factors or {}
         self._merge_adjustment_factors()
 
+    @traced('comparable_sales.merge_factors', category='stage')
     def _merge_adjustment_factors(self, verbose: bool = True):
         """
         Merge derived adjustment factors into effective market parameters.
@@ -141,6 +145,10 @@ class ComparableSalesCalculator:
         IMPORTANT: Uses parameter_mapping to translate derived factor names
         to module-compatible parameter names. Without this mapping, derived
         factors would be silently ignored.
+
+        Args:
+            verbose: Emit progress events for applied factors and their
+                validation (shown by the active progress reporter)
         """
         # Industry defaults by property type (CUSPAP: requires disclosure when used)
         property_type = self.subject.get('property_type', 'industrial')
@@ -180,12 +188,13 @@ class ComparableSalesCalculator:
             # Use parameter_mapping to translate derived names -> module names
             mapped_derived = map_derived_factors_to_module_params(
                 self.derived_factors['factors'],
-                log_mappings=verbose
+                log_mappings=verbose and enabled(INFO)
             )
             self.effective_factors.update(mapped_derived)
 
             if verbose:
-                logger.info(f"Applied {len(mapped_derived)} derived factors (name-mapped)")
+                emit('comparable_sales', 'derived_factors', "Applied {count} derived factors (name-mapped)",
+                     count=len(mapped_derived))
 
         # Layer 2: User/appraiser overrides have highest priority
         # These are already in module-compatible naming (direct from config)
@@ -194,18 +203,17 @@ class ComparableSalesCalculator:
                 if value is not None:
                     self.effective_factors[key] = value
             if verbose:
-                logger.info(f"Applied {len(self.market)} user overrides")
+                emit('comparable_sales', 'user_overrides', "Applied {count} user overrides", count=len(self.market))
 
         # Generate factor source report for CUSPAP compliance
         self.factor_sources = {}
         derived_factors_dict = self.derived_factors.get('factors', {}) if self.derived_factors else {}
+        mapped_derived = map_derived_factors_to_module_params(
+            derived_factors_dict, log_mappings=False
+        ) if derived_factors_dict else {}
 
         for key in self.effective_factors:
             # Check if this came from derived factors (mapped)
-            mapped_derived = map_derived_factors_to_module_params(
-                derived_factors_dict, log_mappings=False
-            ) if derived_factors_dict else {}
-
             if key in self.market:
                 self.factor_sources[key] = 'appraiser_input'
             elif key in mapped_derived:
@@ -220,16 +228,15 @@ class ComparableSalesCalculator:
                 self.derived_factors['factors']
             )
             if validation['total_applied'] > 0:
-                logger.info(
-                    f"Factor validation: {validation['total_applied']}/{validation['total_derived']} "
-                    f"derived factors correctly applied"
-                )
+                emit('comparable_sales', 'factor_validation',
+                     "Factor validation: {applied}/{derived} derived factors correctly applied",
+                     applied=validation['total_applied'], derived=validation['total_derived'])
             if validation['using_defaults']:
-                logger.warning(
-                    f"Parameters using defaults instead of derived: "
-                    f"{[d['param'] for d in validation['using_defaults']]}"
-                )
+                emit('comparable_sales', 'factors_using_defaults',
+                     "Parameters using defaults instead of derived: {params}", WARNING,
+                     params=[d['param'] for d in validation['using_defaults']])
 
+    @traced
     def calculate_property_rights_adjustment(self, comparable: Dict, base_price: float) -> Dict:
         """
         Stage 1: Property Rights Adjustment
@@ -288,6 +295,7 @@ class ComparableSalesCalculator:
             'explanation': 'No property rights adjustment required'
         }
 
+    @traced
     def calculate_financing_adjustment(self, comparable: Dict, base_price: float) -> Dict:
         """
         Stage 2: Financing Terms Adjustment
@@ -372,6 +380,7 @@ class ComparableSalesCalculator:
             'explanation': 'No financing adjustment required'
         }
 
+    @traced
     def calculate_conditions_of_sale_adjustment(self, comparable: Dict, base_price: float) -> Dict:
         """
         Stage 3: Conditions of Sale Adjustment
@@ -427,6 +436,7 @@ class ComparableSalesCalculator:
             'explanation': 'No conditions of sale adjustment required'
         }
 
+    @traced
     def calculate_market_conditions_adjustment(self, comparable: Dict, base_price: float) -> Dict:
         """
         Stage 4: Market Conditions/Time Adjustment
@@ -523,6 +533,7 @@ class ComparableSalesCalculator:
                 'explanation': f'Error parsing dates: {str(e)}'
             }
 
+    @traced
     def calculate_location_adjustment(self, comparable: Dict, base_price: float) -> Dict:
         """
         Stage 5: Location Adjustment (NON-LINEAR MODEL)
@@ -751,6 +762,7 @@ class ComparableSalesCalculator:
             'explanation': explanation
         }
 
+    @traced
     def calculate_physical_characteristics_adjustment(self, comparable: Dict, base_price: float) -> Dict:
         """
         Stage 6: Physical Characteristics Adjustment (MODULAR VERSION)
@@ -840,6 +852,7 @@ class ComparableSalesCalculator:
             },
             'explanation': f'{len(adjustments)} physical characteristic adjustments applied across {len(categories)} categories (USPAP & CUSPAP compliant)'
         }
+    @traced('comparable_sales.adjust_comparable')
     def calculate_comparable_adjustments(self, comparable: Dict) -> Dict:
         """Apply all 6 stages of adjustments to a single comparable."""
         address = comparable.get('address', 'Unknown')
@@ -875,9 +888,12 @@ class ComparableSalesCalculator:
         final_adjusted_price = stage6['adjusted_price']
 
         # Validation flags using defined constants
-        gross_exceeds_25pct = gross_adjustment_pct > GROSS_ADJUSTMENT_WARNING_PCT
-        gross_exceeds_40pct = gross_adjustment_pct > GROSS_ADJUSTMENT_REJECT_PCT
-        net_exceeds_15pct = abs(net_adjustment_pct) > NET_ADJUSTMENT_WARNING_PCT
+        with span('comparable_sales.validate'):
+            gross_exceeds_25pct = gross_adjustment_pct > GROSS_ADJUSTMENT_WARNING_PCT
+            gross_exceeds_40pct = gross_adjustment_pct > GROSS_ADJUSTMENT_REJECT_PCT
+            net_exceeds_15pct = abs(net_adjustment_pct) > NET_ADJUSTMENT_WARNING_PCT
+            validation_status = self._get_validation_status(gross_adjustment_pct, gross_exceeds_40pct)
+            validation_recommendation = self._get_validation_recommendation(gross_adjustment_pct, gross_exceeds_40pct)
 
         return {
             'comparable': {
@@ -897,8 +913,8 @@ class ComparableSalesCalculator:
                 'gross_exceeds_25pct': gross_exceeds_25pct,
                 'gross_exceeds_40pct': gross_exceeds_40pct,
                 'net_exceeds_15pct': net_exceeds_15pct,
-                'status': self._get_validation_status(gross_adjustment_pct, gross_exceeds_40pct),
-                'recommendation': self._get_validation_recommendation(gross_adjustment_pct, gross_exceeds_40pct)
+                'status': validation_status,
+                'recommendation': validation_recommendation
             }
         }
 
@@ -990,10 +1006,16 @@ class ComparableSalesCalculator:
         # Calculate adjustments for all comparables
         all_results = []
 
-        for comp in self.comparables:
-            result = self.calculate_comparable_adjustments(comp)
-            all_results.append(result)
+        with span('comparable_sales.adjust', comparables=len(self.comparables)):
+            for comp in self.comparables:
+                result = self.calculate_comparable_adjustments(comp)
+                all_results.append(result)
+
+        return self._reconcile(all_results)
 
+    @traced('comparable_sales.reconcile', category='stage')
+    def _reconcile(self, all_results: List[Dict]) -> Dict:
+        """Statistics, validation-status weighting and value range of the adjusted comparables."""
         # Extract adjusted prices
         adjusted_prices = [r['summary']['final_adjusted_price'] for r in all_results]
 
@@ -1160,7 +1182,8 @@ def main():
     args = parser.parse_args()
 
     # Load input with proper error handling
-    input_data = load_json_file(args.input_file, "Input file")
+    with span('comparable_sales.load', path=args.input_file):
+        input_data = load_json_file(args.input_file, "Input file")
 
     # Load appraiser overrides if provided
     appraiser_overrides = None
@@ -29,12 +29,18 @@ CUSPAP Compliance: 2024 Edition
 import json
 import logging
 import math
+import sys
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any, Callable
 from datetime import datetime, date
 from dataclasses import dataclass, field
 from statistics import mean, stdev, median, StatisticsError
 from enum import Enum
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from Shared_Utils.progress import DEBUG, emit
+from Shared_Utils.tracing import traced
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
@@ -341,12 +347,13 @@ class PairedSalesAnalyzer:
             recommendation=recommendation
         )
         self.disclosures.append(disclosure)
-        self._log(f"  ⚠️ DISCLOSURE ({category.value}): {description}")
+        self._log(f"  ⚠️ DISCLOSURE ({category.value}): {description}", event='disclosure')
 
     # -------------------------------------------------------------------------
     # ARM'S-LENGTH AND FINANCING VERIFICATION (CUSPAP CRITICAL)
     # -------------------------------------------------------------------------
 
+    @traced
     def _verify_and_adjust_transactions(self) -> List[Dict]:
         """
         CUSPAP-compliant transaction verification and adjustment.
@@ -373,7 +380,7 @@ class PairedSalesAnalyzer:
             original_price = comp.get('sale_price', 0)
 
             if not original_price or original_price <= 0:
-                self._log(f"  EXCLUDED: {address} - No valid sale price")
+                self._log(f"  EXCLUDED: {address} - No valid sale price", event='transaction_excluded')
                 excluded_count += 1
                 continue
 
@@ -396,13 +403,13 @@ class PairedSalesAnalyzer:
                     adjusted_price += adjustment
                     adjustments_applied['conditions_of_sale'] = adjustment
                     adjusted_count += 1
-                    self._log(f"  ADJUSTED: {address} - Non-arm's-length, +{motivation_discount}% = ${adjustment:,.0f}")
+                    self._log(f"  ADJUSTED: {address} - Non-arm's-length, +{motivation_discount}% = ${adjustment:,.0f}", event='transaction_adjusted')
                 else:
                     # Cannot quantify - exclude with disclosure
                     excluded = True
                     exclusion_reason = "Non-arm's-length transaction without quantifiable adjustment"
                     excluded_count += 1
-                    self._log(f"  EXCLUDED: {address} - Non-arm's-length, cannot quantify")
+                    self._log(f"  EXCLUDED: {address} - Non-arm's-length, cannot quantify", event='transaction_excluded')
                     self._add_disclosure(
                         DisclosureCategory.DATA_LIMITATION,
                         f"Sale at {address} excluded as non-arm's-length",
@@ -432,7 +439,7 @@ class PairedSalesAnalyzer:
                         adjusted_price += adjustment
                         adjustments_applied['financing'] = adjustment
                         adjusted_count += 1
-                        self._log(f"  ADJUSTED: {address} - Below-market financing, {adjustment:,.0f}")
+                        self._log(f"  ADJUSTED: {address} - Below-market financing, {adjustment:,.0f}", event='transaction_adjusted')
                 elif rate == 0 and market_rate == 0 and financing_type == 'seller_vtb':
                     # VTB without rate info - disclose but don't exclude
                     self._add_disclosure(
@@ -479,6 +486,7 @@ class PairedSalesAnalyzer:
     # MAIN ANALYSIS
     # -------------------------------------------------------------------------
 
+    @traced('paired_sales.analyze_all', category='stage')
     def analyze_all(self) -> DerivedAdjustments:
         """
         Run all paired sales analyses and return derived adjustments.
@@ -544,6 +552,7 @@ class PairedSalesAnalyzer:
 
         return self.derived
 
+    @traced
     def _normalize_prices(self):
         """Add normalized $/SF price to each comparable."""
         self._log("\n--- Price Normalization ---")
@@ -568,9 +577,10 @@ class PairedSalesAnalyzer:
     # UTILITY METHODS
     # -------------------------------------------------------------------------
 
-    def _log(self, message: str):
-        """Add to analysis log."""
+    def _log(self, message: str, event: str = 'log'):
+        """Add to analysis log and emit it as a debug progress event."""
         self.analysis_log.append(message)
+        emit('paired_sales', event, message, DEBUG)
 
     def _parse_date(self, date_val) -> date:
         """Parse date from string or return as-is."""
@@ -688,6 +698,7 @@ class PairedSalesAnalyzer:
 
         return is_valid, normalized_score, similarity_notes
 
+    @traced
     def _find_pairs_differing_in(
         self,
         characteristic: str,
@@ -898,6 +909,7 @@ class PairedSalesAnalyzer:
     # ADJUSTMENT DERIVATION METHODS
     # -------------------------------------------------------------------------
 
+    @traced
     def _derive_time_adjustment(self) -> PairedSalesResult:
         """
         Derive market appreciation rate.
@@ -1009,6 +1021,7 @@ class PairedSalesAnalyzer:
             market_supported=True
         )
 
+    @traced
     def _derive_size_adjustment(self) -> PairedSalesResult:
         """Derive size adjustment (economies of scale) from paired sales."""
         self._log("\n--- Size Adjustment (Economies of Scale) ---")
@@ -1089,6 +1102,7 @@ class PairedSalesAnalyzer:
 
         return result
 
+    @traced
     def _derive_highway_frontage(self) -> PairedSalesResult:
         """Derive highway frontage premium from paired sales."""
         self._log("\n--- Highway Frontage Premium ---")
@@ -1160,6 +1174,7 @@ class PairedSalesAnalyzer:
 
         return result
 
+    @traced
     def _derive_condition_adjustment(self) -> PairedSalesResult:
         """Derive condition adjustment per level from paired sales."""
         self._log("\n--- Condition Adjustment ---")
@@ -1250,6 +1265,7 @@ class PairedSalesAnalyzer:
 
         return result
 
+    @traced
     def _derive_age_depreciation(self) -> PairedSalesResult:
         """Derive age depreciation rate from paired sales."""
         self._log("\n--- Age Depreciation ---")
@@ -1320,6 +1336,7 @@ class PairedSalesAnalyzer:
 
         return result
 
+    @traced
     def _derive_clear_height(self) -> PairedSalesResult:
         """Derive clear height adjustment for industrial properties."""
         self._log("\n--- Clear Height Adjustment ---")
@@ -1389,6 +1406,7 @@ class PairedSalesAnalyzer:
 
         return result
 
+    @traced
     def _derive_loading_dock_value(self) -> PairedSalesResult:
         """Derive loading dock value for industrial properties."""
         self._log("\n--- Loading Dock Value ---")
@@ -1460,6 +1478,7 @@ class PairedSalesAnalyzer:
 
         return result
 
+    @traced
     def _derive_rail_spur_premium(self) -> PairedSalesResult:
         """Derive rail spur premium for industrial properties."""
         self._log("\n--- Rail Spur Premium ---")
@@ -1523,6 +1542,7 @@ class PairedSalesAnalyzer:
 
         return result
 
+    @traced
     def _derive_building_class(self) -> PairedSalesResult:
         """Derive building class adjustment for office properties."""
         self._log("\n--- Building Class Adjustment ---")
@@ -1600,6 +1620,7 @@ class PairedSalesAnalyzer:
 
         return result
 
+    @traced
     def _derive_submarket_differentials(self) -> Dict[str, float]:
         """
         Derive price differentials between submarkets.
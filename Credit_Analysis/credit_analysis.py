@@ -216,6 +216,44 @@ DEFAULT_PROBABILITIES = {
 }
 
 
+# ============================================================================
+# SCORING TABLES
+# ============================================================================
+# Shared by the scalar functions below and batch_credit_analysis
+
+# Ratio points for the first threshold met, best first (none met: 0)
+RATIO_LEVEL_POINTS = [('excellent', 10.0), ('good', 8.0), ('fair', 5.0), ('poor', 3.0)]
+
+# Banded points: (minimum value, points), highest band first (below all bands: 0)
+YEARS_IN_BUSINESS_POINTS = [(10, 10.0), (5, 7.0), (2, 4.0)]
+BUREAU_SCORE_POINTS = [(750, 10.0), (650, 7.0), (550, 4.0)]
+NO_BUREAU_SCORE_POINTS = 5.0
+
+# Rent as % of revenue: (maximum share, points), lowest band first (above all bands: 0)
+RENT_TO_REVENUE_POINTS = [(0.05, 5.0), (0.10, 3.0)]
+
+# Qualitative points: (points by level, default level)
+INDUSTRY_STABILITY_POINTS = ({'stable': 10.0, 'moderate': 6.0, 'volatile': 3.0}, 'moderate')
+PAYMENT_HISTORY_POINTS = ({'excellent': 10.0, 'good': 7.0, 'fair': 4.0, 'poor': 0.0}, 'good')
+USE_CRITICALITY_POINTS = ({'mission-critical': 5.0, 'important': 3.0, 'discretionary': 0.0}, 'important')
+
+# Financial trend points; 'stable' is the placeholder until trends are analyzed
+TREND_POINTS = {'improving': 10.0, 'stable': 6.0, 'deteriorating': 0.0}
+
+# Credit rating bands: (minimum total score, rating), highest first
+CREDIT_RATING_BANDS = [(80, 'A'), (60, 'B'), (40, 'C'), (20, 'D'), (float('-inf'), 'F')]
+
+# Average YoY revenue/income change beyond +/- this is improving/deteriorating
+YOY_TREND_THRESHOLD = 0.05
+# Current ratio / debt-to-equity change (most recent vs oldest) beyond +/- this
+RATIO_TREND_THRESHOLD = 0.1
+
+# Risk assessment by credit rating
+RECOVERY_RATES = {'A': 0.50, 'B': 0.40, 'C': 0.30, 'D': 0.20, 'F': 0.10}
+CUSHION_MONTHS = {'A': 0, 'B': 1, 'C': 1.5, 'D': 2, 'F': 3}       # Months of rent
+RELEASING_MONTHS = {'A': 3, 'B': 6, 'C': 9, 'D': 12, 'F': 15}     # Commission + downtime + TI
+
+
 # ============================================================================
 # SCORING FUNCTIONS
 # ============================================================================
@@ -240,43 +278,23 @@ def score_ratio(ratio_value: Optional[float], ratio_name: str, reverse: bool = F
 
     thresholds = RATIO_THRESHOLDS[ratio_name]
 
-    if reverse:
-        # Lower is better (debt ratios)
-        if ratio_value <= thresholds['excellent']:
-            return 10.0
-        elif ratio_value <= thresholds['good']:
-            return 8.0
-        elif ratio_value <= thresholds['fair']:
-            return 5.0
-        elif ratio_value <= thresholds['poor']:
-            return 3.0
-        else:
-            return 0.0
-    else:
-        # Higher is better (most ratios)
-        # Exception: rent_to_revenue (lower is better)
-        if ratio_name == 'rent_to_revenue':
-            if ratio_value <= thresholds['excellent']:
-                return 10.0
-            elif ratio_value <= thresholds['good']:
-                return 8.0
-            elif ratio_value <= thresholds['fair']:
-                return 5.0
-            elif ratio_value <= thresholds['poor']:
-                return 3.0
-            else:
-                return 0.0
-        else:
-            if ratio_value >= thresholds['excellent']:
-                return 10.0
-            elif ratio_value >= thresholds['good']:
-                return 8.0
-            elif ratio_value >= thresholds['fair']:
-                return 5.0
-            elif ratio_value >= thresholds['poor']:
-                return 3.0
-            else:
-                return 0.0
+    # Lower is better for debt ratios (reverse) and rent_to_revenue
+    lower_is_better = reverse or ratio_name == 'rent_to_revenue'
+    for level, points in RATIO_LEVEL_POINTS:
+        if (ratio_value <= thresholds[level]) if lower_is_better else (ratio_value >= thresholds[level]):
+            return points
+    return 0.0
+
+
+def level_points(value: str, table: Tuple[Dict[str, float], str]) -> float:
+    """Points for a qualitative level from a (points by level, default level) table."""
+    points, default = table
+    return points.get(value, points[default])
+
+
+def assign_credit_rating(total_score: float) -> str:
+    """Map a 0-100 credit score to an A-F rating."""
+    return next(rating for minimum, rating in CREDIT_RATING_BANDS if total_score >= minimum)
 
 
 def calculate_credit_score(
@@ -324,24 +342,18 @@ def calculate_credit_score(
     # ========================================================================
 
     # Years in business (0-10)
-    if inputs.years_in_business >= 10:
-        years_score = 10.0
-    elif inputs.years_in_business >= 5:
-        years_score = 7.0
-    elif inputs.years_in_business >= 2:
-        years_score = 4.0
-    else:
-        years_score = 0.0
+    years_score = next(
+        (points for minimum, points in YEARS_IN_BUSINESS_POINTS if inputs.years_in_business >= minimum), 0.0
+    )
     breakdown['years_in_business'] = years_score
 
     # Industry stability (0-10)
-    industry_map = {'stable': 10.0, 'moderate': 6.0, 'volatile': 3.0}
-    industry_score = industry_map.get(inputs.industry_stability, 6.0)
+    industry_score = level_points(inputs.industry_stability, INDUSTRY_STABILITY_POINTS)
     breakdown['industry_stability'] = industry_score
 
     # Financial trend (0-10) - will be calculated from trend analysis
     # For now, use placeholder
-    trend_score = 6.0  # Will be updated if multi-year data available
+    trend_score = TREND_POINTS['stable']  # Will be updated if multi-year data available
     breakdown['financial_trend'] = trend_score
 
     business_quality = years_score + industry_score + trend_score
@@ -351,22 +363,16 @@ def calculate_credit_score(
     # ========================================================================
 
     # Payment history (0-10)
-    payment_map = {'excellent': 10.0, 'good': 7.0, 'fair': 4.0, 'poor': 0.0}
-    payment_score = payment_map.get(inputs.payment_history, 7.0)
+    payment_score = level_points(inputs.payment_history, PAYMENT_HISTORY_POINTS)
     breakdown['payment_history'] = payment_score
 
     # Credit score (0-10)
     if inputs.credit_score:
-        if inputs.credit_score >= 750:
-            credit_score_points = 10.0
-        elif inputs.credit_score >= 650:
-            credit_score_points = 7.0
-        elif inputs.credit_score >= 550:
-            credit_score_points = 4.0
-        else:
-            credit_score_points = 0.0
+        credit_score_points = next(
+            (points for minimum, points in BUREAU_SCORE_POINTS if inputs.credit_score >= minimum), 0.0
+        )
     else:
-        credit_score_points = 5.0  # Default if not provided
+        credit_score_points = NO_BUREAU_SCORE_POINTS  # Default if not provided
     breakdown['credit_score'] = credit_score_points
 
     credit_history = payment_score + credit_score_points
@@ -377,17 +383,16 @@ def calculate_credit_score(
 
     # Rent as % of revenue (0-5, lower is better)
     rent_revenue = ratios.get('rent_to_revenue', 0)
-    if rent_revenue and rent_revenue <= 0.05:
-        rent_pct_score = 5.0
-    elif rent_revenue and rent_revenue <= 0.10:
-        rent_pct_score = 3.0
+    if rent_revenue:
+        rent_pct_score = next(
+            (points for maximum, points in RENT_TO_REVENUE_POINTS if rent_revenue <= maximum), 0.0
+        )
     else:
         rent_pct_score = 0.0
     breakdown['rent_pct_of_revenue'] = rent_pct_score
 
     # Use criticality (0-5)
-    use_map = {'mission-critical': 5.0, 'important': 3.0, 'discretionary': 0.0}
-    use_score = use_map.get(inputs.use_criticality, 3.0)
+    use_score = level_points(inputs.use_criticality, USE_CRITICALITY_POINTS)
     breakdown['use_criticality'] = use_score
 
     lease_specific = rent_pct_score + use_score
@@ -399,16 +404,7 @@ def calculate_credit_score(
     total_score = financial_strength + business_quality + credit_history + lease_specific
 
     # Assign credit rating
-    if total_score >= 80:
-        rating = 'A'
-    elif total_score >= 60:
-        rating = 'B'
-    elif total_score >= 40:
-        rating = 'C'
-    elif total_score >= 20:
-        rating = 'D'
-    else:
-        rating = 'F'
+    rating = assign_credit_rating(total_score)
 
     return CreditScore(
         financial_strength_score=financial_strength,
@@ -452,8 +448,7 @@ def calculate_risk_assessment(
     # Loss given default (1 - recovery rate)
     # Recovery comes from security + re-leasing
     # Assume 30-50% recovery depending on rating
-    recovery_map = {'A': 0.50, 'B': 0.40, 'C': 0.30, 'D': 0.20, 'F': 0.10}
-    recovery_rate = recovery_map.get(credit_score.credit_rating, 0.30)
+    recovery_rate = RECOVERY_RATES.get(credit_score.credit_rating, 0.30)
     lgd = 1 - recovery_rate
 
     # Expected loss = PD × EAD × LGD
@@ -463,13 +458,11 @@ def calculate_risk_assessment(
     # Target: Cover expected loss + cushion + re-leasing costs
 
     # Cushion: 1-2 months rent based on rating
-    cushion_months = {'A': 0, 'B': 1, 'C': 1.5, 'D': 2, 'F': 3}
-    cushion = cushion_months.get(credit_score.credit_rating, 1) * annual_rent / 12
+    cushion = CUSHION_MONTHS.get(credit_score.credit_rating, 1) * annual_rent / 12
 
     # Re-leasing costs: Commission + downtime + TI
     # Estimate: 6-12 months rent depending on market
-    releasing_months = {'A': 3, 'B': 6, 'C': 9, 'D': 12, 'F': 15}
-    releasing_costs = releasing_months.get(credit_score.credit_rating, 6) * annual_rent / 12
+    releasing_costs = RELEASING_MONTHS.get(credit_score.credit_rating, 6) * annual_rent / 12
 
     # Total recommended security
     recommended_security = expected_loss + cushion + releasing_costs
@@ -656,14 +649,14 @@ def analyze_trends(inputs: CreditInputs) -> TrendAnalysis:
         # Liquidity trend (current ratio)
         if old_ratios.get('current_ratio') and recent_ratios.get('current_ratio'):
             liquidity_change = recent_ratios['current_ratio'] - old_ratios['current_ratio']
-            liquidity_trend = 'improving' if liquidity_change > 0.1 else ('deteriorating' if liquidity_change < -0.1 else 'stable')
+            liquidity_trend = 'improving' if liquidity_change > RATIO_TREND_THRESHOLD else ('deteriorating' if liquidity_change < -RATIO_TREND_THRESHOLD else 'stable')
         else:
             liquidity_trend = 'stable'
 
         # Leverage trend (debt-to-equity, lower is better)
         if old_ratios.get('debt_to_equity') and recent_ratios.get('debt_to_equity'):
             leverage_change = old_ratios['debt_to_equity'] - recent_ratios['debt_to_equity']
-            leverage_trend = 'improving' if leverage_change > 0.1 else ('deteriorating' if leverage_change < -0.1 else 'stable')
+            leverage_trend = 'improving' if leverage_change > RATIO_TREND_THRESHOLD else ('deteriorating' if leverage_change < -RATIO_TREND_THRESHOLD else 'stable')
         else:
             leverage_trend = 'stable'
     else:
@@ -709,9 +702,9 @@ def classify_trend(yoy_changes: List[float]) -> Literal['improving', 'stable', '
 
     avg_change = np.mean(yoy_changes)
 
-    if avg_change > 0.05:  # >5% average growth
+    if avg_change > YOY_TREND_THRESHOLD:  # >5% average growth
         return 'improving'
-    elif avg_change < -0.05:  # >5% average decline
+    elif avg_change < -YOY_TREND_THRESHOLD:  # >5% average decline
         return 'deteriorating'
     else:
         return 'stable'
@@ -836,27 +829,14 @@ def analyze_tenant_credit(inputs: CreditInputs) -> CreditAnalysisResult:
     # Analyze trends
     trend_analysis = analyze_trends(inputs)
 
-    # Update credit score with trend
-    if trend_analysis.overall_trend == 'improving':
-        credit_score.score_breakdown['financial_trend'] = 10.0
-        credit_score.business_quality_score += 4.0  # Adjust from placeholder
-        credit_score.total_score += 4.0
-    elif trend_analysis.overall_trend == 'deteriorating':
-        credit_score.score_breakdown['financial_trend'] = 0.0
-        credit_score.business_quality_score -= 6.0  # Adjust from placeholder
-        credit_score.total_score -= 6.0
+    # Update credit score with trend (adjust from placeholder)
+    trend_adjustment = TREND_POINTS[trend_analysis.overall_trend] - TREND_POINTS['stable']
+    credit_score.score_breakdown['financial_trend'] = TREND_POINTS[trend_analysis.overall_trend]
+    credit_score.business_quality_score += trend_adjustment
+    credit_score.total_score += trend_adjustment
 
     # Re-assign rating after trend adjustment
-    if credit_score.total_score >= 80:
-        credit_score.credit_rating = 'A'
-    elif credit_score.total_score >= 60:
-        credit_score.credit_rating = 'B'
-    elif credit_score.total_score >= 40:
-        credit_score.credit_rating = 'C'
-    elif credit_score.total_score >= 20:
-        credit_score.credit_rating = 'D'
-    else:
-        credit_score.credit_rating = 'F'
+    credit_score.credit_rating = assign_credit_rating(credit_score.total_score)
 
     # Identify red flags
     red_flags = identify_red_flags(ratios, credit_score, trend_analysis, inputs)
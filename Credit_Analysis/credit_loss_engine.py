@@ -0,0 +1,319 @@
+"""
+Credit Loss Engine
+
+Links tenant credit ratings to Default_Calculator damages to produce a
+term structure of default risk and expected loss for a whole lease
+portfolio in one pass.
+
+For each tenant:
+- The 5-year cumulative PD for its rating (DEFAULT_PROBABILITIES) is
+  converted to a constant monthly hazard, giving a monthly marginal PD
+  curve over the remaining lease term
+- Net landlord damages if default occurs in month m are computed exactly
+  as calculate_default_damages() would with (remaining_months - m + 1)
+  months left: accelerated rent NPV + re-leasing costs + downtime rent,
+  less security deposit and mitigation credit (floored at zero)
+- Expected loss = sum over months of marginal PD x damages, discounted
+  back to the analysis date
+
+Every step is an array operation over a (tenant x month) grid; the
+*_array helpers below are vectorized forms of calculate_accelerated_rent_npv(),
+calculate_re_leasing_costs() and calculate_mitigation_credit().
+
+Inputs (one row per lease, LeaseTerms column names):
+    tenant_id, current_monthly_rent, additional_rent_annual, rentable_area_sf,
+    remaining_months, security_deposit, market_rent_sf, ti_allowance_sf,
+    leasing_commission_pct, legal_fees, downtime_months, discount_rate_annual
+plus one credit column: pd_5yr, credit_rating or total_score
+(or pass BatchCreditResult.summary as `credit`).
+
+Author: Claude Code
+Created: 2026-10-18
+"""
+
+from dataclasses import MISSING, dataclass, fields
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from Credit_Analysis.credit_analysis import DEFAULT_PROBABILITIES
+from Credit_Analysis.batch_credit_analysis import assign_ratings
+from Default_Calculator.default_calculator import LeaseTerms
+
+
+# Horizon of DEFAULT_PROBABILITIES (5-year cumulative)
+PD_HORIZON_MONTHS = 60
+
+# PD used by calculate_risk_assessment() for unknown ratings
+UNRATED_PD = 0.30
+
+LEASE_COLUMNS = [
+    'current_monthly_rent', 'additional_rent_annual', 'rentable_area_sf',
+    'remaining_months', 'security_deposit', 'market_rent_sf', 'ti_allowance_sf',
+    'leasing_commission_pct', 'legal_fees', 'downtime_months', 'discount_rate_annual'
+]
+
+# LeaseTerms defaults for optional columns
+LEASE_DEFAULTS = {
+    f.name: f.default for f in fields(LeaseTerms)
+    if f.name in LEASE_COLUMNS and f.default is not MISSING
+}
+
+
+@dataclass
+class PortfolioLossResult:
+    """
+    Portfolio expected-loss results.
+
+    summary is indexed by tenant_id; the monthly arrays are
+    (n_tenants x horizon) in summary row order, zero past each lease's
+    remaining term.
+    """
+    summary: pd.DataFrame
+    marginal_pd: np.ndarray          # P(default in month m)
+    loss_at_default: np.ndarray      # Net damages if default in month m (at default date)
+    expected_loss_by_month: np.ndarray  # marginal_pd x PV of loss_at_default
+
+    @property
+    def total_expected_loss(self) -> float:
+        """Portfolio expected loss (PV at analysis date)"""
+        return float(self.summary['expected_loss'].sum())
+
+
+# ============================================================================
+# PD CURVES
+# ============================================================================
+
+def monthly_hazard(pd_cumulative: np.ndarray, horizon_months: int = PD_HORIZON_MONTHS) -> np.ndarray:
+    """
+    Constant monthly default hazard reproducing a cumulative PD over a horizon.
+
+    h = 1 - (1 - PD)^(1 / horizon)
+    """
+    pd_cumulative = np.clip(np.asarray(pd_cumulative, dtype=float), 0.0, 1.0)
+    return 1.0 - (1.0 - pd_cumulative) ** (1.0 / horizon_months)
+
+
+def marginal_pd_curves(hazard: np.ndarray, horizon_months: int) -> np.ndarray:
+    """
+    Monthly marginal default probabilities (n_tenants x horizon_months).
+
+    Column m-1 holds P(survive months 1..m-1) x h, so each row sums to the
+    cumulative PD over the horizon.
+    """
+    hazard = np.asarray(hazard, dtype=float)[:, None]
+    months = np.arange(horizon_months)[None, :]
+    return (1.0 - hazard) ** months * hazard
+
+
+def ratings_to_pd(ratings: Iterable[str]) -> np.ndarray:
+    """5-year cumulative PD for each rating (unknown ratings use UNRATED_PD)."""
+    return np.array([DEFAULT_PROBABILITIES.get(r, UNRATED_PD) for r in ratings], dtype=float)
+
+
+# ============================================================================
+# VECTORIZED DAMAGE FORMULAS
+# ============================================================================
+
+def _monthly_rate(discount_rate_annual: np.ndarray) -> np.ndarray:
+    return (1 + np.asarray(discount_rate_annual, dtype=float)) ** (1 / 12) - 1
+
+
+def _annuity_factor(monthly_rate: np.ndarray, months: np.ndarray) -> np.ndarray:
+    """PV of 1 per month in arrears for `months` months (broadcasting)."""
+    months = np.maximum(months, 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        factor = (1 - (1 + monthly_rate) ** -months) / monthly_rate
+    return np.where(monthly_rate == 0, months, factor)
+
+
+def accelerated_rent_npv_array(
+    monthly_rent: np.ndarray,
+    additional_rent_monthly: np.ndarray,
+    remaining_months: np.ndarray,
+    discount_rate_annual: np.ndarray
+) -> np.ndarray:
+    """Vectorized calculate_accelerated_rent_npv() (broadcasting arrays)."""
+    monthly_rate = _monthly_rate(discount_rate_annual)
+    remaining_months = np.asarray(remaining_months)
+    npv = (np.asarray(monthly_rent) + additional_rent_monthly) * _annuity_factor(monthly_rate, remaining_months)
+    return np.where(remaining_months <= 0, 0.0, npv)
+
+
+def re_leasing_costs_array(
+    rentable_area_sf: np.ndarray,
+    ti_allowance_sf: np.ndarray,
+    market_rent_annual: np.ndarray,
+    lease_term_years: np.ndarray,
+    leasing_commission_pct: np.ndarray,
+    legal_fees: np.ndarray
+) -> np.ndarray:
+    """Vectorized calculate_re_leasing_costs() total."""
+    ti_costs = np.asarray(rentable_area_sf) * ti_allowance_sf
+    commissions = np.asarray(market_rent_annual) * lease_term_years * leasing_commission_pct
+    return ti_costs + commissions + legal_fees
+
+
+def mitigation_credit_array(
+    market_rent_monthly: np.ndarray,
+    remaining_months: np.ndarray,
+    downtime_months: np.ndarray,
+    discount_rate_annual: np.ndarray
+) -> np.ndarray:
+    """Vectorized calculate_mitigation_credit()."""
+    monthly_rate = _monthly_rate(discount_rate_annual)
+    overlap_months = np.asarray(remaining_months) - downtime_months
+    pv_rent = np.asarray(market_rent_monthly) * _annuity_factor(monthly_rate, overlap_months)
+    credit = pv_rent * (1 + monthly_rate) ** -np.asarray(downtime_months, dtype=float)
+    return np.where(overlap_months <= 0, 0.0, credit)
+
+
+# ============================================================================
+# PORTFOLIO ENGINE
+# ============================================================================
+
+def leases_to_frame(leases: Iterable[LeaseTerms], credit_ratings: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """
+    Build an engine input frame from LeaseTerms (tenant_id = tenant_name).
+
+    Args:
+        leases: Lease terms
+        credit_ratings: Optional A-F rating per lease
+    """
+    leases = list(leases)
+    frame = pd.DataFrame(
+        [{col: getattr(lease, col) for col in LEASE_COLUMNS} for lease in leases],
+        columns=LEASE_COLUMNS
+    )
+    frame.insert(0, 'tenant_id', [lease.tenant_name for lease in leases])
+    if credit_ratings is not None:
+        frame['credit_rating'] = list(credit_ratings)
+    return frame
+
+
+def _prepare_leases(leases: pd.DataFrame, credit: Optional[pd.DataFrame]) -> pd.DataFrame:
+    """Index by tenant_id, fill LeaseTerms defaults and resolve pd_5yr / credit_rating."""
+    if 'tenant_id' in leases.columns:
+        leases = leases.set_index('tenant_id')
+    leases = leases.copy()
+
+    required = ['current_monthly_rent', 'rentable_area_sf', 'remaining_months']
+    missing = [col for col in required if col not in leases.columns]
+    if missing:
+        raise ValueError(f"Lease frame missing required columns: {missing}")
+
+    for col, default in LEASE_DEFAULTS.items():
+        if col not in leases.columns:
+            leases[col] = default
+        else:
+            leases[col] = leases[col].fillna(default)
+
+    if credit is not None:
+        credit = credit.set_index('tenant_id') if 'tenant_id' in credit.columns else credit
+        unmatched = leases.index.difference(credit.index)
+        if len(unmatched) > 0:
+            raise ValueError(f"No credit results for tenants: {list(unmatched)}")
+        leases['credit_rating'] = credit.loc[leases.index, 'credit_rating'].to_numpy()
+
+    if 'pd_5yr' not in leases.columns:
+        if 'credit_rating' not in leases.columns:
+            if 'total_score' not in leases.columns:
+                raise ValueError("Provide pd_5yr, credit_rating or total_score for each lease")
+            leases['credit_rating'] = assign_ratings(leases['total_score'].to_numpy())
+        leases['pd_5yr'] = ratings_to_pd(leases['credit_rating'])
+
+    if (leases['remaining_months'] < 0).any():
+        raise ValueError("remaining_months must be non-negative")
+    return leases
+
+
+def analyze_portfolio_losses(
+    leases: pd.DataFrame,
+    credit: Optional[pd.DataFrame] = None
+) -> PortfolioLossResult:
+    """
+    Expected loss and loss-given-default per tenant for a lease portfolio.
+
+    Args:
+        leases: One row per lease (tenant_id index or column, LeaseTerms columns)
+        credit: Optional frame with credit_rating by tenant_id
+                (e.g. BatchCreditResult.summary)
+
+    Returns:
+        PortfolioLossResult; summary columns:
+            credit_rating, pd_5yr, monthly_hazard, lifetime_pd,
+            exposure_at_default, loss_given_default, lgd_pct, expected_loss
+
+        exposure_at_default and loss_given_default are the expected
+        accelerated rent claim and net damages conditional on default
+        during the remaining term, in PV at the analysis date.
+
+    Raises:
+        ValueError: If required columns or credit information are missing
+    """
+    leases = _prepare_leases(leases, credit)
+
+    def col(name: str) -> np.ndarray:
+        return leases[name].to_numpy(dtype=float)[:, None]
+
+    remaining = leases['remaining_months'].to_numpy(dtype=int)
+    horizon = int(remaining.max()) if len(remaining) else 0
+
+    # Default in month m (1-based): rent paid through m-1, damages assessed at m-1
+    month = np.arange(1, horizon + 1)[None, :]
+    active = month <= remaining[:, None]
+    months_left = np.where(active, remaining[:, None] - month + 1, 0)
+
+    monthly_rent = col('current_monthly_rent')
+    rate = col('discount_rate_annual')
+    market_rent_annual = col('market_rent_sf') * col('rentable_area_sf')
+
+    accelerated = accelerated_rent_npv_array(
+        monthly_rent, col('additional_rent_annual') / 12, months_left, rate
+    )
+    re_leasing = re_leasing_costs_array(
+        col('rentable_area_sf'), col('ti_allowance_sf'), market_rent_annual,
+        np.minimum(5, months_left / 12), col('leasing_commission_pct'), col('legal_fees')
+    )
+    mitigation = mitigation_credit_array(
+        market_rent_annual / 12, months_left, col('downtime_months'), rate
+    )
+    net_damages = (
+        accelerated + re_leasing + monthly_rent * col('downtime_months')
+        - col('security_deposit') - mitigation
+    )
+    loss_at_default = np.where(active, np.maximum(net_damages, 0.0), 0.0)
+
+    hazard = monthly_hazard(leases['pd_5yr'].to_numpy(dtype=float))
+    marginal_pd = np.where(active, marginal_pd_curves(hazard, horizon), 0.0)
+    discount = (1 + _monthly_rate(rate)) ** -(month - 1.0)
+
+    weighted_pd = marginal_pd * discount
+    expected_loss_by_month = weighted_pd * loss_at_default
+    expected_loss = expected_loss_by_month.sum(axis=1)
+    expected_exposure = (weighted_pd * np.where(active, accelerated, 0.0)).sum(axis=1)
+    lifetime_pd = marginal_pd.sum(axis=1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        loss_given_default = np.where(lifetime_pd > 0, expected_loss / lifetime_pd, 0.0)
+        exposure_at_default = np.where(lifetime_pd > 0, expected_exposure / lifetime_pd, 0.0)
+        lgd_pct = np.where(exposure_at_default > 0, loss_given_default / exposure_at_default, 0.0)
+
+    summary = pd.DataFrame({
+        'credit_rating': leases['credit_rating'] if 'credit_rating' in leases.columns else None,
+        'pd_5yr': leases['pd_5yr'],
+        'monthly_hazard': hazard,
+        'lifetime_pd': lifetime_pd,
+        'exposure_at_default': exposure_at_default,
+        'loss_given_default': loss_given_default,
+        'lgd_pct': lgd_pct,
+        'expected_loss': expected_loss,
+    }, index=leases.index)
+
+    return PortfolioLossResult(
+        summary=summary,
+        marginal_pd=marginal_pd,
+        loss_at_default=loss_at_default,
+        expected_loss_by_month=expected_loss_by_month
+    )
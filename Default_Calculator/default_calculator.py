@@ -21,6 +21,10 @@ from datetime import date, datetime
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 
+# Add repo root to path for Shared_Utils
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from Shared_Utils.discount_curve import discount_curve
+
 
 # ============================================================================
 # DATA STRUCTURES
@@ -236,16 +240,12 @@ def calculate_accelerated_rent_npv(
     if remaining_months <= 0:
         return 0.0
 
-    monthly_rate = (1 + discount_rate_annual) ** (1/12) - 1
     total_monthly_rent = monthly_rent + additional_rent_monthly
 
-    # NPV of annuity formula
-    if monthly_rate == 0:
-        npv = total_monthly_rent * remaining_months
-    else:
-        npv = total_monthly_rent * (1 - (1 + monthly_rate) ** -remaining_months) / monthly_rate
-
-    return npv
+    # NPV of annuity: (1 - (1 + r)^-n) / r from the shared discount curve,
+    # r = (1 + annual)^(1/12) - 1
+    curve = discount_curve(discount_rate_annual, 'annual_effective')
+    return total_monthly_rent * curve.annuity(remaining_months)
 
 
 def calculate_re_leasing_costs(
@@ -317,17 +317,9 @@ def calculate_mitigation_credit(
     if overlap_months <= 0:
         return 0.0
 
-    monthly_rate = (1 + discount_rate_annual) ** (1/12) - 1
-
     # PV of rent starting after downtime period
-    discount_factor = (1 + monthly_rate) ** -downtime_months
-
-    if monthly_rate == 0:
-        pv_rent = market_rent_monthly * overlap_months
-    else:
-        pv_rent = market_rent_monthly * (1 - (1 + monthly_rate) ** -overlap_months) / monthly_rate
-
-    return pv_rent * discount_factor
+    curve = discount_curve(discount_rate_annual, 'annual_effective')
+    return curve.pv(market_rent_monthly, overlap_months, downtime_months)
 
 
 def calculate_bankruptcy_claims(
@@ -518,6 +510,11 @@ def load_default_scenario_from_json(json_path: str) -> tuple[LeaseTerms, Default
     with open(json_path, 'r') as f:
         data = json.load(f)
 
+    return default_scenario_from_dict(data)
+
+
+def default_scenario_from_dict(data: Dict[str, Any]) -> tuple[LeaseTerms, DefaultEvent]:
+    """Build lease terms and default event from a parsed JSON input document"""
     # Parse lease terms
     lease_data = data["lease_terms"]
     lease = LeaseTerms(
@@ -557,16 +554,9 @@ def load_default_scenario_from_json(json_path: str) -> tuple[LeaseTerms, Default
     return lease, default
 
 
-def save_results_to_json(results: DefaultAnalysisResults, output_path: str):
-    """Save analysis results to JSON file"""
-
-    def date_to_str(obj):
-        """Convert date objects to ISO strings for JSON serialization"""
-        if isinstance(obj, date):
-            return obj.isoformat()
-        return obj
-
-    output = {
+def results_to_dict(results: DefaultAnalysisResults) -> Dict[str, Any]:
+    """Analysis results in the JSON output layout"""
+    return {
         "analysis_date": results.analysis_date.isoformat(),
         "lease_terms": {
             "property_address": results.lease_terms.property_address,
@@ -620,8 +610,11 @@ def save_results_to_json(results: DefaultAnalysisResults, output_path: str):
         "analysis_notes": results.analysis_notes
     }
 
+
+def save_results_to_json(results: DefaultAnalysisResults, output_path: str):
+    """Save analysis results to JSON file"""
     with open(output_path, 'w') as f:
-        json.dump(output, f, indent=2)
+        json.dump(results_to_dict(results), f, indent=2)
 
 
 # ============================================================================
@@ -0,0 +1,253 @@
+"""
+Test suite for the batch (columnar) tenant credit analysis path.
+
+Tests include:
+- Vectorized ratio scoring vs score_ratio()
+- Columnar financial ratios vs calculate_financial_ratios()
+- Batch results vs analyze_tenant_credit() across a randomized tenant book
+- Frame round-trip and validation
+- Parallel report rendering
+
+Run with: pytest test_batch_credit_analysis.py -v
+"""
+
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from Shared_Utils.financial_utils import (
+    calculate_financial_ratios,
+    calculate_financial_ratios_frame
+)
+from Credit_Analysis.credit_analysis import (
+    FinancialData,
+    CreditInputs,
+    RATIO_THRESHOLDS,
+    score_ratio,
+    analyze_tenant_credit
+)
+from Credit_Analysis.batch_credit_analysis import (
+    score_ratio_array,
+    inputs_to_frames,
+    frames_to_inputs,
+    analyze_credit_batch,
+    render_credit_reports
+)
+
+
+def _random_book(n_tenants: int, seed: int = 7, zero_prob: float = 0.15):
+    """Randomized tenants including zero denominators and negative equity."""
+    rng = random.Random(seed)
+
+    def amount(low=-1e5, high=5e6):
+        return 0.0 if rng.random() < zero_prob else rng.uniform(low, high)
+
+    book = []
+    for t in range(n_tenants):
+        years = rng.randint(1, 4)
+        financial_data = [
+            FinancialData(
+                year=2024 - i,
+                current_assets=abs(amount()),
+                total_assets=abs(amount()),
+                inventory=abs(amount()),
+                cash_and_equivalents=abs(amount()),
+                current_liabilities=abs(amount()),
+                total_liabilities=abs(amount()),
+                shareholders_equity=amount(),
+                revenue=amount(),
+                gross_profit=amount(),
+                ebit=amount(),
+                ebitda=amount(),
+                net_income=amount(),
+                interest_expense=abs(amount()),
+                annual_rent=rng.uniform(1e4, 5e5)
+            )
+            for i in range(years)
+        ]
+        book.append(CreditInputs(
+            financial_data=financial_data,
+            tenant_name=f"Tenant {t}",
+            years_in_business=rng.randint(0, 15),
+            credit_score=rng.choice([None, 500, 600, 700, 800]),
+            payment_history=rng.choice(['excellent', 'good', 'fair', 'poor']),
+            lease_term_years=rng.randint(1, 10),
+            use_criticality=rng.choice(['mission-critical', 'important', 'discretionary']),
+            industry_stability=rng.choice(['stable', 'moderate', 'volatile']),
+            current_security=rng.uniform(0, 5e5)
+        ))
+    return book
+
+
+# ============================================================================
+# VECTORIZED BUILDING BLOCKS
+# ============================================================================
+
+class TestVectorizedScoring:
+    """Test score_ratio_array against score_ratio."""
+
+    @pytest.mark.parametrize('ratio_name', list(RATIO_THRESHOLDS) + ['unknown_ratio'])
+    @pytest.mark.parametrize('reverse', [False, True])
+    def test_matches_scalar(self, ratio_name, reverse):
+        values = [None, -1.0, 0.0, 0.01, 0.05, 0.1, 0.3, 0.5, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0]
+        array = np.array([np.nan if v is None else v for v in values])
+
+        vectorized = score_ratio_array(array, ratio_name, reverse=reverse)
+        expected = [score_ratio(v, ratio_name, reverse=reverse) for v in values]
+
+        assert list(vectorized) == expected
+
+
+class TestFinancialRatiosFrame:
+    """Test calculate_financial_ratios_frame against calculate_financial_ratios."""
+
+    def test_matches_scalar(self):
+        frame = pd.DataFrame([
+            {'current_assets': 150000, 'current_liabilities': 100000, 'total_assets': 500000,
+             'total_liabilities': 300000, 'shareholders_equity': 200000, 'revenue': 1000000,
+             'net_income': 50000, 'ebit': 80000, 'ebitda': 100000, 'interest_expense': 10000,
+             'annual_rent': 60000},
+            {'current_assets': 1000, 'current_liabilities': 0, 'revenue': 0, 'annual_rent': 0},
+        ]).fillna(0.0)
+
+        ratios = calculate_financial_ratios_frame(frame)
+
+        for i, row in enumerate(frame.to_dict('records')):
+            expected = calculate_financial_ratios(row)
+            for name, value in expected.items():
+                if value is None:
+                    assert np.isnan(ratios.loc[i, name])
+                else:
+                    assert ratios.loc[i, name] == pytest.approx(value)
+
+    def test_missing_columns_treated_as_zero(self):
+        ratios = calculate_financial_ratios_frame(pd.DataFrame({'current_assets': [10.0]}))
+        assert np.isnan(ratios.loc[0, 'current_ratio'])
+        assert ratios.loc[0, 'working_capital'] == 10.0
+
+
+# ============================================================================
+# BATCH VS SINGLE-TENANT EQUIVALENCE
+# ============================================================================
+
+@pytest.fixture(scope='module')
+def book():
+    return _random_book(150)
+
+
+@pytest.fixture(scope='module')
+def batch(book):
+    financials, tenants = inputs_to_frames(book)
+    return analyze_credit_batch(financials, tenants)
+
+
+class TestBatchMatchesSingleTenant:
+    """Batch results must equal analyze_tenant_credit() for every tenant."""
+
+    def test_scores_and_ratings(self, book, batch):
+        for tenant_id, inputs in enumerate(book):
+            expected = analyze_tenant_credit(inputs)
+            row = batch.summary.loc[tenant_id]
+
+            assert row['total_score'] == pytest.approx(expected.credit_score.total_score)
+            assert row['financial_strength_score'] == pytest.approx(expected.credit_score.financial_strength_score)
+            assert row['business_quality_score'] == pytest.approx(expected.credit_score.business_quality_score)
+            assert row['credit_history_score'] == pytest.approx(expected.credit_score.credit_history_score)
+            assert row['lease_specific_score'] == pytest.approx(expected.credit_score.lease_specific_score)
+            assert row['credit_rating'] == expected.credit_score.credit_rating
+            assert row['approval_recommendation'] == expected.approval_recommendation
+
+    def test_risk_metrics(self, book, batch):
+        for tenant_id, inputs in enumerate(book):
+            risk = analyze_tenant_credit(inputs).risk_assessment
+            row = batch.summary.loc[tenant_id]
+
+            assert row['probability_of_default'] == pytest.approx(risk.probability_of_default)
+            assert row['expected_loss'] == pytest.approx(risk.expected_loss)
+            assert row['recommended_security'] == pytest.approx(risk.recommended_security)
+            assert row['security_coverage_ratio'] == pytest.approx(risk.security_coverage_ratio)
+
+    def test_trends_and_yoy(self, book, batch):
+        for tenant_id, inputs in enumerate(book):
+            trend = analyze_tenant_credit(inputs).trend_analysis
+            row = batch.trends.loc[tenant_id]
+            yoy = batch.yoy[batch.yoy['tenant_id'] == tenant_id]
+
+            assert row['overall_trend'] == trend.overall_trend
+            assert row['revenue_trend'] == trend.revenue_trend
+            assert row['liquidity_trend'] == trend.liquidity_trend
+            assert row['leverage_trend'] == trend.leverage_trend
+            assert list(yoy['revenue_change_pct'].dropna()) == pytest.approx(trend.yoy_revenue_change_pct)
+            assert list(yoy['income_change_pct'].dropna()) == pytest.approx(trend.yoy_income_change_pct)
+
+    def test_red_flags(self, book, batch):
+        for tenant_id, inputs in enumerate(book):
+            expected = analyze_tenant_credit(inputs)
+            assert batch.red_flags.loc[tenant_id, 'red_flags'] == expected.red_flags
+            assert batch.red_flags.loc[tenant_id, 'red_flag_count'] == len(expected.red_flags)
+
+    def test_latest_ratios(self, book, batch):
+        for tenant_id, inputs in enumerate(book):
+            expected = analyze_tenant_credit(inputs).financial_ratios
+            for name, value in expected.items():
+                actual = batch.ratios.loc[tenant_id, name]
+                if value is None:
+                    assert np.isnan(actual)
+                else:
+                    assert actual == pytest.approx(value)
+
+
+# ============================================================================
+# FRAMES AND VALIDATION
+# ============================================================================
+
+class TestFramesAndValidation:
+    """Test frame conversion and input validation."""
+
+    def test_round_trip(self):
+        book = _random_book(5, seed=3)
+        financials, tenants = inputs_to_frames(book)
+        restored = frames_to_inputs(financials, tenants.reset_index())
+
+        for tenant_id, inputs in enumerate(book):
+            assert restored[tenant_id].tenant_name == inputs.tenant_name
+            assert restored[tenant_id].credit_score == inputs.credit_score
+            assert [fd.year for fd in restored[tenant_id].financial_data] == \
+                   [fd.year for fd in inputs.financial_data]
+
+    def test_tenant_defaults_filled(self):
+        financials = pd.DataFrame({'tenant_id': ['X'], 'year': [2024], 'revenue': [1e6],
+                                   'ebitda': [2e5], 'annual_rent': [5e4]})
+        tenants = pd.DataFrame({'tenant_id': ['X']})
+
+        result = analyze_credit_batch(financials, tenants)
+        expected = analyze_tenant_credit(CreditInputs(
+            financial_data=[FinancialData(year=2024, revenue=1e6, ebitda=2e5, annual_rent=5e4)]
+        ))
+        assert result.summary.loc['X', 'total_score'] == pytest.approx(expected.credit_score.total_score)
+
+    def test_missing_financials_raise(self):
+        financials = pd.DataFrame({'tenant_id': ['A'], 'year': [2024], 'revenue': [1.0]})
+        tenants = pd.DataFrame({'tenant_id': ['A', 'B']})
+        with pytest.raises(ValueError, match="B"):
+            analyze_credit_batch(financials, tenants)
+
+
+class TestReportRendering:
+    """Test parallel report rendering."""
+
+    def test_render_in_process_and_pool(self):
+        # print_credit_report needs every ratio defined, so no zero denominators
+        book = {f"T{i}": inputs for i, inputs in enumerate(_random_book(4, seed=11, zero_prob=0.0))}
+
+        serial = render_credit_reports(book, max_workers=1)
+        parallel = render_credit_reports(book, max_workers=2, chunksize=1)
+
+        assert list(serial) == list(book)
+        assert all("TENANT CREDIT ANALYSIS REPORT" in text for text in serial.values())
+        # Reports differ only by analysis date at most; same tenants, same ratings
+        for tenant_id in book:
+            assert serial[tenant_id].split("Analysis Date")[0] == parallel[tenant_id].split("Analysis Date")[0]
+            assert "RECOMMENDATION:" in parallel[tenant_id]
@@ -0,0 +1,118 @@
+"""
+Test suite for the benchmark harness and suite.
+
+Tests include:
+- Timing: calls, items, throughput and latency percentiles
+- Peak memory from tracemalloc and quiet mode
+- Run comparison: regression, improvement, unchanged, new and removed
+- Benchmark suite at a tiny scale: seeded inputs, results file round trip
+
+Run with: pytest test_benchmark_utils.py -v
+"""
+
+import sys
+
+import numpy as np
+import pytest
+
+from Shared_Utils.benchmark_utils import (
+    compare_results, format_comparison, format_results, latency_summary, load_results, run_benchmark, save_results
+)
+from Shared_Utils.cli import REPO_ROOT
+
+sys.path.insert(0, str(REPO_ROOT / 'Benchmarks'))
+from benchmark_suite import BENCHMARKS, generate_ifrs16_leases, main as suite_main, run_suite   # noqa: E402
+
+
+def _document(**benchmarks):
+    return {'benchmarks': {
+        name: {'latency_ms': {'p50': p50}, 'throughput': throughput, 'peak_memory_mb': peak}
+        for name, (p50, throughput, peak) in benchmarks.items()
+    }}
+
+
+class TestRunBenchmark:
+    """Timing and memory measurement."""
+
+    def test_counts_and_latency(self, capsys):
+        calls = []
+
+        def function(case):
+            calls.append(case)
+            print("calculator output")
+
+        result = run_benchmark('count', function, [1, 2, 3], items=30, repeat=2, warmup=1, memory=False)
+        assert calls == [1, 1, 2, 3, 1, 2, 3]
+        assert result.calls == 3 and result.items == 30 and result.repeat == 2
+        assert result.peak_memory_mb is None
+        assert result.throughput == pytest.approx(30 / result.pass_seconds)
+        latency = result.latency_ms
+        assert latency['p50'] <= latency['p90'] <= latency['p99'] <= latency['max']
+        assert capsys.readouterr().out == ''
+
+    def test_peak_memory(self):
+        result = run_benchmark('alloc', lambda n: np.ones(n), [1_000_000], repeat=1)
+        assert result.peak_memory_mb >= 7.5   # 8 MB array
+
+    def test_latency_summary_and_validation(self):
+        summary = latency_summary([1_000_000] * 99 + [100_000_000])
+        assert summary['p50'] == 1.0 and summary['max'] == 100.0
+        with pytest.raises(ValueError, match="no cases"):
+            run_benchmark('empty', print, [])
+        with pytest.raises(ValueError, match="repeat"):
+            run_benchmark('zero', print, [1], repeat=0)
+
+
+class TestCompareResults:
+    """Regression report between runs."""
+
+    def test_statuses(self):
+        baseline = _document(same=(10, 100, 5), slower=(10, 100, 5), faster=(10, 100, 5),
+                             fatter=(10, 100, 5), gone=(1, 1, 1))
+        current = _document(same=(10.5, 98, 5.2), slower=(12, 83, 5), faster=(7, 140, 5),
+                            fatter=(9, 110, 8), fresh=(1, 1, None))
+        comparison = compare_results(baseline, current)
+        assert comparison['status'].to_dict() == {
+            'same': 'unchanged', 'slower': 'regression', 'faster': 'improvement',
+            'fatter': 'regression', 'gone': 'removed', 'fresh': 'new'
+        }
+        assert comparison.loc['slower', 'p50_change'] == pytest.approx(0.2)
+        assert compare_results(baseline, current, threshold=0.25).loc['slower', 'status'] == 'unchanged'
+        report = format_comparison(comparison)
+        assert 'REGRESSION' in report and report.endswith('2 regression(s) of 6 benchmark(s)')
+
+
+class TestSuite:
+    """Benchmark suite at a tiny scale."""
+
+    def test_generators_are_seeded(self):
+        first = generate_ifrs16_leases(5, np.random.default_rng(1))
+        assert first == generate_ifrs16_leases(5, np.random.default_rng(1))
+        assert first != generate_ifrs16_leases(5, np.random.default_rng(2))
+        assert all(len(lease['monthly_payments']) >= 36 for lease in first)
+
+    def test_run_and_round_trip(self, tmp_path):
+        results = run_suite(['eff-rent', 'relative-valuation', 'monte-carlo'], scale=0.002, memory=False)
+        assert [result.parameters['size'] for result in results] == [20, 10, 2000]
+        assert all(result.throughput > 0 for result in results)
+        assert 'eff-rent' in format_results(results)
+
+        path = tmp_path / 'results.json'
+        save_results(results, path)
+        document = load_results(path)
+        assert document['environment']['python'] and document['benchmarks']['eff-rent']['items'] == 20
+        assert (compare_results(document, document)['status'] == 'unchanged').all()
+        with pytest.raises(ValueError, match="Unknown benchmark"):
+            run_suite(['nope'])
+
+    def test_every_benchmark_runs(self):
+        results = run_suite(list(BENCHMARKS), scale=0.001, memory=False)
+        assert [result.name for result in results] == list(BENCHMARKS)
+
+    def test_command_line(self, tmp_path, capsys):
+        baseline = tmp_path / 'baseline.json'
+        args = ['--only', 'eff-rent', '--scale', '0.001', '--no-memory']
+        assert suite_main([*args, '--output', str(baseline)]) == 0
+        # A negative threshold flags any change, so --fail-on-regression exits 1
+        assert suite_main([*args, '--compare', str(baseline), '--threshold', '-1', '--fail-on-regression']) == 1
+        assert 'regression(s)' in capsys.readouterr().out
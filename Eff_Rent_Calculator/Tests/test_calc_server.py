@@ -0,0 +1,201 @@
+"""
+Test suite for the JSON-RPC calculation server.
+
+Tests include:
+- Calculator methods match the command line's JSON output
+- JSON-RPC errors: parse, invalid request, unknown method, bad params,
+  calculator exceptions, notifications and empty batches
+- A broken process pool is replaced once, however many requests it fails
+- The client refuses a socket owned by another user
+- Server round trip over a Unix socket: batch through the process pool,
+  persistent client connection, shutdown
+
+Run with: pytest test_calc_server.py -v
+"""
+
+import asyncio
+import json
+import os
+import socket
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+import subprocess
+import sys
+import time
+
+import pytest
+
+from Shared_Utils.calc_server import (
+    CALCULATION_ERROR, INTERNAL_ERROR, INVALID_PARAMS, INVALID_REQUEST, METHOD_NOT_FOUND, METHODS, PARSE_ERROR,
+    CalculationClient, CalculationServer, RpcError, default_damages, rollover
+)
+from Shared_Utils.cli import REPO_ROOT
+
+
+def _load(relative_path):
+    with open(REPO_ROOT / relative_path) as f:
+        return json.load(f)
+
+
+DEFAULT_SCENARIO = _load('Default_Calculator/default_inputs/sample_default_monetary.json')
+PORTFOLIO = _load('Rollover_Analysis/rollover_inputs/sample_portfolio.json')
+DEAL = _load('Eff_Rent_Calculator/baf_input_simple.json')
+
+
+def _handle(message, tmp_path):
+    server = CalculationServer(tmp_path / 'unused.sock', max_workers=1)
+    server._start_executor()
+    try:
+        return asyncio.run(server.handle_message(message))
+    finally:
+        server.executor.shutdown()
+
+
+class TestMethods:
+    """Calculator methods return what the command line saves."""
+
+    def test_default_matches_saved_json(self, tmp_path):
+        from Default_Calculator.default_calculator import (
+            calculate_default_damages, load_default_scenario_from_json, save_results_to_json
+        )
+        path = REPO_ROOT / 'Default_Calculator/default_inputs/sample_default_monetary.json'
+        save_results_to_json(calculate_default_damages(*load_default_scenario_from_json(path)), tmp_path / 'out.json')
+        assert default_damages(DEFAULT_SCENARIO) == json.loads((tmp_path / 'out.json').read_text())
+
+    def test_rollover_matches_saved_json(self, tmp_path):
+        from Rollover_Analysis.rollover_calculator import (
+            calculate_rollover_analysis, load_portfolio_from_json, save_results_to_json
+        )
+        path = REPO_ROOT / 'Rollover_Analysis/rollover_inputs/sample_portfolio.json'
+        save_results_to_json(calculate_rollover_analysis(load_portfolio_from_json(path)), tmp_path / 'out.json')
+        assert rollover(PORTFOLIO) == json.loads((tmp_path / 'out.json').read_text())
+
+    def test_registry_covers_cli_commands(self):
+        from Shared_Utils.cli import COMMANDS
+        assert set(METHODS) <= set(COMMANDS)
+
+
+class TestProtocol:
+    """JSON-RPC 2.0 replies and error codes."""
+
+    def test_single_and_positional(self, tmp_path):
+        reply = _handle({'jsonrpc': '2.0', 'id': 7, 'method': 'default', 'params': [DEFAULT_SCENARIO]}, tmp_path)
+        assert reply['id'] == 7 and reply['result']['damages']['totals']['net_damages'] > 0
+
+    def test_errors(self, tmp_path):
+        batch = [
+            {'jsonrpc': '2.0', 'id': 1, 'method': 'nope'},
+            {'jsonrpc': '2.0', 'id': 2, 'method': 'default', 'params': {'scenario': {}}},
+            {'jsonrpc': '2.0', 'id': 3, 'method': 'default', 'params': {'input': []}},
+            {'jsonrpc': '2.0', 'id': 4, 'method': 'default', 'params': {'input': {}}},
+            {'id': 5, 'method': 'default'},
+            {'jsonrpc': '2.0', 'method': 'default', 'params': {'input': DEFAULT_SCENARIO}},   # Notification
+            17
+        ]
+        replies = _handle(batch, tmp_path)
+        assert [reply['error']['code'] for reply in replies] == [
+            METHOD_NOT_FOUND, INVALID_PARAMS, INVALID_PARAMS, CALCULATION_ERROR, INVALID_REQUEST, INVALID_REQUEST
+        ]
+        assert replies[3]['error']['data']['type'] == 'KeyError'
+        assert replies[5]['id'] is None
+        assert _handle([], tmp_path)['error']['code'] == INVALID_REQUEST
+        notification = {'jsonrpc': '2.0', 'method': 'rpc.ping'}
+        assert _handle(notification, tmp_path) is None and _handle([notification], tmp_path) is None
+
+
+class _BrokenPool:
+    """Executor whose workers have all died"""
+
+    def __init__(self):
+        self.shutdowns = []
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_exception(BrokenProcessPool('A worker process terminated abruptly'))
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shutdowns.append(wait)
+
+
+class TestBrokenPool:
+    """A dead worker fails its batch and the pool is replaced once."""
+
+    def test_replaced_once(self, tmp_path, monkeypatch):
+        server = CalculationServer(tmp_path / 'unused.sock', max_workers=2)
+        broken = server.executor = _BrokenPool()
+        started = []
+
+        def start_executor():
+            started.append(True)
+            server.executor = object()
+
+        monkeypatch.setattr(server, '_start_executor', start_executor)
+
+        request = {'jsonrpc': '2.0', 'method': 'default', 'params': {'input': DEFAULT_SCENARIO}}
+        replies = asyncio.run(server.handle_message([dict(request, id=i) for i in range(4)]))
+        assert [reply['error']['code'] for reply in replies] == [INTERNAL_ERROR] * 4
+        assert len(started) == 1 and server.executor is not broken
+        assert broken.shutdowns == [False]
+
+
+class TestClient:
+    """Client-side socket checks."""
+
+    def test_foreign_socket_refused(self, tmp_path, monkeypatch):
+        socket_path = tmp_path / 'calc.sock'
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(str(socket_path))
+        uid = os.getuid()
+        monkeypatch.setattr(os, 'getuid', lambda: uid + 1)
+        try:
+            with pytest.raises(ValueError, match="not a socket owned by this user"):
+                CalculationClient(socket_path)
+        finally:
+            listener.close()
+
+
+class TestServer:
+    """Round trip over a Unix socket with a process pool."""
+
+    def test_round_trip(self, tmp_path):
+        socket_path = tmp_path / 'calc.sock'
+        process = subprocess.Popen(
+            [sys.executable, str(REPO_ROOT / 'realestate.py'), 'server',
+             '--socket', str(socket_path), '--max-workers', '2'],
+            stdout=subprocess.DEVNULL
+        )
+        try:
+            deadline = time.monotonic() + 30
+            while not socket_path.exists():
+                assert process.poll() is None and time.monotonic() < deadline
+                time.sleep(0.05)
+
+            with CalculationClient(socket_path) as client:
+                assert client.call('rpc.ping')['methods'] == len(METHODS)
+                assert set(client.call('rpc.methods')) == set(METHODS)
+
+                replies = client.batch([
+                    ('eff-rent', {'input': DEAL}),
+                    ('default', [DEFAULT_SCENARIO]),
+                    ('rollover', {'input': PORTFOLIO}),
+                    ('default', {'input': {}})
+                ])
+                assert [('result' in reply) for reply in replies] == [True, True, True, False]
+                assert replies[1]['result'] == default_damages(DEFAULT_SCENARIO)
+                assert replies[2]['result'] == rollover(PORTFOLIO)
+                assert replies[0]['result']['results']['effective_rent']['ner_lease_term_only'] > 0
+
+                with pytest.raises(RpcError) as error:
+                    client.call('default', input={})
+                assert error.value.code == CALCULATION_ERROR
+
+                # Malformed line: error reply, connection stays usable
+                client.connection.sendall(b'{not json\n')
+                assert json.loads(client.stream.readline())['error']['code'] == PARSE_ERROR
+                assert client.call('rpc.shutdown') is True
+            assert process.wait(timeout=30) == 0
+            assert not socket_path.exists()
+        finally:
+            if process.poll() is None:
+                process.kill()
@@ -0,0 +1,168 @@
+"""
+Test suite for the realestate command line.
+
+Tests include:
+- Lazy Shared_Utils re-exports and deferred scipy imports
+- Command listing, unknown commands and in-process runs
+- Warm worker: start, run with the client's working directory, status, stop
+  and fallback when no worker is listening
+- Worker runs see the client's environment (REALESTATE_LOG_LEVEL, REALESTATE_TRACE)
+- Socket location ($XDG_RUNTIME_DIR) and refusal of another user's socket
+
+Run with: pytest test_cli.py -v
+"""
+
+import json
+import os
+import socket
+import subprocess
+import tempfile
+import sys
+from pathlib import Path
+
+import pytest
+
+from Shared_Utils.cli import (
+    COMMANDS, REPO_ROOT, default_socket_path, main, run_command, start_worker, worker_request
+)
+
+
+SAMPLE = REPO_ROOT / 'Default_Calculator' / 'default_inputs' / 'sample_default_monetary.json'
+RELATIVE_VALUATION_INPUT = REPO_ROOT / 'Relative_Valuation' / 'test_fix_edge_cases.json'
+COMPARABLE_SALES_INPUT = REPO_ROOT / 'Comparable_Sales_Analysis' / 'sample_inputs' / 'sample_industrial_comps.json'
+
+
+def _loaded_modules(statement):
+    code = f"import sys; {statement}; print(' '.join(sorted(sys.modules)))"
+    output = subprocess.run([sys.executable, '-c', code], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    return set(output.stdout.split())
+
+
+class TestLazyImports:
+    """Heavy dependencies load only when used."""
+
+    def test_shared_utils_submodule(self):
+        modules = _loaded_modules('import Shared_Utils.discount_curve')
+        assert 'scipy' not in modules and 'pandas' not in modules
+        modules = _loaded_modules('from Shared_Utils import npv, discount_curve')
+        assert 'Shared_Utils.financial_utils' in modules and 'scipy.optimize' not in modules
+
+    def test_option_valuation_defers_scipy_stats(self):
+        assert 'scipy.stats' not in _loaded_modules('import Option_Valuation.option_valuation')
+        assert 'scipy.stats' in _loaded_modules(
+            'from Option_Valuation.option_valuation import cumulative_normal_distribution as N; N(0.5)'
+        )
+
+    def test_unknown_attribute(self):
+        import Shared_Utils
+        with pytest.raises(AttributeError):
+            Shared_Utils.not_a_function
+        assert 'irr' in dir(Shared_Utils)
+
+
+class TestCommands:
+    """Dispatch without a worker."""
+
+    def test_list_and_unknown(self, capsys):
+        assert main(['list']) == 0
+        listing = capsys.readouterr().out
+        assert all(name in listing for name in COMMANDS)
+        assert main(['--no-worker', 'nope']) == 2
+        with pytest.raises(ValueError, match="Unknown command"):
+            run_command('nope', [])
+
+    def test_all_scripts_exist(self):
+        for command in COMMANDS.values():
+            assert (REPO_ROOT / command.script).is_file(), command.script
+
+    def test_in_process(self, tmp_path, capsys):
+        output = tmp_path / 'results.json'
+        assert main(['--no-worker', 'default', str(SAMPLE), str(output)]) == 0
+        assert 'Net damages' in capsys.readouterr().out
+        assert json.loads(output.read_text())
+        # Calculator usage errors come back as exit codes, argv is restored
+        argv = sys.argv[:]
+        assert run_command('default', []) == 1
+        assert sys.argv == argv
+
+
+class TestWorker:
+    """Warm worker round trip."""
+
+    def test_worker_round_trip(self, tmp_path, capsys, monkeypatch):
+        socket_path = tmp_path / 'worker.sock'
+        assert worker_request(socket_path, 'ping') is None
+        start_worker(socket_path)
+        try:
+            with pytest.raises(RuntimeError, match="already listening"):
+                start_worker(socket_path)
+
+            monkeypatch.chdir(tmp_path)
+            assert main(['--worker', str(socket_path), 'default', str(SAMPLE), 'warm.json']) == 0
+            assert 'Net damages' in capsys.readouterr().out
+            assert main(['--no-worker', 'default', str(SAMPLE), 'cold.json']) == 0
+            capsys.readouterr()
+            assert (tmp_path / 'warm.json').read_text() == (tmp_path / 'cold.json').read_text()
+
+            assert main(['--worker', str(socket_path), 'default']) == 1
+            assert 'Usage' in capsys.readouterr().out
+            assert worker_request(socket_path, 'bogus')['exit_code'] == 2
+            assert main(['worker', 'status', '--socket', str(socket_path)]) == 0
+        finally:
+            main(['worker', 'stop', '--socket', str(socket_path)])
+        assert not Path(socket_path).exists()
+        assert main(['worker', 'status', '--socket', str(socket_path)]) == 1
+
+    def test_client_environment(self, tmp_path, capsys, monkeypatch):
+        socket_path = tmp_path / 'worker.sock'
+        monkeypatch.delenv('REALESTATE_LOG_LEVEL', raising=False)
+        monkeypatch.delenv('REALESTATE_TRACE', raising=False)
+        start_worker(socket_path)
+        try:
+            monkeypatch.chdir(tmp_path)
+            relative_valuation = ['--worker', str(socket_path), 'relative-valuation',
+                                  '--input', str(RELATIVE_VALUATION_INPUT), '--output-json', 'rv.json']
+            assert main(relative_valuation) == 0
+            assert 'Running Relative Valuation Analysis' in capsys.readouterr().out
+
+            # Set in the client only; the worker was started without them
+            monkeypatch.setenv('REALESTATE_LOG_LEVEL', 'quiet')
+            assert main(relative_valuation) == 0
+            assert 'Running Relative Valuation Analysis' not in capsys.readouterr().out
+
+            monkeypatch.setenv('REALESTATE_TRACE', str(tmp_path / 'trace.json'))
+            assert main(['--worker', str(socket_path), 'comparable-sales', str(COMPARABLE_SALES_INPUT),
+                         '--output', 'cs.json']) == 0
+            summary = json.loads((tmp_path / 'trace.json').read_text())['summary']
+            assert summary['comparable_sales.load']['calls'] == 1
+        finally:
+            main(['worker', 'stop', '--socket', str(socket_path)])
+
+
+class TestSocketOwnership:
+    """Sockets live in a per-user directory and clients refuse foreign ones."""
+
+    def test_default_path(self, tmp_path, monkeypatch):
+        monkeypatch.delenv('REALESTATE_WORKER', raising=False)
+        monkeypatch.setenv('XDG_RUNTIME_DIR', str(tmp_path))
+        assert default_socket_path() == tmp_path / f"realestate-{os.getuid()}.sock"
+        monkeypatch.delenv('XDG_RUNTIME_DIR')
+        assert default_socket_path().parent == Path(tempfile.gettempdir())
+
+    def test_foreign_socket_refused(self, tmp_path, monkeypatch, capsys):
+        socket_path = tmp_path / 'worker.sock'
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(str(socket_path))
+        listener.listen()
+        uid = os.getuid()
+        monkeypatch.setattr(os, 'getuid', lambda: uid + 1)   # Socket now belongs to "another user"
+        try:
+            with pytest.raises(ValueError, match="not a socket owned by this user"):
+                worker_request(socket_path, 'ping')
+            output = tmp_path / 'results.json'
+            assert main(['--worker', str(socket_path), 'default', str(SAMPLE), str(output)]) == 0
+            assert 'running in this process' in capsys.readouterr().err
+            assert json.loads(output.read_text())
+            assert main(['worker', 'status', '--socket', str(socket_path)]) == 1
+        finally:
+            listener.close()
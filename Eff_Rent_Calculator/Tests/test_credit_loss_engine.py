@@ -0,0 +1,175 @@
+"""
+Test suite for the portfolio credit loss engine.
+
+Tests include:
+- Vectorized damage formulas vs the Default_Calculator scalar functions
+- Loss at default vs calculate_default_damages() month by month
+- PD curve calibration to DEFAULT_PROBABILITIES
+- Expected loss vs an explicit per-tenant loop
+- Credit input resolution (ratings, scores, BatchCreditResult summary)
+
+Run with: pytest test_credit_loss_engine.py -v
+"""
+
+import random
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from Credit_Analysis.credit_analysis import DEFAULT_PROBABILITIES
+from Credit_Analysis.credit_loss_engine import (
+    monthly_hazard,
+    marginal_pd_curves,
+    accelerated_rent_npv_array,
+    re_leasing_costs_array,
+    mitigation_credit_array,
+    leases_to_frame,
+    analyze_portfolio_losses
+)
+from Default_Calculator.default_calculator import (
+    LeaseTerms,
+    DefaultEvent,
+    calculate_accelerated_rent_npv,
+    calculate_re_leasing_costs,
+    calculate_mitigation_credit,
+    calculate_default_damages
+)
+
+
+def _lease(tenant: str, rng: random.Random, remaining_months: int) -> LeaseTerms:
+    area = rng.uniform(2_000, 50_000)
+    rent_sf = rng.uniform(15, 45)
+    return LeaseTerms(
+        property_address="1 Test St",
+        tenant_name=tenant,
+        landlord_name="Landlord",
+        current_monthly_rent=area * rent_sf / 12,
+        current_annual_rent=area * rent_sf,
+        rentable_area_sf=area,
+        rent_per_sf=rent_sf,
+        lease_commencement_date=date(2022, 1, 1),
+        lease_expiry_date=date(2030, 12, 31),
+        remaining_months=remaining_months,
+        additional_rent_annual=area * rng.uniform(0, 12),
+        security_deposit=rng.choice([0.0, area * rent_sf / 6]),
+        market_rent_sf=rent_sf * rng.uniform(0.7, 1.2),
+        downtime_months=rng.randint(0, 18),
+        discount_rate_annual=rng.choice([0.0, 0.06, 0.10])
+    )
+
+
+@pytest.fixture(scope='module')
+def portfolio():
+    rng = random.Random(5)
+    leases = [_lease(f"T{i}", rng, rng.randint(0, 96)) for i in range(40)]
+    ratings = [rng.choice(['A', 'B', 'C', 'D', 'F']) for _ in leases]
+    return leases, ratings
+
+
+class TestVectorizedFormulas:
+    """Array helpers must match the Default_Calculator scalar functions."""
+
+    @pytest.mark.parametrize('rate', [0.0, 0.08])
+    def test_accelerated_rent_and_mitigation(self, rate):
+        months = np.arange(-1, 40)
+        accelerated = accelerated_rent_npv_array(10_000.0, 1_500.0, months, rate)
+        mitigation = mitigation_credit_array(9_000.0, months, 6, rate)
+
+        for i, n in enumerate(months):
+            assert accelerated[i] == pytest.approx(calculate_accelerated_rent_npv(10_000.0, 1_500.0, int(n), rate))
+            assert mitigation[i] == pytest.approx(calculate_mitigation_credit(9_000.0, int(n), 6, rate))
+
+    def test_re_leasing_costs(self):
+        terms = np.array([0.5, 2.0, 5.0])
+        totals = re_leasing_costs_array(10_000, 20.0, 300_000, terms, 0.05, 5_000)
+        for term, total in zip(terms, totals):
+            assert total == pytest.approx(calculate_re_leasing_costs(10_000, 20.0, 300_000, term, 0.05, 5_000)["total"])
+
+
+class TestPDCurves:
+    """Test hazard calibration."""
+
+    def test_curve_reproduces_cumulative_pd(self):
+        pd_5yr = np.array(list(DEFAULT_PROBABILITIES.values()))
+        curves = marginal_pd_curves(monthly_hazard(pd_5yr), 60)
+        assert curves.sum(axis=1) == pytest.approx(pd_5yr)
+        assert np.all(np.diff(curves, axis=1) <= 0)
+
+    def test_extreme_pds(self):
+        assert list(monthly_hazard([0.0, 1.0])) == [0.0, 1.0]
+
+
+class TestPortfolioLosses:
+    """Engine results vs explicit Default_Calculator computations."""
+
+    def test_loss_at_default_matches_calculate_default_damages(self, portfolio):
+        leases, ratings = portfolio
+        result = analyze_portfolio_losses(leases_to_frame(leases, ratings))
+        default = DefaultEvent(date(2026, 1, 1), "non-monetary", "Vacated premises")
+
+        for i, lease in enumerate(leases[:10]):
+            for month in range(1, lease.remaining_months + 1):
+                months_left = lease.remaining_months - month + 1
+                damages = calculate_default_damages(
+                    LeaseTerms(**{**lease.__dict__, 'remaining_months': months_left}), default
+                ).damage_calculation
+                assert result.loss_at_default[i, month - 1] == pytest.approx(max(damages.net_damages, 0.0))
+            assert not result.loss_at_default[i, lease.remaining_months:].any()
+
+    def test_expected_loss_matches_loop(self, portfolio):
+        leases, ratings = portfolio
+        result = analyze_portfolio_losses(leases_to_frame(leases, ratings))
+
+        for i, (lease, rating) in enumerate(zip(leases, ratings)):
+            hazard = 1 - (1 - DEFAULT_PROBABILITIES[rating]) ** (1 / 60)
+            v = 1 / (1 + lease.discount_rate_annual) ** (1 / 12)
+            survival, expected_loss = 1.0, 0.0
+            for month in range(1, lease.remaining_months + 1):
+                expected_loss += survival * hazard * v ** (month - 1) * result.loss_at_default[i, month - 1]
+                survival *= 1 - hazard
+
+            row = result.summary.iloc[i]
+            assert row['expected_loss'] == pytest.approx(expected_loss)
+            assert row['lifetime_pd'] == pytest.approx(1 - survival)
+            if lease.remaining_months == 0:
+                assert row['loss_given_default'] == 0.0
+
+        assert result.total_expected_loss == pytest.approx(result.summary['expected_loss'].sum())
+
+    def test_lgd_bounded_by_damages(self, portfolio):
+        leases, ratings = portfolio
+        summary = analyze_portfolio_losses(leases_to_frame(leases, ratings)).summary
+        active = summary[summary['lifetime_pd'] > 0]
+        assert (active['expected_loss'] <= active['loss_given_default'] + 1e-9).all()
+        assert (summary['lgd_pct'] >= 0).all()
+
+
+class TestCreditInputs:
+    """Test resolution of credit columns."""
+
+    def _frame(self):
+        return pd.DataFrame({
+            'tenant_id': ['X', 'Y'],
+            'current_monthly_rent': [20_000.0, 20_000.0],
+            'rentable_area_sf': [10_000.0, 10_000.0],
+            'remaining_months': [36, 36],
+        })
+
+    def test_scores_map_to_ratings(self):
+        frame = self._frame().assign(total_score=[85.0, 10.0])
+        summary = analyze_portfolio_losses(frame).summary
+        assert list(summary['credit_rating']) == ['A', 'F']
+        assert summary.loc['Y', 'expected_loss'] > summary.loc['X', 'expected_loss']
+
+    def test_credit_summary_join(self):
+        credit = pd.DataFrame({'credit_rating': ['C', 'B']}, index=pd.Index(['Y', 'X'], name='tenant_id'))
+        summary = analyze_portfolio_losses(self._frame(), credit=credit).summary
+        assert list(summary['pd_5yr']) == [DEFAULT_PROBABILITIES['B'], DEFAULT_PROBABILITIES['C']]
+
+    def test_missing_credit_raises(self):
+        with pytest.raises(ValueError, match="pd_5yr"):
+            analyze_portfolio_losses(self._frame())
+        with pytest.raises(ValueError, match="Y"):
+            analyze_portfolio_losses(self._frame(), credit=pd.DataFrame({'tenant_id': ['X'], 'credit_rating': ['A']}))
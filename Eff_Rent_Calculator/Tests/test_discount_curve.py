@@ -0,0 +1,164 @@
+"""
+Test suite for the shared discount curve cache.
+
+Tests include:
+- Discount and annuity factors vs closed-form formulas and pv_annuity()
+- Compounding conventions
+- Table growth, read-only arrays and LRU caching
+- Calculators reading from the cache (BAF, yield curve, default damages)
+
+Run with: pytest test_discount_curve.py -v
+"""
+
+import numpy as np
+import numpy_financial as npf
+import pytest
+
+from Shared_Utils.financial_utils import pv_annuity, annual_to_monthly_rate
+from Shared_Utils.discount_curve import (
+    DISCOUNT_CURVE_CACHE_SIZE,
+    DiscountCurve,
+    discount_curve,
+    periodic_rate,
+    clear_discount_curve_cache,
+    discount_curve_cache_info
+)
+
+
+class TestDiscountCurve:
+    """Test factor tables against closed-form formulas."""
+
+    @pytest.mark.parametrize('timing', ['beginning', 'end'])
+    @pytest.mark.parametrize('rate', [0.0, 0.005, 0.10])
+    def test_annuity_matches_pv_annuity(self, rate, timing):
+        curve = DiscountCurve(rate, timing)
+        for periods in (1, 12, 60, 300):
+            assert curve.annuity(periods) == pytest.approx(pv_annuity(1.0, rate, periods, timing))
+
+    def test_discount_factors(self):
+        curve = DiscountCurve(0.01)
+        assert curve.discount_factors(3) == pytest.approx([1.0, 1 / 1.01, 1 / 1.01 ** 2, 1 / 1.01 ** 3])
+        assert curve.discount_factor(np.array([0, 2])) == pytest.approx([1.0, 1 / 1.01 ** 2])
+
+    def test_pv_with_offset_matches_excel_pv(self):
+        curve = DiscountCurve(0.08 / 12, 'beginning')
+        expected = -npf.pv(0.08 / 12, 48, 1000, 0, 1) / (1 + 0.08 / 12) ** 12
+        assert curve.pv(1000, 48, 12) == pytest.approx(expected)
+        assert curve.pv(1000, 0, 12) == 0.0
+
+    def test_npv_first_flow_undiscounted(self):
+        curve = DiscountCurve(0.10)
+        assert curve.npv([-100, 110]) == pytest.approx(0.0)
+
+    def test_tables_grow_and_are_read_only(self):
+        curve = DiscountCurve(0.01)
+        assert curve.annuity(1000) == pytest.approx(pv_annuity(1.0, 0.01, 1000))
+        assert curve.periods >= 1000
+        with pytest.raises(ValueError):
+            curve.annuity_factors(10)[0] = 1.0
+
+    @pytest.mark.parametrize('timing', ['beginning', 'end'])
+    @pytest.mark.parametrize('rate', [0.0, 0.005])
+    def test_fractional_periods_use_closed_form(self, rate, timing):
+        curve = DiscountCurve(rate, timing)
+        assert curve.annuity(12.5) == pytest.approx(pv_annuity(1.0, rate, 12.5, timing))
+        assert curve.annuity(np.array([12, 12.5])) == pytest.approx(
+            [curve.annuity(12), pv_annuity(1.0, rate, 12.5, timing)]
+        )
+        assert curve.discount_factor(2.5) == pytest.approx((1 + rate) ** -2.5)
+        assert curve.pv(1000, 11.5, 12.5) == pytest.approx(pv_annuity(1000, rate, 11.5, timing) / (1 + rate) ** 12.5)
+
+    def test_invalid_periods(self):
+        curve = DiscountCurve(0.01)
+        assert curve.annuity(36.0) == curve.annuity(36)
+        with pytest.raises(ValueError, match="whole numbers"):
+            curve.annuity_factors(2.5)
+        with pytest.raises(ValueError, match="non-negative"):
+            curve.discount_factor(-1)
+        with pytest.raises(ValueError, match="non-negative"):
+            curve.annuity(-0.5)
+
+
+class TestCompounding:
+    """Test rate conventions."""
+
+    def test_conventions(self):
+        assert periodic_rate(0.06, 'annual_effective') == pytest.approx(annual_to_monthly_rate(0.06))
+        assert periodic_rate(0.06, 'annual_nominal') == pytest.approx(0.005)
+        assert periodic_rate(0.06) == 0.06
+
+    def test_invalid(self):
+        with pytest.raises(ValueError, match="Unknown compounding"):
+            periodic_rate(0.06, 'daily')
+        with pytest.raises(ValueError):
+            discount_curve(-1.0)
+        with pytest.raises(ValueError, match="timing"):
+            DiscountCurve(0.01, 'middle')
+
+
+class TestCache:
+    """Test memoization and eviction."""
+
+    def test_same_curve_returned(self):
+        clear_discount_curve_cache()
+        first = discount_curve(0.12, 'annual_nominal', 'beginning')
+        assert discount_curve(0.01, 'periodic', 'beginning') is first
+        assert discount_curve(0.12, 'annual_nominal', 'end') is not first
+        assert discount_curve_cache_info().hits == 1
+
+    def test_bounded(self):
+        clear_discount_curve_cache()
+        for i in range(DISCOUNT_CURVE_CACHE_SIZE + 10):
+            discount_curve(i * 1e-4)
+        assert discount_curve_cache_info().currsize == DISCOUNT_CURVE_CACHE_SIZE
+
+
+class TestCalculatorsUseCache:
+    """Calculators must give the closed-form results via the shared curve."""
+
+    def test_default_calculator(self):
+        from Default_Calculator.default_calculator import (
+            calculate_accelerated_rent_npv,
+            calculate_mitigation_credit
+        )
+        r = (1.10) ** (1 / 12) - 1
+        assert calculate_accelerated_rent_npv(20000, 5000, 36, 0.10) == pytest.approx(
+            25000 * (1 - (1 + r) ** -36) / r)
+        assert calculate_mitigation_credit(18000, 36, 6, 0.10) == pytest.approx(
+            18000 * (1 - (1 + r) ** -30) / r * (1 + r) ** -6)
+
+    def test_yield_curve_and_baf(self):
+        from Rental_Yield_Curve.rental_yield_curve import RentalYieldCurveCalculator, YieldCurveInputs
+        from Eff_Rent_Calculator.eff_rent_calculator import BAFCalculator, LeaseTerms
+
+        yc = RentalYieldCurveCalculator(YieldCurveInputs(nominal_discount_rate=0.09))
+        assert yc.calculate_pv(12.0, 24, 6) == pytest.approx(-npf.pv(0.0075, 24, 1.0, 0, 1) / 1.0075 ** 6)
+
+        baf = BAFCalculator(LeaseTerms(nominal_discount_rate=0.09))
+        assert baf.calculate_pv(1000.0, 60, 12) == pytest.approx(-npf.pv(0.0075, 60, 1000.0, 0, 1) / 1.0075 ** 12)
+        assert baf.discount_curve is yc.discount_curve
+
+    def test_baf_fractional_rent_schedule(self):
+        from Eff_Rent_Calculator.eff_rent_calculator import BAFCalculator, lease_terms_from_dict
+
+        months = [12.5, 11.5, 12, 12, 12]
+        rents = [10.0, 10.5, 11.0, 11.5, 12.0]
+        terms = lease_terms_from_dict({
+            'property_info': {'area_sf': 20000, 'property_type': 'industrial'},
+            'lease_terms': {'lease_term_months': 60},
+            'rent_schedule': {'rent_psf_by_year': rents, 'months_per_period': months},
+            'incentives': {'net_free_rent_months': 2.5},
+            'leasing_costs': {'listing_agent_year1_pct': 0.05, 'listing_agent_subsequent_pct': 0.02},
+            'financial_assumptions': {'nominal_discount_rate': 0.09}
+        })
+        calculator = BAFCalculator(terms)
+        results = calculator.calculate_all()
+
+        # Excel PV (type=1) per period, discounted by the months already elapsed
+        r = terms.nominal_discount_rate / 12
+        starts = np.cumsum([0] + months[:-1])
+        expected = [-npf.pv(r, int(m), rent * 20000 / 12, 0, 1) / (1 + r) ** start
+                    for rent, m, start in zip(rents, months, starts)]
+        assert calculator.calculate_rent_npv()[1] == pytest.approx(expected)
+        assert calculator.discount_curve.discount_factor(starts[1]) == pytest.approx((1 + r) ** -12.5)
+        assert np.isfinite([results.npv_net_rent, results.npv_lease_deal, results.ner_lease_term_only]).all()
@@ -25,6 +25,8 @@ from Shared_Utils.financial_utils import (
     pv_annuity,
     npv,
     irr,
+    npv_many,
+    irr_many,
     annual_to_monthly_rate,
     monthly_to_annual_rate,
     effective_annual_rate,
@@ -200,6 +202,61 @@ class TestIRR:
         assert irr_val == pytest.approx(expected, rel=1e-7)
 
 
+class TestBatchNPVIRR:
+    """Test array-native npv_many / irr_many against npv / irr."""
+
+    @pytest.fixture
+    def streams(self):
+        rng = np.random.default_rng(42)
+        flows = rng.uniform(5000, 40000, size=(200, 11))
+        flows[:, 0] = -rng.uniform(50000, 200000, size=200)
+        return flows
+
+    def test_npv_many_matches_npv(self, streams):
+        rates = np.linspace(0.0, 0.2, len(streams))
+        values = npv_many(streams, rates)
+        for row, rate, value in zip(streams, rates, values):
+            assert value == pytest.approx(npv(list(row), rate))
+
+    def test_npv_many_ragged_rows(self):
+        values = npv_many([[-100000, 30000, 30000, 30000, 30000, 30000], [-50000, 20000]], 0.10)
+        assert values[0] == pytest.approx(13723.60, abs=0.01)
+        assert values[1] == pytest.approx(npv([-50000, 20000], 0.10))
+
+    def test_npv_many_validation(self):
+        with pytest.raises(ValueError, match="empty"):
+            npv_many([], 0.10)
+        with pytest.raises(ValueError, match="-100%"):
+            npv_many([[-1, 2]], -1.0)
+
+    def test_irr_many_matches_irr(self, streams):
+        rates = irr_many(streams)
+        for row, rate in zip(streams, rates):
+            assert rate == pytest.approx(irr(list(row)), abs=1e-6)
+
+    def test_irr_many_nan_padding(self):
+        padded = np.array([
+            [-100000, 30000, 30000, 30000, 30000, 30000],
+            [-50000, 20000, 20000, 20000, np.nan, np.nan],
+        ])
+        rates = irr_many(padded)
+        assert rates[0] == pytest.approx(irr([-100000, 30000, 30000, 30000, 30000, 30000]), abs=1e-6)
+        assert rates[1] == pytest.approx(irr([-50000, 20000, 20000, 20000]), abs=1e-6)
+
+    def test_irr_many_unsolvable_rows_are_nan(self):
+        rates = irr_many([[100, 100, 100], [-5], [-1000, 0, 0], [-100000, 30000, 30000, 30000, 30000, 30000]])
+        assert np.isnan(rates[:3]).all()
+        assert 0.152 < rates[3] < 0.153
+
+    def test_irr_many_bracket_fallback(self):
+        """Rows where Newton leaves the domain are solved by bisection."""
+        flows = [[-250000, 90000, 110000, 130000, 150000], [-100, 0, 0, 0, 0, 0, 0, 0, 0, 1000]]
+        rates = irr_many(flows, guess=-0.95, max_iterations=3)
+        for row, rate in zip(flows, rates):
+            assert rate == pytest.approx(npf.irr(row), abs=1e-6)
+            assert abs(npv(row, rate)) < 1
+
+
 # ============================================================================
 # DISCOUNT RATE CONVERSION TESTS
 # ============================================================================
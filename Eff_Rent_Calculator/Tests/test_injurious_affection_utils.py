@@ -0,0 +1,247 @@
+"""
+Test suite for corridor-wide injurious affection.
+
+Tests include:
+- Single-source corridor vs the archived calculate_injurious_affection()
+- Energy-summed noise and time-phased exposure
+- Chunking invariance
+- WorkZoneIndex receptor/work-zone distance tables vs brute force, and the
+  impact-radius (sparse) corridor path
+- Input validation
+
+Run with: pytest test_injurious_affection_utils.py -v
+"""
+
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from Shared_Utils.injurious_affection_utils import (
+    DUST_ZONES,
+    WorkZoneIndex,
+    receptor_work_zone_distances,
+    corridor_exposure,
+    corridor_injurious_affection
+)
+
+
+ORIGINAL = (
+    Path(__file__).resolve().parents[2]
+    / 'docs' / 'skills' / 'injurious-affection-assessment' / 'injurious_affection_calculator_original.py'
+)
+
+
+@pytest.fixture(scope='module')
+def original():
+    spec = importlib.util.spec_from_file_location('injurious_affection_calculator_original', ORIGINAL)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _receptors(n, seed=0, max_distance=280):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'x': rng.uniform(5, max_distance, n),
+        'y': 0.0,
+        'property_type': rng.choice(['residential', 'commercial', 'industrial'], n),
+        'property_value': rng.uniform(300000, 2000000, n),
+        'rental_income_monthly': rng.uniform(1000, 5000, n),
+        'number_of_units': rng.integers(1, 5, n),
+        'annual_revenue': rng.choice([0.0, 500000.0], n),
+        'background_noise_dba': 0.0
+    })
+
+
+class TestSingleSource:
+    """One source reduces to the per-property calculator."""
+
+    def test_matches_original(self, original):
+        receptors = _receptors(150)
+        schedule = pd.DataFrame({
+            'x': [0.0], 'y': [0.0], 'start_month': [0], 'duration_months': [6.5],
+            'dba_at_15m': [88.0], 'ppv_at_reference_mms': [20.0],
+            'traffic_reduction_pct': [0.25], 'night_work': [True]
+        })
+        corridor = corridor_injurious_affection(receptors, schedule)
+
+        for i, row in receptors.iterrows():
+            distance = row['x']
+            level = 88.0 - 6.0 * np.log2(distance / 15.0)
+            construction = original.ConstructionActivity(
+                duration_months=6.5,
+                equipment=[{'equipment_type': 'excavator', 'dba_at_15m': 88.0, 'hours_per_day': 8}],
+                dust_impact_zone=next(zone for zone, limit in zip(DUST_ZONES, (50, 150, 300)) if distance <= limit),
+                vibration_ppv_mms=20.0 * (7.62 / distance) ** 1.5,
+                traffic_reduction_pct=0.25 if distance <= 100 else 0.0,
+                night_work=level >= 65.0
+            )
+            details = original.PropertyDetails(
+                property_type=row['property_type'],
+                property_value=row['property_value'],
+                rental_income_monthly=row['rental_income_monthly'],
+                distance_to_construction_m=distance,
+                number_of_units=int(row['number_of_units']),
+                annual_revenue=row['annual_revenue'],
+                background_noise_dba=0.0
+            )
+            summary = original.calculate_injurious_affection(details, construction, original.MarketParameters())
+            result = corridor.loc[i]
+
+            assert result['noise_damage'] == pytest.approx(summary.noise_impact.total_noise_damage, abs=0.01)
+            assert result['dust_damage'] == pytest.approx(summary.dust_impact.total_dust_damage, abs=0.01)
+            assert result['dust_cleanings'] == summary.dust_impact.number_of_cleanings
+            assert result['vibration_threshold'] == summary.vibration_impact.damage_threshold
+            assert result['traffic_damage'] == pytest.approx(summary.traffic_impact.total_traffic_damage, abs=0.01)
+            assert result['business_loss'] == pytest.approx(summary.business_loss.total_business_loss, abs=0.01)
+            assert result['total_temporary_damages'] == pytest.approx(summary.total_temporary_damages, abs=0.05)
+
+
+class TestExposure:
+    """Energy summation and time phasing."""
+
+    def test_energy_sum_not_max(self):
+        receptors = pd.DataFrame({'x': [30.0], 'y': [0.0], 'background_noise_dba': [0.0]})
+        one = pd.DataFrame({'x': [0.0], 'y': [0.0], 'start_month': [0], 'duration_months': [1], 'dba_at_15m': [80.0]})
+        two = pd.concat([one, one.assign(x=60.0)], ignore_index=True)
+        level_one = corridor_exposure(receptors, one)['noise_dba'][0, 0]
+        level_two = corridor_exposure(receptors, two)['noise_dba'][0, 0]
+        assert level_one == pytest.approx(74.0, abs=1e-6)
+        assert level_two - level_one == pytest.approx(10 * np.log10(2), abs=1e-6)
+
+        half_duty = corridor_exposure(receptors, one.assign(duty_cycle=0.5))['noise_dba'][0, 0]
+        assert level_one - half_duty == pytest.approx(10 * np.log10(2), abs=1e-6)
+
+    def test_time_phased_schedule(self):
+        # Works move along the corridor: each receptor is exposed only while the works are near
+        receptors = pd.DataFrame({'x': [0.0, 1000.0], 'y': 20.0, 'property_type': 'residential',
+                                  'rental_income_monthly': 2000.0})
+        schedule = pd.DataFrame({
+            'x': [0.0, 1000.0], 'y': 0.0, 'start_month': [0, 4], 'duration_months': [4, 2.5],
+            'dba_at_15m': [85.0, 85.0]
+        })
+        exposure = corridor_exposure(receptors, schedule)
+        assert exposure['noise_dba'].shape == (2, 7)
+        assert exposure['month_weights'] == pytest.approx([1, 1, 1, 1, 1, 1, 0.5])
+        assert (exposure['noise_dba'][0, :4] > 75).all() and (exposure['noise_dba'][0, 4:] < 55).all()
+        assert (exposure['dust_zone'][1, :4] == len(DUST_ZONES)).all() and (exposure['dust_zone'][1, 4:] == 0).all()
+
+        damages = corridor_injurious_affection(receptors, schedule)
+        assert damages['noise_months'].tolist() == [4.0, 2.5]
+        assert damages['noise_damage'].tolist() == pytest.approx([2000 * 0.2 * 4, 2000 * 0.2 * 2.5])
+
+    def test_chunking_invariant(self):
+        rng = np.random.default_rng(3)
+        receptors = _receptors(400, seed=3, max_distance=2000).assign(y=rng.uniform(-60, 60, 400))
+        schedule = pd.DataFrame({
+            'x': rng.uniform(0, 2000, 30), 'y': 0.0, 'start_month': rng.integers(0, 12, 30),
+            'duration_months': rng.integers(1, 6, 30), 'dba_at_15m': rng.uniform(75, 95, 30),
+            'ppv_at_reference_mms': rng.uniform(0, 15, 30), 'traffic_reduction_pct': 0.2,
+            'dust_generating': rng.random(30) < 0.5, 'night_work': rng.random(30) < 0.3
+        })
+        whole = corridor_injurious_affection(receptors, schedule)
+        chunked = corridor_injurious_affection(receptors, schedule, chunk_cells=1000)
+        pd.testing.assert_frame_equal(whole, chunked)
+        assert (whole['total_injurious_affection'] > 0).any()
+
+
+def _segment_distance(px, py, x0, y0, x1, y1):
+    """Point-to-segment distance, one pair at a time"""
+    dx, dy = x1 - x0, y1 - y0
+    t = ((px - x0) * dx + (py - y0) * dy) / (dx * dx + dy * dy) if (dx or dy) else 0.0
+    t = min(max(t, 0.0), 1.0)
+    return ((px - x0 - t * dx) ** 2 + (py - y0 - t * dy) ** 2) ** 0.5
+
+
+class TestWorkZoneIndex:
+    """Spatial proximity stage."""
+
+    @pytest.fixture
+    def corridor(self):
+        rng = np.random.default_rng(5)
+        receptors = pd.DataFrame(
+            {'x': rng.uniform(0, 3000, 300), 'y': rng.uniform(-250, 250, 300)},
+            index=[f'R{i:03d}' for i in range(300)]
+        )
+        x0 = rng.uniform(0, 3000, 40)
+        zones = pd.DataFrame({
+            'x0': x0, 'y0': rng.uniform(-30, 30, 40),
+            'x1': x0 + rng.uniform(0, 600, 40), 'y1': rng.uniform(-30, 30, 40),
+            'zone': [f'Z{i // 4}' for i in range(40)]     # polylines of 4 segments
+        })
+        return receptors, zones
+
+    def test_matches_brute_force(self, corridor):
+        receptors, zones = corridor
+        table = receptor_work_zone_distances(receptors, zones, radius_m=120, zone_column='zone')
+
+        polylines = {
+            zone_label: list(segments[['x0', 'y0', 'x1', 'y1']].itertuples(index=False))
+            for zone_label, segments in zones.groupby('zone')
+        }
+        expected = {}
+        for label, row in receptors.iterrows():
+            for zone_label, segments in polylines.items():
+                distance = min(_segment_distance(row['x'], row['y'], *segment) for segment in segments)
+                if distance <= 120:
+                    expected[(label, zone_label)] = distance
+
+        found = {(r, z): d for r, z, d in table.itertuples(index=False)}
+        assert set(found) == set(expected)
+        for key, distance in expected.items():
+            assert found[key] == pytest.approx(distance, abs=0.01)
+        # Sorted by receptor, then distance
+        assert all(group['distance_m'].is_monotonic_increasing for _, group in table.groupby('receptor'))
+
+    def test_nearest_only_and_points(self, corridor):
+        receptors, zones = corridor
+        nearest = receptor_work_zone_distances(receptors, zones, radius_m=120, zone_column='zone', nearest_only=True)
+        full = receptor_work_zone_distances(receptors, zones, radius_m=120, zone_column='zone')
+        assert nearest['receptor'].is_unique
+        assert nearest.set_index('receptor')['distance_m'].equals(full.groupby('receptor', sort=False)['distance_m'].min())
+
+        points = WorkZoneIndex(pd.DataFrame({'x': [0.0, 100.0], 'y': [0.0, 0.0]}))
+        table = points.query([0.0, 50.0, 500.0], [30.0, 0.0, 0.0], radius_m=60)
+        assert table[['receptor', 'zone']].values.tolist() == [[0, 0], [1, 0], [1, 1]]
+        assert table['distance_m'].tolist() == pytest.approx([30.0, 50.0, 50.0])
+
+    def test_radius_corridor_matches_dense(self, corridor):
+        receptors, zones = corridor
+        rng = np.random.default_rng(6)
+        receptors = receptors.assign(
+            property_type=rng.choice(['residential', 'commercial'], len(receptors)),
+            rental_income_monthly=2500.0, annual_revenue=400000.0
+        )
+        schedule = zones.assign(
+            start_month=rng.integers(0, 12, 40), duration_months=rng.integers(1, 6, 40),
+            dba_at_15m=rng.uniform(75, 95, 40), ppv_at_reference_mms=rng.uniform(0, 20, 40),
+            traffic_reduction_pct=0.3, night_work=rng.random(40) < 0.3, dust_generating=rng.random(40) < 0.7
+        )
+        dense = corridor_injurious_affection(receptors, schedule)
+        everything = corridor_injurious_affection(receptors, schedule, impact_radius_m=1e5, chunk_cells=500)
+        pd.testing.assert_frame_equal(dense, everything)
+
+        near = corridor_injurious_affection(receptors, schedule, impact_radius_m=300)
+        # Beyond the dust / traffic ranges, far sources only add negligible noise energy
+        assert near['dust_damage'].equals(dense['dust_damage'])
+        assert near['traffic_damage'].equals(dense['traffic_damage'])
+        assert (near['peak_noise_dba'] <= dense['peak_noise_dba'] + 1e-9).all()
+
+
+class TestValidation:
+    """Test input validation."""
+
+    def test_bad_inputs(self):
+        receptors = _receptors(3)
+        schedule = pd.DataFrame({'x': [0.0], 'y': [0.0], 'start_month': [0], 'duration_months': [2]})
+        with pytest.raises(ValueError, match="'duration_months'"):
+            corridor_injurious_affection(receptors, schedule.drop(columns='duration_months'))
+        with pytest.raises(ValueError, match="whole month"):
+            corridor_injurious_affection(receptors, schedule.assign(start_month=0.5))
+        with pytest.raises(ValueError, match="duration_months > 0"):
+            corridor_injurious_affection(receptors, schedule.assign(duration_months=0))
+        with pytest.raises(ValueError, match="Unknown property_type"):
+            corridor_injurious_affection(receptors.assign(property_type='farm'), schedule)
@@ -0,0 +1,165 @@
+"""
+Test suite for the land assembly optimizer.
+
+Tests include:
+- Single-negotiator schedules vs brute-force optimal order
+- Negotiator capacity, critical-first ordering and phase budgets
+- Incremental re-planning as parcels close
+- Input validation
+
+Run with: pytest test_land_assembly_utils.py -v
+"""
+
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+from Shared_Utils.land_assembly_utils import (
+    LandAssemblyOptimizer,
+    optimize_land_assembly
+)
+
+
+IMPACT = {
+    'interest_rate': 0.05,
+    'holdout_escalation': 0.10,
+    'construction_cost_per_day': 50000,
+    'target_completion_days': 120
+}
+
+
+def _corridor(n, seed=0):
+    rng = random.Random(seed)
+    return [
+        {
+            'id': f'P{i:04d}',
+            'estimated_value': rng.uniform(100000, 2000000),
+            'criticality': rng.choice(['critical', 'high', 'medium', 'low']),
+            'complexity': rng.choice(['low', 'medium', 'high']),
+            'holdout_risk': rng.random()
+        }
+        for i in range(n)
+    ]
+
+
+class TestScheduling:
+    """List scheduler output."""
+
+    def test_single_negotiator_is_optimal(self):
+        parcels = [{**p, 'criticality': 'high'} for p in _corridor(6, seed=3)]
+        optimizer = LandAssemblyOptimizer(parcels, {'negotiators': 1}, IMPACT)
+
+        best = min(
+            optimizer.daily_cost[list(order)] @ np.cumsum(optimizer.durations[list(order)])
+            for order in itertools.permutations(range(6))
+        )
+        assert optimizer.delay_cost()['carrying_and_holdout_cost'] == pytest.approx(best, abs=0.01)
+
+    def test_capacity_and_critical_first(self):
+        parcels = _corridor(600, seed=1)
+        resources = {'negotiators': 4, 'parcels_per_negotiator': 3}
+        plan = optimize_land_assembly(parcels, resources, IMPACT)
+        assignments = plan['assignments']
+
+        events = sorted(
+            (day, delta)
+            for a in assignments.values()
+            for day, delta in ((a['start_day'], 1), (a['finish_day'], -1))
+        )
+        concurrent = np.cumsum([delta for _, delta in events])   # finishes sort before same-day starts
+        assert concurrent.max() == 12
+
+        critical = [assignments[p['id']]['start_day'] for p in parcels if p['criticality'] == 'critical']
+        other = [assignments[p['id']]['start_day'] for p in parcels if p['criticality'] != 'critical']
+        assert max(critical) <= min(other)
+        assert sum(w['parcels'] for w in plan['negotiator_workload'].values()) == 600
+        assert sum(phase['count'] for phase in plan['phases']) == 600
+        assert plan['critical_completion_day'] <= plan['makespan_days']
+
+    def test_phase_budget(self):
+        parcels = _corridor(300, seed=2)
+        plan = optimize_land_assembly(
+            parcels, {'negotiators': 10, 'parcels_per_negotiator': 2}, IMPACT,
+            phase_days=60, budget_per_phase=20_000_000
+        )
+        assert len(plan['phases']) > 1
+        assert all(phase['committed_value'] <= 20_000_000 for phase in plan['phases'])
+        for phase in plan['phases']:
+            for parcel_id in phase['parcels']:
+                assert phase['start_day'] <= plan['assignments'][parcel_id]['start_day'] < phase['end_day']
+
+    def test_budget_skips_to_fitting_parcel(self):
+        # Y does not fit what is left of phase 1 after X; the smaller, lower-priority Z takes the slot
+        parcels = [
+            {'id': 'X', 'estimated_value': 90, 'criticality': 'critical', 'negotiation_days': 10},
+            {'id': 'Y', 'estimated_value': 50, 'criticality': 'critical', 'negotiation_days': 10},
+            {'id': 'Z', 'estimated_value': 5, 'criticality': 'low', 'negotiation_days': 10}
+        ]
+        optimizer = LandAssemblyOptimizer(parcels, {'negotiators': 1}, IMPACT, phase_days=60, budget_per_phase=100)
+        assignments = optimizer.plan()['assignments']
+        assert [assignments[p]['start_day'] for p in 'XZY'] == [0, 10, 60]
+
+
+class TestIncrementalReplan:
+    """close_parcel() keeps committed work and re-plans the rest."""
+
+    def test_close_replans_pending_only(self):
+        parcels = _corridor(200, seed=4)
+        optimizer = LandAssemblyOptimizer(parcels, {'negotiators': 5}, IMPACT)
+        before = optimizer.plan()['assignments']
+
+        in_progress = [pid for pid, a in before.items() if a['start_day'] < 40 < a['finish_day']]
+        closing = in_progress[0]
+        after = optimizer.close_parcel(closing, day=40)['assignments']
+
+        assert after[closing]['status'] == 'closed'
+        assert after[closing]['finish_day'] == 40
+        for pid in in_progress[1:]:
+            assert after[pid]['status'] == 'in_progress'
+            assert after[pid]['start_day'] == before[pid]['start_day']
+            assert after[pid]['negotiator'] == before[pid]['negotiator']
+        # The freed negotiator picks up the next parcel at the closing day
+        assert any(a['start_day'] == 40 and a['negotiator'] == before[closing]['negotiator'] for a in after.values())
+        assert all(a['start_day'] >= 40 for a in after.values() if a['status'] == 'planned')
+
+    def test_voluntary_sale_and_delay(self):
+        parcels = _corridor(50, seed=5)
+        optimizer = LandAssemblyOptimizer(parcels, {'negotiators': 2}, IMPACT)
+        planned_last = max(optimizer.plan()['assignments'].items(), key=lambda kv: kv[1]['start_day'])[0]
+
+        plan = optimizer.close_parcel(planned_last, day=10)
+        assert plan['assignments'][planned_last]['negotiator'] is None
+        assert plan['num_closed'] == 1
+
+        # Parcels past their planned finish are assumed to close no earlier than today
+        plan = optimizer.close_parcel(parcels[0]['id'], day=500)
+        assert all(a['finish_day'] >= 500 for a in plan['assignments'].values() if a['status'] == 'in_progress')
+
+
+class TestValidation:
+    """Test input validation."""
+
+    def test_bad_inputs(self):
+        parcels = _corridor(5)
+        with pytest.raises(ValueError, match="negotiators"):
+            LandAssemblyOptimizer(parcels, {'negotiators': 0}, IMPACT)
+        with pytest.raises(ValueError, match="budget_per_phase"):
+            LandAssemblyOptimizer(parcels, {}, IMPACT, budget_per_phase=1000)
+        with pytest.raises(ValueError, match="unique"):
+            LandAssemblyOptimizer(parcels + parcels[:1], {}, IMPACT)
+
+    def test_bad_closings(self):
+        optimizer = LandAssemblyOptimizer(_corridor(5), {}, IMPACT)
+        optimizer.close_parcel('P0000', day=30)
+        with pytest.raises(ValueError, match="already closed"):
+            optimizer.close_parcel('P0000', day=40)
+        with pytest.raises(ValueError, match="before the last"):
+            optimizer.close_parcel('P0001', day=10)
+        with pytest.raises(ValueError, match="Unknown parcel"):
+            optimizer.close_parcel('Z', day=40)
+
+    def test_empty(self):
+        plan = optimize_land_assembly([], {}, IMPACT)
+        assert plan['phases'] == [] and plan['makespan_days'] == 0
@@ -0,0 +1,218 @@
+"""
+Test suite for the monthly renewal/relocation cash-flow engine.
+
+Tests include:
+- Monthly vectors vs hand-built schedules (free rent, TI draws, overlap rent)
+- NPV / NER on the shared monthly curve
+- Scenario functions with cash_flow_basis='monthly'
+- Batched portfolio comparison vs per-site compare_scenarios()
+- Input validation
+
+Run with: pytest test_monthly_cash_flows.py -v
+"""
+
+import random
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from Renewal_Analysis.renewal_analysis import (
+    RenewalScenario,
+    RelocationScenario,
+    GeneralInputs,
+    calculate_renewal_scenario,
+    calculate_relocation_scenario,
+    compare_scenarios
+)
+from Renewal_Analysis.monthly_cash_flows import (
+    renewal_cash_flows,
+    relocation_cash_flows,
+    summarize_cash_flows,
+    compare_sites_monthly
+)
+
+
+@pytest.fixture
+def general():
+    return GeneralInputs(rentable_area_sf=12000, discount_rate=0.08, current_rent_psf=30.0)
+
+
+@pytest.fixture
+def renewal():
+    return RenewalScenario(
+        annual_rent_psf=[25.0, 26.0, 27.0],
+        term_years=5,
+        ti_allowance_psf=5.0,
+        additional_ti_psf=15.0,
+        operating_costs_psf=8.0,
+        legal_fees=10000,
+        renovation_costs_psf=2.0
+    )
+
+
+@pytest.fixture
+def relocation():
+    return RelocationScenario(
+        annual_rent_psf=[21.0, 22.0, 23.0],
+        term_years=7,
+        ti_allowance_psf=20.0,
+        ti_requirement_psf=45.0,
+        operating_costs_psf=9.0,
+        moving_costs=60000,
+        it_moving_costs=20000,
+        signage_costs=5000,
+        downtime_days=3,
+        daily_revenue=8000,
+        customer_loss_pct=0.01,
+        unamortized_improvements=30000,
+        restoration_costs=20000,
+        legal_fees=15000,
+        due_diligence_costs=5000,
+        broker_fees=10000,
+        free_rent_months=3,
+        ti_draw_schedule=[(0, 0.5), (4, 0.5)],
+        overlap_months=2
+    )
+
+
+def _monthly_v(rate, months):
+    return (1 + rate) ** (-np.arange(months) / 12)
+
+
+class TestCashFlowVectors:
+    """Monthly vectors vs hand-built schedules."""
+
+    def test_relocation_vector(self, relocation, general):
+        flows = relocation_cash_flows([relocation], general)
+        area = general.rentable_area_sf
+
+        expected = np.repeat([21.0, 22.0, 23.0, 23.0, 23.0, 23.0, 23.0], 12) * area / 12
+        expected[:3] = 0.0                                      # free rent
+        expected += 9.0 * area / 12                             # operating costs
+        expected[:2] += 30.0 * area / 12                        # overlap at current rent
+        expected[0] += 85000 + 24000 + 29200 + 50000 + 30000    # moving, disruption, abandonment, leasing
+        expected[[0, 4]] += 25.0 * area / 2                     # staggered TI
+
+        assert flows.total.shape == (1, 84)
+        assert flows.total[0] == pytest.approx(expected)
+
+        summary = summarize_cash_flows(flows)
+        assert summary.loc[0, 'npv'] == pytest.approx(expected @ _monthly_v(0.08, 84))
+
+    def test_renewal_ner_uses_annuity_due(self, general):
+        flat = RenewalScenario(annual_rent_psf=[24.0], term_years=5)
+        row = summarize_cash_flows(renewal_cash_flows([flat], general)).iloc[0]
+        # Level rent paid in advance: NER is the monthly rent per sf
+        assert row['net_effective_rent_psf'] == pytest.approx(24.0 / 12)
+
+    def test_annual_cash_flows_aggregate_months(self, renewal, general):
+        flows = renewal_cash_flows([renewal], general)
+        annual = flows.annual_cash_flows()[0]
+        area = general.rentable_area_sf
+        assert annual == pytest.approx((np.array([25, 26, 27, 27, 27]) + 8.0) * area)
+
+
+class TestScenarioFunctions:
+    """calculate_*_scenario() and compare_scenarios() on the monthly basis."""
+
+    def test_monthly_basis_matches_engine(self, renewal, relocation, general):
+        renewal_result = calculate_renewal_scenario(renewal, general, cash_flow_basis='monthly')
+        relocation_result = calculate_relocation_scenario(relocation, general, cash_flow_basis='monthly')
+
+        assert renewal_result.npv == pytest.approx(
+            summarize_cash_flows(renewal_cash_flows([renewal], general)).loc[0, 'npv']
+        )
+        assert relocation_result.cost_breakdown['overlap_rent'] == pytest.approx(2 * 30.0 * 12000 / 12)
+        assert relocation_result.total_cash_outflows == pytest.approx(sum(relocation_result.monthly_cash_flows))
+        assert len(relocation_result.annual_cash_flows) == relocation.term_years
+
+    def test_annual_basis_unchanged(self, renewal, relocation, general):
+        # Monthly timing fields are ignored on the annual basis
+        plain = replace(relocation, free_rent_months=0, ti_draw_schedule=None, overlap_months=0)
+        assert calculate_relocation_scenario(relocation, general).npv == pytest.approx(
+            calculate_relocation_scenario(plain, general).npv
+        )
+
+    def test_free_rent_lowers_npv(self, renewal, general):
+        base = calculate_renewal_scenario(renewal, general, cash_flow_basis='monthly')
+        free = calculate_renewal_scenario(replace(renewal, free_rent_months=6), general, cash_flow_basis='monthly')
+        assert base.npv - free.npv == pytest.approx(25.0 * 12000 / 12 * _monthly_v(0.08, 6).sum())
+
+    def test_monthly_breakeven_equalizes_npv(self, renewal, relocation, general):
+        comparison = compare_scenarios(renewal, relocation, general, cash_flow_basis='monthly')
+        at_breakeven = replace(renewal, annual_rent_psf=[comparison.breakeven_rent_psf] * renewal.term_years)
+        assert calculate_renewal_scenario(at_breakeven, general, 'monthly').npv == pytest.approx(
+            comparison.relocation_result.npv, rel=1e-3
+        )
+
+    def test_invalid_basis(self, renewal, general):
+        with pytest.raises(ValueError, match="cash_flow_basis"):
+            calculate_renewal_scenario(renewal, general, cash_flow_basis='quarterly')
+
+
+class TestPortfolio:
+    """Batched comparison vs per-site scalar results."""
+
+    def test_batch_matches_compare_scenarios(self, renewal, relocation):
+        rng = random.Random(7)
+        renewals, relocations, generals = [], [], []
+        for _ in range(25):
+            renewals.append(replace(
+                renewal,
+                annual_rent_psf=[rng.uniform(15, 40)],
+                term_years=rng.randint(3, 10),
+                free_rent_months=rng.randint(0, 6)
+            ))
+            relocations.append(replace(
+                relocation,
+                term_years=rng.randint(3, 10),
+                free_rent_months=rng.randint(0, 9),
+                ti_draw_schedule=[(0, 0.3), (rng.randint(1, 6), 0.7)],
+                overlap_months=rng.randint(0, 4),
+                moving_costs=rng.uniform(0, 200000)
+            ))
+            generals.append(GeneralInputs(
+                rentable_area_sf=rng.uniform(5000, 50000),
+                discount_rate=rng.choice([0.0, 0.06, 0.10]),
+                current_rent_psf=rng.uniform(20, 40)
+            ))
+
+        batch = compare_sites_monthly(renewals, relocations, generals)
+        assert len(batch) == 25
+
+        for i, (ren, rel, gen) in enumerate(zip(renewals, relocations, generals)):
+            comparison = compare_scenarios(ren, rel, gen, cash_flow_basis='monthly')
+            row = batch.iloc[i]
+            assert row['renewal_npv'] == pytest.approx(comparison.renewal_result.npv)
+            assert row['relocation_npv'] == pytest.approx(comparison.relocation_result.npv)
+            assert row['ner_difference_psf'] == pytest.approx(comparison.ner_difference_psf)
+            if comparison.relocation_irr is None:
+                assert np.isnan(row['relocation_irr'])
+            else:
+                assert row['relocation_irr'] == pytest.approx(comparison.relocation_irr, abs=1e-4)
+            # Scalar breakeven is a binary search with 0.1% NPV tolerance
+            assert row['breakeven_rent_psf'] == pytest.approx(comparison.breakeven_rent_psf, rel=1e-2)
+
+    def test_length_mismatch(self, renewal, relocation, general):
+        with pytest.raises(ValueError, match="same length"):
+            compare_sites_monthly([renewal, renewal], [relocation], general)
+        with pytest.raises(ValueError, match="GeneralInputs"):
+            renewal_cash_flows([renewal, renewal], [general])
+
+
+class TestValidation:
+    """Test timing input validation."""
+
+    @pytest.mark.parametrize('schedule, match', [
+        ([(0, 0.5), (3, 0.4)], "sum to 1"),
+        ([(0, 0.5), (60, 0.5)], "outside lease term"),
+        ([(0, 1.5), (2, -0.5)], "non-negative"),
+    ])
+    def test_bad_ti_draws(self, renewal, general, schedule, match):
+        with pytest.raises(ValueError, match=match):
+            renewal_cash_flows([replace(renewal, ti_draw_schedule=schedule)], general)
+
+    def test_negative_free_rent(self, renewal, general):
+        with pytest.raises(ValueError, match="free_rent_months"):
+            renewal_cash_flows([replace(renewal, free_rent_months=-1)], general)
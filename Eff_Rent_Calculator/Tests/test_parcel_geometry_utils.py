@@ -0,0 +1,276 @@
+"""
+Test suite for parcel geometry shape efficiency and frontage.
+
+Tests include:
+- Area, perimeter, compactness and efficiency index of rectangles, holes
+  and multi-part parcels vs calculate_shape_efficiency_index()
+- Frontage against road centrelines (side lot lines excluded), dominant
+  road classification and landlocked detection
+- GeoJSON (planar and lon/lat) and GeoPackage readers
+- severance_geometry_tables() feeding severance_damages_frame()
+- Input validation
+
+Run with: pytest test_parcel_geometry_utils.py -v
+"""
+
+import importlib.util
+import json
+import sqlite3
+import struct
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from Shared_Utils.parcel_geometry_utils import (
+    FEET_PER_METRE,
+    EARTH_RADIUS_M,
+    GeometryLayer,
+    read_layer,
+    parcel_geometry_frame,
+    severance_geometry_tables
+)
+from Shared_Utils.severance_utils import severance_damages_frame
+
+
+ORIGINAL = (
+    Path(__file__).resolve().parents[2]
+    / 'docs' / 'skills' / 'severance-damages-quantification' / 'severance_calculator_original.py'
+)
+
+ROAD_OFFSET_M = 15.0   # Property line to road centreline
+
+
+@pytest.fixture(scope='module')
+def original():
+    spec = importlib.util.spec_from_file_location('severance_calculator_original', ORIGINAL)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _rectangle(x, y, width, depth):
+    return [[x, y], [x + width, y], [x + width, y + depth], [x, y + depth], [x, y]]
+
+
+def _feature(parcel_id, coordinates, kind='Polygon', **properties):
+    return {'type': 'Feature', 'id': parcel_id, 'geometry': {'type': kind, 'coordinates': coordinates},
+            'properties': {'parcel_id': parcel_id, **properties}}
+
+
+def _lots(n, seed=0):
+    """Rectangular lots north of a road along y = 0, set back ROAD_OFFSET_M"""
+    rng = np.random.default_rng(seed)
+    widths = rng.uniform(20, 120, n)
+    depths = rng.uniform(30, 300, n)
+    starts = np.concatenate([[0], np.cumsum(widths + 5)[:-1]])
+    return [
+        _feature(f'P{i:04d}', [_rectangle(x, ROAD_OFFSET_M, w, d)])
+        for i, (x, w, d) in enumerate(zip(starts, widths, depths))
+    ], widths, depths
+
+
+def _roads(length):
+    return [
+        _feature('R1', [[-50, 0], [length / 2, 0]], 'LineString', road_classification='arterial'),
+        _feature('R2', [[length / 2, 0], [length + 50, 0]], 'LineString', road_classification='local')
+    ]
+
+
+def _write_geopackage(path, features, srs_id=0):
+    """Minimal GeoPackage: one feature table of WKB (XYZ) polygons with envelopes"""
+    connection = sqlite3.connect(path)
+    connection.executescript("""
+        CREATE TABLE gpkg_spatial_ref_sys (srs_name TEXT, srs_id INTEGER PRIMARY KEY, organization TEXT,
+            organization_coordsys_id INTEGER, definition TEXT);
+        CREATE TABLE gpkg_contents (table_name TEXT PRIMARY KEY, data_type TEXT);
+        CREATE TABLE gpkg_geometry_columns (table_name TEXT, column_name TEXT, srs_id INTEGER);
+        CREATE TABLE parcels (fid INTEGER PRIMARY KEY, parcel_id TEXT, geom BLOB);
+        INSERT INTO gpkg_spatial_ref_sys VALUES ('local', 0, 'NONE', 0, 'undefined');
+        INSERT INTO gpkg_contents VALUES ('parcels', 'features');
+    """)
+    connection.execute("INSERT INTO gpkg_geometry_columns VALUES ('parcels', 'geom', ?)", (srs_id,))
+    for fid, feature in enumerate(features, start=1):
+        rings = feature['geometry']['coordinates']
+        wkb = struct.pack('<BII', 1, 1003, len(rings))   # ISO Polygon Z
+        for ring in rings:
+            wkb += struct.pack('<I', len(ring)) + b''.join(struct.pack('<3d', x, y, 0.0) for x, y in ring)
+        xy = np.array(rings[0])
+        header = b'GP' + bytes([0, 0b11]) + struct.pack('<i', srs_id) + struct.pack(
+            '<4d', xy[:, 0].min(), xy[:, 0].max(), xy[:, 1].min(), xy[:, 1].max()
+        )
+        connection.execute("INSERT INTO parcels VALUES (?, ?, ?)", (fid, feature['id'], header + wkb))
+    connection.commit()
+    connection.close()
+
+
+class TestShapeMeasures:
+    """Area, perimeter and efficiency from polygons."""
+
+    def test_rectangles_match_rectangle_index(self, original):
+        features, widths, depths = _lots(50)
+        result = parcel_geometry_frame(GeometryLayer(features))
+
+        acres = widths * depths / 4046.86
+        assert result['acres'].to_numpy() == pytest.approx(acres, rel=1e-4)
+        assert result['perimeter_lf'].to_numpy() == pytest.approx(2 * (widths + depths) * FEET_PER_METRE)
+        for (w, d), row in zip(zip(widths, depths), result.itertuples()):
+            frontage_lf = w * FEET_PER_METRE
+            assert row.efficiency_index == pytest.approx(
+                original.calculate_shape_efficiency_index(row.acres, frontage_lf, frontage_depth_ratio=w / d),
+                rel=1e-4
+            )
+        assert 'frontage_lf' not in result
+
+    def test_holes_and_multipart(self):
+        square = _rectangle(0, 0, 100, 100)
+        hole = _rectangle(40, 40, 20, 20)[::-1]
+        layer = GeometryLayer([
+            _feature('hole', [square, hole]),
+            _feature('split', [[square], [_rectangle(200, 0, 100, 100)]], 'MultiPolygon'),
+            _feature('circle', [[[50 * np.cos(t), 50 * np.sin(t)] for t in np.linspace(0, 2 * np.pi, 721)]])
+        ])
+        result = parcel_geometry_frame(layer)
+        assert result.loc['hole', 'acres'] == pytest.approx(9600 / 4046.86)
+        assert result.loc['hole', 'perimeter_lf'] == pytest.approx(480 * FEET_PER_METRE)
+        assert result.loc['split', 'acres'] == pytest.approx(20000 / 4046.86)
+        assert result.loc['split', 'efficiency_index'] == pytest.approx(4 * np.sqrt(20000) / 800)
+        assert result.loc['circle', 'compactness'] == pytest.approx(1.0, abs=1e-4)
+
+
+class TestFrontage:
+    """Frontage against road centrelines."""
+
+    def test_frontage_and_landlocked(self):
+        features, widths, depths = _lots(200, seed=1)
+        length = features[-1]['geometry']['coordinates'][0][1][0]
+        features.append(_feature('back', [_rectangle(0, 400, 50, 50)]))
+        result = parcel_geometry_frame(GeometryLayer(features), GeometryLayer(_roads(length)))
+
+        lots = result.iloc[:-1]
+        # Side lot lines within the buffer are not counted; piece ends cost < 1 piece
+        assert lots['frontage_lf'].to_numpy() == pytest.approx(widths * FEET_PER_METRE, abs=2 * FEET_PER_METRE)
+        assert not lots['landlocked'].any()
+        assert result.loc['back', 'landlocked'] and result.loc['back', 'frontage_lf'] == 0
+
+        starts = np.array([f['geometry']['coordinates'][0][0][0] for f in features[:-1]])
+        expected = np.where(starts + widths / 2 < length / 2, 'arterial', 'local')
+        clear = np.abs(starts + widths / 2 - length / 2) > widths / 2
+        assert (lots['road_classification'].to_numpy()[clear] == expected[clear]).all()
+
+    def test_per_road_buffer(self):
+        features, _, _ = _lots(10, seed=2)
+        roads = _roads(5000)
+        for road in roads:
+            road['properties']['frontage_buffer_m'] = 10.0
+        result = parcel_geometry_frame(GeometryLayer(features), GeometryLayer(roads))
+        assert result['landlocked'].all()
+
+
+class TestReaders:
+    """GeoJSON and GeoPackage input."""
+
+    def test_geojson_planar_and_lonlat(self, tmp_path):
+        features, widths, depths = _lots(30, seed=3)
+        planar = tmp_path / 'lots.geojson'
+        planar.write_text(json.dumps({
+            'type': 'FeatureCollection', 'crs': {'type': 'name', 'properties': {'name': 'EPSG:26917'}},
+            'features': features
+        }))
+        projected = parcel_geometry_frame(read_layer(planar, id_field='parcel_id'))
+
+        # Same lots in lon/lat around 43.7N, 79.4W
+        lon0, lat0 = -79.4, 43.7
+        for feature in features:
+            feature['geometry']['coordinates'] = [[
+                [lon0 + np.degrees(x / (EARTH_RADIUS_M * np.cos(np.radians(lat0)))), lat0 + np.degrees(y / EARTH_RADIUS_M)]
+                for x, y in ring
+            ] for ring in feature['geometry']['coordinates']]
+        lonlat = tmp_path / 'lots_wgs84.geojson'
+        lonlat.write_text(json.dumps({'type': 'FeatureCollection', 'features': features}))
+        layer = read_layer(lonlat, id_field='parcel_id')
+        assert layer.geographic
+        geographic = parcel_geometry_frame(layer)
+
+        assert geographic.index.equals(projected.index)
+        assert geographic['acres'].to_numpy() == pytest.approx(projected['acres'].to_numpy(), rel=1e-3)
+        assert geographic['efficiency_index'].to_numpy() == pytest.approx(
+            projected['efficiency_index'].to_numpy(), rel=1e-3
+        )
+
+    def test_geopackage(self, tmp_path):
+        features, _, _ = _lots(25, seed=4)
+        features[0]['geometry']['coordinates'].append(_rectangle(5, 20, 5, 5)[::-1])
+        path = tmp_path / 'lots.gpkg'
+        _write_geopackage(path, features)
+
+        layer = read_layer(path, id_field='parcel_id')
+        assert not layer.geographic
+        assert list(layer.properties['fid']) == list(range(1, 26))
+        from_gpkg = parcel_geometry_frame(layer)
+        from_geojson = parcel_geometry_frame(GeometryLayer(features))
+        pd.testing.assert_frame_equal(from_gpkg, from_geojson, check_names=False)
+
+
+class TestSeveranceTables:
+    """Geometry feeding the severance damages register."""
+
+    def test_feeds_severance_frame(self, original):
+        n = 40
+        before_features, widths, depths = _lots(n, seed=5)
+        taken = np.random.default_rng(6).uniform(0.1, 0.6, n) * depths
+        # Rear takings keep the frontage; every tenth takes the front strip
+        # and leaves the remainder landlocked
+        front = np.arange(n) % 10 == 0
+        after_features = [
+            _feature(feature['id'], [_rectangle(
+                feature['geometry']['coordinates'][0][0][0], ROAD_OFFSET_M + (t if strip else 0.0), w, d - t
+            )])
+            for feature, w, d, t, strip in zip(before_features, widths, depths, taken, front)
+        ]
+        roads = GeometryLayer(_roads(n * 130))
+
+        before, taking, remainder = severance_geometry_tables(
+            GeometryLayer(before_features), GeometryLayer(after_features), roads
+        )
+        assert (remainder['access_type'] == np.where(front, 'landlocked', 'direct')).all()
+        assert (taking['creates_landlocked'] == front).all()
+        assert taking['frontage_lost_linear_feet'].to_numpy() == pytest.approx(
+            np.where(front, widths * FEET_PER_METRE, 0.0), abs=2 * FEET_PER_METRE
+        )
+        assert taking['area_taken_acres'].to_numpy() == pytest.approx(widths * taken / 4046.86, rel=1e-4)
+
+        attributes = pd.DataFrame({'value_per_acre': 250000.0, 'use': 'commercial'}, index=before.index)
+        register = severance_damages_frame(
+            before.join(attributes), taking.assign(creates_irregular_shape=True), remainder
+        )
+        assert set(register['road_classification']) == {'arterial', 'local'}
+        for row, w, d, t in zip(register.itertuples(), widths, depths, taken):
+            rectangle = original.calculate_shape_efficiency_index(
+                row.remainder_acres, w * FEET_PER_METRE, frontage_depth_ratio=w / (d - t)
+            )
+            assert row.efficiency_index_after == pytest.approx(rectangle, rel=1e-4)
+            assert row.efficiency_category == original.categorize_shape_efficiency(rectangle)
+        assert (register['landlocked_remedy_cost'] > 0).to_numpy().tolist() == front.tolist()
+
+
+class TestValidation:
+    """Test input validation."""
+
+    def test_bad_layers(self, tmp_path):
+        features, _, _ = _lots(3)
+        with pytest.raises(ValueError, match="all polygons or all lines"):
+            GeometryLayer(features + _roads(100))
+        with pytest.raises(ValueError, match="unique"):
+            GeometryLayer(features + features[:1])
+        with pytest.raises(ValueError, match="polygon layer"):
+            parcel_geometry_frame(GeometryLayer(_roads(100)))
+        with pytest.raises(ValueError, match="both be lon/lat"):
+            parcel_geometry_frame(GeometryLayer(features), GeometryLayer(_roads(100), geographic=True))
+        with pytest.raises(ValueError, match="without a before parcel"):
+            severance_geometry_tables(
+                GeometryLayer(features[:1]), GeometryLayer(features), GeometryLayer(_roads(100))
+            )
+        with pytest.raises(ValueError, match="Unsupported geometry file"):
+            read_layer(tmp_path / 'lots.shp')
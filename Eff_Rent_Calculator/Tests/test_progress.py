@@ -0,0 +1,197 @@
+"""
+Test suite for structured progress events.
+
+Tests include:
+- Levels, counters and lazy message formatting per reporter (quiet,
+  console, logging, collecting)
+- progress() adapter: counts items, draws a bar only when asked to
+- REALESTATE_LOG_LEVEL default reporter
+- Calculators emit events instead of printing: relative valuation, MCDA,
+  paired sales, comparable sales factor merge, MLS Excel formatter
+
+Run with: pytest test_progress.py -v
+"""
+
+import contextlib
+import io
+import json
+import logging
+import os
+import subprocess
+import sys
+
+import pytest
+
+from Shared_Utils.cli import REPO_ROOT
+from Shared_Utils.progress import (
+    DEBUG, INFO, WARNING, CollectingReporter, ConsoleReporter, LoggingReporter,
+    count, emit, enabled, get_reporter, progress, quiet, reporting
+)
+
+sys.path[:0] = [str(REPO_ROOT / 'MCDA_Sales_Comparison'), str(REPO_ROOT / 'Comparable_Sales_Analysis')]
+
+RELATIVE_VALUATION_INPUT = REPO_ROOT / 'Relative_Valuation' / 'test_fix_edge_cases.json'
+COMPARABLE_SALES_INPUT = REPO_ROOT / 'Comparable_Sales_Analysis' / 'sample_inputs' / 'sample_industrial_comps.json'
+
+
+class _Unformattable:
+    def __format__(self, spec):
+        raise AssertionError("message formatted while hidden")
+
+
+class TestReporters:
+    """Levels, counters and output."""
+
+    def test_quiet_counts_without_formatting(self):
+        with quiet() as reporter:
+            emit('calc', 'step', "value {value}", value=_Unformattable())
+            emit('calc', 'step', "again")
+            count('calc', 'rows', 5)
+            assert not enabled(WARNING)
+        assert reporter.summary() == {'calc.rows': 5, 'calc.step': 2}
+
+    def test_console_levels(self):
+        stream = io.StringIO()
+        with reporting(ConsoleReporter(level=WARNING, stream=stream)):
+            emit('calc', 'info', "hidden {n}", n=1)
+            emit('calc', 'warn', "shown {n:.1f} {{literal}}", WARNING, n=2)
+            emit('calc', 'plain', "{not a template}", WARNING)
+            assert enabled(WARNING) and not enabled(INFO)
+        assert stream.getvalue() == "shown 2.0 {literal}\n{not a template}\n"
+
+    def test_console_follows_redirected_stdout(self):
+        stdout = io.StringIO()
+        with reporting(ConsoleReporter()), contextlib.redirect_stdout(stdout):
+            emit('calc', 'step', "Loaded {count} properties", count=3)
+        assert stdout.getvalue() == "Loaded 3 properties\n"
+
+    def test_collecting(self):
+        with reporting(CollectingReporter(level=INFO)) as reporter:
+            emit('calc', 'debug', "hidden", DEBUG)
+            emit('calc', 'loaded', "Loaded {count}", count=4)
+        assert [event.to_dict()['message'] for event in reporter.events] == ['Loaded 4']
+        assert reporter.events[0].fields == {'count': 4}
+        assert reporter.summary() == {'calc.debug': 1, 'calc.loaded': 1}
+
+    def test_logging(self, caplog):
+        with caplog.at_level(logging.INFO, logger='realestate'), reporting(LoggingReporter()):
+            emit('calc', 'excluded', "Excluded {address}", WARNING, address='1 Main St')
+        record = caplog.records[-1]
+        assert (record.name, record.levelno, record.getMessage()) == ('realestate.calc', WARNING, 'Excluded 1 Main St')
+        assert record.event == 'excluded' and record.fields == {'address': '1 Main St'}
+
+    def test_reporting_restores(self):
+        previous = get_reporter()
+        with pytest.raises(RuntimeError):
+            with quiet():
+                raise RuntimeError
+        assert get_reporter() is previous
+
+    def test_environment_level(self):
+        script = (
+            "from Shared_Utils.progress import WARNING, emit\n"
+            "emit('calc', 'info', 'info line')\n"
+            "emit('calc', 'warn', 'warning line', WARNING)\n"
+        )
+        outputs = {}
+        for level in ('info', 'warning', 'quiet'):
+            env = dict(os.environ, REALESTATE_LOG_LEVEL=level, PYTHONPATH=str(REPO_ROOT))
+            outputs[level] = subprocess.run([sys.executable, '-c', script], env=env, check=True,
+                                            capture_output=True, text=True).stdout
+        assert outputs == {'info': 'info line\nwarning line\n', 'warning': 'warning line\n', 'quiet': ''}
+
+
+class TestProgress:
+    """progress() adapter."""
+
+    def test_counts_items(self):
+        with quiet() as reporter:
+            assert list(progress(range(4), 'Rows', counter='calc.rows')) == [0, 1, 2, 3]
+            for _ in progress(iter('abc'), 'Rows', counter='calc.rows'):
+                break
+        assert reporter.summary() == {'calc.rows': 5}
+
+    def test_bar(self, monkeypatch):
+        stderr = io.StringIO()
+        monkeypatch.setattr(sys, 'stderr', stderr)
+        monkeypatch.setitem(sys.modules, 'tqdm', None)   # Built-in bar even where tqdm is installed
+        with reporting(ConsoleReporter(bars=True)):
+            assert sum(progress([1, 2, 3], 'Scoring')) == 6
+            list(progress(iter([1, 2]), 'Streaming'))
+        lines = stderr.getvalue().split('\n')
+        assert lines[0].startswith('\rScoring |') and lines[0].endswith(']') and '3/3 100%' in lines[0]
+        assert 'Streaming 2 [' in lines[1]
+
+    def test_no_bar_off_terminal(self):
+        stderr = io.StringIO()
+        with reporting(ConsoleReporter()), contextlib.redirect_stderr(stderr):
+            list(progress(range(3), 'Rows'))
+        assert stderr.getvalue() == ''
+
+
+class TestCalculatorEvents:
+    """Calculators emit events instead of printing."""
+
+    def test_relative_valuation(self):
+        from Relative_Valuation.relative_valuation_calculator import (
+            get_tenant_persona_weights, prepare_comparable_data, run_analysis
+        )
+        data = json.loads(RELATIVE_VALUATION_INPUT.read_text())
+        data['weights'] = get_tenant_persona_weights('default')
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout), reporting(CollectingReporter()) as reporter:
+            results = run_analysis(prepare_comparable_data(data))
+        assert stdout.getvalue() == ''
+        assert results.subject_property['final_rank'] >= 1
+        summary = reporter.summary()
+        assert summary['relative_valuation.loaded'] == 1
+        assert summary['relative_valuation.weight'] == len(results.weights_used)
+        assert {event.name for event in reporter.events if event.level == WARNING} >= {'subject_fails_filters'}
+
+        with reporting(ConsoleReporter()), contextlib.redirect_stdout(stdout):
+            run_analysis(prepare_comparable_data(data))
+        assert '🔍 Running Relative Valuation Analysis...' in stdout.getvalue()
+        assert f"Loaded {results.total_properties} properties for analysis" in stdout.getvalue()
+
+    def test_mcda(self):
+        from mcda_sales_calculator import run_analysis
+        from Shared_Utils.synthetic_data import iter_records
+        document = next(iter_records('comparables', 1, size=6))
+        document['comparable_sales'][0]['conditions_of_sale'] = {'arms_length': False}
+        with reporting(CollectingReporter()) as reporter:
+            run_analysis(document)
+        summary = reporter.summary()
+        assert summary['mcda.comparables_scored'] == 5 and summary['mcda.excluded'] == 1
+        assert [event.fields['valid'] for event in reporter.events if event.name == 'validated'] == [5]
+
+    def test_paired_sales(self):
+        from paired_sales_analyzer import PairedSalesAnalyzer
+        data = json.loads(COMPARABLE_SALES_INPUT.read_text())
+        analyzer = PairedSalesAnalyzer(data['comparable_sales'], data['subject_property'], property_type='industrial')
+        with reporting(CollectingReporter()) as reporter:
+            analyzer.analyze_all()
+        assert [event.message for event in reporter.events] == analyzer.analysis_log
+        assert all(event.level == DEBUG for event in reporter.events)
+        assert reporter.summary().get('paired_sales.disclosure', 0) == len(analyzer.disclosures)
+
+    def test_comparable_sales_merge(self):
+        from comparable_sales_calculator import ComparableSalesCalculator
+        data = json.loads(COMPARABLE_SALES_INPUT.read_text())
+        derived = {'factors': {'appreciation_rate_annual_pct': {'value': 4.0, 'confidence': 'high'}}}
+        with reporting(CollectingReporter()) as reporter:
+            calculator = ComparableSalesCalculator(data, derived_factors=derived)
+        assert calculator.effective_factors['appreciation_rate_annual'] == 4.0
+        assert calculator.factor_sources['appreciation_rate_annual'] == 'derived_from_paired_sales'
+        assert reporter.summary()['comparable_sales.derived_factors'] == 1
+
+    def test_mls_excel(self, tmp_path):
+        openpyxl = pytest.importorskip('openpyxl')
+        from MLS_Extractor.excel_formatter import create_perfect_excel
+        properties = [{'address': f'{i} Main St', 'available_sf': 1000 * i, 'is_subject': i == 1}
+                      for i in range(1, 4)]
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout), quiet() as reporter:
+            create_perfect_excel(properties, str(tmp_path / 'mls.xlsx'))
+        assert stdout.getvalue() == ''
+        assert reporter.summary() == {'mls_excel.rows': 3, 'mls_excel.created': 1}
+        assert openpyxl.load_workbook(tmp_path / 'mls.xlsx').active.max_row == 4
@@ -0,0 +1,205 @@
+"""
+Test suite for batch holdout/litigation scoring and batch negotiation analytics.
+
+Tests include:
+- assess_holdout_risk_frame() / litigation_risk_assessment_frame() vs the
+  scalar functions on random profiles (including missing and unknown levels)
+- Ranked portfolio scoring
+- calculate_batna_frame() / probability_weighted_ev_frame() vs scalar
+- Input validation
+
+Run with: pytest test_risk_portfolio.py -v
+"""
+
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from Shared_Utils.risk_utils import (
+    assess_holdout_risk,
+    litigation_risk_assessment,
+    assess_holdout_risk_frame,
+    litigation_risk_assessment_frame,
+    score_risk_portfolio
+)
+from Shared_Utils.negotiation_utils import (
+    calculate_batna,
+    probability_weighted_ev,
+    calculate_batna_frame,
+    probability_weighted_ev_frame
+)
+
+
+def _maybe(rng, levels):
+    """A level, occasionally missing or unknown"""
+    roll = rng.random()
+    if roll < 0.1:
+        return None
+    if roll < 0.15:
+        return 'unknown'
+    return rng.choice(levels)
+
+
+def _owner_profile(rng):
+    sections = {
+        'motivation': {
+            'financial_need': _maybe(rng, ['low', 'medium', 'high']),
+            'emotional_attachment': _maybe(rng, ['low', 'medium', 'high']),
+            'business_impact': _maybe(rng, ['minimal', 'moderate', 'critical'])
+        },
+        'sophistication': {
+            'real_estate_experience': _maybe(rng, ['low', 'medium', 'high']),
+            'legal_representation': rng.choice([True, False, None]),
+            'previous_negotiations': rng.choice([0, 1, 2, 3, 5, None])
+        },
+        'alternatives': {
+            'relocation_options': _maybe(rng, ['many', 'some', 'limited', 'none']),
+            'financial_flexibility': _maybe(rng, ['low', 'medium', 'high']),
+            'timeline_pressure': _maybe(rng, ['low', 'medium', 'high'])
+        }
+    }
+    # Missing levels are absent keys in the scalar API
+    return {name: {k: v for k, v in fields.items() if v is not None} for name, fields in sections.items()}
+
+
+def _case(rng):
+    case = {
+        'valuation_gap': rng.uniform(0, 120000),
+        'property_value': rng.choice([0, rng.uniform(50000, 500000)]),
+        'owner_risk_profile': _maybe(rng, ['LOW', 'MEDIUM', 'HIGH', 'CRITICAL']),
+        'legal_complexity': _maybe(rng, ['low', 'medium', 'high']),
+        'precedent_clarity': _maybe(rng, ['clear', 'mixed', 'unclear']),
+        'jurisdiction_history': _maybe(rng, ['owner_favorable', 'neutral', 'buyer_favorable'])
+    }
+    return {k: v for k, v in case.items() if v is not None}
+
+
+class TestHoldoutFrame:
+    """Batch holdout scores vs assess_holdout_risk()."""
+
+    def test_matches_scalar(self):
+        rng = random.Random(1)
+        profiles = [_owner_profile(rng) for _ in range(400)]
+        frame = assess_holdout_risk_frame(profiles)
+
+        for profile, row in zip(profiles, frame.itertuples()):
+            scalar = assess_holdout_risk(profile)
+            assert row.total_score == scalar['total_score']
+            assert row.motivation_score == scalar['breakdown']['motivation_score']
+            assert row.sophistication_score == scalar['breakdown']['sophistication_score']
+            assert row.alternatives_score == scalar['breakdown']['alternatives_score']
+            assert row.risk_level == scalar['risk_level']
+            assert row.holdout_probability == scalar['holdout_probability']
+
+    def test_flat_columns_and_defaults(self):
+        frame = assess_holdout_risk_frame(pd.DataFrame(
+            {'emotional_attachment': ['high', 'low'], 'legal_representation': [True, False]},
+            index=['P1', 'P2']
+        ))
+        default = assess_holdout_risk({})
+        assert list(frame.index) == ['P1', 'P2']
+        assert frame.loc['P1', 'total_score'] == default['total_score'] + 2 + 3
+        assert frame.loc['P2', 'total_score'] == default['total_score'] - 2
+
+
+class TestLitigationFrame:
+    """Batch litigation risk vs litigation_risk_assessment()."""
+
+    def test_matches_scalar(self):
+        rng = random.Random(2)
+        cases = [_case(rng) for _ in range(400)]
+        frame = litigation_risk_assessment_frame(cases)
+
+        for case, row in zip(cases, frame.itertuples()):
+            scalar = litigation_risk_assessment(case)
+            assert round(row.litigation_probability, 3) == pytest.approx(scalar['litigation_probability'])
+            assert row.expected_duration_months == pytest.approx(scalar['expected_duration_months'])
+            assert row.expected_cost == pytest.approx(scalar['expected_cost'])
+            assert row.duration_best == pytest.approx(scalar['duration_range']['best'], abs=0.05)
+            assert row.cost_worst == pytest.approx(scalar['cost_range']['worst'], abs=500)
+
+
+class TestPortfolio:
+    """Ranked portfolio scoring feeding batch negotiation analytics."""
+
+    def test_ranked_and_chained(self):
+        rng = random.Random(3)
+        records = []
+        for i in range(60):
+            profile = _owner_profile(rng)
+            case = _case(rng)
+            case.pop('owner_risk_profile', None)
+            records.append({'parcel_id': f'P{i:03d}', **profile, **case})
+        risk = score_risk_portfolio(records)
+
+        assert list(risk['risk_rank']) == list(range(1, 61))
+        assert risk['litigation_probability'].is_monotonic_decreasing
+        # owner_risk_profile chains from the holdout risk level
+        row = risk.iloc[0]
+        record = records[risk.index[0]]
+        chained = {k: v for k, v in record.items() if k not in ('parcel_id', 'motivation', 'sophistication', 'alternatives')}
+        chained['owner_risk_profile'] = assess_holdout_risk(record)['risk_level']
+        assert row['litigation_probability'] == pytest.approx(
+            litigation_risk_assessment(chained)['litigation_probability'], abs=5e-4
+        )
+
+        hearings = pd.DataFrame({
+            'low_award': 0.2, 'mid_award': 0.5, 'high_award': 0.3,
+            'low_award_amount': 100000, 'mid_award_amount': 150000, 'high_award_amount': 200000,
+            'expert_fees': 30000
+        }, index=risk.index).join(risk['expected_cost'].rename('legal_fees'))
+        batna = calculate_batna_frame(hearings)
+        ev = probability_weighted_ev_frame(
+            np.column_stack([np.full(60, 160000.0), batna['net_batna']]),
+            np.column_stack([1 - risk['litigation_probability'], risk['litigation_probability']]),
+            names=['settle', 'hearing'], index=risk.index
+        )
+        assert (ev['best_case'] == 'settle').all()
+        assert ev.index.equals(risk.index)
+
+
+class TestNegotiationFrames:
+    """Batch BATNA / expected value vs scalar."""
+
+    def test_batna_matches_scalar(self):
+        rng = random.Random(4)
+        rows = []
+        for _ in range(50):
+            p = np.array([rng.random() for _ in range(3)])
+            p /= p.sum()
+            rows.append({
+                'low_award': p[0], 'mid_award': p[1], 'high_award': p[2],
+                'low_award_amount': rng.uniform(50000, 100000),
+                'mid_award_amount': rng.uniform(100000, 150000),
+                'high_award_amount': rng.uniform(150000, 250000),
+                'legal_fees': rng.uniform(0, 60000), 'time_cost': 10000
+            })
+        frame = calculate_batna_frame(pd.DataFrame(rows))
+        for row, result in zip(rows, frame.itertuples()):
+            probabilities = {k: row[k] for k in ('low_award', 'mid_award', 'high_award')}
+            scalar = calculate_batna(probabilities, row)
+            assert result.net_batna == pytest.approx(scalar['net_batna'], abs=0.01)
+            assert result.standard_deviation == pytest.approx(scalar['standard_deviation'], abs=0.01)
+            assert result.coefficient_of_variation == pytest.approx(scalar['coefficient_of_variation'], abs=1e-4)
+
+    def test_ev_matches_scalar(self):
+        costs = np.array([[180000, 200000, 250000], [100000, 90000, 300000]])
+        probabilities = np.array([[0.4, 0.3, 0.3], [0.5, 0.25, 0.25]])
+        frame = probability_weighted_ev_frame(costs, probabilities, names=['offer', 'counter', 'hearing'])
+        for c, p, row in zip(costs, probabilities, frame.itertuples()):
+            scalar = probability_weighted_ev([
+                {'name': n, 'cost': cost, 'probability': prob}
+                for n, cost, prob in zip(['offer', 'counter', 'hearing'], c, p)
+            ])
+            assert row.expected_value == pytest.approx(scalar['expected_value'])
+            assert row.std_dev == pytest.approx(scalar['std_dev'], abs=0.01)
+            assert row.best_case == scalar['best_case']['name']
+            assert row.worst_case == scalar['worst_case']['name']
+
+    def test_ev_validation(self):
+        with pytest.raises(ValueError, match="sum to 1.0"):
+            probability_weighted_ev_frame([[1, 2]], [[0.5, 0.4]])
+        with pytest.raises(ValueError, match="same shape"):
+            probability_weighted_ev_frame([[1, 2]], [[1.0]])
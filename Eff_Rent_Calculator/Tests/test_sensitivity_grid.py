@@ -0,0 +1,226 @@
+"""
+Test suite for the renewal/relocation sensitivity grid engine.
+
+Tests include:
+- Grid points vs compare_scenarios() on adjusted scenarios
+- Breakeven surface (NPV equality at the closed-form rent)
+- One-way and tornado views
+- sensitivity_analysis() built on the grid
+- Input validation
+
+Run with: pytest test_sensitivity_grid.py -v
+"""
+
+import itertools
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from Renewal_Analysis.renewal_analysis import (
+    RenewalScenario,
+    RelocationScenario,
+    GeneralInputs,
+    compare_scenarios,
+    calculate_renewal_scenario,
+    calculate_relocation_scenario,
+    sensitivity_analysis
+)
+from Renewal_Analysis.sensitivity_grid import (
+    GRID_AXES,
+    evaluate_sensitivity_grid,
+    calculate_breakeven_surface
+)
+
+
+@pytest.fixture
+def scenarios():
+    renewal = RenewalScenario(
+        annual_rent_psf=[25.0, 26.0, 27.0, 28.0],
+        term_years=5,
+        ti_allowance_psf=5.0,
+        additional_ti_psf=15.0,
+        operating_costs_psf=8.0,
+        legal_fees=10000,
+        renovation_costs_psf=2.0
+    )
+    relocation = RelocationScenario(
+        annual_rent_psf=[21.0, 22.0, 23.0],
+        term_years=7,
+        ti_allowance_psf=20.0,
+        ti_requirement_psf=45.0,
+        operating_costs_psf=9.0,
+        moving_costs=60000,
+        it_moving_costs=20000,
+        signage_costs=5000,
+        downtime_days=3,
+        daily_revenue=8000,
+        customer_loss_pct=0.01,
+        unamortized_improvements=30000,
+        restoration_costs=20000,
+        legal_fees=15000,
+        due_diligence_costs=5000,
+        broker_fees=10000
+    )
+    general = GeneralInputs(rentable_area_sf=12000, discount_rate=0.08)
+    return renewal, relocation, general
+
+
+def _adjusted(renewal, relocation, general, rent, ti, disruption, moving, rate):
+    """Scenarios rebuilt the way the scalar sensitivity loop does."""
+    return (
+        replace(renewal, annual_rent_psf=[r * rent for r in renewal.annual_rent_psf]),
+        replace(
+            relocation,
+            annual_rent_psf=list(relocation.annual_rent_psf),
+            ti_requirement_psf=relocation.ti_requirement_psf * ti,
+            downtime_days=relocation.downtime_days * disruption,
+            customer_loss_pct=relocation.customer_loss_pct * disruption,
+            moving_costs=relocation.moving_costs * moving,
+            it_moving_costs=relocation.it_moving_costs * moving,
+            signage_costs=relocation.signage_costs * moving
+        ),
+        replace(general, discount_rate=rate)
+    )
+
+
+class TestGridVsScalar:
+    """Every grid point must reproduce compare_scenarios()."""
+
+    AXES = dict(
+        rent_mult=[0.6, 1.0, 1.3],
+        ti_mult=[0.5, 1.0, 1.5],
+        disruption_mult=[0.0, 2.0],
+        moving_mult=[1.0, 3.0],
+        discount_rate=[0.0, 0.08, 0.12]
+    )
+
+    def test_metrics_match(self, scenarios):
+        renewal, relocation, general = scenarios
+        result = evaluate_sensitivity_grid(renewal, relocation, general, **self.AXES)
+        frame = result.frame
+
+        assert len(frame) == np.prod([len(v) for v in self.AXES.values()])
+        assert list(frame.columns[:len(GRID_AXES)]) == list(GRID_AXES)
+
+        for point in itertools.islice(frame.itertuples(index=False), 0, None, 7):
+            comp = compare_scenarios(*_adjusted(
+                renewal, relocation, general,
+                point.rent_mult, point.ti_mult, point.disruption_mult,
+                point.moving_mult, point.discount_rate
+            ))
+            assert point.renewal_npv == pytest.approx(comp.renewal_result.npv)
+            assert point.relocation_npv == pytest.approx(comp.relocation_result.npv)
+            assert point.npv_difference == pytest.approx(comp.npv_difference, abs=1e-6)
+            assert point.renewal_ner_psf == pytest.approx(comp.renewal_result.net_effective_rent_psf)
+            assert point.relocation_ner_psf == pytest.approx(comp.relocation_result.net_effective_rent_psf)
+            assert point.annual_savings == pytest.approx(comp.annual_savings)
+            assert point.recommendation == comp.recommendation
+            if comp.relocation_irr is None:
+                assert np.isnan(point.relocation_irr)
+            else:
+                assert point.relocation_irr == pytest.approx(comp.relocation_irr, abs=1e-4)
+            if comp.payback_period_years is None:
+                assert np.isnan(point.payback_years)
+            else:
+                assert point.payback_years == pytest.approx(comp.payback_period_years)
+            # Scalar breakeven is a binary search with 0.1% NPV tolerance
+            assert point.breakeven_rent_psf == pytest.approx(comp.breakeven_rent_psf, rel=1e-2)
+
+
+class TestBreakevenSurface:
+    """Closed-form breakeven rent equalizes the scenario NPVs."""
+
+    @pytest.mark.parametrize('rate', [0.0, 0.06, 0.10])
+    def test_npvs_equal_at_breakeven(self, scenarios, rate):
+        renewal, relocation, general = scenarios
+        surface = calculate_breakeven_surface(
+            renewal, relocation, general,
+            ti_mult=[0.8, 1.2], disruption_mult=[1.0], moving_mult=[0.5, 1.0],
+            discount_rate=[rate]
+        )
+        assert len(surface) == 4
+
+        for point in surface.itertuples(index=False):
+            adj_renewal, adj_relocation, adj_general = _adjusted(
+                renewal, relocation, general, 1.0, point.ti_mult,
+                point.disruption_mult, point.moving_mult, rate
+            )
+            flat_renewal = replace(adj_renewal, annual_rent_psf=[point.breakeven_rent_psf] * renewal.term_years)
+            assert calculate_renewal_scenario(flat_renewal, adj_general).npv == pytest.approx(
+                calculate_relocation_scenario(adj_relocation, adj_general).npv
+            )
+
+
+class TestViews:
+    """One-way, tornado and xarray views."""
+
+    def test_one_way_holds_other_axes_at_base(self, scenarios):
+        renewal, relocation, general = scenarios
+        result = evaluate_sensitivity_grid(
+            renewal, relocation, general,
+            rent_mult=[0.9, 1.0, 1.1], ti_mult=[0.9, 1.0, 1.1]
+        )
+        one_way = result.one_way()
+        assert set(one_way['variable']) == {'rent_mult', 'ti_mult'}
+        assert len(one_way) == 6
+
+        base = compare_scenarios(renewal, relocation, general).npv_difference
+        at_base = one_way[np.isclose(one_way['value'], 1.0)]
+        assert at_base['npv_difference'].to_numpy() == pytest.approx([base, base])
+
+        tornado = result.tornado()
+        assert list(tornado.columns) == ['variable', 'low', 'high', 'swing']
+        assert tornado['swing'].is_monotonic_decreasing
+
+    def test_one_way_requires_base_value(self, scenarios):
+        result = evaluate_sensitivity_grid(*scenarios, rent_mult=[0.9, 1.1])
+        with pytest.raises(ValueError, match="rent_mult"):
+            result.one_way()
+
+    def test_to_xarray(self, scenarios):
+        result = evaluate_sensitivity_grid(*scenarios, rent_mult=[0.9, 1.0])
+        try:
+            import xarray  # noqa: F401
+        except ImportError:
+            with pytest.raises(ImportError, match="xarray"):
+                result.to_xarray()
+        else:
+            dataset = result.to_xarray()
+            assert dict(dataset.sizes)['rent_mult'] == 2
+
+
+class TestSensitivityAnalysis:
+    """sensitivity_analysis() output built on the grid."""
+
+    def test_rows_match_adjusted_scenarios(self, scenarios):
+        renewal, relocation, general = scenarios
+        table = sensitivity_analysis(
+            renewal, relocation, general,
+            variables=['rent', 'ti', 'disruption', 'moving'], variation_pct=0.2
+        )
+        assert list(table['Variable']) == [
+            'Base Case',
+            'Renewal Rent', 'Renewal Rent',
+            'Relocation TI', 'Relocation TI',
+            'Disruption Costs', 'Disruption Costs',
+            'Moving Costs', 'Moving Costs'
+        ]
+        assert list(table['Variation']) == ['0%'] + ['-20%', '+20%'] * 4
+
+        moving_up = table.iloc[-1]
+        comp = compare_scenarios(*_adjusted(renewal, relocation, general, 1.0, 1.0, 1.0, 1.2, 0.08))
+        assert moving_up['NPV_Difference'] == pytest.approx(round(comp.npv_difference, 2))
+        assert moving_up['Recommendation'] == comp.recommendation
+
+
+class TestValidation:
+    """Test input validation."""
+
+    def test_empty_axis(self, scenarios):
+        with pytest.raises(ValueError, match="ti_mult"):
+            evaluate_sensitivity_grid(*scenarios, ti_mult=[])
+
+    def test_negative_discount_rate(self, scenarios):
+        with pytest.raises(ValueError, match="non-negative"):
+            evaluate_sensitivity_grid(*scenarios, discount_rate=[-0.05])
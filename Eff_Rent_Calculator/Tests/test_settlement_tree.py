@@ -0,0 +1,207 @@
+"""
+Test suite for settlement decision trees and portfolio settlement ranges.
+
+Tests include:
+- Standard offer → counter → hearing tree vs calculate_batna(),
+  probability_weighted_ev() and hearing_cost_benefit()
+- optimal_settlement_range_frame() vs optimal_settlement_range()
+- Monte Carlo leaves through risk_utils.monte_carlo_samples()
+- Shared subtrees (common random numbers) and empty portfolios
+- Input validation
+
+Run with: pytest test_settlement_tree.py -v
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import Shared_Utils.negotiation_utils as negotiation_utils
+from Shared_Utils.negotiation_utils import (
+    calculate_batna,
+    calculate_zopa,
+    probability_weighted_ev,
+    hearing_cost_benefit,
+    optimal_settlement_range,
+    optimal_settlement_range_frame,
+    SettlementTree,
+    decision_node,
+    chance_node,
+    outcome_node,
+    settlement_tree,
+    portfolio_settlement_ranges
+)
+from Shared_Utils.risk_utils import monte_carlo_samples
+
+
+TRIANGULAR_AWARD = {
+    'award': {
+        'type': 'triangular',
+        'min': 'low_award_amount',
+        'most_likely': 'mid_award_amount',
+        'max': 'high_award_amount'
+    }
+}
+
+
+def _portfolio(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'offer_amount': rng.uniform(100000, 200000, n),
+        'counter_amount': rng.uniform(150000, 300000, n),
+        'accept_probability': rng.uniform(0, 0.5, n),
+        'litigation_probability': rng.uniform(0, 0.4, n),
+        'legal_fees_to_settle': 5000,
+        'low_award': 0.2, 'mid_award': 0.5, 'high_award': 0.3,
+        'low_award_amount': rng.uniform(100000, 150000, n),
+        'mid_award_amount': rng.uniform(150000, 200000, n),
+        'high_award_amount': rng.uniform(200000, 300000, n),
+        'legal_fees': rng.uniform(20000, 60000, n),
+        'expert_fees': 20000,
+        'seller_min': rng.uniform(100000, 300000, n)
+    }, index=[f'P{i:03d}' for i in range(n)])
+
+
+class TestSettlementTree:
+    """Standard tree vs the scalar negotiation functions."""
+
+    def test_matches_scalar(self):
+        parcels = _portfolio(40)
+        result = settlement_tree().evaluate(parcels)
+        assert result.index.equals(parcels.index)
+
+        for parcel_id, row in parcels.iterrows():
+            solved = result.loc[parcel_id]
+            batna = calculate_batna(
+                {outcome: row[outcome] for outcome in ('low_award', 'mid_award', 'high_award')}, row.to_dict()
+            )['net_batna']
+            assert solved['strategy.hearing'] == pytest.approx(batna, abs=0.01)
+
+            counter = hearing_cost_benefit(row['counter_amount'], batna, row.to_dict())
+            expected_choice = 'accept_counter' if counter['net_benefit_of_settlement'] >= 0 else 'hearing'
+            assert solved['counter_response'] == expected_choice
+
+            counter_cost = min(row['counter_amount'] + 5000, batna)
+            negotiate = probability_weighted_ev([
+                {'name': 'accept', 'cost': row['offer_amount'] + 5000, 'probability': row['accept_probability']},
+                {'name': 'counter', 'cost': counter_cost,
+                 'probability': 1 - row['accept_probability'] - row['litigation_probability']},
+                {'name': 'reject', 'cost': batna, 'probability': row['litigation_probability']}
+            ])['expected_value']
+            assert solved['strategy.negotiate'] == pytest.approx(negotiate, abs=0.01)
+            assert solved['expected_cost'] == pytest.approx(min(negotiate, batna), abs=0.01)
+
+    def test_portfolio_ranges(self):
+        parcels = _portfolio(60, seed=1)
+        parcels['buyer_max'] = np.where(np.arange(60) % 3 == 0, 150000.0, 1e9)
+        result = portfolio_settlement_ranges(parcels, confidence=0.7)
+
+        assert not result['zopa_exists'].all() and result['zopa_exists'].any()
+        for parcel_id, row in result.iterrows():
+            batna = row['strategy.hearing']
+            zopa = calculate_zopa(min(batna, parcels.loc[parcel_id, 'buyer_max']), parcels.loc[parcel_id, 'seller_min'])
+            scalar = optimal_settlement_range(batna, zopa, confidence=0.7)
+            assert row['zopa_exists'] == zopa['exists']
+            if zopa['exists']:
+                for key in ('target', 'floor', 'ceiling', 'opening_offer', 'walkaway', 'zopa_utilization'):
+                    assert row[key] == pytest.approx(scalar[key], abs=0.01)
+            else:
+                assert np.isnan(row['target']) and np.isnan(row['walkaway'])
+
+    def test_range_frame_scalars(self):
+        frame = optimal_settlement_range_frame(200000, [190000, 150000], [160000, 160000])
+        scalar = optimal_settlement_range(200000, calculate_zopa(190000, 160000))
+        assert frame.loc[0, 'opening_offer'] == pytest.approx(scalar['opening_offer'])
+        assert not frame.loc[1, 'zopa_exists']
+
+
+class TestMonteCarloLeaves:
+    """Simulated leaves and outcome distributions."""
+
+    def test_samples_vectorized_parameters(self):
+        samples = monte_carlo_samples({
+            'a': {'type': 'triangular', 'min': [0, 10], 'most_likely': [5, 10], 'max': [20, 10]},
+            'b': {'type': 'uniform', 'min': 0, 'max': [1, 2]},
+            'c': {'type': 'fixed', 'mean': 3}
+        }, iterations=20000, size=2, rng=np.random.default_rng(0))
+        assert samples['a'].shape == (20000, 2)
+        assert samples['a'][:, 0].mean() == pytest.approx(25 / 3, rel=0.02)
+        assert (samples['a'][:, 1] == 10).all()
+        assert samples['b'].max(axis=0) == pytest.approx([1, 2], abs=1e-3)
+        assert (samples['c'] == 3).all()
+
+    def test_simulated_hearing(self):
+        parcels = _portfolio(30, seed=2)
+        tree = settlement_tree(hearing_simulation=TRIANGULAR_AWARD)
+        result = tree.evaluate(parcels, iterations=20000, seed=3)
+
+        mean_award = parcels[['low_award_amount', 'mid_award_amount', 'high_award_amount']].mean(axis=1)
+        analytic = mean_award + parcels['legal_fees'] + parcels['expert_fees']
+        assert result['strategy.hearing'].to_numpy() == pytest.approx(analytic.to_numpy(), rel=0.005)
+        assert (result['cost_p10'] <= result['cost_p50']).all()
+        assert (result['cost_p50'] <= result['cost_p90']).all()
+
+    def test_sampled_policy_cost(self, monkeypatch):
+        # Chance branches are sampled: the mean sampled cost matches the expectation
+        parcels = _portfolio(20, seed=4)
+        monkeypatch.setattr(negotiation_utils, 'TREE_CHUNK_CELLS', 50000)
+        result = settlement_tree().evaluate(parcels, iterations=40000, seed=5)
+        exact = settlement_tree().evaluate(parcels)
+
+        assert result['expected_cost'].to_numpy() == pytest.approx(exact['expected_cost'].to_numpy())
+        assert (result['strategy'] == exact['strategy']).all()
+        standard_error = result['cost_std'] / np.sqrt(40000)
+        assert (np.abs(result['cost_mean'] - exact['expected_cost']) < 4 * standard_error + 1e-6).all()
+
+    def test_shared_hearing_samples(self):
+        # The hearing is sampled once per parcel and iteration for every branch
+        parcels = _portfolio(10, seed=6)
+        result = settlement_tree(hearing_simulation=TRIANGULAR_AWARD).evaluate(parcels, iterations=500, seed=7)
+        assert (result['strategy.hearing'] == result['counter_response.hearing']).all()
+
+    def test_empty_portfolio(self):
+        parcels = _portfolio(5).iloc[:0]
+        result = settlement_tree().evaluate(parcels)
+        assert result.empty
+        assert {'expected_cost', 'strategy', 'strategy.hearing', 'counter_response'} <= set(result.columns)
+
+        simulated = settlement_tree(hearing_simulation=TRIANGULAR_AWARD).evaluate(parcels, iterations=100)
+        assert simulated.empty
+        assert {'expected_cost', 'cost_mean', 'cost_p90'} <= set(simulated.columns)
+
+    def test_custom_tree_without_frame(self):
+        tree = SettlementTree(decision_node('choice', {
+            'settle': outcome_node(cost=110.0),
+            'gamble': chance_node('outcome', {
+                'win': (0.5, outcome_node(cost=50.0)),
+                'lose': (None, outcome_node(cost=[100.0, 60.0]))
+            })
+        }))
+        result = tree.evaluate()
+        assert result.loc[0, 'choice'] == 'gamble'
+        assert result.loc[0, 'expected_cost'] == pytest.approx(105.0)
+
+
+class TestValidation:
+    """Test input validation."""
+
+    def test_bad_trees(self):
+        leaf = outcome_node(cost=1.0)
+        with pytest.raises(ValueError, match="unique"):
+            SettlementTree(decision_node('a', {'x': decision_node('a', {'y': leaf})}))
+        with pytest.raises(ValueError, match="more than one remainder"):
+            SettlementTree(chance_node('c', {'x': (None, leaf), 'y': (None, leaf)}))
+        with pytest.raises(ValueError, match="Unknown node type"):
+            SettlementTree({'type': 'terminal'})
+
+    def test_bad_values(self):
+        parcels = _portfolio(5)
+        with pytest.raises(ValueError, match="Unknown column"):
+            settlement_tree(offer='missing').evaluate(parcels)
+        parcels.loc['P002', 'accept_probability'] = 0.9
+        with pytest.raises(ValueError, match="sum to 1.0"):
+            settlement_tree().evaluate(parcels)
+        with pytest.raises(ValueError, match="iterations"):
+            settlement_tree(hearing_simulation=TRIANGULAR_AWARD).evaluate(_portfolio(5), iterations=0)
+        with pytest.raises(ValueError, match="BATNA column"):
+            portfolio_settlement_ranges(_portfolio(5), batna_column='nope')
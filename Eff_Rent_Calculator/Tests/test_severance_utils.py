@@ -0,0 +1,206 @@
+"""
+Test suite for batch severance damages.
+
+Tests include:
+- severance_damages_frame() vs the archived calculate_severance_damages()
+  on random takings (all categories, missing optional fields)
+- Vectorized shape efficiency and frontage rates
+- Report rendering (in-process and process pool) vs save_to_json()
+- Register / summary / report files
+- Input validation
+
+Run with: pytest test_severance_utils.py -v
+"""
+
+import importlib.util
+import json
+from dataclasses import asdict
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from Shared_Utils.severance_utils import (
+    frontage_rate_array,
+    shape_efficiency_index_array,
+    categorize_shape_efficiency_array,
+    severance_damages_frame,
+    render_severance_reports,
+    write_damages_register
+)
+
+
+ORIGINAL = (
+    Path(__file__).resolve().parents[2]
+    / 'docs' / 'skills' / 'severance-damages-quantification' / 'severance_calculator_original.py'
+)
+
+COMPONENTS = {
+    'access_damages': [
+        'frontage_loss_value', 'circuitous_access_cost', 'landlocked_remedy_cost',
+        'total_access_damages', 'annual_time_cost'
+    ],
+    'shape_damages': [
+        'efficiency_index_before', 'efficiency_index_after', 'value_discount_pct',
+        'geometric_inefficiency_value', 'buildable_area_reduction_value',
+        'development_yield_loss', 'total_shape_damages'
+    ],
+    'utility_damages': ['site_servicing_costs', 'development_potential_reduction', 'total_utility_damages'],
+    'farm_damages': [
+        'fencing_cost', 'drainage_modifications', 'field_division_costs', 'annual_equipment_time_cost',
+        'equipment_access_complications', 'irrigation_repair_cost', 'irrigation_system_impacts',
+        'total_farm_damages'
+    ]
+}
+
+
+@pytest.fixture(scope='module')
+def original():
+    spec = importlib.util.spec_from_file_location('severance_calculator_original', ORIGINAL)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _cases(original, n, seed=0):
+    rng = np.random.default_rng(seed)
+    cases = []
+    for _ in range(n):
+        total = rng.uniform(1, 200)
+        taken = total * rng.uniform(0.02, 0.4)
+        frontage = rng.choice([0.0, rng.uniform(100, 3000)])
+        lost = min(frontage, rng.choice([0.0, rng.uniform(0, 800)]))
+        landlocked = bool(rng.random() < 0.1)
+        minutes = rng.choice([0.0, rng.uniform(1, 20)])
+        units = rng.choice([None, 0, int(rng.integers(5, 300))])
+        buildable = rng.choice([None, int(rng.integers(10000, 500000))])
+
+        before = original.PropertyBefore(
+            total_acres=total,
+            frontage_linear_feet=frontage,
+            road_classification=str(rng.choice(['highway', 'arterial', 'collector', 'local', 'private'])),
+            shape_ratio_frontage_depth=float(rng.choice([0.0, rng.uniform(0.1, 1.5)])),
+            value_per_acre=rng.uniform(10000, 800000),
+            use=str(rng.choice(['industrial', 'commercial', 'residential', 'agricultural'])),
+            development_potential_units=units,
+            buildable_area_sf=buildable
+        )
+        taking = original.Taking(
+            area_taken_acres=taken,
+            frontage_lost_linear_feet=lost,
+            creates_landlocked=landlocked,
+            eliminates_direct_access=bool(rng.random() < 0.5),
+            circuitous_access_added_minutes=minutes,
+            creates_irregular_shape=bool(rng.random() < 0.5),
+            severs_utilities=bool(rng.random() < 0.3),
+            reduces_development_potential=bool(rng.random() < 0.4),
+            bisects_farm=bool(rng.random() < 0.5),
+            disrupts_irrigation=bool(rng.random() < 0.5)
+        )
+        remainder = original.Remainder(
+            acres=total - taken,
+            frontage_remaining_linear_feet=0.0 if landlocked else frontage - lost,
+            shape_ratio_frontage_depth=float(rng.uniform(0.05, 1.2)),
+            access_type=str(rng.choice(['direct', 'circuitous', 'landlocked'])),
+            buildable_area_sf=None if buildable is None else int(buildable * rng.uniform(0.3, 1.0)),
+            development_potential_units=None if units is None else int(units * rng.uniform(0.2, 1.0)),
+            requires_new_fencing_linear_meters=float(rng.choice([0.0, rng.uniform(50, 2000)])),
+            irrigation_acres_affected=float(rng.choice([0.0, rng.uniform(1, 200)]))
+        )
+        cases.append((before, taking, remainder))
+    return cases
+
+
+def _frames(cases):
+    index = [f'T{i:04d}' for i in range(len(cases))]
+    return tuple(pd.DataFrame([asdict(case[k]) for case in cases], index=index) for k in range(3))
+
+
+class TestSeveranceFrame:
+    """Batch register vs calculate_severance_damages()."""
+
+    @pytest.mark.parametrize('cap_rate', [0.07, 0.0])
+    def test_matches_scalar(self, original, cap_rate):
+        cases = _cases(original, 400, seed=int(cap_rate * 100))
+        market = original.MarketParameters(cap_rate=cap_rate, trips_per_day=35)
+        register = severance_damages_frame(*_frames(cases), params={'cap_rate': cap_rate, 'trips_per_day': 35})
+
+        for (before, taking, remainder), (_, row) in zip(cases, register.iterrows()):
+            summary = original.calculate_severance_damages(before, taking, remainder, market)
+            for group, columns in COMPONENTS.items():
+                damages = getattr(summary, group)
+                for column in columns:
+                    assert row[column] == pytest.approx(getattr(damages, column), rel=1e-9, abs=1e-6), column
+            assert row['efficiency_category'] == summary.shape_damages.efficiency_category
+            assert row['frontage_rate_per_lf'] == summary.access_damages.frontage_rate_used
+            assert row['total_severance_damages'] == pytest.approx(summary.total_severance_damages)
+            assert row['after_value_remainder'] == pytest.approx(summary.after_value_remainder)
+            assert row['before_value_taken'] == pytest.approx(summary.before_value_taken)
+
+    def test_shape_and_frontage_arrays(self, original):
+        acres = [10, 10, 5, 5]
+        frontage = [660, 0, 300, 300]
+        ratio = [1.0, 0.5, 0.25, np.nan]
+        index = shape_efficiency_index_array(acres, frontage, ratio)
+        assert index[0] == pytest.approx(original.calculate_shape_efficiency_index(10, 660, frontage_depth_ratio=1.0))
+        assert index[1] == 0.2
+        assert index[3] == pytest.approx(original.calculate_shape_efficiency_index(5, 300))
+        assert list(categorize_shape_efficiency_array([0.8, 0.79, 0.4, 0.1])) == ['high', 'moderate', 'low', 'very_low']
+
+        rates = frontage_rate_array(['highway', 'local', 'private'], ['commercial', 'industrial', 'commercial'])
+        assert list(rates) == [1000.0, 80.0, 50.0]
+
+
+class TestReports:
+    """Per-taking reports and the written register."""
+
+    def test_reports_match_save_to_json(self, original, tmp_path):
+        cases = _cases(original, 30, seed=5)
+        register = severance_damages_frame(*_frames(cases))
+        in_process = render_severance_reports(register, max_workers=1)
+        pooled = render_severance_reports(register, max_workers=2, chunksize=4)
+        assert in_process == pooled
+
+        market = original.MarketParameters(cap_rate=0.07)
+        for (before, taking, remainder), (taking_id, report) in zip(cases, in_process.items()):
+            summary = original.calculate_severance_damages(before, taking, remainder, market)
+            path = tmp_path / f'{taking_id}.json'
+            original.save_to_json(summary, str(path))
+            expected = json.loads(path.read_text())
+            assert report['analysis_notes'] == expected['analysis_notes']
+            assert report['severance_damages']['shape_irregularity']['efficiency_category'] == (
+                expected['severance_damages']['shape_irregularity']['efficiency_category']
+            )
+            assert report['reconciliation'] == pytest.approx(expected['reconciliation'])
+
+    def test_write_register(self, original, tmp_path):
+        register = severance_damages_frame(*_frames(_cases(original, 40, seed=6)))
+        files = write_damages_register(
+            register, tmp_path, reports=True, max_workers=1
+        )
+
+        written = pd.read_csv(files['register'], index_col='taking_id')
+        assert written.index.equals(register.index)
+        assert written['total_compensation'].to_numpy() == pytest.approx(register['total_compensation'].to_numpy())
+
+        summary = pd.read_csv(files['summary'], index_col='use')
+        assert summary.loc['total', 'takings'] == 40
+        assert summary.loc['total', 'total_severance_damages'] == pytest.approx(register['total_severance_damages'].sum())
+        report = json.loads((Path(files['reports']) / 'T0007.json').read_text())
+        assert report['analysis_date'] == date.today().isoformat()
+
+
+class TestValidation:
+    """Test input validation."""
+
+    def test_bad_inputs(self, original):
+        before, taking, remainder = _frames(_cases(original, 5))
+        with pytest.raises(ValueError, match="same index"):
+            severance_damages_frame(before, taking, remainder.iloc[::-1])
+        with pytest.raises(ValueError, match="Missing required column 'creates_landlocked'"):
+            severance_damages_frame(before, taking.drop(columns='creates_landlocked'), remainder)
+        before.iloc[0, before.columns.get_loc('total_acres')] = 0
+        with pytest.raises(ValueError, match="total_acres"):
+            severance_damages_frame(before, taking, remainder)
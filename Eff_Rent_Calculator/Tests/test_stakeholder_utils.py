@@ -0,0 +1,116 @@
+"""
+Test suite for stakeholder comment analysis.
+
+Tests include:
+- Word-boundary keyword matching (inflections, multi-word and overlapping keywords)
+- categorize_themes() / sentiment_analysis() on the compiled matcher
+- Streaming ConsultationAnalyzer vs the per-function results, in-process
+  and through the process pool
+- Input validation
+
+Run with: pytest test_stakeholder_utils.py -v
+"""
+
+import random
+
+import pytest
+
+from Shared_Utils.stakeholder_utils import (
+    KeywordMatcher,
+    categorize_themes,
+    sentiment_analysis,
+    frequency_weighting,
+    commitments_matrix,
+    ConsultationAnalyzer,
+    analyze_comments
+)
+
+
+CATEGORIES = {
+    'Traffic': ['traffic', 'congestion', 'parking', 'road'],
+    'Property Values': ['property value', 'assessment', 'market'],
+    'Accessibility': ['access', 'pedestrian', 'wheelchair', 'bike'],
+    'Noise': ['noise', 'loud']
+}
+
+WORDS = (
+    "the we I know north now no concerned traffic roads parking property values market "
+    "pedestrian access bike noise loud great support will ensure commit to promise "
+    "that city improve project good bad when how information"
+).split()
+
+
+def _comments(n, seed=0):
+    rng = random.Random(seed)
+    return [' '.join(rng.choice(WORDS) for _ in range(rng.randint(3, 20))) + '.' for _ in range(n)]
+
+
+class TestKeywordMatcher:
+    """Word-boundary matching."""
+
+    def test_word_boundaries_and_inflections(self):
+        matcher = KeywordMatcher({'opposition': ['no', 'concern'], 'support': ['approve']})
+        assert matcher.match("I know the north side well") == {'opposition': set(), 'support': set()}
+        found = matcher.match("Concerned residents APPROVED it, no doubt")
+        assert found == {'opposition': {'no', 'concern'}, 'support': {'approve'}}
+
+    def test_short_keywords_not_inflected(self):
+        matcher = KeywordMatcher({'opposition': ['no', 'bad'], 'support': ['good'], 'neutral': ['what', 'road']})
+        assert matcher.match("I nod along; the noes have it") == {'opposition': set(), 'support': set(), 'neutral': set()}
+        assert matcher.match("Goods trucks, whats next") == {'opposition': set(), 'support': set(), 'neutral': set()}
+        assert matcher.match("No roads")['neutral'] == {'road'}
+        assert sentiment_analysis(["I nod along"])['sentiment_breakdown'][0]['sentiment'] != 'opposition'
+
+    def test_multi_word_and_overlapping(self):
+        matcher = KeywordMatcher({'a': ['property value'], 'b': ['property', 'value'], 'c': ['value']})
+        found = matcher.match("Property\n  values will drop")
+        assert found == {'a': {'property value'}, 'b': {'property', 'value'}, 'c': {'value'}}
+        assert matcher.match("property is valuable")['a'] == set()
+
+    def test_scalar_functions(self):
+        themes = categorize_themes(["Traffic on my road", "I know nothing", "Loud traffic"], CATEGORIES)
+        assert [item['index'] for item in themes['categorized_feedback']['Traffic']] == [0, 2]
+        assert themes['uncategorized'] == [{'text': 'I know nothing', 'index': 1}]
+        assert themes['multi_category'][0]['categories'] == ['Traffic', 'Noise']
+
+        sentiment = sentiment_analysis(["I know this is north", "We are concerned", "Great but bad"])
+        assert [row['sentiment'] for row in sentiment['sentiment_breakdown']] == ['neutral', 'opposition', 'mixed']
+
+
+class TestConsultationAnalyzer:
+    """Streaming aggregates vs the per-function results."""
+
+    def _expected(self, comments):
+        themes = categorize_themes(comments, CATEGORIES)
+        return themes, sentiment_analysis(comments), themes['categorized_feedback']
+
+    def test_incremental_updates(self):
+        comments = _comments(3000)
+        themes, sentiment, categorized = self._expected(comments)
+
+        analyzer = ConsultationAnalyzer(CATEGORIES)
+        for start in range(0, 3000, 700):
+            analyzer.update(comments[start:start + 700], chunk_size=256)
+        results = analyzer.results()
+
+        assert results['statistics'] == themes['statistics']
+        assert results['sentiment']['sentiment_counts'] == sentiment['sentiment_counts']
+        assert results['sentiment']['overall_sentiment'] == sentiment['overall_sentiment']
+        assert results['frequency_weighting'] == frequency_weighting(categorized)
+        assert results['commitments'] == commitments_matrix(categorized)
+
+    def test_process_pool(self):
+        comments = _comments(2000, seed=1)
+        themes, sentiment, categorized = self._expected(comments)
+        results = analyze_comments(iter(comments), CATEGORIES, max_workers=2, chunk_size=150)
+
+        assert results['statistics'] == themes['statistics']
+        assert results['sentiment']['sentiment_counts'] == sentiment['sentiment_counts']
+        assert results['commitments'] == commitments_matrix(categorized)
+
+    def test_empty_and_validation(self):
+        results = analyze_comments([], CATEGORIES, max_workers=1)
+        assert results['statistics']['total_feedback'] == 0
+        assert results['frequency_weighting']['num_themes'] == 0
+        with pytest.raises(ValueError, match="chunk_size"):
+            ConsultationAnalyzer(CATEGORIES).update(['x'], chunk_size=0)
@@ -0,0 +1,200 @@
+"""
+Test suite for the synthetic data generator.
+
+Tests include:
+- Comparable sales inputs against the unified JSON schema (required fields,
+  enums, bounds, additionalProperties) and MCDA validation / analysis
+- Rollover, IFRS 16, credit and option documents through the calculators'
+  dict loaders
+- Seeding: same seed and count give the same records, blocks differ
+- Streaming: JSONL (plain, gzip), Parquet when pyarrow is installed, and
+  the command line
+
+Run with: pytest test_synthetic_data.py -v
+"""
+
+import contextlib
+import io
+import json
+import sys
+from datetime import date
+
+import pytest
+
+from Shared_Utils.cli import REPO_ROOT
+from Shared_Utils.synthetic_data import (
+    BLOCK_SIZE, DATASETS, PROPERTY_TYPES, iter_records, main, read_jsonl, write_dataset, write_jsonl
+)
+
+sys.path[:0] = [str(REPO_ROOT / 'MCDA_Sales_Comparison'), str(REPO_ROOT / 'Rollover_Analysis')]
+
+with open(REPO_ROOT / 'Shared_Utils' / 'schemas' / 'comparable_sales_input_schema.json') as f:
+    SCHEMA = json.load(f)
+
+JSON_TYPES = {
+    'object': dict, 'array': list, 'string': str, 'boolean': bool,
+    'number': (int, float), 'integer': int
+}
+
+
+def _schema_errors(value, schema, path='$'):
+    """Schema keywords used by the unified comparable sales schema (no jsonschema dependency)"""
+    errors = []
+    expected = JSON_TYPES.get(schema.get('type'))
+    if expected and (not isinstance(value, expected) or
+                     (isinstance(value, bool) and schema['type'] in ('number', 'integer'))):
+        return [f"{path}: expected {schema['type']}, got {value!r}"]
+    if 'enum' in schema and value not in schema['enum']:
+        errors.append(f"{path}: {value!r} not in {schema['enum']}")
+    if 'minimum' in schema and value < schema['minimum']:
+        errors.append(f"{path}: {value} < {schema['minimum']}")
+    if 'maximum' in schema and value > schema['maximum']:
+        errors.append(f"{path}: {value} > {schema['maximum']}")
+    if isinstance(value, str) and len(value) < schema.get('minLength', 0):
+        errors.append(f"{path}: shorter than {schema['minLength']}")
+    if schema.get('format') == 'date':
+        try:
+            date.fromisoformat(value)
+        except ValueError:
+            errors.append(f"{path}: {value!r} is not a date")
+
+    if isinstance(value, dict):
+        properties = schema.get('properties', {})
+        errors += [f"{path}: missing {key}" for key in schema.get('required', []) if key not in value]
+        for key, item in value.items():
+            if key in properties:
+                errors += _schema_errors(item, properties[key], f"{path}.{key}")
+            elif schema.get('additionalProperties') is False:
+                errors.append(f"{path}: unexpected {key}")
+    if isinstance(value, list):
+        if not schema.get('minItems', 0) <= len(value) <= schema.get('maxItems', len(value)):
+            errors.append(f"{path}: {len(value)} items outside {schema.get('minItems')}-{schema.get('maxItems')}")
+        for i, item in enumerate(value):
+            errors += _schema_errors(item, schema.get('items', {}), f"{path}[{i}]")
+    return errors
+
+
+class TestComparables:
+    """Unified schema comparable sales inputs."""
+
+    @pytest.mark.parametrize('property_type', PROPERTY_TYPES)
+    def test_schema_valid_and_analyzable(self, property_type):
+        from mcda_sales_calculator import run_analysis
+        from validation import validate_input_data
+
+        documents = list(iter_records('comparables', 5, size=20, property_type=property_type))
+        assert all(len(document['comparable_sales']) == 20 for document in documents)
+        for document in documents:
+            assert _schema_errors(document, SCHEMA) == []
+            assert validate_input_data(document, use_schema=False) == []
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = run_analysis(documents[0])
+        assert result['value_indication']['indicated_value_psf'] > 0
+
+    def test_checker_catches_violations(self):
+        document = next(iter_records('comparables', 1))
+        document['subject_property']['condition'] = 'pristine'
+        document['comparable_sales'][0]['sale_price'] = -1
+        document['extra'] = True
+        assert len(_schema_errors(document, SCHEMA)) == 3
+
+    def test_prices_follow_condition(self):
+        documents = iter_records('comparables', 200, size=20)
+        by_condition = {}
+        for comparable in (comparable for document in documents for comparable in document['comparable_sales']):
+            by_condition.setdefault(comparable['condition'], []).append(
+                comparable['sale_price'] / comparable['building_sf']
+            )
+        mean = {condition: sum(values) / len(values) for condition, values in by_condition.items()}
+        assert mean['poor'] < mean['average'] < mean['excellent']
+
+    def test_size_bounds(self):
+        with pytest.raises(ValueError, match="3-20"):
+            next(iter_records('comparables', 1, size=21))
+        with pytest.raises(ValueError, match="property_type"):
+            next(iter_records('comparables', 1, property_type='farm'))
+
+
+class TestCalculatorInputs:
+    """Other datasets load and run through the calculators."""
+
+    def test_rollover(self):
+        from rollover_calculator import calculate_rollover_analysis, portfolio_from_dict
+        portfolio = next(iter_records('rollover', 1, size=40))
+        assert len(portfolio['leases']) == 40
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = calculate_rollover_analysis(portfolio_from_dict(portfolio))
+        assert results is not None
+
+    def test_ifrs16(self):
+        from IFRS16_Calculator.ifrs16_calculator import calculate_ifrs16
+        from IFRS16_Calculator.run_ifrs16_analysis import lease_inputs_from_dict
+        for lease in iter_records('ifrs16', 5):
+            assert calculate_ifrs16(lease_inputs_from_dict(lease)).initial_lease_liability > 0
+
+    def test_credit(self):
+        from Credit_Analysis.credit_analysis import analyze_tenant_credit
+        from Credit_Analysis.run_credit_analysis import credit_inputs_from_dict
+        for tenant in iter_records('credit', 20, size=4):
+            years = tenant['financial_data']
+            assert [year['year'] for year in years] == [2024, 2023, 2022, 2021]
+            for year in years:
+                assert year['shareholders_equity'] == pytest.approx(
+                    year['total_assets'] - year['total_liabilities'], abs=1000
+                )
+                assert year['current_assets'] <= year['total_assets']
+                assert year['ebit'] <= year['ebitda'] < year['gross_profit'] < year['revenue']
+            with contextlib.redirect_stdout(io.StringIO()):
+                analyze_tenant_credit(credit_inputs_from_dict(tenant))
+
+    def test_options(self):
+        from Option_Valuation.option_valuation import options_from_dict, value_option
+        for document in iter_records('options', 5, size=3):
+            options, metadata = options_from_dict(document)
+            assert len(options) == 3 and metadata['rentable_area_sf'] > 0
+            for option in options:
+                assert value_option(option).option_value >= 0
+
+
+class TestStreaming:
+    """Seeding, blocks and output formats."""
+
+    def test_seeded(self):
+        for dataset in DATASETS:
+            first = list(iter_records(dataset, 3, seed=1))
+            assert first == list(iter_records(dataset, 3, seed=1))
+            assert first != list(iter_records(dataset, 3, seed=2))
+
+    def test_blocks(self):
+        records = list(iter_records('ifrs16', BLOCK_SIZE + 2))
+        assert len(records) == BLOCK_SIZE + 2
+        assert records[BLOCK_SIZE]['tenant_name'] == f'Tenant {BLOCK_SIZE}'
+        assert records[BLOCK_SIZE]['monthly_payments'] != records[0]['monthly_payments']
+        with pytest.raises(ValueError, match="Unknown dataset"):
+            next(iter_records('nope', 1))
+        with pytest.raises(ValueError, match="no per-document size"):
+            next(iter_records('ifrs16', 1, size=3))
+
+    def test_jsonl_round_trip(self, tmp_path):
+        expected = list(iter_records('credit', 25))
+        assert write_dataset('credit', 25, tmp_path / 'credit.jsonl') == 25
+        assert write_jsonl(iter(expected), str(tmp_path / 'credit.jsonl.gz')) == 25
+        assert list(read_jsonl(tmp_path / 'credit.jsonl')) == expected
+        assert list(read_jsonl(tmp_path / 'credit.jsonl.gz')) == expected
+
+    def test_parquet(self, tmp_path):
+        pq = pytest.importorskip('pyarrow.parquet')
+        path = tmp_path / 'portfolios.parquet'
+        assert write_dataset('rollover', 3, path, size=5) == 3
+        assert pq.read_table(path).to_pylist() == list(iter_records('rollover', 3, size=5))
+
+    def test_command_line(self, tmp_path, capsys):
+        path = tmp_path / 'comps.jsonl'
+        assert main(['comparables', '4', '-o', str(path), '--size', '5', '--property-type', 'office']) == 0
+        documents = list(read_jsonl(path))
+        assert len(documents) == 4 and documents[0]['subject_property']['property_type'] == 'office'
+        assert main(['comparables', '2', '--seed', '3']) == 0
+        assert [json.loads(line) for line in capsys.readouterr().out.splitlines()] == list(
+            iter_records('comparables', 2, seed=3)
+        )
+        assert main(['ifrs16', '2', '-o', str(tmp_path / 'x.jsonl'), '--size', '4']) == 1
@@ -0,0 +1,303 @@
+"""
+Test suite for the timeline utilities CPM/PERT engine.
+
+Tests include:
+- Critical path, early/late times and floats on a textbook network
+- Incremental duration updates vs full recomputation
+- Batched forward pass vs per-sample CPM
+- PERT Monte Carlo in scenario_analysis()
+- Resource requirements by task
+- Schedule risk simulation (criticality, sensitivity, risk flags)
+- Input validation (cycles, unknown tasks)
+
+Run with: pytest test_timeline_utils.py -v
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from Shared_Utils.timeline_utils import (
+    ScheduleNetwork,
+    build_schedule_network,
+    calculate_critical_path,
+    calculate_resource_requirements,
+    identify_risk_flags,
+    sample_pert_durations,
+    simulate_project_durations,
+    simulate_schedule_risk,
+    scenario_analysis
+)
+
+
+@pytest.fixture
+def textbook():
+    """A(3) -> B(4), A -> C(2), B -> D(5), C -> D, C -> E(1); D, E -> F(2)"""
+    tasks = [
+        {'id': 'A', 'name': 'Survey', 'duration': 3, 'optimistic': 2, 'most_likely': 3, 'pessimistic': 6},
+        {'id': 'B', 'name': 'Appraisal', 'duration': 4, 'optimistic': 3, 'most_likely': 4, 'pessimistic': 8},
+        {'id': 'C', 'name': 'Title search', 'duration': 2},
+        {'id': 'D', 'name': 'Negotiation', 'duration': 5, 'optimistic': 4, 'most_likely': 5, 'pessimistic': 12},
+        {'id': 'E', 'name': 'Notice', 'duration': 1},
+        {'id': 'F', 'name': 'Closing', 'duration': 2},
+    ]
+    dependencies = [('A', 'B'), ('A', 'C'), ('B', 'D'), ('C', 'D'), ('C', 'E'), ('D', 'F'), ('E', 'F')]
+    return tasks, dependencies
+
+
+def _random_dag(rng, n, p):
+    order = list(range(n))
+    rng.shuffle(order)
+    tasks = [{'id': f'T{i}', 'duration': rng.uniform(1, 30)} for i in range(n)]
+    deps = [(f'T{order[i]}', f'T{order[j]}') for i in range(n) for j in range(i + 1, n) if rng.random() < p]
+    return tasks, deps
+
+
+class TestCriticalPath:
+    """CPM results on a hand-checked network."""
+
+    def test_textbook_network(self, textbook):
+        timeline = calculate_critical_path(*textbook)
+        details = timeline['task_details']
+
+        assert timeline['project_duration'] == 14
+        assert timeline['critical_path'] == ['A', 'B', 'D', 'F']
+        assert timeline['num_critical_tasks'] == 4
+
+        assert details['C']['early_start'] == 3
+        assert details['C']['late_start'] == 5
+        assert details['C']['total_float'] == 2
+        assert details['C']['free_float'] == 0      # E starts right after C
+        assert details['E']['total_float'] == 6
+        assert details['E']['free_float'] == 6
+        assert details['F']['late_finish'] == 14
+        assert details['C']['name'] == 'Title search'
+
+    def test_network_arrays(self, textbook):
+        network = build_schedule_network(*textbook)
+        assert list(network.level) == [0, 1, 1, 2, 2, 3]
+        assert list(network.height) == [3, 2, 2, 1, 1, 0]
+        assert network.late_start.tolist() == [0, 3, 5, 7, 11, 12]
+
+
+class TestResourceRequirements:
+    """Resource totals and peaks on the engine's timeline."""
+
+    def test_textbook_resources(self, textbook):
+        timeline = calculate_critical_path(*textbook)
+        resources = calculate_resource_requirements(timeline, {
+            'A': {'staff': 2, 'consultants': {'legal': 1}, 'budget': 50000},
+            'C': {'staff': 1, 'consultants': {'legal': 2, 'appraisal': 1}, 'budget': 10000},
+            'F': {'staff': 3, 'budget': 5000},
+        })
+
+        assert resources['total_resources'] == {
+            'staff_days': 2 * 3 + 1 * 2 + 3 * 2,
+            'budget': 65000,
+            'consultant_days': {'legal': 1 * 3 + 2 * 2, 'appraisal': 2}
+        }
+        assert resources['peak_resources'] == {'staff': 3, 'consultants': {'legal': 2, 'appraisal': 1}}
+        assert [r['task_id'] for r in resources['resource_timeline']] == ['A', 'C', 'F']
+        assert [r['is_critical'] for r in resources['resource_timeline']] == [True, False, True]
+        assert resources['project_duration'] == 14
+
+
+class TestIncrementalUpdates:
+    """update_duration() must match a full recomputation."""
+
+    def test_textbook_update(self, textbook):
+        network = build_schedule_network(*textbook)
+        network.update_duration('C', 6)       # C becomes critical
+        assert network.project_duration == 16
+        assert network.critical_path() == ['A', 'C', 'D', 'F']
+
+        touched = network.update_duration('E', 1.5)
+        assert touched < network.n_tasks
+        assert network.project_duration == 16
+
+    def test_random_updates_match_full_pass(self):
+        rng = random.Random(11)
+        tasks, deps = _random_dag(rng, 120, 0.04)
+        network = build_schedule_network(tasks, deps)
+
+        for _ in range(150):
+            network.update_duration(rng.choice(tasks)['id'], rng.uniform(0, 40))
+
+        full = ScheduleNetwork(network.task_ids, network.durations, deps)
+        assert network.early_start == pytest.approx(full.early_start)
+        assert network.early_finish == pytest.approx(full.early_finish)
+        assert network.tail == pytest.approx(full.tail)
+        assert network.to_timeline() == full.to_timeline()
+
+
+class TestBatchedPasses:
+    """Sample-matrix passes vs one network per sample."""
+
+    def test_forward_pass_matches_per_sample(self):
+        rng = random.Random(5)
+        tasks, deps = _random_dag(rng, 60, 0.08)
+        network = build_schedule_network(tasks, deps)
+
+        samples = np.random.default_rng(0).uniform(1, 30, size=(8, network.n_tasks))
+        project = network.project_durations(samples)
+        early_start, _ = network.forward_pass(samples)
+
+        for row, duration, starts in zip(samples, project, early_start):
+            single = ScheduleNetwork(network.task_ids, row, deps)
+            assert duration == pytest.approx(single.project_duration)
+            assert starts == pytest.approx(single.early_start)
+
+    def test_dense_network_passes(self):
+        # In-degrees above the per-rank gather limit use the reduceat overflow
+        rng = random.Random(9)
+        tasks, deps = _random_dag(rng, 50, 0.5)
+        network = build_schedule_network(tasks, deps)
+        assert np.diff(network.pred_ptr).max() > 8
+
+        samples = np.random.default_rng(2).uniform(1, 30, size=(5, network.n_tasks))
+        early_start, early_finish = network.forward_pass(samples)
+        tail = network.backward_pass(samples)
+        critical = network._critical(early_start.T, early_finish.T).T
+
+        for row, starts, tails, mask in zip(samples, early_start, tail, critical):
+            single = ScheduleNetwork(network.task_ids, row, deps)
+            assert starts == pytest.approx(single.early_start)
+            assert tails == pytest.approx(single.tail)
+            assert mask.tolist() == single.is_critical.tolist()
+
+    @pytest.mark.parametrize('method', ['exact', 'table'])
+    def test_pert_samples_within_bounds(self, method):
+        samples = sample_pert_durations(
+            np.array([2.0, 5.0, 0.0]), np.array([3.0, 5.0, 0.0]), np.array([6.0, 5.0, 1.0]),
+            20000, np.random.default_rng(1), method
+        )
+        assert samples.shape == (20000, 3)
+        assert samples[:, 0].min() >= 2 and samples[:, 0].max() <= 6
+        assert samples[:, 0].mean() == pytest.approx((2 + 4 * 3 + 6) / 6, abs=0.02)
+        assert np.all(samples[:, 1] == 5.0)
+        # Optimistic == most likely: Beta(1, 5) with median 1 - 0.5 ** 0.2
+        assert np.median(samples[:, 2]) == pytest.approx(1 - 0.5 ** 0.2, abs=0.01)
+
+
+class TestScenarioAnalysis:
+    """PERT Monte Carlo in scenario_analysis()."""
+
+    def test_deterministic_network(self, textbook):
+        tasks = [{**task, 'optimistic': task['duration'], 'pessimistic': task['duration'],
+                  'most_likely': task['duration']} for task in textbook[0]]
+        network = build_schedule_network(tasks, textbook[1])
+        simulated = simulate_project_durations(network, iterations=50, seed=0)
+        assert np.all(simulated == 14)
+
+    def test_simulation_summary(self, textbook):
+        base = calculate_critical_path(*textbook)
+        network = build_schedule_network(*textbook)
+        scenarios = {'best_case': 0.8, 'likely_case': 1.0, 'worst_case': 1.3}
+
+        first = scenario_analysis(base, scenarios, network=network, iterations=5000, seed=3)
+        second = scenario_analysis(base, scenarios, network=network, iterations=5000, seed=3)
+        simulation = first['pert_simulation']
+
+        assert first == second
+        assert first['likely_case']['duration'] == 14
+        assert simulation['p10'] <= simulation['p50'] <= simulation['p90']
+        # Right-skewed estimates push the expected duration past the deterministic plan
+        assert simulation['mean_duration'] > 14
+        assert 0 < simulation['probability_within_base'] < 1
+
+    def test_without_network_unchanged(self, textbook):
+        result = scenario_analysis(calculate_critical_path(*textbook), {'likely_case': 1.0})
+        assert 'pert_simulation' not in result
+
+
+class TestScheduleRisk:
+    """simulate_schedule_risk() and the identify_risk_flags() simulation mode."""
+
+    @pytest.fixture
+    def uncertain(self, textbook):
+        # C's pessimistic estimate lets the A-C-D branch overtake A-B-D
+        tasks, deps = textbook
+        tasks = [dict(task) for task in tasks]
+        tasks[2].update(optimistic=1, most_likely=2, pessimistic=16)
+        return tasks, deps
+
+    def test_deterministic_network(self, textbook):
+        tasks = [{'id': t['id'], 'duration': t['duration']} for t in textbook[0]]
+        network = build_schedule_network(tasks, textbook[1])
+        risk = simulate_schedule_risk(network, iterations=100, seed=0)
+
+        assert risk['p50'] == risk['p80'] == risk['p95'] == 14
+        assert risk['std_duration'] == 0
+        assert risk['probability_within_deterministic'] == 1
+        assert risk['criticality_index'] == {'A': 1, 'B': 1, 'C': 0, 'D': 1, 'E': 0, 'F': 1}
+
+    def test_criticality_and_ranking(self, uncertain):
+        network = build_schedule_network(*uncertain)
+        risk = simulate_schedule_risk(network, iterations=20000, seed=4, deadlines={'D': 13})
+        index = risk['criticality_index']
+
+        assert risk == simulate_schedule_risk(network, iterations=20000, seed=4, deadlines={'D': 13})
+        assert risk['p50'] <= risk['p80'] <= risk['p95']
+        assert index['A'] == index['D'] == 1
+        assert index['B'] + index['C'] == pytest.approx(1, abs=0.01)
+        assert 0.05 < index['C'] < 0.95
+        assert index['E'] == 0
+
+        ranking = risk['sensitivity_ranking']
+        assert [row['sensitivity_index'] for row in ranking] == sorted(
+            (row['sensitivity_index'] for row in ranking), reverse=True
+        )
+        assert ranking[0]['task_id'] == 'D'
+        assert 0 < risk['deadline_miss_probability']['D'] < 1
+
+    def test_table_sampler_matches_exact(self, uncertain):
+        network = build_schedule_network(*uncertain)
+        table = simulate_schedule_risk(network, iterations=40000, seed=1, sampler='table')
+        exact = simulate_schedule_risk(network, iterations=40000, seed=1, sampler='exact')
+        for key in ('mean_duration', 'p50', 'p80', 'p95'):
+            assert table[key] == pytest.approx(exact[key], rel=0.01)
+        assert table['criticality_index']['C'] == pytest.approx(exact['criticality_index']['C'], abs=0.02)
+
+    def test_risk_flags_simulation_mode(self, uncertain):
+        timeline = calculate_critical_path(*uncertain)
+        network = build_schedule_network(*uncertain)
+        risk = simulate_schedule_risk(network, iterations=20000, seed=2, deadlines={'D': 13})
+
+        flags = identify_risk_flags(timeline, {'D': 13}, simulation=risk)
+        by_type = {(flag['risk_type'], flag['task_id']): flag for flag in flags}
+        assert ('NEAR_CRITICAL', 'C') in by_type
+        assert by_type[('DEADLINE_MISS_RISK', 'D')]['miss_probability'] == risk['deadline_miss_probability']['D']
+
+        plain = identify_risk_flags(timeline, {'D': 13})
+        assert all(flag['risk_type'] not in ('NEAR_CRITICAL', 'DEADLINE_MISS_RISK') for flag in plain)
+
+
+class TestValidation:
+    """Test input validation."""
+
+    def test_cycle(self, textbook):
+        tasks, deps = textbook
+        with pytest.raises(ValueError, match="cycle"):
+            calculate_critical_path(tasks, deps + [('F', 'A')])
+
+    def test_unknown_task(self, textbook):
+        tasks, deps = textbook
+        with pytest.raises(ValueError, match="'Z'"):
+            build_schedule_network(tasks, deps + [('A', 'Z')])
+
+    def test_bad_pert_estimates(self):
+        with pytest.raises(ValueError, match="optimistic"):
+            sample_pert_durations(np.array([5.0]), np.array([3.0]), np.array([6.0]), 10, np.random.default_rng())
+
+    def test_bad_simulation_inputs(self, textbook):
+        network = build_schedule_network(*textbook)
+        with pytest.raises(ValueError, match="'Z'"):
+            simulate_schedule_risk(network, iterations=10, deadlines={'Z': 5})
+        with pytest.raises(ValueError, match="method"):
+            simulate_schedule_risk(network, iterations=10, sampler='sobol')
+
+    def test_empty_network(self):
+        timeline = calculate_critical_path([], [])
+        assert timeline['project_duration'] == 0
+        assert timeline['critical_path'] == []
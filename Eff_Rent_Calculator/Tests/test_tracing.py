@@ -0,0 +1,207 @@
+"""
+Test suite for opt-in tracing spans.
+
+Tests include:
+- Disabled by default: span() is a shared no-op, @traced calls straight through
+- Nesting, self time, errors, async functions and per-task stacks
+- Memory stats, the span cap and the JSON / Chrome trace formats
+- REALESTATE_TRACE for any script and `realestate --trace`
+- Stage spans of the comparable sales pipeline
+
+Run with: pytest test_tracing.py -v
+"""
+
+import asyncio
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from Shared_Utils import tracing as tracing_module
+from Shared_Utils.cli import REPO_ROOT, main as cli_main
+from Shared_Utils.tracing import enable, disable, is_enabled, span, traced, tracing
+
+sys.path.insert(0, str(REPO_ROOT / 'Comparable_Sales_Analysis'))
+
+SAMPLE_INPUT = REPO_ROOT / 'Comparable_Sales_Analysis' / 'sample_inputs' / 'sample_industrial_comps.json'
+
+
+@traced
+def _leaf(seconds=0.0):
+    time.sleep(seconds)
+    return 'done'
+
+
+@traced('test.outer', category='stage')
+def _outer():
+    with span('test.inner', rows=3) as inner:
+        _leaf(0.01)
+        inner.set(matched=2)
+    return _leaf()
+
+
+class TestSpans:
+    """Recording, nesting and statistics."""
+
+    def test_disabled_is_noop(self):
+        assert not is_enabled()
+        assert span('a') is span('b') is tracing_module._NULL_SPAN
+        with span('a') as s:
+            s.set(x=1)
+        assert _outer() == 'done'
+
+    def test_nesting_and_self_time(self):
+        with tracing() as tracer:
+            assert _outer() == 'done'
+        assert not is_enabled()
+
+        summary = tracer.summary()
+        assert list(summary)[0] == 'test.outer'
+        assert summary['_leaf']['calls'] == 2
+        assert summary['test.outer']['category'] == 'stage'
+        assert summary['_leaf']['category'] == 'function'
+        outer, inner = summary['test.outer'], summary['test.inner']
+        assert inner['total_ms'] >= 10
+        assert outer['self_ms'] < outer['total_ms'] - inner['total_ms'] + 1e-6
+        assert inner['self_ms'] < 5
+
+        records = {record['name']: record for record in tracer.spans}
+        assert records['test.inner']['args'] == {'rows': 3, 'matched': 2}
+        assert records['test.inner']['depth'] == 1
+        assert [record['depth'] for record in tracer.spans if record['name'] == '_leaf'] == [2, 1]
+
+    def test_errors_recorded(self):
+        @traced
+        def failing():
+            raise KeyError('missing')
+
+        with tracing() as tracer:
+            with pytest.raises(KeyError):
+                failing()
+        assert tracer.summary()['TestSpans.test_errors_recorded.<locals>.failing']['errors'] == 1
+        assert tracer.spans[0]['args'] == {'error': 'KeyError'}
+
+    def test_async_tasks(self):
+        @traced('test.fetch', category='provider')
+        async def fetch(delay):
+            await asyncio.sleep(delay)
+            return delay
+
+        async def run():
+            with span('test.gather'):
+                return await asyncio.gather(fetch(0.02), fetch(0.01))
+
+        with tracing() as tracer:
+            assert asyncio.run(run()) == [0.02, 0.01]
+
+        fetches = [record for record in tracer.spans if record['name'] == 'test.fetch']
+        assert len(fetches) == 2 and all(record['depth'] == 1 for record in fetches)
+        assert len({record['tid'] for record in fetches}) == 2
+        assert tracer.summary()['test.fetch']['max_ms'] >= 20
+
+    def test_memory(self):
+        with tracing(memory=True) as tracer:
+            with span('test.allocate'):
+                data = [bytearray(1024) for _ in range(1000)]
+            del data
+        stats = tracer.summary()['test.allocate']
+        assert stats['memory_delta_kb'] > 900
+        assert stats['memory_peak_kb'] >= stats['memory_delta_kb']
+
+    def test_span_cap(self):
+        with tracing(max_spans=5) as tracer:
+            for _ in range(8):
+                _leaf()
+        assert len(tracer.spans) == 5 and tracer.dropped_spans == 3
+        assert tracer.summary()['_leaf']['calls'] == 8
+
+    def test_enable_disable(self):
+        tracer = enable()
+        try:
+            _leaf()
+            assert is_enabled()
+        finally:
+            assert disable() is tracer
+        _leaf()
+        assert tracer.summary()['_leaf']['calls'] == 1
+        assert tracer.end_ns is not None
+
+
+class TestOutput:
+    """Trace files, environment variable and command line."""
+
+    def test_json_and_chrome(self, tmp_path):
+        with tracing(tmp_path / 'trace.json') as tracer:
+            _outer()
+        document = json.loads((tmp_path / 'trace.json').read_text())
+        assert set(document['summary']) == {'test.outer', 'test.inner', '_leaf'}
+        assert len(document['spans']) == 4 and document['dropped_spans'] == 0
+
+        tracer.write(tmp_path / 'chrome.json', format='chrome')
+        chrome = json.loads((tmp_path / 'chrome.json').read_text())
+        events = [event for event in chrome['traceEvents'] if event['ph'] == 'X']
+        assert {event['name'] for event in events} == {'test.outer', 'test.inner', '_leaf'}
+        assert all(event['dur'] >= 0 and 'self_ms' in event['args'] for event in events)
+        assert any(event['ph'] == 'M' for event in chrome['traceEvents'])
+        assert chrome['otherData']['summary']['_leaf']['calls'] == 2
+
+        with pytest.raises(ValueError, match="format"):
+            tracer.write(tmp_path / 'x.json', format='xml')
+        with pytest.raises(ValueError, match="format"):
+            with tracing(format='xml'):
+                pass
+
+    def test_environment_variable(self, tmp_path):
+        path = tmp_path / 'env_trace.json'
+        script = (
+            "from Shared_Utils.tracing import span\n"
+            "with span('script.work', items=2):\n"
+            "    pass\n"
+        )
+        env = dict(os.environ, REALESTATE_TRACE=str(path), REALESTATE_TRACE_FORMAT='chrome',
+                   PYTHONPATH=str(REPO_ROOT))
+        subprocess.run([sys.executable, '-c', script], env=env, check=True, cwd=tmp_path)
+        events = json.loads(path.read_text())['traceEvents']
+        assert [event['args']['items'] for event in events if event['name'] == 'script.work'] == [2]
+
+    def test_command_line(self, tmp_path):
+        path = tmp_path / 'cli_trace.json'
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            exit_code = cli_main(['--trace', str(path), 'comparable-sales', str(SAMPLE_INPUT),
+                                  '--output', str(tmp_path / 'results.json')])
+        assert exit_code == 0
+        assert 'Trace written' in stderr.getvalue()
+        summary = json.loads(path.read_text())['summary']
+        assert summary['command.comparable-sales']['category'] == 'command'
+        assert summary['comparable_sales.load']['calls'] == 1
+        assert not is_enabled()
+
+
+class TestComparableSalesStages:
+    """Instrumented pipeline stages."""
+
+    def test_reconcile_spans(self):
+        from comparable_sales_calculator import ComparableSalesCalculator
+        data = json.loads(SAMPLE_INPUT.read_text())
+        calculator = ComparableSalesCalculator(data)
+
+        with tracing() as tracer:
+            results = calculator.reconcile_comparables()
+        untraced = ComparableSalesCalculator(data).reconcile_comparables()
+        assert results['reconciliation'] == untraced['reconciliation']
+
+        summary = tracer.summary()
+        count = len(data['comparable_sales'])
+        assert summary['comparable_sales.adjust']['calls'] == 1
+        assert summary['comparable_sales.adjust_comparable']['calls'] == count
+        assert summary['comparable_sales.validate']['calls'] == count
+        assert summary['comparable_sales.reconcile']['calls'] == 1
+        assert summary['ComparableSalesCalculator.calculate_market_conditions_adjustment']['calls'] == count
+        adjust = summary['comparable_sales.adjust']
+        assert adjust['self_ms'] <= adjust['total_ms']
@@ -28,6 +28,10 @@ import sys
 import argparse
 from pathlib import Path
 
+# Add repo root to path for Shared_Utils
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from Shared_Utils.discount_curve import discount_curve
+
 
 @dataclass
 class LeaseTerms:
@@ -132,6 +136,8 @@ class BAFCalculator:
     def __init__(self, terms: LeaseTerms):
         self.terms = terms
         self.monthly_discount_rate = terms.nominal_discount_rate / 12
+        # Shared annuity-due table (rent paid at beginning of month)
+        self.discount_curve = discount_curve(self.monthly_discount_rate, timing='beginning')
 
     def calculate_pv(self, payment: float, periods: int, months_offset: int = 0) -> float:
         """
@@ -149,16 +155,11 @@ class BAFCalculator:
             return 0.0
 
         # PV formula: PV = payment * ((1 - (1 + r)^-n) / r) * (1 + r)
-        # Excel PV with type=1 (payment at beginning of period)
-        r = self.monthly_discount_rate
-        pv = -npf.pv(r, periods, payment, 0, 1)  # type=1 for beginning of period
-
-        # Discount for months already elapsed (using monthly compounding)
+        # Equivalent to Excel PV with type=1 (payment at beginning of period),
+        # read from the cached annuity-due table
+        # Months already elapsed are discounted with monthly compounding:
         # Excel formula: PV / (1 + monthly_rate)^months_elapsed
-        if months_offset > 0:
-            pv = pv / ((1 + r) ** months_offset)
-
-        return pv
+        return self.discount_curve.pv(payment, periods, months_offset)
 
     def calculate_pmt(self, pv: float, periods: int, rate: Optional[float] = None) -> float:
         """
@@ -258,8 +259,7 @@ class BAFCalculator:
             else:
                 # Subsequent commissions paid at start of each year
                 # Discount from that point back to month 0
-                discount_factor = (1 + self.monthly_discount_rate) ** cumulative_months
-                commission_pv = commission / discount_factor
+                commission_pv = commission * self.discount_curve.discount_factor(cumulative_months)
 
             total_commission_pv += commission_pv
             cumulative_months += months
@@ -622,6 +622,19 @@ def load_from_json(json_path: str) -> LeaseTerms:
     with open(json_path, 'r') as f:
         data = json.load(f)
 
+    return lease_terms_from_dict(data)
+
+
+def lease_terms_from_dict(data: dict) -> LeaseTerms:
+    """
+    Build lease terms from a parsed JSON input document
+
+    Args:
+        data: Input document (same layout as the JSON input file)
+
+    Returns:
+        LeaseTerms object
+    """
     # Parse lease start date if provided
     lease_start = None
     if 'lease_terms' in data and 'lease_start_date' in data['lease_terms']:
@@ -688,18 +701,19 @@ def load_from_json(json_path: str) -> LeaseTerms:
     return terms
 
 
-def save_results_to_file(terms: LeaseTerms, results: CalculationResults,
-                         output_path: str, deal_name: str = "Lease Deal"):
+def results_to_dict(terms: LeaseTerms, results: CalculationResults, deal_name: str = "Lease Deal") -> dict:
     """
-    Save calculation results to JSON file
+    Calculation results in the JSON output layout
 
     Args:
         terms: LeaseTerms object
         results: CalculationResults object
-        output_path: Path for output file
         deal_name: Name of the deal
+
+    Returns:
+        Dictionary written by save_results_to_file
     """
-    output = {
+    return {
         'deal_name': deal_name,
         'calculation_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
         'inputs': {
@@ -755,8 +769,20 @@ def save_results_to_file(terms: LeaseTerms, results: CalculationResults,
         }
     }
 
+
+def save_results_to_file(terms: LeaseTerms, results: CalculationResults,
+                         output_path: str, deal_name: str = "Lease Deal"):
+    """
+    Save calculation results to JSON file
+
+    Args:
+        terms: LeaseTerms object
+        results: CalculationResults object
+        output_path: Path for output file
+        deal_name: Name of the deal
+    """
     with open(output_path, 'w') as f:
-        json.dump(output, f, indent=2)
+        json.dump(results_to_dict(terms, results, deal_name), f, indent=2)
 
     print(f"\n✓ Results saved to: {output_path}")
 
@@ -19,15 +19,67 @@ import json
 import sys
 import os
 from datetime import datetime
+from typing import Any, Dict
 
 from IFRS16_Calculator.ifrs16_calculator import (
     LeaseInputs,
+    LeaseAccountingResult,
     calculate_ifrs16,
     print_summary,
     export_to_csv
 )
 
 
+def lease_inputs_from_dict(data: Dict[str, Any]) -> LeaseInputs:
+    """Build lease inputs from a parsed JSON input document"""
+    commencement_date = datetime.strptime(data['commencement_date'], '%Y-%m-%d') if 'commencement_date' in data else datetime.now()
+
+    return LeaseInputs(
+        monthly_payments=data['monthly_payments'],
+        annual_discount_rate=data['annual_discount_rate'],
+        initial_direct_costs=data.get('initial_direct_costs', 0.0),
+        prepaid_rent=data.get('prepaid_rent', 0.0),
+        lease_incentives=data.get('lease_incentives', 0.0),
+        lease_term_months=data.get('lease_term_months', len(data['monthly_payments'])),
+        payment_timing=data.get('payment_timing', 'beginning'),
+        tenant_name=data.get('tenant_name', 'Tenant'),
+        property_address=data.get('property_address', 'Property'),
+        commencement_date=commencement_date
+    )
+
+
+def results_to_dict(inputs: LeaseInputs, result: LeaseAccountingResult) -> Dict[str, Any]:
+    """Headline results and annual summary in the JSON output layout"""
+    return {
+        'tenant_name': inputs.tenant_name,
+        'property_address': inputs.property_address,
+        'commencement_date': inputs.commencement_date.strftime('%Y-%m-%d'),
+        'lease_term_months': inputs.lease_term_months,
+        'discount_rate': inputs.annual_discount_rate,
+        'payment_timing': inputs.payment_timing,
+
+        # Initial balances
+        'initial_lease_liability': result.initial_lease_liability,
+        'initial_rou_asset': result.initial_rou_asset,
+
+        # Total costs
+        'total_interest_expense': result.total_interest_expense,
+        'total_depreciation': result.total_depreciation,
+        'total_lease_cost': result.total_lease_cost,
+        'total_cash_payments': sum(inputs.monthly_payments),
+
+        # Components
+        'lease_liability_components': result.lease_liability_components,
+        'rou_asset_components': result.rou_asset_components,
+
+        # Rate info
+        'monthly_discount_rate': result.monthly_discount_rate,
+
+        # Annual summary
+        'annual_summary': result.annual_summary.to_dict('records')
+    }
+
+
 def main():
     """Main execution function."""
     if len(sys.argv) < 2:
@@ -47,20 +99,7 @@ def main():
         data = json.load(f)
 
     # Convert JSON to LeaseInputs
-    commencement_date = datetime.strptime(data['commencement_date'], '%Y-%m-%d') if 'commencement_date' in data else datetime.now()
-
-    inputs = LeaseInputs(
-        monthly_payments=data['monthly_payments'],
-        annual_discount_rate=data['annual_discount_rate'],
-        initial_direct_costs=data.get('initial_direct_costs', 0.0),
-        prepaid_rent=data.get('prepaid_rent', 0.0),
-        lease_incentives=data.get('lease_incentives', 0.0),
-        lease_term_months=data.get('lease_term_months', len(data['monthly_payments'])),
-        payment_timing=data.get('payment_timing', 'beginning'),
-        tenant_name=data.get('tenant_name', 'Tenant'),
-        property_address=data.get('property_address', 'Property'),
-        commencement_date=commencement_date
-    )
+    inputs = lease_inputs_from_dict(data)
 
     # Run IFRS 16 calculation
     print(f"\nCalculating IFRS 16 Lease Accounting for: {inputs.tenant_name}")
@@ -101,34 +140,7 @@ def main():
     print(f"  - {annual_file}")
 
     # Save results to JSON
-    output_data = {
-        'tenant_name': inputs.tenant_name,
-        'property_address': inputs.property_address,
-        'commencement_date': inputs.commencement_date.strftime('%Y-%m-%d'),
-        'lease_term_months': inputs.lease_term_months,
-        'discount_rate': inputs.annual_discount_rate,
-        'payment_timing': inputs.payment_timing,
-
-        # Initial balances
-        'initial_lease_liability': result.initial_lease_liability,
-        'initial_rou_asset': result.initial_rou_asset,
-
-        # Total costs
-        'total_interest_expense': result.total_interest_expense,
-        'total_depreciation': result.total_depreciation,
-        'total_lease_cost': result.total_lease_cost,
-        'total_cash_payments': sum(inputs.monthly_payments),
-
-        # Components
-        'lease_liability_components': result.lease_liability_components,
-        'rou_asset_components': result.rou_asset_components,
-
-        # Rate info
-        'monthly_discount_rate': result.monthly_discount_rate,
-
-        # Annual summary
-        'annual_summary': result.annual_summary.to_dict('records')
-    }
+    output_data = results_to_dict(inputs, result)
 
     output_file = input_file.replace('_input.json', '_results.json')
     with open(output_file, 'w') as f:
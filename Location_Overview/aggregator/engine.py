@@ -10,6 +10,8 @@ from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 import logging
 
+from Shared_Utils.tracing import span
+
 from ..providers.base import BaseProvider, ProviderResult, ProviderStatus
 
 
@@ -77,6 +79,33 @@ class AggregationEngine:
         """
         return [p for p in self.providers if p.is_applicable(municipality)]
 
+    async def _traced_query(
+        self,
+        provider: BaseProvider,
+        lat: float,
+        lon: float,
+        **kwargs,
+    ) -> ProviderResult:
+        """
+        Query one provider with the engine timeout, as a tracing span.
+
+        Args:
+            provider: Provider to query
+            lat: Latitude
+            lon: Longitude
+            **kwargs: Additional parameters
+
+        Returns:
+            ProviderResult (timeouts and provider errors propagate)
+        """
+        with span(f"provider.{provider.name}", category="provider") as provider_span:
+            result = await asyncio.wait_for(
+                provider.query(lat, lon, **kwargs),
+                timeout=self.timeout,
+            )
+            provider_span.set(success=result.success, cached=result.cached)
+            return result
+
     async def execute(
         self,
         lat: float,
@@ -96,6 +125,17 @@ class AggregationEngine:
         Returns:
             AggregationResult with merged data
         """
+        with span("aggregation.execute", municipality=municipality):
+            return await self._execute(lat, lon, municipality, **kwargs)
+
+    async def _execute(
+        self,
+        lat: float,
+        lon: float,
+        municipality: str,
+        **kwargs,
+    ) -> AggregationResult:
+        """Run the applicable providers and merge their results (see execute)."""
         import time
 
         start_time = time.time()
@@ -118,10 +158,7 @@ class AggregationEngine:
         provider_names = []
 
         for provider in providers:
-            task = asyncio.wait_for(
-                provider.query(lat, lon, **kwargs),
-                timeout=self.timeout,
-            )
+            task = self._traced_query(provider, lat, lon, **kwargs)
             tasks.append(task)
             provider_names.append(provider.name)
 
@@ -20,10 +20,14 @@ Date: 2025-12-16
 import json
 import argparse
 import statistics
+import sys
 from datetime import datetime
 from typing import Dict, List, Tuple, Any, Optional
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from Shared_Utils.progress import DEBUG, WARNING, ConsoleReporter, emit, progress, reporting
+
 # Import local modules
 from validation import validate_input_data, validate_all_comparables, validate_time_adjustment
 from weight_profiles import (
@@ -36,7 +40,7 @@ from score_to_price import interpolate_value, regression_value, reconcile_method
 
 
 # =============================================================================
-# CONDITION ENCODING
+# CONDITION AND BUILDING CLASS ENCODING
 # =============================================================================
 
 CONDITION_ENCODING = {
@@ -48,6 +52,17 @@ CONDITION_ENCODING = {
     'poor': 6
 }
 
+# Unified schema building classes on the A=1, B=2, C=3 scale
+BUILDING_CLASS_ENCODING = {
+    'A+': 0.7,
+    'A': 1,
+    'A-': 1.3,
+    'B+': 1.7,
+    'B': 2,
+    'B-': 2.3,
+    'C': 3
+}
+
 
 # =============================================================================
 # PROPERTY RANKING
@@ -78,6 +93,8 @@ def rank_properties(
         # Handle condition encoding
         if variable == 'condition' and isinstance(value, str):
             value = CONDITION_ENCODING.get(value.lower(), 4)
+        elif variable == 'building_class' and isinstance(value, str):
+            value = BUILDING_CLASS_ENCODING.get(value.upper(), 2)
 
         # Handle boolean variables
         if isinstance(value, bool):
@@ -209,6 +226,11 @@ def run_analysis(
     # Validate comparables
     validation_result = validate_all_comparables(comparables, valuation_date, property_type)
     valid_comps = validation_result['valid_comparables']
+    emit('mcda', 'validated', "  Valid comparables: {valid} of {total}", DEBUG,
+         valid=len(valid_comps), total=len(comparables))
+    for excluded in validation_result['excluded_comparables']:
+        emit('mcda', 'excluded', "  ⚠️  Excluded {address}: {reasons}", WARNING,
+             address=excluded['comparable'].get('address', 'Unknown'), reasons='; '.join(excluded['reasons']))
 
     # Get weight profile
     if weight_profile:
@@ -223,6 +245,8 @@ def run_analysis(
         available_vars[var] = has_data
 
     adjusted_weights = allocate_dynamic_weights(available_vars, weights)
+    emit('mcda', 'weights', "  Weight profile: {profile} ({count} variables with data)", DEBUG,
+         profile=weight_profile or property_type, count=sum(available_vars.values()))
 
     # Combine subject and comparables for ranking
     all_properties = valid_comps + [subject]
@@ -238,7 +262,7 @@ def run_analysis(
     scored_comps = []
     comparable_analysis = []
 
-    for comp in valid_comps:
+    for comp in progress(valid_comps, 'Scoring comparables', counter='mcda.comparables_scored'):
         address = comp['address']
         score = composite_scores[address]
         price_psf = comp['sale_price'] / comp['building_sf']
@@ -275,6 +299,10 @@ def run_analysis(
     interpolation_result = interpolate_value(subject_score, scored_comps, subject_sf)
     regression_result = regression_value(subject_score, scored_comps, subject_sf, method=regression_method)
     reconciled = reconcile_methods(interpolation_result, regression_result, subject_sf)
+    emit('mcda', 'value',
+         "  Interpolation ${interpolation:.2f}/SF, regression ${regression:.2f}/SF (R² {r_squared:.3f})", DEBUG,
+         interpolation=interpolation_result['indicated_value_psf'],
+         regression=regression_result['indicated_value_psf'], r_squared=regression_result['r_squared'])
 
     # Build value indication
     value_indication = {
@@ -390,11 +418,14 @@ Examples:
         print(f"  Subject: {input_data['subject_property']['address']}")
         print(f"  Comparables: {len(input_data['comparable_sales'])}")
 
-    results = run_analysis(
-        input_data,
-        weight_profile=args.profile,
-        regression_method=args.regression
-    )
+    # Stage events with --verbose; otherwise only warnings, on stderr (stdout may carry the JSON)
+    reporter = ConsoleReporter(level=DEBUG) if args.verbose else ConsoleReporter(level=WARNING, stream=sys.stderr)
+    with reporting(reporter):
+        results = run_analysis(
+            input_data,
+            weight_profile=args.profile,
+            regression_method=args.regression
+        )
 
     # Output results
     if args.output:
@@ -173,6 +173,22 @@ class TestPropertyRanking:
 
         assert comp1_rank == comp4_rank == subject_rank
 
+    def test_rank_unified_schema_building_class(self):
+        """Unified schema building classes (A+ ... C) rank on the A=1, B=2, C=3 scale"""
+        from mcda_sales_calculator import rank_properties
+
+        properties = [
+            {'address': 'Class B', 'building_class': 'B'},
+            {'address': 'Class A+', 'building_class': 'A+'},
+            {'address': 'Class C', 'building_class': 'C'},
+            {'address': 'Class A numeric', 'building_class': 1}
+        ]
+        rankings = rank_properties(properties, 'building_class', 'lower_is_better')
+
+        assert rankings['Class A+'] == 1
+        assert rankings['Class A numeric'] == 2
+        assert rankings['Class C'] == 4
+
 
 # =============================================================================
 # COMPOSITE SCORE TESTS
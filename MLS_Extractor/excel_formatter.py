@@ -17,7 +17,12 @@ from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
 from typing import List, Dict, Any
 from datetime import datetime
+from pathlib import Path
 from zoneinfo import ZoneInfo
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from Shared_Utils.progress import emit, progress
 
 
 # Perfect Column Order - by decision importance
@@ -155,7 +160,7 @@ def create_perfect_excel(properties: List[Dict[str, Any]], output_path: str) ->
     # Save with perfect settings
     wb.save(output_path)
 
-    print(f"✅ Created perfect Excel file: {output_path}")
+    emit('mls_excel', 'created', "✅ Created perfect Excel file: {path}", path=output_path, rows=len(properties))
     return output_path
 
 
@@ -216,7 +221,8 @@ def _write_data_rows(ws, properties: List[Dict[str, Any]]):
         right=Side(style='thin', color='E0E0E0')
     )
 
-    for row_idx, prop in enumerate(properties, start=2):
+    rows = progress(properties, 'Writing Excel rows', counter='mls_excel.rows')
+    for row_idx, prop in enumerate(rows, start=2):
         is_subject = prop.get('is_subject', False)
 
         # Choose fill based on subject/alternating pattern
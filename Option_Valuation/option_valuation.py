@@ -18,7 +18,6 @@ import json
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass, asdict
 from datetime import datetime
-from scipy.stats import norm
 import numpy as np
 
 
@@ -147,6 +146,7 @@ def cumulative_normal_distribution(x: float) -> float:
     Returns:
         Probability that standard normal ≤ x
     """
+    from scipy.stats import norm   # Deferred: scipy.stats takes ~0.7 s to import
     return norm.cdf(x)
 
 
@@ -722,6 +722,19 @@ def load_options_from_json(json_path: str) -> Tuple[List[OptionParameters], Dict
     with open(json_path, 'r') as f:
         data = json.load(f)
 
+    return options_from_dict(data)
+
+
+def options_from_dict(data: Dict) -> Tuple[List[OptionParameters], Dict]:
+    """
+    Build option parameters from a parsed JSON input document
+
+    Args:
+        data: Input document (structure as in load_options_from_json)
+
+    Returns:
+        Tuple of (list of OptionParameters, metadata dict)
+    """
     options_list = []
     for opt_data in data.get('options', []):
         opt = OptionParameters(
@@ -30,6 +30,11 @@ from dataclasses import dataclass, asdict
 from pathlib import Path
 import sys
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from Shared_Utils.progress import WARNING, emit
+
+SOURCE = 'relative_valuation'
+
 
 @dataclass
 class Property:
@@ -139,18 +144,7 @@ def load_comparable_data(json_path: str) -> Dict[str, Any]:
         with open(json_path, 'r') as f:
             data = json.load(f)
 
-        # Validate required fields (except weights - will be auto-loaded if missing)
-        required_fields = ['analysis_date', 'market', 'subject_property', 'comparables']
-        for field in required_fields:
-            if field not in data:
-                raise ValueError(f"Missing required field: {field}")
-
-        # AUTO-LOAD DEFAULT WEIGHTS IF MISSING
-        if 'weights' not in data or not data['weights']:
-            print("[INFO] No weights specified in input JSON - loading default persona weights")
-            data['weights'] = get_tenant_persona_weights(persona="default")
-
-        return data
+        return prepare_comparable_data(data)
 
     except FileNotFoundError:
         print(f"Error: File not found: {json_path}")
@@ -160,6 +154,33 @@ def load_comparable_data(json_path: str) -> Dict[str, Any]:
         sys.exit(1)
 
 
+def prepare_comparable_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate a parsed comparable data document and fill in default weights.
+
+    Args:
+        data: Parsed JSON input (modified in place)
+
+    Returns:
+        The same dictionary, with weights loaded if they were missing
+
+    Raises:
+        ValueError: If a required field is missing
+    """
+    # Validate required fields (except weights - will be auto-loaded if missing)
+    required_fields = ['analysis_date', 'market', 'subject_property', 'comparables']
+    for field in required_fields:
+        if field not in data:
+            raise ValueError(f"Missing required field: {field}")
+
+    # AUTO-LOAD DEFAULT WEIGHTS IF MISSING
+    if 'weights' not in data or not data['weights']:
+        print("[INFO] No weights specified in input JSON - loading default persona weights")
+        data['weights'] = get_tenant_persona_weights(persona="default")
+
+    return data
+
+
 def calculate_area_differences(properties: List[Dict[str, Any]], subject_sf: float) -> List[Dict[str, Any]]:
     """
     Calculate absolute difference in area between each property and subject.
@@ -1175,7 +1196,7 @@ def run_analysis(data: Dict[str, Any]) -> CompetitiveAnalysis:
     Returns:
         CompetitiveAnalysis results object
     """
-    print("\n🔍 Running Relative Valuation Analysis...")
+    emit(SOURCE, 'start', "\n🔍 Running Relative Valuation Analysis...")
 
     # Extract components
     analysis_date = data['analysis_date']
@@ -1200,7 +1221,7 @@ def run_analysis(data: Dict[str, Any]) -> CompetitiveAnalysis:
     # IMPORTANT: Only filter comparables, never remove the subject property
     filters = data.get('filters', {})
     if filters:
-        print(f"\n   Applying must-have filters...")
+        emit(SOURCE, 'filters', "\n   Applying must-have filters...")
 
         # Separate subject from comparables
         comparables = [p for p in all_properties_data if not p.get('is_subject', False)]
@@ -1213,13 +1234,17 @@ def run_analysis(data: Dict[str, Any]) -> CompetitiveAnalysis:
         if subject_list:
             subject_filtered, subject_excluded = apply_must_have_filters(subject_list, filters)
             if subject_excluded:
-                print(f"   ⚠️  WARNING: Subject property would fail filters but is retained for analysis:")
+                emit(SOURCE, 'subject_fails_filters',
+                     "   ⚠️  WARNING: Subject property would fail filters but is retained for analysis:", WARNING)
                 for excl in subject_excluded:
-                    print(f"      - {excl['address']}: {', '.join(excl['exclusion_reasons'])}")
+                    emit(SOURCE, 'subject_filter_reason', "      - {address}: {reasons}", WARNING,
+                         address=excl['address'], reasons=', '.join(excl['exclusion_reasons']))
 
-        print(f"   {len(excluded_properties)} comparable properties excluded by filters")
+        emit(SOURCE, 'filtered', "   {count} comparable properties excluded by filters",
+             count=len(excluded_properties))
         for excl in excluded_properties:
-            print(f"      - {excl['address']}: {', '.join(excl['exclusion_reasons'])}")
+            emit(SOURCE, 'filter_excluded', "      - {address}: {reasons}",
+                 address=excl['address'], reasons=', '.join(excl['exclusion_reasons']))
 
         # Always include subject + filtered comparables
         all_properties_data = subject_list + filtered_comparables
@@ -1228,20 +1253,21 @@ def run_analysis(data: Dict[str, Any]) -> CompetitiveAnalysis:
     subject_sf = subject_data['available_sf']
     all_properties_data = calculate_area_differences(all_properties_data, subject_sf)
 
-    print(f"\n   Loaded {len(all_properties_data)} properties for analysis")
-    print(f"   Subject: {subject_data['address']} {subject_data.get('unit', '')}")
+    emit(SOURCE, 'loaded', "\n   Loaded {count} properties for analysis", count=len(all_properties_data))
+    emit(SOURCE, 'subject', "   Subject: {address} {unit}",
+         address=subject_data['address'], unit=subject_data.get('unit', ''))
 
     # Detect available optional variables
-    print("\n   Detecting available variables...")
+    emit(SOURCE, 'detect_variables', "\n   Detecting available variables...")
     available_vars = detect_available_variables(all_properties_data)
     num_available = sum(1 for v in available_vars.values() if v)
-    print(f"   Using {num_available} of 25 possible variables")
+    emit(SOURCE, 'variables', "   Using {count} of 25 possible variables", count=num_available)
 
     # Allocate weights dynamically based on available data
     dynamic_weights = allocate_dynamic_weights(available_vars, weights)
-    print(f"   Dynamic weights calculated:")
+    emit(SOURCE, 'weights', "   Dynamic weights calculated:")
     for var, weight in sorted(dynamic_weights.items(), key=lambda x: -x[1]):
-        print(f"      {var}: {weight:.1%}")
+        emit(SOURCE, 'weight', "      {variable}: {weight:.1%}", variable=var, weight=weight)
 
     # Extract values for each variable
     building_ages = [p.get('building_age_years', 0) for p in all_properties_data]
@@ -1257,7 +1283,7 @@ def run_analysis(data: Dict[str, Any]) -> CompetitiveAnalysis:
     # Rank each variable
     # Variables where LOWER = BETTER (ascending=True): rent, TMI, distance, class, area_diff, building_age, hvac_coverage, sprinkler_type, occupancy_status
     # Variables where HIGHER = BETTER (ascending=False): clear_height, parking, % office, shipping doors, power, boolean amenities, bay_depth, lot_size
-    print("\n   Ranking variables...")
+    emit(SOURCE, 'rank', "\n   Ranking variables...")
 
     ranks_building_age = rank_variable(building_ages, ascending=True)  # Newer (lower age) = better
     ranks_clear_height = rank_variable(clear_heights, ascending=False)  # Higher = better
@@ -1364,7 +1390,7 @@ def run_analysis(data: Dict[str, Any]) -> CompetitiveAnalysis:
         ranks_zoning = [zoning_rank_map.get(z, worst_rank) if z else worst_rank for z in zoning_values]
 
     # Calculate weighted scores
-    print("   Calculating weighted scores...")
+    emit(SOURCE, 'score', "   Calculating weighted scores...")
     for i, prop in enumerate(all_properties_data):
         # Build ranks_dict with core variables
         ranks_dict = {
@@ -1461,7 +1487,7 @@ def run_analysis(data: Dict[str, Any]) -> CompetitiveAnalysis:
         prop['final_rank'] = i + 1
         prop['gross_rent'] = round(prop['net_asking_rent'] + prop['tmi'], 2)
 
-    print("   Final rankings assigned")
+    emit(SOURCE, 'ranked', "   Final rankings assigned")
 
     # Find subject property
     subject_result = next((p for p in all_properties_data if p.get('is_subject', False)), None)
@@ -1469,8 +1495,9 @@ def run_analysis(data: Dict[str, Any]) -> CompetitiveAnalysis:
         raise ValueError("Subject property not found in results (check is_subject flag)")
 
     subject_rank = subject_result['final_rank']
-    print(f"\n   ✅ Subject Property Rank: #{subject_rank} out of {len(all_properties_data)}")
-    print(f"   Weighted Score: {subject_result['weighted_score']:.2f}")
+    emit(SOURCE, 'subject_rank', "\n   ✅ Subject Property Rank: #{rank} out of {count}",
+         rank=subject_rank, count=len(all_properties_data))
+    emit(SOURCE, 'subject_score', "   Weighted Score: {score:.2f}", score=subject_result['weighted_score'])
 
     # Get top 10 competitors
     top_10 = all_properties_data[:10]
@@ -1499,7 +1526,7 @@ def run_analysis(data: Dict[str, Any]) -> CompetitiveAnalysis:
     # FIXED: Skip sensitivity analysis when there are fewer than 3 comparables
     # (rank_3_score = None indicates insufficient data)
     if gap_analysis['rank_3_score'] is not None:
-        print("\n   Running sensitivity analysis...")
+        emit(SOURCE, 'sensitivity', "\n   Running sensitivity analysis...")
         sensitivity_scenarios = run_sensitivity_analysis(
             subject_result,
             all_properties_data,
@@ -1508,7 +1535,9 @@ def run_analysis(data: Dict[str, Any]) -> CompetitiveAnalysis:
             gap_analysis['rank_3_score']
         )
     else:
-        print(f"\n   ⚠️  Skipping sensitivity analysis - insufficient comparables ({len(all_properties_data)} total, need 3+)")
+        emit(SOURCE, 'sensitivity_skipped',
+             "\n   ⚠️  Skipping sensitivity analysis - insufficient comparables ({count} total, need 3+)", WARNING,
+             count=len(all_properties_data))
         sensitivity_scenarios = []
 
     # Build results object
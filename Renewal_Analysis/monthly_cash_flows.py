@@ -0,0 +1,456 @@
+"""
+Monthly Cash-Flow Engine for Renewal vs. Relocation
+
+Builds monthly-timed outflow vectors for renewal and relocation scenarios
+and discounts them on a single monthly curve, for one site or a whole
+portfolio at once:
+
+- Month 0 is lease commencement; rent and operating costs are paid
+  monthly in advance (t = 0 .. term_months - 1)
+- Free rent: base rent abated for the first free_rent_months months
+  (operating costs still paid)
+- Staggered TI: net TI cost drawn per ti_draw_schedule [(month, fraction)]
+  instead of all at commencement
+- Overlap rent (relocation): rent on the old premises for overlap_months
+  after the new lease commences
+- Other upfront costs (legal, moving, disruption, ...) at month 0
+
+Each site is a row of a (sites × months) matrix. Discount factors come
+from the shared discount-curve cache (annual-effective rate converted to
+monthly), built once per distinct rate and gathered per site, so NPV for
+the whole portfolio is one row-wise dot product. NER uses the annuity-due
+factor from the same curve, so flows and NER are discounted consistently.
+
+calculate_renewal_scenario() / calculate_relocation_scenario() target this
+engine with cash_flow_basis='monthly'.
+
+Author: Claude Code
+Created: 2026-10-18
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from Shared_Utils.financial_utils import irr_many
+from Shared_Utils.discount_curve import discount_curve
+from Renewal_Analysis.renewal_analysis import (
+    RenewalScenario,
+    RelocationScenario,
+    GeneralInputs,
+    ScenarioResult
+)
+
+
+GeneralSpec = Union[GeneralInputs, Sequence[GeneralInputs]]
+
+
+@dataclass
+class MonthlyCashFlows:
+    """
+    Monthly outflows for a batch of sites.
+
+    Cash-flow arrays are (n_sites × n_months); month t is paid at t and
+    discounted by v^t. Rows are zero beyond each site's horizon.
+    """
+    rent: np.ndarray                # Base rent (after free rent)
+    operating: np.ndarray           # Operating costs
+    ti: np.ndarray                  # Net TI draws + renovation
+    other: np.ndarray               # Legal, moving, disruption, overlap rent, ...
+    discount_rate: np.ndarray       # Annual (effective) discount rate per site
+    term_months: np.ndarray         # Lease term per site (months)
+    area: np.ndarray                # Rentable area per site (sf)
+
+    @property
+    def n_sites(self) -> int:
+        return self.rent.shape[0]
+
+    @property
+    def total(self) -> np.ndarray:
+        """Total outflow per site and month"""
+        return self.rent + self.operating + self.ti + self.other
+
+    def discount_factors(self) -> np.ndarray:
+        """(n_sites × n_months) monthly discount factors v^t"""
+        return monthly_discount_factors(self.discount_rate, self.rent.shape[1])
+
+    def annual_cash_flows(self) -> np.ndarray:
+        """Rent + operating costs per lease year, (n_sites × years)"""
+        recurring = self.rent + self.operating
+        years = -(-recurring.shape[1] // 12)
+        padded = np.zeros((self.n_sites, years * 12))
+        padded[:, :recurring.shape[1]] = recurring
+        return padded.reshape(self.n_sites, years, 12).sum(axis=2)
+
+
+# ============================================================================
+# DISCOUNTING
+# ============================================================================
+
+def monthly_discount_factors(annual_rates, months: int) -> np.ndarray:
+    """
+    Monthly discount factors v^t (t = 0..months-1) for each annual rate.
+
+    Each distinct rate is read once from the shared discount-curve cache.
+
+    Returns:
+        Array of shape (len(annual_rates), months)
+    """
+    rates = np.atleast_1d(np.asarray(annual_rates, dtype=float))
+    unique, inverse = np.unique(rates, return_inverse=True)
+    table = np.vstack([
+        discount_curve(rate, 'annual_effective').discount_factors(max(months - 1, 0))
+        for rate in unique
+    ]) if len(unique) else np.empty((0, months))
+    return table[inverse.reshape(-1)]
+
+
+def _annuity_due(annual_rates: np.ndarray, term_months: np.ndarray) -> np.ndarray:
+    """Monthly annuity-due factor for each site's term"""
+    return np.array([
+        discount_curve(rate, 'annual_effective', 'beginning').annuity(int(months))
+        for rate, months in zip(annual_rates, term_months)
+    ])
+
+
+# ============================================================================
+# CASH-FLOW BUILDERS
+# ============================================================================
+
+def _generals(general: GeneralSpec, n_sites: int) -> List[GeneralInputs]:
+    if isinstance(general, GeneralInputs):
+        return [general] * n_sites
+    general = list(general)
+    if len(general) != n_sites:
+        raise ValueError(f"Expected {n_sites} GeneralInputs, got {len(general)}")
+    return general
+
+
+def _monthly_rent_psf(annual_rent_psf: Sequence[float], term_months: int) -> np.ndarray:
+    """Annual $/sf schedule expanded to months; last value carries forward"""
+    if not annual_rent_psf:
+        return np.zeros(term_months)
+    years = -(-term_months // 12)
+    schedule = np.asarray(annual_rent_psf[:years], dtype=float)
+    if len(schedule) < years:
+        schedule = np.concatenate([schedule, np.full(years - len(schedule), annual_rent_psf[-1])])
+    return np.repeat(schedule, 12)[:term_months]
+
+
+def _draw_schedule(schedule: Optional[Sequence], term_months: int) -> List[tuple]:
+    """Validate a [(month, fraction), ...] TI draw schedule (default: all at month 0)"""
+    if not schedule:
+        return [(0, 1.0)]
+    draws = [(int(month), float(fraction)) for month, fraction in schedule]
+    for month, fraction in draws:
+        if not 0 <= month < max(term_months, 1):
+            raise ValueError(f"TI draw month {month} outside lease term (0..{term_months - 1})")
+        if fraction < 0:
+            raise ValueError(f"TI draw fraction must be non-negative, got {fraction}")
+    total = sum(fraction for _, fraction in draws)
+    if not np.isclose(total, 1.0):
+        raise ValueError(f"TI draw fractions must sum to 1 (got {total:.4f})")
+    return draws
+
+
+def _empty_flows(scenarios: Sequence, generals: List[GeneralInputs]) -> MonthlyCashFlows:
+    term_months = np.array([int(s.term_years) * 12 for s in scenarios], dtype=int)
+    overlap = np.array([int(getattr(s, 'overlap_months', 0)) for s in scenarios], dtype=int)
+    if np.any(overlap < 0) or np.any(term_months < 0):
+        raise ValueError("term_years and overlap_months must be non-negative")
+    horizon = int(max(np.max(term_months, initial=0), np.max(overlap, initial=0), 1))
+    shape = (len(scenarios), horizon)
+    return MonthlyCashFlows(
+        rent=np.zeros(shape),
+        operating=np.zeros(shape),
+        ti=np.zeros(shape),
+        other=np.zeros(shape),
+        discount_rate=np.array([g.discount_rate for g in generals], dtype=float),
+        term_months=term_months,
+        area=np.array([g.rentable_area_sf for g in generals], dtype=float)
+    )
+
+
+def _fill_recurring(flows: MonthlyCashFlows, scenarios: Sequence) -> None:
+    """Rent (with free-rent abatement) and operating costs, paid monthly in advance"""
+    months = np.arange(flows.rent.shape[1])
+    in_term = months[None, :] < flows.term_months[:, None]
+    free = np.array([int(s.free_rent_months) for s in scenarios], dtype=int)
+    if np.any(free < 0):
+        raise ValueError("free_rent_months must be non-negative")
+
+    rent_psf = np.zeros_like(flows.rent)
+    for i, scenario in enumerate(scenarios):
+        rent_psf[i, :flows.term_months[i]] = _monthly_rent_psf(scenario.annual_rent_psf, flows.term_months[i])
+    op_psf = np.array([s.operating_costs_psf for s in scenarios], dtype=float)
+
+    monthly_area = flows.area[:, None] / 12
+    flows.rent[:] = rent_psf * monthly_area * (months[None, :] >= free[:, None])
+    flows.operating[:] = np.where(in_term, op_psf[:, None] * monthly_area, 0.0)
+
+
+def _fill_ti_draws(flows: MonthlyCashFlows, scenarios: Sequence, net_ti_psf: np.ndarray) -> None:
+    net_ti = np.maximum(0, net_ti_psf * flows.area)
+    for i, scenario in enumerate(scenarios):
+        for month, fraction in _draw_schedule(scenario.ti_draw_schedule, int(flows.term_months[i])):
+            flows.ti[i, month] += net_ti[i] * fraction
+
+
+def renewal_cash_flows(
+    renewals: Sequence[RenewalScenario],
+    general: GeneralSpec
+) -> MonthlyCashFlows:
+    """
+    Monthly outflows for one or more renewal scenarios.
+
+    Args:
+        renewals: Renewal scenarios (one per site)
+        general: GeneralInputs shared by all sites, or one per site
+
+    Returns:
+        MonthlyCashFlows (one row per site)
+
+    Raises:
+        ValueError: If timing inputs are invalid
+    """
+    renewals = list(renewals)
+    generals = _generals(general, len(renewals))
+    flows = _empty_flows(renewals, generals)
+    _fill_recurring(flows, renewals)
+
+    net_ti_psf = np.array([r.additional_ti_psf - r.ti_allowance_psf for r in renewals], dtype=float)
+    _fill_ti_draws(flows, renewals, net_ti_psf)
+    flows.ti[:, 0] += np.array([r.renovation_costs_psf for r in renewals], dtype=float) * flows.area
+
+    flows.other[:, 0] += np.array([r.legal_fees for r in renewals], dtype=float)
+    return flows
+
+
+def relocation_cost_components(relocation: RelocationScenario) -> Dict[str, float]:
+    """Moving, disruption, abandonment and leasing costs (paid at commencement)"""
+    return {
+        'moving_costs': relocation.moving_costs + relocation.it_moving_costs + relocation.signage_costs,
+        'disruption_costs': (
+            relocation.downtime_days * relocation.daily_revenue
+            + relocation.customer_loss_pct * relocation.daily_revenue * 365
+        ),
+        'abandonment_costs': relocation.unamortized_improvements + relocation.restoration_costs,
+        'leasing_costs': relocation.legal_fees + relocation.due_diligence_costs + relocation.broker_fees,
+    }
+
+
+def relocation_cash_flows(
+    relocations: Sequence[RelocationScenario],
+    general: GeneralSpec
+) -> MonthlyCashFlows:
+    """
+    Monthly outflows for one or more relocation scenarios.
+
+    Overlap rent is charged at overlap_rent_psf (default: the site's
+    GeneralInputs.current_rent_psf) for the first overlap_months months.
+
+    Args:
+        relocations: Relocation scenarios (one per site)
+        general: GeneralInputs shared by all sites, or one per site
+
+    Returns:
+        MonthlyCashFlows (one row per site)
+
+    Raises:
+        ValueError: If timing inputs are invalid
+    """
+    relocations = list(relocations)
+    generals = _generals(general, len(relocations))
+    flows = _empty_flows(relocations, generals)
+    _fill_recurring(flows, relocations)
+
+    net_ti_psf = np.array([r.ti_requirement_psf - r.ti_allowance_psf for r in relocations], dtype=float)
+    _fill_ti_draws(flows, relocations, net_ti_psf)
+
+    flows.other[:, 0] += np.array([
+        sum(relocation_cost_components(r).values()) for r in relocations
+    ], dtype=float)
+
+    overlap = np.array([r.overlap_months for r in relocations], dtype=int)
+    overlap_psf = np.array([
+        g.current_rent_psf if r.overlap_rent_psf is None else r.overlap_rent_psf
+        for r, g in zip(relocations, generals)
+    ], dtype=float)
+    months = np.arange(flows.other.shape[1])
+    flows.other += np.where(
+        months[None, :] < overlap[:, None],
+        (overlap_psf * flows.area / 12)[:, None],
+        0.0
+    )
+    return flows
+
+
+# ============================================================================
+# VALUATION
+# ============================================================================
+
+def summarize_cash_flows(flows: MonthlyCashFlows) -> pd.DataFrame:
+    """
+    Totals, present values and NER per site.
+
+    NER = NPV / area / monthly annuity-due factor over the lease term, the
+    same definition as the annual basis with timing matched to the flows.
+
+    Returns:
+        DataFrame (one row per site) with total_* and pv_* per component,
+        npv and net_effective_rent_psf
+    """
+    factors = flows.discount_factors()
+    components = {
+        'rent': flows.rent,
+        'operating_costs': flows.operating,
+        'ti_costs': flows.ti,
+        'other_costs': flows.other,
+    }
+
+    summary = pd.DataFrame(index=pd.RangeIndex(flows.n_sites, name='site'))
+    for name, values in components.items():
+        summary[f'total_{name}'] = values.sum(axis=1)
+    for name, values in components.items():
+        summary[f'pv_{name}'] = np.einsum('ij,ij->i', values, factors)
+    summary['npv'] = summary[[f'pv_{name}' for name in components]].sum(axis=1)
+
+    annuity = _annuity_due(flows.discount_rate, flows.term_months)
+    valid = (flows.area > 0) & (annuity > 0)
+    summary['net_effective_rent_psf'] = np.where(
+        valid,
+        summary['npv'].to_numpy() / np.where(valid, flows.area * annuity, 1.0),
+        0.0
+    )
+    return summary
+
+
+def _scenario_result(
+    scenario_name: str,
+    flows: MonthlyCashFlows,
+    breakdown: Dict[str, float]
+) -> ScenarioResult:
+    """ScenarioResult for a single-site MonthlyCashFlows"""
+    row = summarize_cash_flows(flows).iloc[0]
+    total_cash = float(flows.total.sum())
+    return ScenarioResult(
+        scenario_name=scenario_name,
+        total_rent_payments=row['total_rent'],
+        total_operating_costs=row['total_operating_costs'],
+        total_ti_costs=row['total_ti_costs'],
+        total_other_costs=row['total_other_costs'],
+        total_cash_outflows=total_cash,
+        pv_rent=row['pv_rent'],
+        pv_operating_costs=row['pv_operating_costs'],
+        pv_ti_costs=row['pv_ti_costs'],
+        pv_other_costs=row['pv_other_costs'],
+        npv=row['npv'],
+        net_effective_rent_psf=row['net_effective_rent_psf'],
+        gross_effective_rent_psf=row['net_effective_rent_psf'],
+        annual_cash_flows=flows.annual_cash_flows()[0].tolist(),
+        cost_breakdown={**breakdown, 'total': total_cash},
+        monthly_cash_flows=flows.total[0].tolist()
+    )
+
+
+def monthly_renewal_result(renewal: RenewalScenario, general: GeneralInputs) -> ScenarioResult:
+    """calculate_renewal_scenario(..., cash_flow_basis='monthly')"""
+    flows = renewal_cash_flows([renewal], general)
+    renovation = renewal.renovation_costs_psf * general.rentable_area_sf
+    return _scenario_result(renewal.scenario_name, flows, {
+        'rent_payments': float(flows.rent.sum()),
+        'operating_costs': float(flows.operating.sum()),
+        'ti_costs': float(flows.ti.sum()),
+        'legal_fees': renewal.legal_fees,
+        'renovation_costs': renovation,
+    })
+
+
+def monthly_relocation_result(relocation: RelocationScenario, general: GeneralInputs) -> ScenarioResult:
+    """calculate_relocation_scenario(..., cash_flow_basis='monthly')"""
+    flows = relocation_cash_flows([relocation], general)
+    components = relocation_cost_components(relocation)
+    return _scenario_result(relocation.scenario_name, flows, {
+        'rent_payments': float(flows.rent.sum()),
+        'operating_costs': float(flows.operating.sum()),
+        'ti_costs': float(flows.ti.sum()),
+        **components,
+        'overlap_rent': float(flows.other.sum()) - sum(components.values()),
+    })
+
+
+def compare_sites_monthly(
+    renewals: Sequence[RenewalScenario],
+    relocations: Sequence[RelocationScenario],
+    general: GeneralSpec
+) -> pd.DataFrame:
+    """
+    Renewal vs. relocation for a portfolio of sites on the monthly basis.
+
+    Args:
+        renewals: Renewal scenario per site
+        relocations: Relocation scenario per site (same order)
+        general: GeneralInputs shared by all sites, or one per site
+
+    Returns:
+        DataFrame (one row per site) with renewal_npv, relocation_npv,
+        npv_difference, renewal_ner_psf, relocation_ner_psf,
+        ner_difference_psf, relocation_irr (annualized, from monthly
+        savings; NaN when there is no net relocation outlay) and
+        breakeven_rent_psf (flat renewal rent at which NPVs are equal)
+
+    Raises:
+        ValueError: If renewals and relocations differ in length
+    """
+    renewals = list(renewals)
+    relocations = list(relocations)
+    if len(renewals) != len(relocations):
+        raise ValueError(
+            f"renewals and relocations must have the same length ({len(renewals)} vs {len(relocations)})"
+        )
+
+    renewal_flows = renewal_cash_flows(renewals, general)
+    relocation_flows = relocation_cash_flows(relocations, general)
+    renewal = summarize_cash_flows(renewal_flows)
+    relocation = summarize_cash_flows(relocation_flows)
+
+    result = pd.DataFrame({
+        'renewal_npv': renewal['npv'],
+        'relocation_npv': relocation['npv'],
+        'npv_difference': relocation['npv'] - renewal['npv'],
+        'renewal_ner_psf': renewal['net_effective_rent_psf'],
+        'relocation_ner_psf': relocation['net_effective_rent_psf'],
+    })
+    result['ner_difference_psf'] = result['relocation_ner_psf'] - result['renewal_ner_psf']
+
+    # Relocation as an investment: monthly savings = renewal outflow - relocation outflow
+    horizon = max(renewal_flows.rent.shape[1], relocation_flows.rent.shape[1])
+    savings = np.zeros((len(renewals), horizon))
+    savings[:, :renewal_flows.rent.shape[1]] += renewal_flows.total
+    savings[:, :relocation_flows.rent.shape[1]] -= relocation_flows.total
+    monthly_irr = irr_many(savings, guess=0.01)
+    result['relocation_irr'] = np.where(savings[:, 0] < 0, (1 + monthly_irr) ** 12 - 1, np.nan)
+
+    # Breakeven: renewal NPV is linear in a flat rent level
+    rent_npv_per_psf = np.einsum(
+        'ij,ij->i',
+        _rent_months(renewal_flows, renewals),
+        renewal_flows.discount_factors()
+    ) * renewal_flows.area / 12
+    fixed_npv = renewal['npv'] - renewal['pv_rent']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result['breakeven_rent_psf'] = np.where(
+            rent_npv_per_psf > 0,
+            (relocation['npv'] - fixed_npv) / rent_npv_per_psf,
+            np.nan
+        )
+    return result
+
+
+def _rent_months(flows: MonthlyCashFlows, scenarios: Sequence) -> np.ndarray:
+    """Mask of in-term months after the free-rent period"""
+    months = np.arange(flows.rent.shape[1])
+    free = np.array([int(s.free_rent_months) for s in scenarios], dtype=int)
+    return (months[None, :] >= free[:, None]) & (months[None, :] < flows.term_months[:, None])
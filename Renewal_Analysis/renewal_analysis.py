@@ -21,15 +21,14 @@ GitHub Issue: #5
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple, Optional, Literal
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from Shared_Utils.financial_utils import (
     npv,
     irr,
-    annual_to_monthly_rate,
-    annuity_factor,
     safe_divide
 )
+from Shared_Utils.discount_curve import discount_curve
 
 
 @dataclass
@@ -54,6 +53,10 @@ class RenewalScenario:
     legal_fees: float = 0.0             # Legal fees for renewal
     renovation_costs_psf: float = 0.0   # Refresh/renovation costs ($/sf)
 
+    # Monthly timing (cash_flow_basis='monthly' only)
+    free_rent_months: int = 0           # Months of base-rent abatement from commencement
+    ti_draw_schedule: Optional[List[Tuple[int, float]]] = None  # [(month, fraction of net TI)]
+
     # Metadata
     scenario_name: str = "Renewal"
 
@@ -95,6 +98,12 @@ class RelocationScenario:
     due_diligence_costs: float = 0.0    # Site surveys, environmental, etc.
     broker_fees: float = 0.0            # If tenant pays broker
 
+    # Monthly timing (cash_flow_basis='monthly' only)
+    free_rent_months: int = 0           # Months of base-rent abatement from commencement
+    ti_draw_schedule: Optional[List[Tuple[int, float]]] = None  # [(month, fraction of net TI)]
+    overlap_months: int = 0             # Months paying old-premises rent after commencement
+    overlap_rent_psf: Optional[float] = None  # Old-premises rent (default: current_rent_psf)
+
     # Metadata
     scenario_name: str = "Relocation"
 
@@ -141,6 +150,9 @@ class ScenarioResult:
     # Detailed breakdown
     cost_breakdown: Dict[str, float]
 
+    # Total outflows by month (cash_flow_basis='monthly' only)
+    monthly_cash_flows: Optional[List[float]] = None
+
 
 @dataclass
 class ComparisonResult:
@@ -172,9 +184,18 @@ class ComparisonResult:
 # SCENARIO CALCULATIONS
 # ============================================================================
 
+CashFlowBasis = Literal['annual', 'monthly']
+
+
+def _check_basis(cash_flow_basis: str) -> None:
+    if cash_flow_basis not in ('annual', 'monthly'):
+        raise ValueError(f"cash_flow_basis must be 'annual' or 'monthly', got {cash_flow_basis}")
+
+
 def calculate_renewal_scenario(
     renewal: RenewalScenario,
-    general: GeneralInputs
+    general: GeneralInputs,
+    cash_flow_basis: CashFlowBasis = 'annual'
 ) -> ScenarioResult:
     """
     Calculate NPV and effective rent for renewal scenario.
@@ -182,10 +203,18 @@ def calculate_renewal_scenario(
     Args:
         renewal: Renewal scenario parameters
         general: General parameters
+        cash_flow_basis: 'annual' (yearly rent flows, upfront costs at t=0) or
+            'monthly' (monthly engine: free rent, TI draws; see monthly_cash_flows)
 
     Returns:
         ScenarioResult with NPV, NER, and cost breakdown
     """
+    _check_basis(cash_flow_basis)
+    if cash_flow_basis == 'monthly':
+        # Imported here: monthly_cash_flows imports this module
+        from Renewal_Analysis.monthly_cash_flows import monthly_renewal_result
+        return monthly_renewal_result(renewal, general)
+
     area = general.rentable_area_sf
     years = renewal.term_years
     rate = general.discount_rate
@@ -245,9 +274,8 @@ def calculate_renewal_scenario(
     total_npv = pv_rent + pv_op_costs + pv_ti + pv_other
 
     # Calculate NER
-    # NER = NPV / area / annuity_factor
-    monthly_rate = annual_to_monthly_rate(rate)
-    af = annuity_factor(monthly_rate, years * 12)
+    # NER = NPV / area / annuity_factor (monthly, from the shared discount curve)
+    af = discount_curve(rate, 'annual_effective').annuity(years * 12)
     ner_psf = total_npv / area / af if area > 0 and af > 0 else 0.0
 
     # GER includes operating costs
@@ -284,7 +312,8 @@ def calculate_renewal_scenario(
 
 def calculate_relocation_scenario(
     relocation: RelocationScenario,
-    general: GeneralInputs
+    general: GeneralInputs,
+    cash_flow_basis: CashFlowBasis = 'annual'
 ) -> ScenarioResult:
     """
     Calculate NPV and effective rent for relocation scenario.
@@ -292,10 +321,17 @@ def calculate_relocation_scenario(
     Args:
         relocation: Relocation scenario parameters
         general: General parameters
+        cash_flow_basis: 'annual' (yearly rent flows, upfront costs at t=0) or
+            'monthly' (monthly engine: free rent, TI draws, overlap rent)
 
     Returns:
         ScenarioResult with NPV, NER, and cost breakdown
     """
+    _check_basis(cash_flow_basis)
+    if cash_flow_basis == 'monthly':
+        from Renewal_Analysis.monthly_cash_flows import monthly_relocation_result
+        return monthly_relocation_result(relocation, general)
+
     area = general.rentable_area_sf
     years = relocation.term_years
     rate = general.discount_rate
@@ -386,8 +422,7 @@ def calculate_relocation_scenario(
     total_npv = pv_rent + pv_op_costs + pv_ti + pv_other
 
     # Calculate NER
-    monthly_rate = annual_to_monthly_rate(rate)
-    af = annuity_factor(monthly_rate, years * 12)
+    af = discount_curve(rate, 'annual_effective').annuity(years * 12)
     ner_psf = total_npv / area / af if area > 0 and af > 0 else 0.0
 
     ger_psf = ner_psf
@@ -430,7 +465,8 @@ def calculate_relocation_scenario(
 def compare_scenarios(
     renewal: RenewalScenario,
     relocation: RelocationScenario,
-    general: GeneralInputs
+    general: GeneralInputs,
+    cash_flow_basis: CashFlowBasis = 'annual'
 ) -> ComparisonResult:
     """
     Compare renewal vs. relocation scenarios.
@@ -439,13 +475,14 @@ def compare_scenarios(
         renewal: Renewal scenario
         relocation: Relocation scenario
         general: General parameters
+        cash_flow_basis: 'annual' or 'monthly' (see calculate_renewal_scenario)
 
     Returns:
         ComparisonResult with comparison metrics and recommendation
     """
     # Calculate both scenarios
-    renewal_result = calculate_renewal_scenario(renewal, general)
-    relocation_result = calculate_relocation_scenario(relocation, general)
+    renewal_result = calculate_renewal_scenario(renewal, general, cash_flow_basis)
+    relocation_result = calculate_relocation_scenario(relocation, general, cash_flow_basis)
 
     # NPV difference (negative = relocation costs more)
     npv_diff = relocation_result.npv - renewal_result.npv
@@ -477,7 +514,10 @@ def compare_scenarios(
     irr_cash_flows = [-relocation_upfront] + annual_diff_flows
 
     try:
-        relocation_irr = irr(irr_cash_flows) if relocation_upfront > 0 else None
+        if cash_flow_basis == 'monthly':
+            relocation_irr = _monthly_relocation_irr(renewal_result, relocation_result)
+        else:
+            relocation_irr = irr(irr_cash_flows) if relocation_upfront > 0 else None
     except:
         relocation_irr = None
 
@@ -489,7 +529,7 @@ def compare_scenarios(
 
     # Breakeven analysis
     # Solve for renewal rent where NPV(renewal) = NPV(relocation)
-    breakeven_rent = calculate_breakeven_rent(renewal, relocation, general)
+    breakeven_rent = calculate_breakeven_rent(renewal, relocation, general, cash_flow_basis)
 
     # Current margin (if breakeven calculated)
     if breakeven_rent is not None and len(renewal.annual_rent_psf) > 0:
@@ -522,10 +562,32 @@ def compare_scenarios(
     )
 
 
+def _monthly_relocation_irr(
+    renewal_result: ScenarioResult,
+    relocation_result: ScenarioResult
+) -> Optional[float]:
+    """
+    Annualized IRR of relocation from monthly savings (renewal - relocation outflows).
+
+    Returns None when relocation needs no net outlay at commencement.
+    """
+    renewal_flows = renewal_result.monthly_cash_flows or []
+    relocation_flows = relocation_result.monthly_cash_flows or []
+    months = max(len(renewal_flows), len(relocation_flows))
+    savings = np.zeros(months)
+    savings[:len(renewal_flows)] += renewal_flows
+    savings[:len(relocation_flows)] -= relocation_flows
+
+    if months < 2 or savings[0] >= 0:
+        return None
+    return (1 + irr(list(savings), guess=0.01)) ** 12 - 1
+
+
 def calculate_breakeven_rent(
     renewal: RenewalScenario,
     relocation: RelocationScenario,
-    general: GeneralInputs
+    general: GeneralInputs,
+    cash_flow_basis: CashFlowBasis = 'annual'
 ) -> Optional[float]:
     """
     Calculate renewal rent ($/sf) where NPV(renewal) = NPV(relocation).
@@ -536,12 +598,13 @@ def calculate_breakeven_rent(
         renewal: Renewal scenario
         relocation: Relocation scenario
         general: General parameters
+        cash_flow_basis: 'annual' or 'monthly' (see calculate_renewal_scenario)
 
     Returns:
         Breakeven rent ($/sf) or None if not found
     """
     # Calculate relocation NPV (fixed)
-    reloc_result = calculate_relocation_scenario(relocation, general)
+    reloc_result = calculate_relocation_scenario(relocation, general, cash_flow_basis)
     target_npv = reloc_result.npv
 
     # Binary search for breakeven rent
@@ -555,17 +618,9 @@ def calculate_breakeven_rent(
         mid_rent = (low_rent + high_rent) / 2
 
         # Create test renewal scenario with mid_rent
-        test_renewal = RenewalScenario(
-            annual_rent_psf=[mid_rent] * renewal.term_years,
-            ti_allowance_psf=renewal.ti_allowance_psf,
-            additional_ti_psf=renewal.additional_ti_psf,
-            term_years=renewal.term_years,
-            operating_costs_psf=renewal.operating_costs_psf,
-            legal_fees=renewal.legal_fees,
-            renovation_costs_psf=renewal.renovation_costs_psf
-        )
-
-        test_result = calculate_renewal_scenario(test_renewal, general)
+        test_renewal = replace(renewal, annual_rent_psf=[mid_rent] * renewal.term_years)
+
+        test_result = calculate_renewal_scenario(test_renewal, general, cash_flow_basis)
 
         # Check if close enough
         if abs(test_result.npv - target_npv) < tolerance * target_npv:
@@ -683,110 +738,43 @@ def sensitivity_analysis(
     Returns:
         DataFrame with sensitivity results
     """
-    results = []
-
-    # Base case
-    base_comparison = compare_scenarios(renewal, relocation, general)
-
-    results.append({
-        'Variable': 'Base Case',
-        'Variation': '0%',
-        'Renewal_NPV': base_comparison.renewal_result.npv,
-        'Relocation_NPV': base_comparison.relocation_result.npv,
-        'NPV_Difference': base_comparison.npv_difference,
-        'Recommendation': base_comparison.recommendation
-    })
-
-    # Rent sensitivity
-    if 'rent' in variables:
-        for mult in [1 - variation_pct, 1 + variation_pct]:
-            # Adjust renewal rent
-            adj_renewal = RenewalScenario(
-                annual_rent_psf=[r * mult for r in renewal.annual_rent_psf],
-                ti_allowance_psf=renewal.ti_allowance_psf,
-                additional_ti_psf=renewal.additional_ti_psf,
-                term_years=renewal.term_years,
-                operating_costs_psf=renewal.operating_costs_psf,
-                legal_fees=renewal.legal_fees,
-                renovation_costs_psf=renewal.renovation_costs_psf
-            )
-
-            comp = compare_scenarios(adj_renewal, relocation, general)
-
-            results.append({
-                'Variable': 'Renewal Rent',
-                'Variation': f"{(mult - 1) * 100:+.0f}%",
-                'Renewal_NPV': comp.renewal_result.npv,
-                'Relocation_NPV': comp.relocation_result.npv,
-                'NPV_Difference': comp.npv_difference,
-                'Recommendation': comp.recommendation
-            })
-
-    # TI sensitivity (relocation)
-    if 'ti' in variables:
-        for mult in [1 - variation_pct, 1 + variation_pct]:
-            adj_relocation = RelocationScenario(
-                annual_rent_psf=relocation.annual_rent_psf.copy(),
-                ti_allowance_psf=relocation.ti_allowance_psf,
-                ti_requirement_psf=relocation.ti_requirement_psf * mult,
-                term_years=relocation.term_years,
-                operating_costs_psf=relocation.operating_costs_psf,
-                moving_costs=relocation.moving_costs,
-                it_moving_costs=relocation.it_moving_costs,
-                signage_costs=relocation.signage_costs,
-                downtime_days=relocation.downtime_days,
-                daily_revenue=relocation.daily_revenue,
-                customer_loss_pct=relocation.customer_loss_pct,
-                unamortized_improvements=relocation.unamortized_improvements,
-                restoration_costs=relocation.restoration_costs,
-                legal_fees=relocation.legal_fees,
-                due_diligence_costs=relocation.due_diligence_costs,
-                broker_fees=relocation.broker_fees
-            )
-
-            comp = compare_scenarios(renewal, adj_relocation, general)
-
-            results.append({
-                'Variable': 'Relocation TI',
-                'Variation': f"{(mult - 1) * 100:+.0f}%",
-                'Renewal_NPV': comp.renewal_result.npv,
-                'Relocation_NPV': comp.relocation_result.npv,
-                'NPV_Difference': comp.npv_difference,
-                'Recommendation': comp.recommendation
-            })
-
-    # Disruption sensitivity
-    if 'disruption' in variables:
-        for mult in [1 - variation_pct, 1 + variation_pct]:
-            adj_relocation = RelocationScenario(
-                annual_rent_psf=relocation.annual_rent_psf.copy(),
-                ti_allowance_psf=relocation.ti_allowance_psf,
-                ti_requirement_psf=relocation.ti_requirement_psf,
-                term_years=relocation.term_years,
-                operating_costs_psf=relocation.operating_costs_psf,
-                moving_costs=relocation.moving_costs,
-                it_moving_costs=relocation.it_moving_costs,
-                signage_costs=relocation.signage_costs,
-                downtime_days=relocation.downtime_days * mult,
-                daily_revenue=relocation.daily_revenue,
-                customer_loss_pct=relocation.customer_loss_pct * mult,
-                unamortized_improvements=relocation.unamortized_improvements,
-                restoration_costs=relocation.restoration_costs,
-                legal_fees=relocation.legal_fees,
-                due_diligence_costs=relocation.due_diligence_costs,
-                broker_fees=relocation.broker_fees
-            )
-
-            comp = compare_scenarios(renewal, adj_relocation, general)
-
-            results.append({
-                'Variable': 'Disruption Costs',
-                'Variation': f"{(mult - 1) * 100:+.0f}%",
-                'Renewal_NPV': comp.renewal_result.npv,
-                'Relocation_NPV': comp.relocation_result.npv,
-                'NPV_Difference': comp.npv_difference,
-                'Recommendation': comp.recommendation
-            })
+    # Evaluated on the vectorized grid engine (imported here: it imports this module)
+    from Renewal_Analysis.sensitivity_grid import AXIS_LABELS, evaluate_sensitivity_grid
+
+    variable_axes = {
+        'rent': 'rent_mult',
+        'ti': 'ti_mult',
+        'disruption': 'disruption_mult',
+        'moving': 'moving_mult',
+    }
+    multipliers = [1 - variation_pct, 1 + variation_pct]
+    tested = [axis for name, axis in variable_axes.items() if name in variables]
+
+    grid = evaluate_sensitivity_grid(
+        renewal, relocation, general,
+        **{axis: [1.0] + multipliers for axis in tested}
+    ).frame
+
+    def grid_row(axis: Optional[str] = None, mult: float = 1.0) -> pd.Series:
+        mask = np.ones(len(grid), dtype=bool)
+        for other in variable_axes.values():
+            mask &= np.isclose(grid[other], mult if other == axis else 1.0)
+        return grid[mask].iloc[0]
+
+    def result_row(variable: str, variation: str, point: pd.Series) -> Dict:
+        return {
+            'Variable': variable,
+            'Variation': variation,
+            'Renewal_NPV': point['renewal_npv'],
+            'Relocation_NPV': point['relocation_npv'],
+            'NPV_Difference': point['npv_difference'],
+            'Recommendation': point['recommendation']
+        }
+
+    results = [result_row('Base Case', '0%', grid_row())]
+    for axis in tested:
+        for mult in multipliers:
+            results.append(result_row(AXIS_LABELS[axis], f"{(mult - 1) * 100:+.0f}%", grid_row(axis, mult)))
 
     df = pd.DataFrame(results)
 
@@ -0,0 +1,414 @@
+"""
+Grid Sensitivity Engine for Renewal vs. Relocation
+
+Evaluates compare_scenarios() over a full multidimensional grid in one
+vectorized pass instead of rebuilding both scenarios per point:
+
+    rent_mult × ti_mult × disruption_mult × moving_mult × discount_rate
+
+- rent_mult scales the renewal rent schedule
+- ti_mult scales the relocation TI requirement
+- disruption_mult scales relocation disruption costs (downtime and customer loss)
+- moving_mult scales relocation moving, IT and signage costs
+- discount_rate replaces GeneralInputs.discount_rate
+
+Both scenario NPVs are linear in every multiplier, so each scenario only
+needs one discounted rent / operating-cost PV per discount rate (read from
+the shared discount-curve cache); the grid is then a broadcast sum.
+Relocation IRRs for every (rent, TI, disruption, moving) combination are
+solved together with irr_many().
+
+The breakeven surface generalizes calculate_breakeven_rent(): the constant
+renewal rent at which NPV(renewal) = NPV(relocation), solved in closed form
+for every relocation grid point and discount rate.
+
+Author: Claude Code
+Created: 2026-10-18
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from Shared_Utils.financial_utils import irr_many
+from Shared_Utils.discount_curve import discount_curve
+from Renewal_Analysis.renewal_analysis import (
+    RenewalScenario,
+    RelocationScenario,
+    GeneralInputs
+)
+
+
+GRID_AXES = ('rent_mult', 'ti_mult', 'disruption_mult', 'moving_mult', 'discount_rate')
+
+AXIS_LABELS = {
+    'rent_mult': 'Renewal Rent',
+    'ti_mult': 'Relocation TI',
+    'disruption_mult': 'Disruption Costs',
+    'moving_mult': 'Moving Costs',
+    'discount_rate': 'Discount Rate',
+}
+
+# generate_recommendation() thresholds
+NPV_DECISION_THRESHOLD = 10000.0
+IRR_HURDLE = 0.15
+
+
+@dataclass
+class SensitivityGridResult:
+    """
+    Grid sensitivity results.
+
+    frame has one row per grid point (GRID_AXES columns + metrics);
+    breakeven has one row per (ti_mult, disruption_mult, moving_mult,
+    discount_rate) point.
+    """
+    frame: pd.DataFrame
+    breakeven: pd.DataFrame
+    axes: Dict[str, np.ndarray]
+    base: Dict[str, float]
+
+    def to_xarray(self):
+        """
+        Grid as an xarray Dataset with one dimension per axis.
+
+        Raises:
+            ImportError: If xarray is not installed
+        """
+        try:
+            import xarray  # noqa: F401
+        except ImportError as exc:
+            raise ImportError("xarray is required for to_xarray(); use .frame instead") from exc
+        return self.frame.set_index(list(GRID_AXES)).to_xarray()
+
+    def one_way(self, metric: str = 'npv_difference') -> pd.DataFrame:
+        """
+        One-at-a-time sensitivity (spider chart data).
+
+        For each axis with more than one value, varies that axis with all
+        other axes held at their base value.
+
+        Returns:
+            DataFrame with variable, value, <metric>
+
+        Raises:
+            ValueError: If an axis grid does not contain its base value
+        """
+        base_mask = {}
+        for axis in GRID_AXES:
+            matches = np.isclose(self.frame[axis], self.base[axis])
+            if not matches.any():
+                raise ValueError(f"{axis} grid must include its base value {self.base[axis]}")
+            base_mask[axis] = matches
+
+        rows = []
+        for axis in GRID_AXES:
+            if len(self.axes[axis]) < 2:
+                continue
+            mask = np.ones(len(self.frame), dtype=bool)
+            for other in GRID_AXES:
+                if other != axis:
+                    mask &= base_mask[other]
+            subset = self.frame.loc[mask, [axis, metric]]
+            rows.append(pd.DataFrame({
+                'variable': axis,
+                'value': subset[axis].to_numpy(),
+                metric: subset[metric].to_numpy()
+            }))
+
+        if not rows:
+            return pd.DataFrame(columns=['variable', 'value', metric])
+        return pd.concat(rows, ignore_index=True)
+
+    def tornado(self, metric: str = 'npv_difference') -> pd.DataFrame:
+        """
+        Tornado chart data: metric range per axis, widest swing first.
+
+        Returns:
+            DataFrame with variable, low, high, swing
+        """
+        one_way = self.one_way(metric)
+        summary = one_way.groupby('variable', sort=False)[metric].agg(low='min', high='max')
+        summary['swing'] = summary['high'] - summary['low']
+        return summary.sort_values('swing', ascending=False).reset_index()
+
+
+# ============================================================================
+# SCENARIO BUILDING BLOCKS
+# ============================================================================
+
+def _rent_schedule(annual_rent_psf: Sequence[float], years: int) -> np.ndarray:
+    """Annual rent $/sf for each year; last value carries forward"""
+    schedule = np.asarray(annual_rent_psf[:years], dtype=float)
+    if len(schedule) < years:
+        schedule = np.concatenate([schedule, np.full(years - len(schedule), annual_rent_psf[-1])])
+    return schedule
+
+
+def _discount_matrix(rates: np.ndarray, periods: int) -> np.ndarray:
+    """(n_rates x periods) annual discount factors v^t, t = 0..periods-1"""
+    if np.any(rates < 0):
+        raise ValueError(f"discount_rate must be non-negative, got {rates[rates < 0]}")
+    return np.vstack([discount_curve(rate).discount_factors(periods - 1) for rate in rates])
+
+
+def _monthly_annuity(rates: np.ndarray, years: int) -> np.ndarray:
+    """NER annuity factor per discount rate (monthly, years * 12 periods)"""
+    return np.array([discount_curve(rate, 'annual_effective').annuity(years * 12) for rate in rates])
+
+
+def _relocation_components(relocation: RelocationScenario, area: float) -> Dict[str, float]:
+    """Relocation upfront cost components as in calculate_relocation_scenario()"""
+    return {
+        'ti_requirement': relocation.ti_requirement_psf * area,
+        'ti_allowance': relocation.ti_allowance_psf * area,
+        'moving': relocation.moving_costs + relocation.it_moving_costs + relocation.signage_costs,
+        'disruption': (
+            relocation.downtime_days * relocation.daily_revenue +
+            relocation.customer_loss_pct * relocation.daily_revenue * 365
+        ),
+        'fixed': (
+            relocation.unamortized_improvements + relocation.restoration_costs +
+            relocation.legal_fees + relocation.due_diligence_costs + relocation.broker_fees
+        ),
+    }
+
+
+def _renewal_upfront(renewal: RenewalScenario, area: float) -> float:
+    """Renewal TI, renovation and legal costs as in calculate_renewal_scenario()"""
+    net_ti_cost = max(0, (renewal.additional_ti_psf - renewal.ti_allowance_psf) * area)
+    return net_ti_cost + renewal.renovation_costs_psf * area + renewal.legal_fees
+
+
+def _grid_axes(general: GeneralInputs, rent_mult, ti_mult, disruption_mult,
+               moving_mult, discount_rate) -> Dict[str, np.ndarray]:
+    if discount_rate is None:
+        discount_rate = [general.discount_rate]
+    axes = {
+        'rent_mult': rent_mult,
+        'ti_mult': ti_mult,
+        'disruption_mult': disruption_mult,
+        'moving_mult': moving_mult,
+        'discount_rate': discount_rate,
+    }
+    axes = {name: np.atleast_1d(np.asarray(values, dtype=float)) for name, values in axes.items()}
+    for name, values in axes.items():
+        if values.size == 0:
+            raise ValueError(f"{name} grid cannot be empty")
+    return axes
+
+
+# ============================================================================
+# BREAKEVEN SURFACE
+# ============================================================================
+
+def calculate_breakeven_surface(
+    renewal: RenewalScenario,
+    relocation: RelocationScenario,
+    general: GeneralInputs,
+    ti_mult: Sequence[float] = (1.0,),
+    disruption_mult: Sequence[float] = (1.0,),
+    moving_mult: Sequence[float] = (1.0,),
+    discount_rate: Optional[Sequence[float]] = None
+) -> pd.DataFrame:
+    """
+    Breakeven renewal rent over a grid of relocation costs and discount rates.
+
+    Generalizes calculate_breakeven_rent(): the constant renewal rent ($/sf)
+    at which NPV(renewal) = NPV(relocation), solved exactly rather than by
+    binary search. Values outside calculate_breakeven_rent()'s $0-$200
+    search range are returned as-is (negative = relocation never wins).
+
+    Returns:
+        DataFrame with ti_mult, disruption_mult, moving_mult, discount_rate,
+        relocation_npv, breakeven_rent_psf
+    """
+    axes = _grid_axes(general, [1.0], ti_mult, disruption_mult, moving_mult, discount_rate)
+    relocation_npv, renewal_fixed_pv, renewal_rent_annuity = _breakeven_terms(renewal, relocation, general, axes)
+
+    breakeven = (relocation_npv - renewal_fixed_pv) / renewal_rent_annuity
+    return _surface_frame(axes, relocation_npv, breakeven)
+
+
+def _surface_frame(axes: Dict[str, np.ndarray], relocation_npv: np.ndarray,
+                   breakeven: np.ndarray) -> pd.DataFrame:
+    """Long frame over the relocation axes and discount rate"""
+    grids = np.meshgrid(*(axes[name] for name in GRID_AXES[1:]), indexing='ij')
+    frame = pd.DataFrame({name: grid.ravel() for name, grid in zip(GRID_AXES[1:], grids)})
+    frame['relocation_npv'] = relocation_npv.ravel()
+    frame['breakeven_rent_psf'] = breakeven.ravel()
+    return frame
+
+
+def _breakeven_terms(renewal: RenewalScenario, relocation: RelocationScenario,
+                     general: GeneralInputs, axes: Dict[str, np.ndarray]):
+    """Relocation NPV (T, D, M, K) and renewal NPV = fixed + rent * annuity terms"""
+    area = general.rentable_area_sf
+    rates = axes['discount_rate']
+    renew_years = renewal.term_years
+    reloc_years = relocation.term_years
+    discount = _discount_matrix(rates, max(renew_years, reloc_years))
+
+    reloc_flows = (_rent_schedule(relocation.annual_rent_psf, reloc_years) + relocation.operating_costs_psf) * area
+    reloc_flows_pv = discount[:, :reloc_years] @ reloc_flows
+
+    parts = _relocation_components(relocation, area)
+    ti_cost = np.maximum(0, parts['ti_requirement'] * axes['ti_mult'] - parts['ti_allowance'])
+    relocation_npv = (
+        ti_cost[:, None, None, None]
+        + parts['disruption'] * axes['disruption_mult'][None, :, None, None]
+        + parts['moving'] * axes['moving_mult'][None, None, :, None]
+        + parts['fixed']
+        + reloc_flows_pv[None, None, None, :]
+    )
+
+    renewal_annuity = discount[:, :renew_years].sum(axis=1)
+    renewal_fixed_pv = renewal.operating_costs_psf * area * renewal_annuity + _renewal_upfront(renewal, area)
+    return relocation_npv, renewal_fixed_pv, area * renewal_annuity
+
+
+# ============================================================================
+# FULL GRID
+# ============================================================================
+
+def evaluate_sensitivity_grid(
+    renewal: RenewalScenario,
+    relocation: RelocationScenario,
+    general: GeneralInputs,
+    rent_mult: Sequence[float] = (1.0,),
+    ti_mult: Sequence[float] = (1.0,),
+    disruption_mult: Sequence[float] = (1.0,),
+    moving_mult: Sequence[float] = (1.0,),
+    discount_rate: Optional[Sequence[float]] = None
+) -> SensitivityGridResult:
+    """
+    Evaluate renewal vs. relocation over a full sensitivity grid.
+
+    Every grid point reproduces compare_scenarios() on correspondingly
+    adjusted scenarios: NPVs, NERs, annual savings, relocation IRR,
+    payback, breakeven rent, current margin and recommendation.
+
+    Args:
+        renewal: Renewal scenario
+        relocation: Relocation scenario
+        general: General parameters
+        rent_mult: Renewal rent schedule multipliers
+        ti_mult: Relocation TI requirement multipliers
+        disruption_mult: Relocation disruption cost multipliers
+        moving_mult: Relocation moving/IT/signage cost multipliers
+        discount_rate: Annual discount rates (default: general.discount_rate)
+
+    Returns:
+        SensitivityGridResult (long frame + breakeven surface)
+
+    Raises:
+        ValueError: If an axis is empty or a discount rate is negative
+    """
+    axes = _grid_axes(general, rent_mult, ti_mult, disruption_mult, moving_mult, discount_rate)
+    area = general.rentable_area_sf
+    rates = axes['discount_rate']
+    renew_years = renewal.term_years
+    reloc_years = relocation.term_years
+    horizon = max(renew_years, reloc_years)
+    discount = _discount_matrix(rates, horizon)
+
+    # Annual cash flows (rent and operating costs kept separate for rent_mult)
+    renew_rent = _rent_schedule(renewal.annual_rent_psf, renew_years) * area
+    renew_op = renewal.operating_costs_psf * area
+    reloc_flows = (_rent_schedule(relocation.annual_rent_psf, reloc_years) + relocation.operating_costs_psf) * area
+
+    # Renewal NPV (R, K)
+    renew_rent_pv = discount[:, :renew_years] @ renew_rent
+    renew_op_pv = renew_op * discount[:, :renew_years].sum(axis=1)
+    renewal_npv = (
+        axes['rent_mult'][:, None] * renew_rent_pv[None, :]
+        + renew_op_pv[None, :]
+        + _renewal_upfront(renewal, area)
+    )
+
+    # Relocation NPV (T, D, M, K) and breakeven terms
+    relocation_npv, renewal_fixed_pv, renewal_rent_annuity = _breakeven_terms(renewal, relocation, general, axes)
+    breakeven = (relocation_npv - renewal_fixed_pv) / renewal_rent_annuity
+
+    shape = tuple(len(axes[name]) for name in GRID_AXES)
+    renewal_full = np.broadcast_to(renewal_npv[:, None, None, None, :], shape)
+    relocation_full = np.broadcast_to(relocation_npv[None, ...], shape)
+    npv_difference = relocation_full - renewal_full
+
+    # NER
+    with np.errstate(divide='ignore', invalid='ignore'):
+        renew_af = _monthly_annuity(rates, renew_years)
+        reloc_af = _monthly_annuity(rates, reloc_years)
+        renewal_ner = np.where((area > 0) & (renew_af > 0), renewal_full / area / renew_af, 0.0)
+        relocation_ner = np.where((area > 0) & (reloc_af > 0), relocation_full / area / reloc_af, 0.0)
+
+    # Savings, IRR and payback depend on (R, T, D, M) only
+    renew_flows = np.zeros((len(axes['rent_mult']), horizon))
+    renew_flows[:, :renew_years] = axes['rent_mult'][:, None] * renew_rent[None, :] + renew_op
+    reloc_padded = np.zeros(horizon)
+    reloc_padded[:reloc_years] = reloc_flows
+    diff_flows = renew_flows - reloc_padded                     # (R, H)
+    annual_savings = diff_flows.mean(axis=1)
+
+    parts = _relocation_components(relocation, area)
+    upfront = (
+        np.maximum(0, parts['ti_requirement'] * axes['ti_mult'] - parts['ti_allowance'])[:, None, None]
+        + parts['disruption'] * axes['disruption_mult'][None, :, None]
+        + parts['moving'] * axes['moving_mult'][None, None, :]
+        + parts['fixed']
+    )                                                            # (T, D, M)
+
+    n_rent, n_upfront = len(axes['rent_mult']), upfront.size
+    irr_flows = np.empty((n_rent * n_upfront, horizon + 1))
+    irr_flows[:, 0] = -np.tile(upfront.ravel(), n_rent)
+    irr_flows[:, 1:] = np.repeat(diff_flows, n_upfront, axis=0)
+    relocation_irr = irr_many(irr_flows).reshape(shape[:-1])
+    relocation_irr = np.where(upfront[None, ...] > 0, relocation_irr, np.nan)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        payback = np.where(
+            annual_savings[:, None, None, None] > 0,
+            upfront[None, ...] / annual_savings[:, None, None, None],
+            np.nan
+        )
+
+    # Recommendation (generate_recommendation() decision rules)
+    primary = np.select(
+        [npv_difference > NPV_DECISION_THRESHOLD, npv_difference < -NPV_DECISION_THRESHOLD],
+        ['RENEW', 'RELOCATE'],
+        default='NEGOTIATE'
+    )
+    strong_irr = np.broadcast_to((relocation_irr > IRR_HURDLE)[..., None], shape)
+    recommendation = np.where((primary == 'RENEW') & strong_irr, 'NEGOTIATE', primary)
+
+    first_year_rent = renewal.annual_rent_psf[0] if renewal.annual_rent_psf else np.nan
+    breakeven_full = np.broadcast_to(breakeven[None, ...], shape)
+
+    grids = np.meshgrid(*(axes[name] for name in GRID_AXES), indexing='ij')
+    frame = pd.DataFrame({name: grid.ravel() for name, grid in zip(GRID_AXES, grids)})
+    frame['renewal_npv'] = renewal_full.ravel()
+    frame['relocation_npv'] = relocation_full.ravel()
+    frame['npv_difference'] = npv_difference.ravel()
+    frame['renewal_ner_psf'] = renewal_ner.ravel()
+    frame['relocation_ner_psf'] = relocation_ner.ravel()
+    frame['ner_difference_psf'] = (relocation_ner - renewal_ner).ravel()
+    frame['annual_savings'] = np.broadcast_to(annual_savings[:, None, None, None, None], shape).ravel()
+    frame['relocation_irr'] = np.broadcast_to(relocation_irr[..., None], shape).ravel()
+    frame['payback_years'] = np.broadcast_to(payback[..., None], shape).ravel()
+    frame['breakeven_rent_psf'] = breakeven_full.ravel()
+    frame['current_margin_psf'] = (
+        np.broadcast_to(axes['rent_mult'][:, None, None, None, None], shape) * first_year_rent - breakeven_full
+    ).ravel()
+    frame['recommendation'] = recommendation.ravel()
+
+    base = {name: 1.0 for name in GRID_AXES}
+    base['discount_rate'] = general.discount_rate
+
+    return SensitivityGridResult(
+        frame=frame,
+        breakeven=_surface_frame(axes, relocation_npv, breakeven),
+        axes=axes,
+        base=base
+    )
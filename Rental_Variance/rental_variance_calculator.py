@@ -315,9 +315,9 @@ def load_json_input(file_path: str) -> VarianceAnalysisInput:
     return VarianceAnalysisInput(**data)
 
 
-def save_json_results(results: VarianceAnalysisResults, file_path: str):
-    """Save results to JSON file"""
-    results_dict = {
+def results_to_dict(results: VarianceAnalysisResults) -> Dict:
+    """Results in the JSON output layout"""
+    return {
         'summary': {
             'total_budget_revenue': results.total_budget_revenue,
             'total_actual_revenue': results.total_actual_revenue,
@@ -332,8 +332,11 @@ def save_json_results(results: VarianceAnalysisResults, file_path: str):
         'tenant_results': results.tenant_results
     }
 
+
+def save_json_results(results: VarianceAnalysisResults, file_path: str):
+    """Save results to JSON file"""
     with open(file_path, 'w') as f:
-        json.dump(results_dict, f, indent=2)
+        json.dump(results_to_dict(results), f, indent=2)
 
     print(f"Results saved to: {file_path}")
 
@@ -30,6 +30,18 @@ we calculate shorter term rates by working backwards:
 
 The $X that makes these equivalent is the 4-year spot rate.
 
+Closed Form:
+------------
+With annuity-due factor a(n) = sum(v^k, k=0..n-1) and v = 1/(1+r), the
+blended NPV is base*a(N) + MTM*v^N*a(B-N). Since a(N) + v^N*a(B-N) = a(B),
+the N-month spot rate simplifies to:
+
+    rate(N) = MTM - (MTM - base) * a(N) / a(B)
+
+so a full curve only needs one cumulative discount-factor array per
+monthly rate (shared via Shared_Utils.discount_curve). See
+build_yield_curve_table() for the batch API.
+
 Usage:
 ------
 python3 rental_yield_curve.py --base-term 60 --base-rate 8.00 --mtm-multiplier 1.25 --discount-rate 0.10
@@ -37,11 +49,18 @@ python3 rental_yield_curve.py --base-term 60 --base-rate 8.00 --mtm-multiplier 1
 
 import numpy as np
 import numpy_financial as npf
+import pandas as pd
 from dataclasses import dataclass
-from typing import List, Dict
+from typing import List, Dict, Optional, Sequence
 import argparse
 import json
+import sys
 from datetime import datetime
+from pathlib import Path
+
+# Add repo root to path for Shared_Utils
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from Shared_Utils.discount_curve import discount_curve
 
 
 @dataclass
@@ -77,6 +96,39 @@ class TermStructurePoint:
         return self.term_months / 12
 
 
+def annuity_due_factors(monthly_rate: float, max_months: int) -> np.ndarray:
+    """
+    Cumulative annuity-due factors a(n) for n = 0..max_months
+
+    a(n) is the present value of $1 paid at the start of each month for n
+    months. Read from the shared discount-curve cache, so every curve
+    sharing a discount rate reuses the same table.
+
+    Args:
+        monthly_rate: Monthly discount rate
+        max_months: Longest horizon required
+
+    Returns:
+        Read-only array of length max_months + 1 (a[0] = 0.0)
+    """
+    return discount_curve(monthly_rate, timing='beginning').annuity_factors(max_months)
+
+
+def _term_rate_ratios(monthly_rate: float, base_term_months: int,
+                      terms: np.ndarray) -> np.ndarray:
+    """
+    Weight a(N)/a(B) of the base rate in the N-month spot rate
+
+    Terms at or beyond the base term return 1.0 (base rate); terms of one
+    month or less return 0.0 (MTM rate), matching calculate_term_rate().
+    """
+    factors = annuity_due_factors(monthly_rate, base_term_months)
+    clipped = np.clip(terms, 0, base_term_months)
+    ratios = factors[clipped] / factors[base_term_months]
+    ratios = np.where(terms >= base_term_months, 1.0, ratios)
+    return np.where(terms <= 1, 0.0, ratios)
+
+
 class RentalYieldCurveCalculator:
     """
     Calculate rental rates for all lease terms using implied termination options
@@ -92,6 +144,7 @@ class RentalYieldCurveCalculator:
     def __init__(self, inputs: YieldCurveInputs):
         self.inputs = inputs
         self.monthly_rate = inputs.monthly_discount_rate
+        self.discount_curve = discount_curve(self.monthly_rate, timing='beginning')
 
     def calculate_pv(self, payment_psf: float, months: int, offset_months: int = 0) -> float:
         """
@@ -111,14 +164,9 @@ class RentalYieldCurveCalculator:
         # Annualize the payment for input (payment is annual $/sf)
         monthly_payment = payment_psf / 12
 
-        # PV with annuity due (type=1, payment at beginning of period)
-        pv = -npf.pv(self.monthly_rate, months, monthly_payment, 0, 1)
-
-        # Discount for offset
-        if offset_months > 0:
-            pv = pv / ((1 + self.monthly_rate) ** offset_months)
-
-        return pv
+        # PV with annuity due (payment at beginning of period), discounted
+        # for offset, from the cached discount curve
+        return self.discount_curve.pv(monthly_payment, months, offset_months)
 
     def calculate_pmt_from_pv(self, pv_psf: float, months: int) -> float:
         """
@@ -187,6 +235,24 @@ class RentalYieldCurveCalculator:
 
         return term_rate
 
+    def calculate_term_rates(self, terms_months: Sequence[int]) -> np.ndarray:
+        """
+        Calculate rental rates for many terms at once (closed form)
+
+        Equivalent to calling calculate_term_rate() for each term, but solves
+        all terms as one array expression over memoized annuity factors.
+
+        Args:
+            terms_months: Lease terms in months
+
+        Returns:
+            Array of annual rental rates per square foot
+        """
+        terms = np.asarray(terms_months, dtype=int)
+        ratios = _term_rate_ratios(self.monthly_rate, self.inputs.base_term_months, terms)
+        mtm_rate = self.inputs.mtm_rate_psf
+        return mtm_rate - (mtm_rate - self.inputs.base_rate_psf) * ratios
+
     def generate_yield_curve(self, terms_list: List[int] = None) -> List[TermStructurePoint]:
         """
         Generate complete rental yield curve
@@ -209,9 +275,10 @@ class RentalYieldCurveCalculator:
 
         curve = []
         base_rate = self.inputs.base_rate_psf
+        terms = sorted(terms_list)
+        rates = self.calculate_term_rates(terms)
 
-        for term in sorted(terms_list):
-            rate = self.calculate_term_rate(term)
+        for term, rate in zip(terms, rates.tolist()):
             change = rate - base_rate
             pct_change = (change / base_rate) if base_rate != 0 else 0.0
 
@@ -236,6 +303,71 @@ class RentalYieldCurveCalculator:
         return self.generate_yield_curve(all_months)
 
 
+def build_yield_curve_table(inputs_grid: Sequence[YieldCurveInputs],
+                            terms_list: Optional[Sequence[int]] = None) -> pd.DataFrame:
+    """
+    Build yield curves for a grid of inputs as one stacked table
+
+    Curves sharing a (discount rate, base term) pair share one annuity factor
+    array, so each group is solved as a single broadcast over
+    (curves x terms) regardless of base rate or MTM multiplier.
+
+    Args:
+        inputs_grid: Sequence of YieldCurveInputs (e.g. submarket x base term x MTM premium)
+        terms_list: Terms (in months) to evaluate for every curve. If None,
+                    each curve is evaluated for every month 1..base_term.
+
+    Returns:
+        Long DataFrame with one row per (curve_id, term_months), where
+        curve_id is the position of the inputs in inputs_grid
+    """
+    columns = [
+        'curve_id', 'base_term_months', 'base_rate_psf', 'mtm_multiplier',
+        'nominal_discount_rate', 'term_months', 'rate_psf',
+        'change_from_base', 'pct_change_from_base'
+    ]
+    if len(inputs_grid) == 0:
+        return pd.DataFrame(columns=columns)
+
+    groups: Dict[tuple, List[int]] = {}
+    for curve_id, inputs in enumerate(inputs_grid):
+        key = (inputs.monthly_discount_rate, inputs.base_term_months)
+        groups.setdefault(key, []).append(curve_id)
+
+    frames = []
+    for (monthly_rate, base_term), curve_ids in groups.items():
+        if terms_list is None:
+            terms = np.arange(1, base_term + 1)
+        else:
+            terms = np.array(sorted(terms_list), dtype=int)
+        ratios = _term_rate_ratios(monthly_rate, base_term, terms)
+
+        members = [inputs_grid[i] for i in curve_ids]
+        base_rates = np.array([m.base_rate_psf for m in members])
+        mtm_rates = np.array([m.mtm_rate_psf for m in members])
+
+        rates = mtm_rates[:, None] - (mtm_rates - base_rates)[:, None] * ratios[None, :]
+        changes = rates - base_rates[:, None]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pct = np.where(base_rates[:, None] != 0, changes / base_rates[:, None], 0.0)
+
+        n_terms = len(terms)
+        frames.append(pd.DataFrame({
+            'curve_id': np.repeat(curve_ids, n_terms),
+            'base_term_months': base_term,
+            'base_rate_psf': np.repeat(base_rates, n_terms),
+            'mtm_multiplier': np.repeat([m.mtm_multiplier for m in members], n_terms),
+            'nominal_discount_rate': np.repeat([m.nominal_discount_rate for m in members], n_terms),
+            'term_months': np.tile(terms, len(members)),
+            'rate_psf': rates.ravel(),
+            'change_from_base': changes.ravel(),
+            'pct_change_from_base': pct.ravel(),
+        }))
+
+    table = pd.concat(frames, ignore_index=True)
+    return table.sort_values(['curve_id', 'term_months'], kind='stable').reset_index(drop=True)
+
+
 def print_yield_curve(curve: List[TermStructurePoint], inputs: YieldCurveInputs):
     """Print formatted yield curve table"""
 
@@ -0,0 +1,95 @@
+"""
+Consistency Tests for the Closed-Form and Batch Yield Curve Paths
+
+The vectorized solver (calculate_term_rates / build_yield_curve_table) must
+reproduce the scalar annuity-based calculate_term_rate() for every month.
+"""
+
+import itertools
+
+import pytest
+
+from rental_yield_curve import (
+    RentalYieldCurveCalculator,
+    YieldCurveInputs,
+    annuity_due_factors,
+    build_yield_curve_table,
+)
+
+
+def test_closed_form_matches_scalar_solver_all_months():
+    """Every month of the closed-form curve equals the scalar solver"""
+    inputs = YieldCurveInputs(base_term_months=120, base_rate_psf=15.00,
+                              mtm_multiplier=1.40, nominal_discount_rate=0.08)
+    calc = RentalYieldCurveCalculator(inputs)
+
+    terms = list(range(0, 130))
+    vectorized = calc.calculate_term_rates(terms)
+
+    for term, rate in zip(terms, vectorized):
+        assert rate == pytest.approx(calc.calculate_term_rate(term), abs=1e-9)
+
+
+def test_full_curve_still_matches_paper():
+    """generate_full_curve_all_months() keeps the paper's 4-year rate"""
+    calc = RentalYieldCurveCalculator(YieldCurveInputs())
+    curve = calc.generate_full_curve_all_months()
+
+    assert len(curve) == 60
+    assert curve[0].rate_psf == pytest.approx(10.00)
+    assert curve[47].rate_psf == pytest.approx(8.32, abs=0.01)
+    assert curve[-1].rate_psf == pytest.approx(8.00)
+
+
+def test_zero_discount_rate():
+    """With no discounting a(n) = n, so rates interpolate linearly"""
+    inputs = YieldCurveInputs(base_term_months=10, base_rate_psf=10.0,
+                              mtm_multiplier=1.5, nominal_discount_rate=0.0)
+    calc = RentalYieldCurveCalculator(inputs)
+
+    assert calc.calculate_term_rates([5])[0] == pytest.approx(12.5)
+    assert list(annuity_due_factors(0.0, 3)) == [0.0, 1.0, 2.0, 3.0]
+
+
+def test_batch_table_matches_individual_curves():
+    """Stacked table rows equal per-curve results for a mixed grid"""
+    grid = [
+        YieldCurveInputs(base_term_months=term, base_rate_psf=rate,
+                         mtm_multiplier=mtm, nominal_discount_rate=disc)
+        for term, rate, mtm, disc in itertools.product(
+            [36, 60], [8.0, 12.5], [1.25, 1.50], [0.06, 0.10]
+        )
+    ]
+
+    table = build_yield_curve_table(grid)
+
+    assert len(table) == sum(inputs.base_term_months for inputs in grid)
+    assert table['curve_id'].is_monotonic_increasing
+
+    for curve_id, inputs in enumerate(grid):
+        rows = table[table['curve_id'] == curve_id]
+        expected = RentalYieldCurveCalculator(inputs).generate_full_curve_all_months()
+        assert list(rows['term_months']) == [p.term_months for p in expected]
+        assert list(rows['rate_psf']) == pytest.approx([p.rate_psf for p in expected])
+        assert list(rows['pct_change_from_base']) == pytest.approx(
+            [p.pct_change_from_base for p in expected]
+        )
+
+
+def test_batch_table_with_explicit_terms():
+    """Explicit terms beyond a curve's base term price at the base rate"""
+    grid = [YieldCurveInputs(base_term_months=24), YieldCurveInputs(base_term_months=60)]
+
+    table = build_yield_curve_table(grid, terms_list=[48, 1, 12])
+
+    short = table[table['curve_id'] == 0]
+    assert list(short['term_months']) == [1, 12, 48]
+    assert short['rate_psf'].iloc[-1] == pytest.approx(8.00)
+    assert short['rate_psf'].iloc[0] == pytest.approx(10.00)
+
+
+def test_batch_table_empty_grid():
+    """An empty grid returns an empty table with the expected columns"""
+    table = build_yield_curve_table([])
+    assert table.empty
+    assert 'rate_psf' in table.columns
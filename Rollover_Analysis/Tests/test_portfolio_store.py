@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Incremental Portfolio Store and Incremental Report
+
+Test Coverage:
+- Store results match calculate_rollover_analysis()
+- Year/quarter buckets after add/update/remove
+- Cache invalidation granularity (priority-only vs bucket changes,
+  analysis date and assumptions)
+- Default lease IDs for duplicate address/tenant pairs
+- Incremental report re-renders only changed sections
+
+Author: Claude Code
+Version: 1.0.0
+Date: 2026-10-18
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import unittest
+from dataclasses import replace
+from datetime import date
+
+from rollover_calculator import (
+    Lease,
+    load_portfolio_from_json,
+    calculate_rollover_analysis
+)
+from portfolio_store import PortfolioStore, default_lease_id
+from report_generator import IncrementalReport, generate_markdown_report
+
+SAMPLE_PATH = os.path.join(os.path.dirname(__file__), '..', 'rollover_inputs', 'sample_portfolio.json')
+
+
+def _strip_timestamp(report: str) -> str:
+    return "\n".join(line for line in report.splitlines() if "Report Generated**:" not in line)
+
+
+class TestStoreMatchesBatchAnalysis(unittest.TestCase):
+    """Store results must equal the full recomputation"""
+
+    def setUp(self):
+        self.portfolio = load_portfolio_from_json(SAMPLE_PATH)
+        self.store = PortfolioStore.from_portfolio(self.portfolio)
+
+    def assertResultsMatch(self, store):
+        expected = calculate_rollover_analysis(store.to_portfolio_input()).to_dict()
+        actual = store.results().to_dict()
+        self.assertEqual(actual, expected)
+
+    def test_initial_results(self):
+        self.assertEqual(len(self.store), len(self.portfolio.leases))
+        self.assertAlmostEqual(self.store.total_area_sf, self.portfolio.total_area_sf)
+        self.assertAlmostEqual(self.store.total_annual_rent, self.portfolio.total_annual_rent)
+        self.assertResultsMatch(self.store)
+
+    def test_results_after_changes(self):
+        ids = self.store.lease_ids
+        self.store.remove_lease(ids[0])
+        lease = self.store.get_lease(ids[1])
+        self.store.update_lease(ids[1], replace(lease, lease_expiry_date=date(2031, 2, 28)))
+        self.store.add_lease(Lease("9 New Rd", "Newco", 12_000, 180_000,
+                                   date(2027, 11, 30), [], "BB", -5.0))
+        self.assertResultsMatch(self.store)
+
+
+class TestBuckets(unittest.TestCase):
+    """Test year and quarter bucket maintenance"""
+
+    def setUp(self):
+        self.store = PortfolioStore("Test", date(2026, 1, 1))
+        self.a = self.store.add_lease(Lease("1 A St", "A", 1_000, 10_000, date(2027, 2, 28), [], "A", 0.0))
+        self.b = self.store.add_lease(Lease("2 B St", "B", 2_000, 30_000, date(2027, 11, 30), [], "BB", 0.0))
+
+    def test_year_and_quarter_buckets(self):
+        years = self.store.year_buckets()
+        self.assertEqual([b.period for b in years], [2027])
+        self.assertEqual(years[0].lease_count, 2)
+        self.assertEqual(years[0].total_sf, 3_000)
+
+        quarters = self.store.quarter_buckets()
+        self.assertEqual([b.period for b in quarters], [(2027, 1), (2027, 4)])
+        self.assertEqual(quarters[1].to_dict()["period"], "2027-Q4")
+
+    def test_move_between_buckets(self):
+        lease = self.store.get_lease(self.b)
+        self.store.update_lease(self.b, replace(lease, lease_expiry_date=date(2029, 5, 31)))
+        self.assertEqual([b.period for b in self.store.year_buckets()], [2027, 2029])
+        self.assertEqual([b.period for b in self.store.quarter_buckets()], [(2027, 1), (2029, 2)])
+
+    def test_remove_empties_bucket(self):
+        self.store.remove_lease(self.a)
+        self.assertEqual([b.period for b in self.store.quarter_buckets()], [(2027, 4)])
+        self.assertEqual(self.store.total_annual_rent, 30_000)
+
+    def test_duplicate_and_missing_ids(self):
+        with self.assertRaises(ValueError):
+            self.store.add_lease(self.store.get_lease(self.b), lease_id=self.a)
+        with self.assertRaises(KeyError):
+            self.store.remove_lease("missing")
+        self.assertEqual(self.a, default_lease_id(self.store.get_lease(self.a)))
+
+    def test_duplicate_default_ids_get_position_suffix(self):
+        lease = self.store.get_lease(self.a)
+        second = self.store.add_lease(replace(lease, rentable_area_sf=500))
+        self.assertEqual(second, f"{self.a}#2")
+        self.assertEqual(self.store.year_buckets()[0].total_sf, 3_500)
+
+        portfolio = load_portfolio_from_json(SAMPLE_PATH)
+        portfolio.leases.append(portfolio.leases[0])
+        store = PortfolioStore.from_portfolio(portfolio)
+        self.assertEqual(len(store), len(portfolio.leases))
+
+    def test_empty_store_results(self):
+        store = PortfolioStore("Empty", date(2026, 1, 1))
+        with self.assertRaises(ValueError):
+            store.results()
+
+
+class TestCacheInvalidation(unittest.TestCase):
+    """Test which cached components are rebuilt"""
+
+    def setUp(self):
+        self.store = PortfolioStore.from_portfolio(load_portfolio_from_json(SAMPLE_PATH))
+        self.lease_id = self.store.lease_ids[0]
+
+    def test_credit_change_only_touches_priority(self):
+        schedule = self.store.expiry_schedule()
+        before = self.store.versions
+
+        lease = self.store.get_lease(self.lease_id)
+        self.store.update_lease(self.lease_id, replace(lease, tenant_credit_rating="CCC"))
+
+        after = self.store.versions
+        self.assertEqual(after["expiry"], before["expiry"])
+        self.assertEqual(after["scenarios"], before["scenarios"])
+        self.assertEqual(after["priority"], before["priority"] + 1)
+        self.assertIs(self.store.expiry_schedule(), schedule)
+
+    def test_analysis_date_and_assumptions_invalidate(self):
+        schedule = self.store.expiry_schedule()
+        ranking = self.store.priority_ranking()
+        scenarios = self.store.scenarios()
+
+        self.store.assumptions = replace(self.store.assumptions, renewal_rate_base=0.55)
+        self.assertIs(self.store.priority_ranking(), ranking)
+        self.assertIsNot(self.store.scenarios(), scenarios)
+
+        before = self.store.versions
+        self.store.analysis_date = date(2027, 6, 30)
+        after = self.store.versions
+        self.assertEqual(after["expiry"], before["expiry"])
+        self.assertEqual(after["priority"], before["priority"] + 1)
+        self.assertEqual(after["scenarios"], before["scenarios"] + 1)
+        self.assertIs(self.store.expiry_schedule(), schedule)
+        expected = calculate_rollover_analysis(self.store.to_portfolio_input()).to_dict()
+        self.assertEqual(self.store.results().to_dict(), expected)
+
+    def test_rent_change_invalidates_schedule(self):
+        schedule = self.store.expiry_schedule()
+        lease = self.store.get_lease(self.lease_id)
+        self.store.update_lease(self.lease_id, replace(lease, current_annual_rent=1.0))
+        self.assertIsNot(self.store.expiry_schedule(), schedule)
+
+
+class TestIncrementalReport(unittest.TestCase):
+    """Test section-level report regeneration"""
+
+    def setUp(self):
+        self.store = PortfolioStore.from_portfolio(load_portfolio_from_json(SAMPLE_PATH))
+        self.report = IncrementalReport(self.store)
+
+    def test_first_render_matches_full_report(self):
+        rendered = self.report.render()
+        full = generate_markdown_report(self.store.results())
+        self.assertEqual(_strip_timestamp(rendered), _strip_timestamp(full))
+        self.assertEqual(len(self.report.last_rendered), 8)
+
+    def test_unchanged_store_rerenders_header_only(self):
+        self.report.render()
+        self.report.render()
+        self.assertEqual(self.report.last_rendered, ["header"])
+
+    def test_priority_change_rerenders_dependent_sections(self):
+        self.report.render()
+        lease_id = self.store.lease_ids[0]
+        lease = self.store.get_lease(lease_id)
+        self.store.update_lease(lease_id, replace(lease, below_market_pct=-19.0))
+
+        rendered = self.report.render()
+        self.assertEqual(self.report.last_rendered,
+                         ["header", "priority_ranking", "recommended_actions"])
+        full = generate_markdown_report(self.store.results())
+        self.assertEqual(_strip_timestamp(rendered), _strip_timestamp(full))
+
+    def test_analysis_date_change_rerenders(self):
+        self.report.render()
+        self.store.analysis_date = date(2027, 6, 30)
+        rendered = self.report.render()
+        self.assertIn("priority_ranking", self.report.last_rendered)
+        self.assertIn("scenario_analysis", self.report.last_rendered)
+        full = generate_markdown_report(self.store.results())
+        self.assertEqual(_strip_timestamp(rendered), _strip_timestamp(full))
+
+    def test_removal_rerenders_schedule_sections(self):
+        self.report.render()
+        self.store.remove_lease(self.store.lease_ids[-1])
+        rendered = self.report.render()
+        self.assertIn("expiry_schedule", self.report.last_rendered)
+        self.assertIn("scenario_analysis", self.report.last_rendered)
+        self.assertNotIn("methodology", self.report.last_rendered)
+        full = generate_markdown_report(self.store.results())
+        self.assertEqual(_strip_timestamp(rendered), _strip_timestamp(full))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for Portfolio Rollover Monte Carlo Simulator
+
+Test Coverage:
+- Credit-adjusted renewal probabilities
+- Deterministic limits (all renew / none renew, zero volatility)
+- Vacancy-at-risk and expiry-concentration VaR shape
+- Chunking invariance and reproducibility with a seed
+- Input validation
+
+Author: Claude Code
+Version: 1.0.0
+Date: 2026-10-18
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import unittest
+from datetime import date
+
+import numpy as np
+
+from rollover_calculator import Lease, Assumptions, PortfolioInput
+from rollover_simulation import (
+    SimulationSettings,
+    calculate_renewal_probabilities,
+    simulate_rollover
+)
+
+
+def _portfolio(assumptions=None):
+    """Three-lease portfolio: rent paid through months 6 and 18, third beyond horizon"""
+    leases = [
+        Lease("1 A St", "Alpha", 10_000, 120_000, date(2026, 7, 31), [], "AAA", 0.0),
+        Lease("2 B St", "Beta", 20_000, 240_000, date(2027, 7, 31), [], "B", -20.0),
+        Lease("3 C St", "Gamma", 30_000, 360_000, date(2035, 1, 31), [], "BBB", 0.0),
+    ]
+    return PortfolioInput(
+        portfolio_name="Test",
+        analysis_date=date(2026, 1, 15),
+        leases=leases,
+        assumptions=assumptions or Assumptions(
+            market_rent_growth_annual=0.0,
+            downtime_months={"optimistic": 4, "base": 4, "pessimistic": 4}
+        )
+    )
+
+
+class TestRenewalProbabilities(unittest.TestCase):
+    """Test credit-adjusted renewal probabilities"""
+
+    def test_stronger_credit_renews_more(self):
+        probs = calculate_renewal_probabilities(_portfolio())
+        self.assertGreater(probs[0], probs[2])
+        self.assertGreater(probs[2], probs[1])
+
+    def test_neutral_credit_equals_base_rate(self):
+        probs = calculate_renewal_probabilities(_portfolio())
+        self.assertAlmostEqual(probs[2], 0.65)
+
+    def test_probabilities_clipped(self):
+        probs = calculate_renewal_probabilities(_portfolio(), credit_sensitivity=10.0)
+        self.assertTrue(np.all((probs >= 0) & (probs <= 1)))
+
+
+class TestDeterministicLimits(unittest.TestCase):
+    """With no randomness the simulation reduces to a single cash-flow path"""
+
+    def test_all_renew_no_downtime(self):
+        portfolio = _portfolio()
+        settings = SimulationSettings(n_simulations=50, horizon_months=24,
+                                      rent_volatility=0.0, seed=1)
+        results = simulate_rollover(portfolio, settings, renewal_probabilities=[1.0, 1.0, 1.0])
+
+        self.assertTrue(np.allclose(results.expected_vacancy_sf, 0.0))
+        # Beta is 20% below market: 240k / 0.8 = 300k after month 18
+        self.assertAlmostEqual(results.expected_monthly_noi[18], 60_000.0)
+        self.assertAlmostEqual(results.expected_monthly_noi[19], 65_000.0)
+        self.assertTrue(np.allclose(results.noi_pv, results.noi_pv[0]))
+        for cohort in results.expiry_concentration:
+            self.assertAlmostEqual(cohort.var, 0.0)
+
+    def test_none_renew_fixed_downtime(self):
+        portfolio = _portfolio()
+        settings = SimulationSettings(n_simulations=20, horizon_months=24,
+                                      rent_volatility=0.0, seed=1)
+        results = simulate_rollover(portfolio, settings, renewal_probabilities=[0.0, 0.0, 0.0])
+
+        # Expiry month is paid: Alpha vacant months 7-10, Beta vacant months 19-22
+        self.assertAlmostEqual(results.expected_vacancy_sf[6], 0.0)
+        self.assertAlmostEqual(results.expected_monthly_noi[6], 60_000.0)
+        self.assertAlmostEqual(results.expected_vacancy_sf[7], 10_000.0)
+        self.assertAlmostEqual(results.expected_vacancy_sf[10], 10_000.0)
+        self.assertAlmostEqual(results.expected_vacancy_sf[11], 0.0)
+        self.assertAlmostEqual(results.expected_vacancy_sf[18], 0.0)
+        self.assertAlmostEqual(results.expected_vacancy_sf[19], 20_000.0)
+
+        # Alpha's cohort loss = 4 months rent + TI + 5-year commission
+        alpha = results.expiry_concentration[0]
+        self.assertEqual(alpha.year, 2026)
+        expected = 4 * 10_000 + 15.0 * 10_000 + 0.05 * 120_000 * 5
+        self.assertAlmostEqual(alpha.expected_loss, expected)
+        self.assertAlmostEqual(alpha.var, expected)
+
+    def test_mid_month_expiry_vacates_that_month(self):
+        portfolio = _portfolio()
+        portfolio.leases[0].lease_expiry_date = date(2026, 7, 15)
+        settings = SimulationSettings(n_simulations=5, horizon_months=12,
+                                      rent_volatility=0.0, seed=1)
+        results = simulate_rollover(portfolio, settings, renewal_probabilities=[0.0, 0.0, 0.0])
+        self.assertAlmostEqual(results.expected_vacancy_sf[5], 0.0)
+        self.assertAlmostEqual(results.expected_vacancy_sf[6], 10_000.0)
+
+    def test_leases_beyond_horizon_are_constant(self):
+        portfolio = _portfolio()
+        settings = SimulationSettings(n_simulations=10, horizon_months=3, seed=1)
+        results = simulate_rollover(portfolio, settings)
+
+        self.assertEqual(results.expiry_concentration, [])
+        self.assertTrue(np.allclose(results.expected_monthly_noi, 60_000.0))
+
+
+class TestStochasticOutputs(unittest.TestCase):
+    """Test distributional outputs"""
+
+    def test_seed_reproducible_and_chunk_invariant_shapes(self):
+        portfolio = _portfolio()
+        a = simulate_rollover(portfolio, SimulationSettings(n_simulations=500, chunk_size=64, seed=7))
+        b = simulate_rollover(portfolio, SimulationSettings(n_simulations=500, chunk_size=64, seed=7))
+        self.assertTrue(np.array_equal(a.noi_pv, b.noi_pv))
+        self.assertEqual(a.noi_pv.shape, (500,))
+        self.assertEqual(a.vacancy_at_risk_sf.shape, (60,))
+
+    def test_chunk_size_invariant(self):
+        portfolio = _portfolio(Assumptions())
+        a = simulate_rollover(portfolio, SimulationSettings(n_simulations=500, chunk_size=64, seed=7))
+        b = simulate_rollover(portfolio, SimulationSettings(n_simulations=500, chunk_size=500, seed=7))
+        self.assertTrue(np.array_equal(a.noi_pv, b.noi_pv))
+        self.assertTrue(np.array_equal(a.vacancy_at_risk_sf, b.vacancy_at_risk_sf))
+        self.assertEqual(a.expiry_concentration, b.expiry_concentration)
+
+    def test_risk_measures_bounded(self):
+        portfolio = _portfolio(Assumptions())
+        results = simulate_rollover(portfolio, SimulationSettings(n_simulations=2_000, seed=3))
+        self.assertTrue(np.all(results.vacancy_at_risk_sf >= 0))
+        self.assertTrue(np.all(results.vacancy_at_risk_sf <= 30_000))
+        for cohort in results.expiry_concentration:
+            self.assertGreaterEqual(cohort.cvar, cohort.var)
+            self.assertGreaterEqual(cohort.var, 0.0)
+
+    def test_renewal_frequency_matches_probability(self):
+        portfolio = _portfolio()
+        settings = SimulationSettings(n_simulations=20_000, horizon_months=12,
+                                      rent_volatility=0.0, seed=11)
+        results = simulate_rollover(portfolio, settings, renewal_probabilities=[0.3, 0.0, 0.0])
+        # Alpha vacant at month 7 only when not renewed
+        self.assertAlmostEqual(results.expected_vacancy_sf[7] / 10_000, 0.7, delta=0.02)
+
+    def test_to_dict(self):
+        results = simulate_rollover(_portfolio(), SimulationSettings(n_simulations=100, seed=1))
+        data = results.to_dict()
+        self.assertEqual(len(data["monthly"]), 60)
+        self.assertIn("p95", data["noi_pv"])
+        self.assertEqual(len(data["renewal_probabilities"]), 3)
+
+
+class TestValidation(unittest.TestCase):
+    """Test input validation"""
+
+    def test_empty_portfolio(self):
+        portfolio = _portfolio()
+        portfolio.leases = []
+        with self.assertRaises(ValueError):
+            simulate_rollover(portfolio)
+
+    def test_bad_probability_override(self):
+        with self.assertRaises(ValueError):
+            simulate_rollover(_portfolio(), renewal_probabilities=[0.5, 0.5])
+        with self.assertRaises(ValueError):
+            simulate_rollover(_portfolio(), renewal_probabilities=[0.5, 1.5, 0.5])
+
+    def test_bad_settings(self):
+        with self.assertRaises(ValueError):
+            SimulationSettings(n_simulations=0)
+        with self.assertRaises(ValueError):
+            SimulationSettings(confidence_level=1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Incremental Portfolio Store for Lease Rollover Analysis
+
+Keeps a portfolio indexed by expiry year and quarter so that day-to-day
+lease changes (add / update / remove) only touch the affected buckets:
+- Per-year and per-quarter buckets hold lease IDs, SF and rent totals
+- Portfolio totals are derived from bucket totals and cached
+- Expiry schedule, priority ranking and scenarios are cached and only
+  rebuilt when a change invalidates them
+- Component version counters let report_generator.IncrementalReport
+  re-render only the sections whose inputs changed
+
+Results match calculate_rollover_analysis() on the equivalent PortfolioInput.
+
+Author: Claude Code
+Version: 1.0.0
+Date: 2026-10-18
+"""
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from rollover_calculator import (
+    Lease,
+    Assumptions,
+    PortfolioInput,
+    ExpiryScheduleItem,
+    PriorityScore,
+    ScenarioResult,
+    RolloverAnalysisResults,
+    build_expiry_schedule,
+    build_scenario_analysis,
+    score_leases
+)
+
+
+# Cached components tracked by PortfolioStore.versions
+COMPONENTS = ("expiry", "priority", "scenarios")
+
+
+@dataclass
+class ExpiryBucket:
+    """Leases expiring in one period (year or (year, quarter))"""
+    period: object
+    lease_ids: Set[str] = field(default_factory=set)
+    total_sf: float = 0.0
+    total_annual_rent: float = 0.0
+
+    @property
+    def lease_count(self) -> int:
+        """Number of leases in bucket"""
+        return len(self.lease_ids)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization"""
+        if isinstance(self.period, tuple):
+            period = f"{self.period[0]}-Q{self.period[1]}"
+        else:
+            period = self.period
+        return {
+            "period": period,
+            "lease_count": self.lease_count,
+            "total_sf": self.total_sf,
+            "total_annual_rent": self.total_annual_rent
+        }
+
+
+def lease_quarter(lease: Lease) -> Tuple[int, int]:
+    """(year, quarter) of lease expiry"""
+    expiry = lease.lease_expiry_date
+    return expiry.year, (expiry.month - 1) // 3 + 1
+
+
+def default_lease_id(lease: Lease) -> str:
+    """Default lease key: property address + tenant name"""
+    return f"{lease.property_address}|{lease.tenant_name}"
+
+
+class PortfolioStore:
+    """
+    Expiry-indexed lease portfolio with cached aggregates
+
+    Usage:
+        store = PortfolioStore.from_portfolio(load_portfolio_from_json(path))
+        store.update_lease(lease_id, revised_lease)
+        results = store.results()
+    """
+
+    def __init__(
+        self,
+        portfolio_name: str,
+        analysis_date: date,
+        assumptions: Optional[Assumptions] = None,
+        leases: Iterable[Lease] = ()
+    ):
+        self.portfolio_name = portfolio_name
+        self._analysis_date = analysis_date
+        self._assumptions = assumptions or Assumptions()
+
+        self._leases: Dict[str, Lease] = {}
+        self._years: Dict[int, ExpiryBucket] = {}
+        self._quarters: Dict[Tuple[int, int], ExpiryBucket] = {}
+
+        self._totals: Optional[Tuple[float, float]] = None
+        self._expiry_schedule: Optional[List[ExpiryScheduleItem]] = None
+        self._priority_ranking: Optional[List[PriorityScore]] = None
+        self._scenarios: Optional[List[ScenarioResult]] = None
+        self._versions: Dict[str, int] = {name: 0 for name in COMPONENTS}
+
+        for lease in leases:
+            self.add_lease(lease)
+
+    @classmethod
+    def from_portfolio(cls, portfolio: PortfolioInput) -> "PortfolioStore":
+        """Build store from a PortfolioInput"""
+        return cls(
+            portfolio.portfolio_name,
+            portfolio.analysis_date,
+            portfolio.assumptions,
+            portfolio.leases
+        )
+
+    # ------------------------------------------------------------------
+    # Lease access
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._leases)
+
+    def __contains__(self, lease_id: str) -> bool:
+        return lease_id in self._leases
+
+    @property
+    def lease_ids(self) -> List[str]:
+        """Lease IDs in insertion order"""
+        return list(self._leases)
+
+    @property
+    def leases(self) -> List[Lease]:
+        """Leases in insertion order"""
+        return list(self._leases.values())
+
+    def get_lease(self, lease_id: str) -> Lease:
+        """Look up lease by ID"""
+        return self._leases[lease_id]
+
+    @property
+    def analysis_date(self) -> date:
+        """Analysis date (setting it invalidates priority ranking and scenarios)"""
+        return self._analysis_date
+
+    @analysis_date.setter
+    def analysis_date(self, value: date) -> None:
+        self._analysis_date = value
+        self._priority_ranking = None
+        self._scenarios = None
+        self._versions["priority"] += 1
+        self._versions["scenarios"] += 1
+
+    @property
+    def assumptions(self) -> Assumptions:
+        """Scenario assumptions (setting them invalidates scenarios)"""
+        return self._assumptions
+
+    @assumptions.setter
+    def assumptions(self, value: Assumptions) -> None:
+        self._assumptions = value
+        self._scenarios = None
+        self._versions["scenarios"] += 1
+
+    @property
+    def versions(self) -> Dict[str, int]:
+        """Change counters for each cached component"""
+        return dict(self._versions)
+
+    # ------------------------------------------------------------------
+    # Incremental updates
+    # ------------------------------------------------------------------
+
+    def add_lease(self, lease: Lease, lease_id: Optional[str] = None) -> str:
+        """
+        Add lease to portfolio
+
+        Returns:
+            Lease ID (defaults to "property_address|tenant_name", with a
+            "#<position>" suffix if another lease already has that ID)
+
+        Raises:
+            ValueError: If an explicit lease ID already exists
+        """
+        if not lease_id:
+            lease_id = default_lease_id(lease)
+            position = len(self._leases)
+            while lease_id in self._leases:
+                lease_id = f"{default_lease_id(lease)}#{position}"
+                position += 1
+        elif lease_id in self._leases:
+            raise ValueError(f"Lease already exists: {lease_id}")
+
+        self._leases[lease_id] = lease
+        self._index(lease_id, lease)
+        self._invalidate(expiry=True)
+        return lease_id
+
+    def update_lease(self, lease_id: str, lease: Lease) -> None:
+        """
+        Replace lease, keeping its ID and position
+
+        Changes that leave area, rent and expiry date untouched (e.g. credit
+        rating, below-market %, renewal options) only invalidate the
+        priority ranking.
+
+        Raises:
+            KeyError: If lease ID does not exist
+        """
+        old = self._leases[lease_id]
+        affects_buckets = (
+            old.lease_expiry_date != lease.lease_expiry_date or
+            old.rentable_area_sf != lease.rentable_area_sf or
+            old.current_annual_rent != lease.current_annual_rent
+        )
+
+        if affects_buckets:
+            self._unindex(lease_id, old)
+        self._leases[lease_id] = lease
+        if affects_buckets:
+            self._index(lease_id, lease)
+
+        self._invalidate(expiry=affects_buckets)
+
+    def remove_lease(self, lease_id: str) -> Lease:
+        """
+        Remove lease from portfolio
+
+        Raises:
+            KeyError: If lease ID does not exist
+        """
+        lease = self._leases.pop(lease_id)
+        self._unindex(lease_id, lease)
+        self._invalidate(expiry=True)
+        return lease
+
+    def _index(self, lease_id: str, lease: Lease) -> None:
+        """Add lease to its year and quarter buckets"""
+        year = lease.lease_expiry_date.year
+        quarter = lease_quarter(lease)
+        for buckets, key in ((self._years, year), (self._quarters, quarter)):
+            bucket = buckets.setdefault(key, ExpiryBucket(period=key))
+            bucket.lease_ids.add(lease_id)
+            self._refresh_bucket(bucket)
+
+    def _unindex(self, lease_id: str, lease: Lease) -> None:
+        """Remove lease from its year and quarter buckets"""
+        year = lease.lease_expiry_date.year
+        quarter = lease_quarter(lease)
+        for buckets, key in ((self._years, year), (self._quarters, quarter)):
+            bucket = buckets[key]
+            bucket.lease_ids.discard(lease_id)
+            if bucket.lease_ids:
+                self._refresh_bucket(bucket)
+            else:
+                del buckets[key]
+
+    def _refresh_bucket(self, bucket: ExpiryBucket) -> None:
+        """Re-sum bucket totals from its members (avoids float drift)"""
+        members = [self._leases[lease_id] for lease_id in bucket.lease_ids]
+        bucket.total_sf = sum(lease.rentable_area_sf for lease in members)
+        bucket.total_annual_rent = sum(lease.current_annual_rent for lease in members)
+
+    def _invalidate(self, expiry: bool) -> None:
+        """Drop cached components affected by a change"""
+        self._priority_ranking = None
+        self._versions["priority"] += 1
+        if expiry:
+            self._totals = None
+            self._expiry_schedule = None
+            self._scenarios = None
+            self._versions["expiry"] += 1
+            self._versions["scenarios"] += 1
+
+    # ------------------------------------------------------------------
+    # Cached aggregates
+    # ------------------------------------------------------------------
+
+    def _aggregate_totals(self) -> Tuple[float, float]:
+        if self._totals is None:
+            self._totals = (
+                sum(bucket.total_sf for bucket in self._years.values()),
+                sum(bucket.total_annual_rent for bucket in self._years.values())
+            )
+        return self._totals
+
+    @property
+    def total_area_sf(self) -> float:
+        """Total portfolio area (cached)"""
+        return self._aggregate_totals()[0]
+
+    @property
+    def total_annual_rent(self) -> float:
+        """Total portfolio rent (cached)"""
+        return self._aggregate_totals()[1]
+
+    def year_buckets(self) -> List[ExpiryBucket]:
+        """Expiry buckets by year, sorted"""
+        return [self._years[year] for year in sorted(self._years)]
+
+    def quarter_buckets(self) -> List[ExpiryBucket]:
+        """Expiry buckets by (year, quarter), sorted"""
+        return [self._quarters[key] for key in sorted(self._quarters)]
+
+    def expiry_schedule(self) -> List[ExpiryScheduleItem]:
+        """Annual expiry schedule (cached)"""
+        if self._expiry_schedule is None:
+            self._expiry_schedule = build_expiry_schedule(
+                [
+                    (year, bucket.lease_count, bucket.total_sf, bucket.total_annual_rent)
+                    for year, bucket in self._years.items()
+                ],
+                self.total_area_sf,
+                self.total_annual_rent
+            )
+        return self._expiry_schedule
+
+    def priority_ranking(self) -> List[PriorityScore]:
+        """Renewal priority ranking (cached)"""
+        if self._priority_ranking is None:
+            self._priority_ranking = score_leases(
+                self._leases.values(),
+                self.total_annual_rent,
+                self.analysis_date
+            )
+        return self._priority_ranking
+
+    def scenarios(self) -> List[ScenarioResult]:
+        """Scenario analysis (cached)"""
+        if self._scenarios is None:
+            self._scenarios = build_scenario_analysis(
+                self.assumptions,
+                self.analysis_date,
+                len(self._leases),
+                self.total_area_sf,
+                self.total_annual_rent,
+                self.expiry_schedule()
+            )
+        return self._scenarios
+
+    def results(self) -> RolloverAnalysisResults:
+        """Assemble full results from cached components"""
+        if not self._leases:
+            raise ValueError("Portfolio must contain at least one lease")
+
+        return RolloverAnalysisResults(
+            portfolio_name=self.portfolio_name,
+            analysis_date=self.analysis_date,
+            total_area_sf=self.total_area_sf,
+            total_annual_rent=self.total_annual_rent,
+            expiry_schedule=self.expiry_schedule(),
+            priority_ranking=self.priority_ranking(),
+            scenarios=self.scenarios()
+        )
+
+    def to_portfolio_input(self) -> PortfolioInput:
+        """Snapshot as a PortfolioInput"""
+        return PortfolioInput(
+            portfolio_name=self.portfolio_name,
+            analysis_date=self.analysis_date,
+            leases=self.leases,
+            assumptions=self.assumptions
+        )
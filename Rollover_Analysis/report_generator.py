@@ -12,11 +12,13 @@ Date: 2025-11-06
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import Dict, List
 from rollover_calculator import (
     RolloverAnalysisResults,
     load_portfolio_from_json,
     calculate_rollover_analysis
 )
+from portfolio_store import PortfolioStore
 
 
 def get_eastern_timestamp() -> str:
@@ -24,23 +26,10 @@ def get_eastern_timestamp() -> str:
     return datetime.now().strftime("%Y-%m-%d_%H%M%S")
 
 
-def generate_markdown_report(results: RolloverAnalysisResults) -> str:
-    """
-    Generate executive-ready markdown report from rollover analysis results
-
-    Report includes:
-    - Executive summary with key metrics
-    - Expiry schedule table with risk flags
-    - Top 10 priority leases
-    - Scenario analysis with NOI impact
-    - Recommended actions
-    """
-
+def render_header(results: RolloverAnalysisResults) -> List[str]:
+    """Title block with portfolio name and dates"""
     report = []
 
-    # ========================================================================
-    # HEADER
-    # ========================================================================
     report.append(f"# Portfolio Lease Rollover Analysis")
     report.append(f"")
     report.append(f"**Portfolio**: {results.portfolio_name}")
@@ -50,9 +39,13 @@ def generate_markdown_report(results: RolloverAnalysisResults) -> str:
     report.append(f"---")
     report.append(f"")
 
-    # ========================================================================
-    # EXECUTIVE SUMMARY
-    # ========================================================================
+    return report
+
+
+def render_executive_summary(results: RolloverAnalysisResults) -> List[str]:
+    """Portfolio overview and rollover risk assessment"""
+    report = []
+
     report.append(f"## Executive Summary")
     report.append(f"")
     report.append(f"### Portfolio Overview")
@@ -87,9 +80,13 @@ def generate_markdown_report(results: RolloverAnalysisResults) -> str:
     report.append(f"---")
     report.append(f"")
 
-    # ========================================================================
-    # EXPIRY SCHEDULE
-    # ========================================================================
+    return report
+
+
+def render_expiry_schedule(results: RolloverAnalysisResults) -> List[str]:
+    """Lease expiry schedule table with risk flags"""
+    report = []
+
     report.append(f"## Lease Expiry Schedule")
     report.append(f"")
     report.append(f"| Year | # Leases | Total SF | Total Rent | % SF | % Rent | Cumulative SF | Cumulative Rent | Risk Level |")
@@ -118,9 +115,13 @@ def generate_markdown_report(results: RolloverAnalysisResults) -> str:
     report.append(f"---")
     report.append(f"")
 
-    # ========================================================================
-    # PRIORITY RANKING (TOP 10)
-    # ========================================================================
+    return report
+
+
+def render_priority_ranking(results: RolloverAnalysisResults) -> List[str]:
+    """Top 10 renewal priority leases"""
+    report = []
+
     report.append(f"## Renewal Priority Ranking")
     report.append(f"")
     report.append(f"Leases ranked by weighted priority score (0-1 scale):")
@@ -164,9 +165,13 @@ def generate_markdown_report(results: RolloverAnalysisResults) -> str:
     report.append(f"---")
     report.append(f"")
 
-    # ========================================================================
-    # SCENARIO ANALYSIS
-    # ========================================================================
+    return report
+
+
+def render_scenario_analysis(results: RolloverAnalysisResults) -> List[str]:
+    """Scenario table with NOI impact"""
+    report = []
+
     report.append(f"## Scenario Analysis")
     report.append(f"")
     report.append(f"Three scenarios model different renewal rate and downtime assumptions:")
@@ -197,9 +202,15 @@ def generate_markdown_report(results: RolloverAnalysisResults) -> str:
     report.append(f"---")
     report.append(f"")
 
-    # ========================================================================
-    # RECOMMENDED ACTIONS
-    # ========================================================================
+    return report
+
+
+def render_recommended_actions(results: RolloverAnalysisResults) -> List[str]:
+    """Immediate, strategic and concentration-risk actions"""
+    report = []
+
+    critical_years = [item for item in results.expiry_schedule if item.risk_level == "CRITICAL"]
+
     report.append(f"## Recommended Actions")
     report.append(f"")
 
@@ -256,9 +267,13 @@ def generate_markdown_report(results: RolloverAnalysisResults) -> str:
     report.append(f"---")
     report.append(f"")
 
-    # ========================================================================
-    # METHODOLOGY
-    # ========================================================================
+    return report
+
+
+def render_methodology(results: RolloverAnalysisResults) -> List[str]:
+    """Scoring, scenario and risk-level methodology"""
+    report = []
+
     report.append(f"## Methodology")
     report.append(f"")
     report.append(f"### Priority Scoring Algorithm")
@@ -290,9 +305,13 @@ def generate_markdown_report(results: RolloverAnalysisResults) -> str:
     report.append(f"---")
     report.append(f"")
 
-    # ========================================================================
-    # FOOTER
-    # ========================================================================
+    return report
+
+
+def render_footer(results: RolloverAnalysisResults) -> List[str]:
+    """Disclaimer and generator footer"""
+    report = []
+
     report.append(f"## Disclaimer")
     report.append(f"")
     report.append(f"This analysis is for informational purposes only and does not constitute professional advice. ")
@@ -304,9 +323,90 @@ def generate_markdown_report(results: RolloverAnalysisResults) -> str:
     report.append(f"**Report Generated by**: Rollover Analysis Calculator v1.0.0")
     report.append(f"")
 
+    return report
+
+
+SECTION_RENDERERS = {
+    "header": render_header,
+    "executive_summary": render_executive_summary,
+    "expiry_schedule": render_expiry_schedule,
+    "priority_ranking": render_priority_ranking,
+    "scenario_analysis": render_scenario_analysis,
+    "recommended_actions": render_recommended_actions,
+    "methodology": render_methodology,
+    "footer": render_footer,
+}
+
+
+# Report sections in order, with the PortfolioStore components each depends on.
+# Sections with no dependencies are static for a given store; "header" carries
+# the generation timestamp and is always re-rendered.
+REPORT_SECTIONS = [
+    ("header", None),
+    ("executive_summary", ("expiry",)),
+    ("expiry_schedule", ("expiry",)),
+    ("priority_ranking", ("priority",)),
+    ("scenario_analysis", ("scenarios",)),
+    ("recommended_actions", ("expiry", "priority")),
+    ("methodology", ()),
+    ("footer", ()),
+]
+
+
+def generate_markdown_report(results: RolloverAnalysisResults) -> str:
+    """
+    Generate executive-ready markdown report from rollover analysis results
+
+    Report includes:
+    - Executive summary with key metrics
+    - Expiry schedule table with risk flags
+    - Top 10 priority leases
+    - Scenario analysis with NOI impact
+    - Recommended actions
+    """
+    report = []
+    for name, _ in REPORT_SECTIONS:
+        report.extend(SECTION_RENDERERS[name](results))
+
     return "\n".join(report)
 
 
+class IncrementalReport:
+    """
+    Markdown report bound to a PortfolioStore that re-renders only the
+    sections whose underlying components changed since the last render
+
+    Usage:
+        report = IncrementalReport(store)
+        markdown = report.render()
+        store.update_lease(lease_id, revised_lease)
+        markdown = report.render()   # only priority-dependent sections rebuilt
+    """
+
+    def __init__(self, store: PortfolioStore):
+        self.store = store
+        self._sections: Dict[str, List[str]] = {}
+        self._section_versions: Dict[str, tuple] = {}
+        self.last_rendered: List[str] = []
+
+    def render(self) -> str:
+        """Render report, reusing cached sections whose inputs are unchanged"""
+        results = self.store.results()
+        versions = self.store.versions
+
+        self.last_rendered = []
+        report = []
+        for name, depends_on in REPORT_SECTIONS:
+            key = None if depends_on is None else tuple(versions[c] for c in depends_on)
+            if key is None or self._section_versions.get(name) != key:
+                self._sections[name] = SECTION_RENDERERS[name](results)
+                self._section_versions[name] = key
+                self.last_rendered.append(name)
+            report.extend(self._sections[name])
+
+        return "\n".join(report)
+
+
 def main():
     """Command-line interface for report generation"""
     if len(sys.argv) < 2:
@@ -18,7 +18,7 @@ import json
 import sys
 from dataclasses import dataclass, field
 from datetime import date, datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from collections import defaultdict
 from pathlib import Path
 
@@ -262,20 +262,39 @@ def calculate_expiry_schedule(
         year = lease.lease_expiry_date.year
         expiries_by_year[year].append(lease)
 
-    # Calculate totals
-    total_sf = portfolio.total_area_sf
-    total_rent = portfolio.total_annual_rent
+    year_totals = [
+        (
+            year,
+            len(leases),
+            sum(l.rentable_area_sf for l in leases),
+            sum(l.current_annual_rent for l in leases)
+        )
+        for year, leases in expiries_by_year.items()
+    ]
+
+    return build_expiry_schedule(
+        year_totals,
+        portfolio.total_area_sf,
+        portfolio.total_annual_rent
+    )
+
+
+def build_expiry_schedule(
+    year_totals: Iterable[Tuple[int, int, float, float]],
+    total_sf: float,
+    total_rent: float
+) -> List[ExpiryScheduleItem]:
+    """
+    Build expiry schedule from pre-aggregated (year, lease_count, sf, rent) totals
 
-    # Build schedule
+    Shared by calculate_expiry_schedule() and PortfolioStore, which keeps
+    per-year totals up to date incrementally.
+    """
     schedule = []
     cumulative_sf = 0.0
     cumulative_rent = 0.0
 
-    for year in sorted(expiries_by_year.keys()):
-        leases = expiries_by_year[year]
-        year_sf = sum(l.rentable_area_sf for l in leases)
-        year_rent = sum(l.current_annual_rent for l in leases)
-
+    for year, lease_count, year_sf, year_rent in sorted(year_totals):
         pct_sf = (year_sf / total_sf * 100) if total_sf > 0 else 0
         pct_rent = (year_rent / total_rent * 100) if total_rent > 0 else 0
 
@@ -295,7 +314,7 @@ def calculate_expiry_schedule(
 
         schedule.append(ExpiryScheduleItem(
             year=year,
-            lease_count=len(leases),
+            lease_count=lease_count,
             total_sf=year_sf,
             total_annual_rent=year_rent,
             pct_of_portfolio_sf=pct_sf,
@@ -318,11 +337,25 @@ def calculate_priority_scores(
 
     All components normalized to 0-1 scale to prevent scale dominance
     """
-    total_rent = portfolio.total_annual_rent
-    analysis_date = portfolio.analysis_date
+    return score_leases(
+        portfolio.leases,
+        portfolio.total_annual_rent,
+        portfolio.analysis_date
+    )
+
+
+def score_leases(
+    leases: Iterable[Lease],
+    total_rent: float,
+    analysis_date: date
+) -> List[PriorityScore]:
+    """
+    Score and rank leases against a known portfolio rent total
 
+    See calculate_priority_scores() for the scoring formula.
+    """
     scores = []
-    for lease in portfolio.leases:
+    for lease in leases:
         # 1. Rent percentage (0-1, capped at 100%)
         rent_pct = min(lease.current_annual_rent / total_rent, 1.0) if total_rent > 0 else 0.0
 
@@ -376,9 +409,29 @@ def calculate_scenario_analysis(
     - Calculate expected vacancy and lost rent
     - Discount NOI impact to present value
     """
-    assumptions = portfolio.assumptions
-    analysis_date = portfolio.analysis_date
+    return build_scenario_analysis(
+        portfolio.assumptions,
+        portfolio.analysis_date,
+        len(portfolio.leases),
+        portfolio.total_area_sf,
+        portfolio.total_annual_rent,
+        expiry_schedule
+    )
+
+
+def build_scenario_analysis(
+    assumptions: Assumptions,
+    analysis_date: date,
+    total_leases: int,
+    total_sf: float,
+    total_rent: float,
+    expiry_schedule: List[ExpiryScheduleItem]
+) -> List[ScenarioResult]:
+    """
+    Model the three scenarios from pre-computed portfolio aggregates
 
+    Shared by calculate_scenario_analysis() and PortfolioStore.
+    """
     scenarios = [
         ("Optimistic", assumptions.renewal_rate_optimistic, assumptions.downtime_months["optimistic"]),
         ("Base", assumptions.renewal_rate_base, assumptions.downtime_months["base"]),
@@ -388,14 +441,9 @@ def calculate_scenario_analysis(
     results = []
     for scenario_name, renewal_rate, downtime_months in scenarios:
         # Calculate renewals vs new tenants
-        total_leases = len(portfolio.leases)
         leases_renewed = int(total_leases * renewal_rate)
         leases_new_tenant = total_leases - leases_renewed
 
-        # Calculate expected vacancy
-        total_sf = portfolio.total_area_sf
-        total_rent = portfolio.total_annual_rent
-
         # FIXED: Only churning tenants (1 - renewal_rate) have full downtime
         # Renewing tenants have minimal downtime (renewal_downtime_months, default 0)
         churn_rate = 1 - renewal_rate
@@ -482,6 +530,11 @@ def load_portfolio_from_json(json_path: str) -> PortfolioInput:
     with open(json_path, 'r') as f:
         data = json.load(f)
 
+    return portfolio_from_dict(data)
+
+
+def portfolio_from_dict(data: Dict) -> PortfolioInput:
+    """Build portfolio input from a parsed JSON input document"""
     # Parse assumptions
     assumptions_data = data.get('assumptions', {})
     assumptions = Assumptions(
@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+Portfolio Lease Rollover Monte Carlo Simulator
+
+Per-lease, monthly-granularity companion to the three-scenario model in
+rollover_calculator.calculate_scenario_analysis():
+- Each expiring lease renews by its own Bernoulli draw (credit-adjusted)
+- Non-renewals sample downtime from a triangular distribution spanning the
+  optimistic/base/pessimistic downtime assumptions
+- Re-leasing rent is sampled around each lease's own market rent
+  (implied by below_market_pct) grown to the expiry month
+- New tenants incur TI allowance and leasing commission at re-leasing
+
+Outputs NOI (monthly and present value) distributions, vacancy-at-risk by
+month, and expiry-concentration VaR by expiry year.
+
+Simulations are processed in chunks; within a chunk every lease and
+simulation is drawn at once and monthly totals are accumulated with
+bincount + cumsum, so memory is bounded by chunk_size x leases rather than
+simulations x leases x months. Renewals, downtime and rent shocks each draw
+from their own stream spawned from the seed, so results do not depend on
+chunk_size.
+
+Author: Claude Code
+Version: 1.0.0
+Date: 2026-10-18
+"""
+
+import json
+import sys
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from rollover_calculator import (
+    PortfolioInput,
+    credit_rating_to_score,
+    load_portfolio_from_json
+)
+
+
+# Credit score treated as neutral when adjusting renewal probability (BBB)
+NEUTRAL_CREDIT_SCORE = 0.40
+
+
+# ============================================================================
+# DATA STRUCTURES
+# ============================================================================
+
+@dataclass
+class SimulationSettings:
+    """Monte Carlo simulation settings"""
+    n_simulations: int = 10_000
+    horizon_months: int = 60
+    new_lease_term_months: int = 60  # Term used to size leasing commissions
+    rent_volatility: float = 0.10  # Lognormal sigma of re-leasing rent around market
+    credit_sensitivity: float = 0.50  # Renewal probability shift per unit of credit score
+    confidence_level: float = 0.95
+    chunk_size: int = 2_000
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        """Validate settings"""
+        if self.n_simulations <= 0:
+            raise ValueError(f"n_simulations must be > 0: {self.n_simulations}")
+        if self.horizon_months <= 0:
+            raise ValueError(f"horizon_months must be > 0: {self.horizon_months}")
+        if self.chunk_size <= 0:
+            raise ValueError(f"chunk_size must be > 0: {self.chunk_size}")
+        if self.rent_volatility < 0:
+            raise ValueError(f"rent_volatility must be >= 0: {self.rent_volatility}")
+        if not (0 < self.confidence_level < 1):
+            raise ValueError(f"confidence_level must be between 0 and 1: {self.confidence_level}")
+
+
+@dataclass
+class ExpiryConcentrationRisk:
+    """Simulated loss distribution for one expiry-year cohort"""
+    year: int
+    lease_count: int
+    expected_loss: float
+    var: float  # Loss at the confidence level
+    cvar: float  # Mean loss beyond VaR
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            "year": self.year,
+            "lease_count": self.lease_count,
+            "expected_loss": round(self.expected_loss, 0),
+            "var": round(self.var, 0),
+            "cvar": round(self.cvar, 0)
+        }
+
+
+@dataclass
+class SimulationResults:
+    """Monte Carlo rollover simulation results"""
+    portfolio_name: str
+    n_simulations: int
+    horizon_months: int
+    confidence_level: float
+    renewal_probabilities: np.ndarray  # Per lease, in portfolio order
+    noi_pv: np.ndarray  # Present value of NOI over horizon, per simulation
+    expected_monthly_noi: np.ndarray
+    monthly_noi_lower: np.ndarray  # (1 - confidence) percentile
+    expected_vacancy_sf: np.ndarray
+    vacancy_at_risk_sf: np.ndarray  # Confidence-level percentile of vacant SF
+    expiry_concentration: List[ExpiryConcentrationRisk] = field(default_factory=list)
+
+    @property
+    def noi_pv_percentiles(self) -> Dict[str, float]:
+        """P5/P50/P95 of NOI present value"""
+        p5, p50, p95 = np.percentile(self.noi_pv, [5, 50, 95])
+        return {"p5": float(p5), "p50": float(p50), "p95": float(p95)}
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization (excludes raw draws)"""
+        return {
+            "portfolio_name": self.portfolio_name,
+            "n_simulations": self.n_simulations,
+            "horizon_months": self.horizon_months,
+            "confidence_level": self.confidence_level,
+            "noi_pv": {
+                "mean": round(float(self.noi_pv.mean()), 0),
+                "std": round(float(self.noi_pv.std()), 0),
+                **{k: round(v, 0) for k, v in self.noi_pv_percentiles.items()}
+            },
+            "monthly": [
+                {
+                    "month": m + 1,
+                    "expected_noi": round(float(self.expected_monthly_noi[m]), 0),
+                    "noi_lower": round(float(self.monthly_noi_lower[m]), 0),
+                    "expected_vacancy_sf": round(float(self.expected_vacancy_sf[m]), 0),
+                    "vacancy_at_risk_sf": round(float(self.vacancy_at_risk_sf[m]), 0)
+                }
+                for m in range(self.horizon_months)
+            ],
+            "expiry_concentration": [item.to_dict() for item in self.expiry_concentration],
+            "renewal_probabilities": [round(float(p), 4) for p in self.renewal_probabilities]
+        }
+
+
+# ============================================================================
+# INPUT PREPARATION
+# ============================================================================
+
+def calculate_renewal_probabilities(
+    portfolio: PortfolioInput,
+    credit_sensitivity: float = 0.50
+) -> np.ndarray:
+    """
+    Credit-adjusted renewal probability for each lease
+
+    p = renewal_rate_base + credit_sensitivity × (0.40 - credit_score)
+
+    where credit_score is the 0-1 risk score from credit_rating_to_score()
+    (0.40 = BBB is neutral). Stronger credits renew more often. Clipped to [0, 1].
+    """
+    credit = np.array([
+        credit_rating_to_score(lease.tenant_credit_rating) for lease in portfolio.leases
+    ])
+    base = portfolio.assumptions.renewal_rate_base
+    return np.clip(base + credit_sensitivity * (NEUTRAL_CREDIT_SCORE - credit), 0.0, 1.0)
+
+
+def _months_to_expiry(portfolio: PortfolioInput) -> np.ndarray:
+    """
+    Whole months from analysis date to the first month each lease no longer
+    pays (floored at 0).
+
+    Measured to the day after expiry, so a lease expiring on the last day of
+    a month pays that month's rent and vacancy starts the month after.
+    """
+    analysis_date = portfolio.analysis_date
+    months = []
+    for lease in portfolio.leases:
+        vacated = lease.lease_expiry_date + timedelta(days=1)
+        months.append((vacated.year - analysis_date.year) * 12 +
+                      (vacated.month - analysis_date.month))
+    return np.maximum(np.array(months, dtype=int), 0)
+
+
+def _sample_downtime(rng: np.random.Generator, downtime: Dict[str, int],
+                     size: tuple) -> np.ndarray:
+    """Triangular(optimistic, base, pessimistic) downtime in whole months"""
+    left = downtime["optimistic"]
+    mode = downtime["base"]
+    right = downtime["pessimistic"]
+    if left == right:
+        return np.full(size, left, dtype=int)
+    return np.rint(rng.triangular(left, mode, right, size=size)).astype(int)
+
+
+# ============================================================================
+# SIMULATION
+# ============================================================================
+
+def simulate_rollover(
+    portfolio: PortfolioInput,
+    settings: Optional[SimulationSettings] = None,
+    renewal_probabilities: Optional[Sequence[float]] = None
+) -> SimulationResults:
+    """
+    Simulate monthly portfolio NOI and vacancy with stochastic lease renewals
+
+    Each lease is modelled through at most one rollover within the horizon:
+    in-place rent until expiry, then (renewal) renewal_downtime_months or
+    (new tenant) sampled downtime, then re-leased at sampled market rent.
+    New tenants also incur TI (ti_allowance_sf × area) and a leasing
+    commission (leasing_commission_pct × new rent × new lease term) in the
+    month re-leasing starts.
+
+    Expiry-cohort loss per lease = lost rent during downtime + leasing costs.
+
+    Args:
+        portfolio: Portfolio input (same as calculate_rollover_analysis)
+        settings: Simulation settings (defaults to SimulationSettings())
+        renewal_probabilities: Optional per-lease override, in portfolio order.
+                               Defaults to calculate_renewal_probabilities().
+
+    Returns:
+        SimulationResults
+    """
+    if not portfolio.leases:
+        raise ValueError("Portfolio must contain at least one lease")
+
+    settings = settings or SimulationSettings()
+    assumptions = portfolio.assumptions
+    horizon = settings.horizon_months
+    n_sims = settings.n_simulations
+    # Independent stream per draw type: chunking does not change the sequence
+    renewal_rng, downtime_rng, shock_rng = (
+        np.random.default_rng(seq) for seq in np.random.SeedSequence(settings.seed).spawn(3)
+    )
+
+    if renewal_probabilities is None:
+        probs = calculate_renewal_probabilities(portfolio, settings.credit_sensitivity)
+    else:
+        probs = np.asarray(renewal_probabilities, dtype=float)
+        if probs.shape != (len(portfolio.leases),):
+            raise ValueError("renewal_probabilities must have one entry per lease")
+        if np.any((probs < 0) | (probs > 1)):
+            raise ValueError("renewal_probabilities must be between 0 and 1")
+
+    area = np.array([lease.rentable_area_sf for lease in portfolio.leases])
+    rent = np.array([lease.current_annual_rent for lease in portfolio.leases])
+    below_market = np.array([lease.below_market_pct for lease in portfolio.leases])
+    expiry = _months_to_expiry(portfolio)
+    expiry_years = np.array([lease.lease_expiry_date.year for lease in portfolio.leases])
+
+    # Lease-specific market rent (below_market_pct < 0 means rent is below market)
+    market_rent = rent / (1 + below_market / 100.0)
+    market_rent_at_expiry = market_rent * (1 + assumptions.market_rent_growth_annual) ** (expiry / 12.0)
+
+    # In-place rent is deterministic: lease pays through its expiry month (or horizon)
+    months = np.arange(horizon)
+    in_place = (months[None, :] < expiry[:, None]) * (rent[:, None] / 12.0)
+    base_monthly_noi = in_place.sum(axis=0)
+
+    # Only leases expiring inside the horizon are stochastic
+    rolling = expiry < horizon
+    r_probs = probs[rolling]
+    r_area = area[rolling]
+    r_rent = rent[rolling]
+    r_expiry = expiry[rolling]
+    r_market = market_rent_at_expiry[rolling]
+    n_rolling = int(rolling.sum())
+
+    cohort_years, cohort_index = np.unique(expiry_years[rolling], return_inverse=True)
+    n_cohorts = len(cohort_years)
+
+    # Vacancy starts deterministically at expiry for every rolling lease
+    vacancy_start = np.bincount(r_expiry, weights=r_area, minlength=horizon + 1)
+
+    monthly_rate = (1 + assumptions.discount_rate) ** (1 / 12) - 1
+    discount_factors = (1 + monthly_rate) ** -months.astype(float)
+
+    noi_pv = np.empty(n_sims)
+    noi_sum = np.zeros(horizon)
+    vacancy_sum = np.zeros(horizon)
+    noi_paths = np.empty((n_sims, horizon))
+    vacancy_paths = np.empty((n_sims, horizon))
+    cohort_losses = np.zeros((n_sims, n_cohorts))
+
+    sigma = settings.rent_volatility
+    width = horizon + 1
+
+    for start in range(0, n_sims, settings.chunk_size):
+        stop = min(start + settings.chunk_size, n_sims)
+        size = (stop - start, n_rolling)
+
+        renewed = renewal_rng.random(size) < r_probs
+        downtime = np.where(
+            renewed,
+            assumptions.renewal_downtime_months,
+            _sample_downtime(downtime_rng, assumptions.downtime_months, size)
+        )
+        shock = np.exp(shock_rng.normal(-0.5 * sigma ** 2, sigma, size)) if sigma > 0 else np.ones(size)
+        new_rent = r_market * shock
+
+        leasing_costs = np.where(
+            renewed,
+            0.0,
+            assumptions.ti_allowance_sf * r_area +
+            assumptions.leasing_commission_pct * new_rent * settings.new_lease_term_months / 12.0
+        )
+
+        # Event month when re-leased rent starts (clipped to horizon = "after")
+        relet = np.minimum(r_expiry + downtime, horizon)
+        row_offset = (np.arange(size[0]) * width)[:, None]
+        flat = (row_offset + relet).ravel()
+
+        # Monthly re-leased rent and vacancy deltas via bincount + cumsum
+        rent_delta = np.bincount(flat, weights=(new_rent / 12.0).ravel(),
+                                 minlength=size[0] * width).reshape(size[0], width)
+        cost_delta = np.bincount(flat, weights=leasing_costs.ravel(),
+                                 minlength=size[0] * width).reshape(size[0], width)
+        vacancy_end = np.bincount(flat, weights=np.broadcast_to(r_area, size).ravel(),
+                                  minlength=size[0] * width).reshape(size[0], width)
+
+        noi = base_monthly_noi + np.cumsum(rent_delta, axis=1)[:, :horizon] - cost_delta[:, :horizon]
+        vacancy = np.cumsum(vacancy_start - vacancy_end, axis=1)[:, :horizon]
+
+        noi_pv[start:stop] = noi @ discount_factors
+        noi_paths[start:stop] = noi
+        vacancy_paths[start:stop] = vacancy
+        noi_sum += noi.sum(axis=0)
+        vacancy_sum += vacancy.sum(axis=0)
+
+        # Cohort loss: lost rent during downtime + leasing costs
+        lease_loss = downtime * (r_rent / 12.0) + leasing_costs
+        cohort_flat = (np.arange(size[0]) * n_cohorts)[:, None] + cohort_index
+        cohort_losses[start:stop] = np.bincount(
+            cohort_flat.ravel(), weights=lease_loss.ravel(),
+            minlength=size[0] * n_cohorts
+        ).reshape(size[0], n_cohorts)
+
+    tail_pct = (1 - settings.confidence_level) * 100
+    conf_pct = settings.confidence_level * 100
+
+    lease_counts = np.bincount(cohort_index, minlength=n_cohorts)
+    concentration = []
+    for c, year in enumerate(cohort_years):
+        losses = cohort_losses[:, c]
+        var = float(np.percentile(losses, conf_pct))
+        tail = losses[losses >= var]
+        concentration.append(ExpiryConcentrationRisk(
+            year=int(year),
+            lease_count=int(lease_counts[c]),
+            expected_loss=float(losses.mean()),
+            var=var,
+            cvar=float(tail.mean()) if tail.size else var
+        ))
+
+    return SimulationResults(
+        portfolio_name=portfolio.portfolio_name,
+        n_simulations=n_sims,
+        horizon_months=horizon,
+        confidence_level=settings.confidence_level,
+        renewal_probabilities=probs,
+        noi_pv=noi_pv,
+        expected_monthly_noi=noi_sum / n_sims,
+        monthly_noi_lower=np.percentile(noi_paths, tail_pct, axis=0),
+        expected_vacancy_sf=vacancy_sum / n_sims,
+        vacancy_at_risk_sf=np.percentile(vacancy_paths, conf_pct, axis=0),
+        expiry_concentration=concentration
+    )
+
+
+# ============================================================================
+# CLI ENTRY POINT
+# ============================================================================
+
+def main():
+    """Command-line interface"""
+    if len(sys.argv) < 2:
+        print("Usage: python rollover_simulation.py <input.json> [output.json] [n_simulations]")
+        print("\nExample:")
+        print("  python rollover_simulation.py portfolio.json")
+        print("  python rollover_simulation.py portfolio.json simulation.json 100000")
+        sys.exit(1)
+
+    input_path = sys.argv[1]
+    output_path = sys.argv[2] if len(sys.argv) > 2 else input_path.replace('.json', '_simulation.json')
+    n_simulations = int(sys.argv[3]) if len(sys.argv) > 3 else SimulationSettings.n_simulations
+
+    portfolio = load_portfolio_from_json(input_path)
+    print(f"Simulating portfolio: {portfolio.portfolio_name}")
+    print(f"  - {len(portfolio.leases)} leases, {n_simulations:,} simulations")
+
+    results = simulate_rollover(portfolio, SimulationSettings(n_simulations=n_simulations))
+
+    with open(output_path, 'w') as f:
+        json.dump(results.to_dict(), f, indent=2)
+
+    pct = results.noi_pv_percentiles
+    print(f"\nSaving results to: {output_path}")
+    print(f"\nNOI present value: P5 ${pct['p5']:,.0f} | P50 ${pct['p50']:,.0f} | P95 ${pct['p95']:,.0f}")
+    print(f"Peak vacancy-at-risk: {results.vacancy_at_risk_sf.max():,.0f} SF")
+
+
+if __name__ == '__main__':
+    main()
@@ -5,51 +5,81 @@ Common financial calculation functions used across all lease analysis calculator
 
 Modules:
 - financial_utils: NPV, IRR, PV, rate conversions, ratios, statistics, amortization
+- discount_curve: Shared LRU cache of discount-factor and annuity tables
 
 Author: Claude Code
 Created: 2025-10-30
 """
 
-from .financial_utils import (
+import importlib
+
+# Re-exports are resolved on first access so that importing one submodule
+# (e.g. Shared_Utils.discount_curve) does not load pandas / scipy
+_EXPORTS = {
     # Present value
-    present_value,
-    pv_annuity,
+    'present_value': 'financial_utils',
+    'pv_annuity': 'financial_utils',
 
     # NPV and IRR
-    npv,
-    irr,
+    'npv': 'financial_utils',
+    'irr': 'financial_utils',
+    'npv_many': 'financial_utils',
+    'irr_many': 'financial_utils',
 
     # Rate conversions
-    annual_to_monthly_rate,
-    monthly_to_annual_rate,
-    effective_annual_rate,
+    'annual_to_monthly_rate': 'financial_utils',
+    'monthly_to_annual_rate': 'financial_utils',
+    'effective_annual_rate': 'financial_utils',
 
     # Annuity
-    annuity_factor,
+    'annuity_factor': 'financial_utils',
 
     # Interest and amortization
-    simple_interest,
-    amortization_schedule,
+    'simple_interest': 'financial_utils',
+    'amortization_schedule': 'financial_utils',
 
     # Financial ratios
-    safe_divide,
-    calculate_financial_ratios,
+    'safe_divide': 'financial_utils',
+    'calculate_financial_ratios': 'financial_utils',
+    'calculate_financial_ratios_frame': 'financial_utils',
 
     # Statistics
-    percentile_rank,
-    variance_analysis,
-    descriptive_statistics,
+    'percentile_rank': 'financial_utils',
+    'variance_analysis': 'financial_utils',
+    'descriptive_statistics': 'financial_utils',
 
     # Date utilities
-    months_between,
-    add_months
-)
+    'months_between': 'financial_utils',
+    'add_months': 'financial_utils',
+
+    # Discount curves
+    'DiscountCurve': 'discount_curve',
+    'discount_curve': 'discount_curve',
+    'clear_discount_curve_cache': 'discount_curve',
+    'discount_curve_cache_info': 'discount_curve'
+}
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     'present_value',
     'pv_annuity',
     'npv',
     'irr',
+    'npv_many',
+    'irr_many',
     'annual_to_monthly_rate',
     'monthly_to_annual_rate',
     'effective_annual_rate',
@@ -58,9 +88,14 @@ __all__ = [
     'amortization_schedule',
     'safe_divide',
     'calculate_financial_ratios',
+    'calculate_financial_ratios_frame',
     'percentile_rank',
     'variance_analysis',
     'descriptive_statistics',
     'months_between',
-    'add_months'
+    'add_months',
+    'DiscountCurve',
+    'discount_curve',
+    'clear_discount_curve_cache',
+    'discount_curve_cache_info'
 ]
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Benchmark Utilities Module
+Provides timing, latency percentiles, throughput and peak memory for
+calculator benchmarks, and comparison between two benchmark runs.
+
+A benchmark is a function applied to a list of cases (one lease, one
+analysis input, one simulation). Each call is timed with perf_counter_ns;
+one pass runs every case. Throughput is items per second over the median
+pass, latency percentiles are over every timed call, and peak memory is the
+tracemalloc high-water mark of one extra (untimed) pass, since tracing slows
+the calculation down.
+
+Results are saved as JSON with the environment (Python, numpy, pandas,
+scipy, CPU count, git commit) so two runs can be compared with
+compare_results() / format_comparison().
+
+Used by:
+- Benchmarks/benchmark_suite.py
+"""
+
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .progress import Reporter, reporting
+
+
+LATENCY_PERCENTILES = (50, 90, 99)
+REGRESSION_THRESHOLD = 0.10   # Relative change treated as a regression / improvement
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing and memory for one benchmark"""
+    name: str
+    items: int                        # Logical items per pass (leases, transactions, iterations)
+    calls: int                        # Timed calls per pass
+    repeat: int                       # Timed passes
+    pass_seconds: float               # Median pass wall time
+    throughput: float                 # Items per second over the median pass
+    latency_ms: Dict[str, float]      # Per call: mean, p50, p90, p99, max
+    peak_memory_mb: Optional[float]   # tracemalloc peak of one pass (None if not measured)
+    parameters: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def latency_summary(latencies_ns: Sequence[int]) -> Dict[str, float]:
+    """
+    Summarize call latencies.
+
+    Args:
+        latencies_ns: Call durations in nanoseconds
+
+    Returns:
+        Dict with mean, p50, p90, p99 and max in milliseconds
+    """
+    values = np.asarray(latencies_ns, dtype=float) / 1e6
+    summary = {'mean': float(values.mean())}
+    for percentile, value in zip(LATENCY_PERCENTILES, np.percentile(values, LATENCY_PERCENTILES)):
+        summary[f'p{percentile}'] = float(value)
+    summary['max'] = float(values.max())
+    return summary
+
+
+def run_benchmark(
+    name: str,
+    function: Callable[[Any], Any],
+    cases: Sequence[Any],
+    items: Optional[int] = None,
+    repeat: int = 3,
+    warmup: int = 1,
+    memory: bool = True,
+    quiet: bool = True,
+    parameters: Optional[Dict] = None
+) -> BenchmarkResult:
+    """
+    Time a function over a list of cases.
+
+    Args:
+        name: Benchmark name
+        function: Called once per case
+        cases: Inputs; one pass calls function on each
+        items: Logical items per pass for throughput (default len(cases))
+        repeat: Timed passes
+        warmup: Untimed calls on the first case before timing (imports, caches)
+        memory: Measure tracemalloc peak over one extra pass
+        quiet: Discard anything the calculator prints, and its progress events
+        parameters: Benchmark parameters recorded with the result (scale, sizes)
+
+    Returns:
+        BenchmarkResult
+    """
+    if not cases:
+        raise ValueError(f"Benchmark '{name}' has no cases")
+    if repeat < 1:
+        raise ValueError(f"repeat must be >= 1: {repeat}")
+
+    with open(os.devnull, 'w') as devnull, \
+            (contextlib.redirect_stdout(devnull) if quiet else contextlib.nullcontext()), \
+            (reporting(Reporter()) if quiet else contextlib.nullcontext()):
+        for _ in range(warmup):
+            function(cases[0])
+
+        latencies = []
+        pass_times = []
+        for _ in range(repeat):
+            start = time.perf_counter_ns()
+            for case in cases:
+                call_start = time.perf_counter_ns()
+                function(case)
+                latencies.append(time.perf_counter_ns() - call_start)
+            pass_times.append((time.perf_counter_ns() - start) / 1e9)
+
+        peak_memory_mb = None
+        if memory:
+            tracemalloc.start()
+            try:
+                for case in cases:
+                    function(case)
+                peak_memory_mb = tracemalloc.get_traced_memory()[1] / 2**20
+            finally:
+                tracemalloc.stop()
+
+    pass_seconds = float(np.median(pass_times))
+    items = len(cases) if items is None else items
+    return BenchmarkResult(
+        name=name,
+        items=items,
+        calls=len(cases),
+        repeat=repeat,
+        pass_seconds=pass_seconds,
+        throughput=items / pass_seconds if pass_seconds > 0 else float('inf'),
+        latency_ms=latency_summary(latencies),
+        peak_memory_mb=peak_memory_mb,
+        parameters=dict(parameters or {})
+    )
+
+
+# ============================================================================
+# RESULTS FILES
+# ============================================================================
+
+def environment() -> Dict[str, Any]:
+    """Python / library versions, CPU count and git commit of this run"""
+    import scipy
+
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=Path(__file__).resolve().parent,
+            capture_output=True, text=True, timeout=10
+        ).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'scipy': scipy.__version__,
+        'git_commit': commit
+    }
+
+
+def save_results(results: List[BenchmarkResult], output_path: str) -> Dict:
+    """
+    Save benchmark results to JSON.
+
+    Returns:
+        The saved document (created, environment, benchmarks by name)
+    """
+    document = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'environment': environment(),
+        'benchmarks': {result.name: result.to_dict() for result in results}
+    }
+    with open(output_path, 'w') as f:
+        json.dump(document, f, indent=2)
+    return document
+
+
+def load_results(path: str) -> Dict:
+    """Load a results document written by save_results()"""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+# ============================================================================
+# RUN COMPARISON
+# ============================================================================
+
+def _change(baseline, current):
+    if baseline is None or current is None or not baseline:
+        return np.nan
+    return current / baseline - 1
+
+
+def compare_results(baseline: Dict, current: Dict, threshold: float = REGRESSION_THRESHOLD) -> pd.DataFrame:
+    """
+    Compare two results documents benchmark by benchmark.
+
+    A benchmark regresses when its p50 latency or peak memory grows, or its
+    throughput drops, by more than threshold; it improves when latency or
+    throughput moves the other way by more than threshold (and nothing
+    regressed).
+
+    Args:
+        baseline: Results document (save_results() / load_results())
+        current: Results document of the run being checked
+        threshold: Relative change that counts (0.10 = 10%)
+
+    Returns:
+        DataFrame indexed by benchmark with baseline / current p50 latency,
+        throughput and peak memory, their relative changes and a status
+        (regression, improvement, unchanged, new, removed)
+    """
+    rows = []
+    names = list(dict.fromkeys([*baseline['benchmarks'], *current['benchmarks']]))
+    for name in names:
+        before = baseline['benchmarks'].get(name)
+        after = current['benchmarks'].get(name)
+        row = {'benchmark': name}
+        for prefix, result in (('baseline', before), ('current', after)):
+            row[f'{prefix}_p50_ms'] = result['latency_ms']['p50'] if result else np.nan
+            row[f'{prefix}_throughput'] = result['throughput'] if result else np.nan
+            row[f'{prefix}_peak_mb'] = result['peak_memory_mb'] if result else np.nan
+        row['p50_change'] = _change(before and before['latency_ms']['p50'], after and after['latency_ms']['p50'])
+        row['throughput_change'] = _change(before and before['throughput'], after and after['throughput'])
+        row['memory_change'] = _change(before and before['peak_memory_mb'], after and after['peak_memory_mb'])
+
+        if before is None:
+            row['status'] = 'new'
+        elif after is None:
+            row['status'] = 'removed'
+        elif (row['p50_change'] > threshold or row['throughput_change'] < -threshold
+              or row['memory_change'] > threshold):
+            row['status'] = 'regression'
+        elif row['p50_change'] < -threshold or row['throughput_change'] > threshold:
+            row['status'] = 'improvement'
+        else:
+            row['status'] = 'unchanged'
+        rows.append(row)
+
+    return pd.DataFrame(rows).set_index('benchmark')
+
+
+def _markdown_table(rows: List[Dict[str, str]], columns: List[str]) -> str:
+    """Markdown table of pre-formatted cells; first column left-aligned, the rest right-aligned"""
+    lines = [
+        "| " + " | ".join(column.replace('_', ' ') for column in columns) + " |",
+        "| :--- | " + " | ".join('---:' for _ in columns[1:]) + " |"
+    ]
+    lines += ["| " + " | ".join(row[column] for column in columns) + " |" for row in rows]
+    return "\n".join(lines)
+
+
+def _percent(value: float) -> str:
+    return '' if pd.isna(value) else f"{value:+.1%}"
+
+
+def _number(value: float, digits: int = 2) -> str:
+    return '' if pd.isna(value) else f"{value:,.{digits}f}"
+
+
+def format_comparison(comparison: pd.DataFrame) -> str:
+    """
+    Markdown regression report from compare_results().
+
+    Returns:
+        Markdown table (one row per benchmark) with a regression count line
+    """
+    rows = [
+        {
+            'benchmark': name,
+            'p50_ms': f"{_number(row.baseline_p50_ms, 3)} → {_number(row.current_p50_ms, 3)}",
+            'p50_change': _percent(row.p50_change),
+            'items_per_s': f"{_number(row.baseline_throughput, 0)} → {_number(row.current_throughput, 0)}",
+            'throughput_change': _percent(row.throughput_change),
+            'peak_mb': f"{_number(row.baseline_peak_mb)} → {_number(row.current_peak_mb)}",
+            'memory_change': _percent(row.memory_change),
+            'status': row.status.upper() if row.status == 'regression' else row.status
+        }
+        for name, row in comparison.iterrows()
+    ]
+    columns = ['benchmark', 'p50_ms', 'p50_change', 'items_per_s', 'throughput_change',
+               'peak_mb', 'memory_change', 'status']
+    table = _markdown_table(rows, columns)
+    regressions = int((comparison['status'] == 'regression').sum())
+    return f"{table}\n\n{regressions} regression(s) of {len(comparison)} benchmark(s)"
+
+
+def format_results(results: List[BenchmarkResult]) -> str:
+    """Markdown table of one run (throughput, latency percentiles, peak memory)"""
+    rows = [
+        {
+            'benchmark': result.name,
+            'items': f"{result.items:,}",
+            'pass_s': _number(result.pass_seconds, 3),
+            'items_per_s': _number(result.throughput, 0),
+            **{f'p{p}_ms': _number(result.latency_ms[f'p{p}'], 3) for p in LATENCY_PERCENTILES},
+            'peak_mb': '' if result.peak_memory_mb is None else _number(result.peak_memory_mb)
+        }
+        for result in results
+    ]
+    columns = ['benchmark', 'items', 'pass_s', 'items_per_s',
+               *[f'p{p}_ms' for p in LATENCY_PERCENTILES], 'peak_mb']
+    return _markdown_table(rows, columns)
@@ -0,0 +1,515 @@
+#!/usr/bin/env python3
+"""
+Calculation Server Module
+Long-running local JSON-RPC 2.0 server for the calculators, so a caller
+(the leasing portal, scripts) pays the process spawn and import cost once
+instead of once per calculation.
+
+    python realestate.py server --socket /tmp/calc.sock --max-workers 4
+
+Protocol: newline-delimited JSON over a Unix socket (owner-only). Each
+line is one JSON-RPC request or a batch (array of requests); each reply is
+one line. A connection can carry any number of requests.
+
+    {"jsonrpc": "2.0", "id": 1, "method": "eff-rent", "params": {"input": {...}}}
+
+Every calculator method takes the same document its JSON input file holds
+(`input`, by name or first positional parameter) plus the options its
+command line offers, and returns the dictionary its save function writes.
+Calculations run in a process pool that has the calculator modules
+imported; the requests of a batch run concurrently. Nothing is written to
+disk. Built-in methods: rpc.methods, rpc.ping, rpc.shutdown.
+
+Used by:
+- realestate.py server
+- leasing portal back end (CalculationClient)
+"""
+
+import argparse
+import asyncio
+import importlib
+import inspect
+import json
+import os
+import signal
+import socket
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from Shared_Utils.cli import check_socket_owner, user_socket_path
+
+SERVER_ENV = 'REALESTATE_RPC'
+MAX_MESSAGE_BYTES = 64 * 1024 * 1024   # One request or batch line (portfolio inputs can be large)
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+CALCULATION_ERROR = -32000   # Calculator raised (bad input values, missing fields)
+
+# MCDA modules import their siblings by bare name
+MCDA_DIR = REPO_ROOT / 'MCDA_Sales_Comparison'
+
+# Imported by every pool worker before its first calculation
+CALCULATOR_MODULES = [
+    'Eff_Rent_Calculator.eff_rent_calculator',
+    'Default_Calculator.default_calculator',
+    'Option_Valuation.option_valuation',
+    'Rollover_Analysis.rollover_calculator',
+    'IFRS16_Calculator.run_ifrs16_analysis',
+    'Credit_Analysis.run_credit_analysis',
+    'Rental_Variance.rental_variance_calculator',
+    'Relative_Valuation.relative_valuation_calculator',
+    'mcda_sales_calculator',
+    'scipy.stats'
+]
+
+
+class RpcError(ValueError):
+    """JSON-RPC error reply (raised by CalculationClient.call)"""
+
+    def __init__(self, code: int, message: str, data: Any = None):
+        super().__init__(f"{message} ({code})")
+        self.code = code
+        self.message = message
+        self.data = data
+
+
+def default_socket_path() -> Path:
+    """Server socket: $REALESTATE_RPC or a per-user path (see cli.user_socket_path())"""
+    if os.environ.get(SERVER_ENV):
+        return Path(os.environ[SERVER_ENV])
+    return user_socket_path('realestate-rpc')
+
+
+# ============================================================================
+# CALCULATOR METHODS
+# ============================================================================
+
+def eff_rent(input: Dict, deal_name: Optional[str] = None) -> Dict:
+    """Effective rent / BAF analysis (eff_rent_calculator.save_results_to_file layout)"""
+    from Eff_Rent_Calculator.eff_rent_calculator import BAFCalculator, lease_terms_from_dict, results_to_dict
+    terms = lease_terms_from_dict(input)
+    results = BAFCalculator(terms).calculate_all()
+    return results_to_dict(terms, results, deal_name or input.get('deal_name', 'Lease Deal'))
+
+
+def default_damages(input: Dict) -> Dict:
+    """Default damages (default_calculator.save_results_to_json layout)"""
+    from Default_Calculator.default_calculator import (
+        calculate_default_damages, default_scenario_from_dict, results_to_dict
+    )
+    lease, default = default_scenario_from_dict(input)
+    return results_to_dict(calculate_default_damages(lease, default))
+
+
+def option_valuation(input: Dict, perform_sensitivity: bool = True) -> Dict:
+    """Lease option portfolio valuation (PortfolioOptionValuation as a dict)"""
+    from Option_Valuation.option_valuation import options_from_dict, value_option_portfolio
+    options, metadata = options_from_dict(input)
+    results = value_option_portfolio(
+        options=options,
+        property_address=metadata['property_address'],
+        rentable_area_sf=metadata['rentable_area_sf'],
+        perform_sensitivity=perform_sensitivity,
+        market_rent_psf=metadata.get('market_rent_psf'),
+        base_rent_psf=metadata.get('base_rent_psf')
+    )
+    return asdict(results)
+
+
+def rollover(input: Dict) -> Dict:
+    """Portfolio rollover analysis (RolloverAnalysisResults.to_dict())"""
+    from Rollover_Analysis.rollover_calculator import calculate_rollover_analysis, portfolio_from_dict
+    return calculate_rollover_analysis(portfolio_from_dict(input)).to_dict()
+
+
+def ifrs16(input: Dict, include_schedules: bool = False) -> Dict:
+    """
+    IFRS 16 / ASC 842 lease accounting (run_ifrs16_analysis results layout).
+
+    include_schedules adds the amortization and depreciation schedules the
+    command line writes as CSV, as lists of records.
+    """
+    from IFRS16_Calculator.ifrs16_calculator import calculate_ifrs16
+    from IFRS16_Calculator.run_ifrs16_analysis import lease_inputs_from_dict, results_to_dict
+    inputs = lease_inputs_from_dict(input)
+    result = calculate_ifrs16(inputs)
+    output = results_to_dict(inputs, result)
+    if include_schedules:
+        output['amortization_schedule'] = result.amortization_schedule.to_dict('records')
+        output['depreciation_schedule'] = result.depreciation_schedule.to_dict('records')
+    return output
+
+
+def credit(input: Dict) -> Dict:
+    """Tenant credit analysis (run_credit_analysis results layout)"""
+    from Credit_Analysis.credit_analysis import analyze_tenant_credit
+    from Credit_Analysis.run_credit_analysis import credit_inputs_from_dict, results_to_dict
+    return results_to_dict(analyze_tenant_credit(credit_inputs_from_dict(input)))
+
+
+def rental_variance(input: Dict) -> Dict:
+    """Rental variance decomposition (save_json_results layout)"""
+    from Rental_Variance.rental_variance_calculator import (
+        VarianceAnalysisInput, VarianceCalculator, results_to_dict
+    )
+    return results_to_dict(VarianceCalculator(VarianceAnalysisInput(**input)).calculate_all())
+
+
+def relative_valuation(input: Dict, persona: str = 'default') -> Dict:
+    """Relative valuation ranking (CompetitiveAnalysis as a dict)"""
+    from Relative_Valuation.relative_valuation_calculator import (
+        get_tenant_persona_weights, prepare_comparable_data, run_analysis
+    )
+    data = dict(input)
+    if persona != 'default':
+        data['weights'] = get_tenant_persona_weights(persona)
+    return asdict(run_analysis(prepare_comparable_data(data)))
+
+
+def mcda(input: Dict, weight_profile: Optional[str] = None, regression_method: str = 'ols') -> Dict:
+    """MCDA sales comparison (run_analysis results)"""
+    if str(MCDA_DIR) not in sys.path:
+        sys.path.insert(0, str(MCDA_DIR))
+    from mcda_sales_calculator import run_analysis
+    from validation import validate_input_data
+    errors = validate_input_data(input)
+    if errors:
+        raise ValueError("; ".join(errors))
+    return run_analysis(input, weight_profile=weight_profile, regression_method=regression_method)
+
+
+# Method name (as in `realestate list`) -> calculator function
+METHODS: Dict[str, Callable[..., Dict]] = {
+    'eff-rent': eff_rent,
+    'default': default_damages,
+    'option': option_valuation,
+    'rollover': rollover,
+    'ifrs16': ifrs16,
+    'credit': credit,
+    'rental-variance': rental_variance,
+    'relative-valuation': relative_valuation,
+    'mcda': mcda
+}
+
+
+def _preload():
+    """Pool worker initializer: import every calculator once"""
+    sys.path[:0] = [str(REPO_ROOT), str(MCDA_DIR)]
+    for module in CALCULATOR_MODULES:
+        importlib.import_module(module)
+
+
+def _invoke(method: str, params: Any) -> Dict:
+    """Run one calculator method (in a pool worker, without progress output)"""
+    from Shared_Utils.progress import quiet
+    function = METHODS[method]
+    with quiet():
+        if isinstance(params, list):
+            return function(*params)
+        return function(**(params or {}))
+
+
+def _json_default(value):
+    """JSON encoding for numpy scalars, dates and other calculator values"""
+    if hasattr(value, 'item'):
+        return value.item()
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+# ============================================================================
+# SERVER
+# ============================================================================
+
+def _error(request_id: Any, code: int, message: str, data: Any = None) -> Dict:
+    error = {'code': code, 'message': message}
+    if data is not None:
+        error['data'] = data
+    return {'jsonrpc': '2.0', 'id': request_id, 'error': error}
+
+
+class CalculationServer:
+    """
+    JSON-RPC calculation server.
+
+    Args:
+        path: Unix socket path (default: default_socket_path())
+        max_workers: Worker processes (None = CPU count; 1 = run in a thread
+            of the server process)
+    """
+
+    def __init__(self, path: Optional[Path] = None, max_workers: Optional[int] = None):
+        self.path = Path(path or default_socket_path())
+        self.max_workers = max_workers
+        self.executor = None
+        self._stopped = None
+        self._connections = {}   # Connection task -> writer, closed on shutdown
+
+    def _start_executor(self):
+        if self.max_workers == 1:
+            _preload()
+            self.executor = ThreadPoolExecutor(max_workers=1)
+        else:
+            self.executor = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_preload)
+
+    def _replace_executor(self, broken):
+        """
+        Swap a broken pool (a worker died) for a fresh one.
+
+        Every request in flight on the broken pool fails together; only the
+        first to get here replaces it, the rest find it already replaced.
+        """
+        if self.executor is broken:
+            broken.shutdown(wait=False, cancel_futures=True)
+            self._start_executor()
+
+    async def _call(self, request: Any) -> Optional[Dict]:
+        """Reply to one request object (None for a notification)"""
+        if not isinstance(request, dict) or request.get('jsonrpc') != '2.0' \
+                or not isinstance(request.get('method'), str) \
+                or not isinstance(request.get('params', {}), (dict, list)):
+            return _error(request.get('id') if isinstance(request, dict) else None,
+                          INVALID_REQUEST, 'Invalid Request')
+        request_id, method = request.get('id'), request['method']
+        params = request.get('params', {})
+
+        try:
+            result = await self._run(method, params)
+        except RpcError as exc:
+            reply = _error(request_id, exc.code, exc.message, exc.data)
+        except BrokenProcessPool as exc:   # Later requests get a fresh pool (see _run)
+            reply = _error(request_id, INTERNAL_ERROR, 'Internal error', str(exc))
+        except Exception as exc:
+            reply = _error(request_id, CALCULATION_ERROR, 'Calculation error',
+                           {'type': type(exc).__name__, 'message': str(exc)})
+        else:
+            reply = {'jsonrpc': '2.0', 'id': request_id, 'result': result}
+        return reply if 'id' in request else None
+
+    async def _run(self, method: str, params: Any) -> Any:
+        if method == 'rpc.methods':
+            return {name: (inspect.getdoc(function) or '').splitlines()[0] for name, function in METHODS.items()}
+        if method == 'rpc.ping':
+            return {'pid': os.getpid(), 'methods': len(METHODS)}
+        if method == 'rpc.shutdown':
+            self.path.unlink(missing_ok=True)   # Gone before the client hears back
+            self._stopped.set()
+            return True
+        if method not in METHODS:
+            raise RpcError(METHOD_NOT_FOUND, 'Method not found', method)
+        try:
+            arguments = inspect.signature(METHODS[method]).bind(
+                *(params if isinstance(params, list) else []),
+                **(params if isinstance(params, dict) else {})
+            )
+        except TypeError as exc:
+            raise RpcError(INVALID_PARAMS, 'Invalid params', str(exc)) from None
+        if not isinstance(arguments.arguments.get('input'), dict):
+            raise RpcError(INVALID_PARAMS, 'Invalid params', "'input' must be an object")
+        loop = asyncio.get_running_loop()
+        executor = self.executor
+        try:
+            return await loop.run_in_executor(executor, _invoke, method, params)
+        except BrokenProcessPool:
+            self._replace_executor(executor)
+            raise
+
+    async def handle_message(self, message: Any) -> Optional[Any]:
+        """
+        Reply to a decoded request or batch.
+
+        Returns:
+            Response object, list of responses for a batch, or None when
+            nothing is owed (notifications only)
+        """
+        if isinstance(message, list):
+            if not message:
+                return _error(None, INVALID_REQUEST, 'Invalid Request')
+            replies = await asyncio.gather(*(self._call(request) for request in message))
+            return [reply for reply in replies if reply is not None] or None
+        return await self._call(message)
+
+    async def _connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        task = asyncio.current_task()
+        self._connections[task] = writer
+        try:
+            while not reader.at_eof():
+                try:
+                    line = await reader.readline()
+                except ValueError:   # Line longer than MAX_MESSAGE_BYTES
+                    writer.write(json.dumps(_error(None, INVALID_REQUEST, 'Request too large')).encode() + b'\n')
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    reply = _error(None, PARSE_ERROR, 'Parse error')
+                else:
+                    reply = await self.handle_message(message)
+                if reply is not None:
+                    writer.write(json.dumps(reply, default=_json_default).encode() + b'\n')
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._connections.pop(task, None)
+            writer.close()
+
+    def _bind(self) -> socket.socket:
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(self.path))
+        except OSError:
+            self.path.unlink(missing_ok=True)   # Stale socket from a server that did not shut down
+        else:
+            raise ValueError(f"A server is already listening on {self.path}")
+        finally:
+            probe.close()
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        umask = os.umask(0o177)   # Owner-only socket: it runs calculations as this user
+        try:
+            sock.bind(str(self.path))
+        finally:
+            os.umask(umask)
+        return sock
+
+    async def serve(self):
+        """Serve until rpc.shutdown, SIGINT or SIGTERM"""
+        self._stopped = asyncio.Event()
+        sock = self._bind()
+        self._start_executor()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, self._stopped.set)
+        server = await asyncio.start_unix_server(self._connection, sock=sock, limit=MAX_MESSAGE_BYTES)
+        try:
+            async with server:
+                await self._stopped.wait()
+                # Closing the transports ends each connection at its next read
+                for writer in self._connections.values():
+                    writer.close()
+                await asyncio.gather(*self._connections, return_exceptions=True)
+        finally:
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                loop.remove_signal_handler(signum)
+            self.path.unlink(missing_ok=True)
+            self.executor.shutdown(wait=True, cancel_futures=True)
+
+
+def serve(path: Optional[Path] = None, max_workers: Optional[int] = None):
+    """Run a CalculationServer in the foreground"""
+    asyncio.run(CalculationServer(path, max_workers).serve())
+
+
+# ============================================================================
+# CLIENT
+# ============================================================================
+
+class CalculationClient:
+    """
+    Blocking client for a CalculationServer (one connection, reused).
+
+    Example:
+        with CalculationClient() as client:
+            damages = client.call('default', input=scenario)
+            replies = client.batch([('eff-rent', {'input': deal}) for deal in deals])
+    """
+
+    def __init__(self, path: Optional[Path] = None, timeout: Optional[float] = None):
+        path = Path(path or default_socket_path())
+        check_socket_owner(path)   # Raises ValueError for another user's socket
+        self.connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.connection.settimeout(timeout)
+        self.connection.connect(str(path))
+        self.stream = self.connection.makefile('rb')
+        self._next_id = 0
+
+    def _request(self, method: str, params: Any) -> Dict:
+        self._next_id += 1
+        return {'jsonrpc': '2.0', 'id': self._next_id, 'method': method, 'params': params}
+
+    def _exchange(self, message: Any) -> Any:
+        self.connection.sendall(json.dumps(message, default=_json_default).encode() + b'\n')
+        line = self.stream.readline()
+        if not line:
+            raise ConnectionError("Server closed the connection")
+        return json.loads(line)
+
+    def call(self, method: str, *args, **kwargs) -> Any:
+        """
+        Call one method.
+
+        Returns:
+            The method's result
+
+        Raises:
+            RpcError: If the server replies with an error
+        """
+        reply = self._exchange(self._request(method, list(args) if args else kwargs))
+        if 'error' in reply:
+            error = reply['error']
+            raise RpcError(error['code'], error['message'], error.get('data'))
+        return reply['result']
+
+    def batch(self, calls: List[tuple]) -> List[Dict]:
+        """
+        Send (method, params) pairs as one batch.
+
+        Returns:
+            Response objects (result or error) in the order of calls
+        """
+        requests = [self._request(method, params) for method, params in calls]
+        replies = self._exchange(requests)
+        if isinstance(replies, dict):   # Whole batch rejected
+            raise RpcError(replies['error']['code'], replies['error']['message'])
+        by_id = {reply['id']: reply for reply in replies}
+        return [by_id[request['id']] for request in requests]
+
+    def close(self):
+        self.stream.close()
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# ============================================================================
+# ENTRY POINT
+# ============================================================================
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """realestate server entry point"""
+    parser = argparse.ArgumentParser(prog='realestate server',
+                                     description='JSON-RPC calculation server on a Unix socket')
+    parser.add_argument('--socket', type=Path, default=None,
+                        help=f'Socket path (default: ${SERVER_ENV} or a per-user runtime/temp path)')
+    parser.add_argument('--max-workers', type=int, default=None,
+                        help='Calculation processes (default: CPU count; 1 = server process)')
+    options = parser.parse_args(argv)
+    path = options.socket or default_socket_path()
+    print(f"Calculation server listening on {path}", flush=True)
+    serve(path, options.max_workers)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+"""
+realestate Command Line
+
+One entry point for every calculator script:
+
+    python realestate.py <command> [calculator arguments...]
+    python realestate.py list
+
+Each command runs the calculator's script exactly as `python <script> ...`
+would (runpy, argv, script directory on sys.path), and nothing is imported
+until a command is chosen.
+
+Warm worker: `realestate.py worker start` runs a background process on a
+Unix socket that has numpy / pandas / scipy and the shared utilities
+already imported. While it is running, commands are sent to it and run in
+a forked child (fresh state per command, no import cost) with the client's
+working directory and environment; output and exit code come back to the
+client. Without a
+worker (or with --no-worker) commands run in-process.
+
+Tracing: `realestate.py --trace trace.json <command>` runs the command
+in-process with Shared_Utils.tracing enabled and writes the spans of the
+instrumented calculators (JSON summary, or --trace-format chrome).
+
+Used by:
+- realestate.py
+- slash-command wrappers
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import runpy
+import signal
+import socket
+import stat
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+class Command(NamedTuple):
+    script: str
+    description: str
+
+
+COMMANDS: Dict[str, Command] = {
+    'eff-rent': Command('Eff_Rent_Calculator/eff_rent_calculator.py', 'Effective rent / BAF deal analysis'),
+    'ifrs16': Command('IFRS16_Calculator/run_ifrs16_analysis.py', 'IFRS 16 / ASC 842 lease accounting'),
+    'credit': Command('Credit_Analysis/run_credit_analysis.py', 'Tenant credit analysis'),
+    'default': Command('Default_Calculator/default_calculator.py', 'Default damages'),
+    'default-notice': Command('Default_Calculator/notice_generator.py', 'Default notice generation'),
+    'option': Command('Option_Valuation/option_valuation.py', 'Lease option valuation (Black-Scholes)'),
+    'renewal': Command('Renewal_Analysis/renewal_analysis.py', 'Renewal vs relocation example analysis'),
+    'rental-variance': Command('Rental_Variance/rental_variance_calculator.py', 'Rental variance decomposition'),
+    'yield-curve': Command('Rental_Yield_Curve/rental_yield_curve.py', 'Rental yield curve'),
+    'rollover': Command('Rollover_Analysis/rollover_calculator.py', 'Lease rollover analysis'),
+    'rollover-report': Command('Rollover_Analysis/report_generator.py', 'Rollover report'),
+    'relative-valuation': Command(
+        'Relative_Valuation/relative_valuation_calculator.py', 'Relative valuation ranking'
+    ),
+    'mcda': Command('MCDA_Sales_Comparison/mcda_sales_calculator.py', 'MCDA sales comparison'),
+    'comparable-sales': Command(
+        'Comparable_Sales_Analysis/comparable_sales_calculator.py', 'Comparable sales adjustments'
+    ),
+    'paired-sales': Command('Comparable_Sales_Analysis/paired_sales_analyzer.py', 'Paired sales analysis'),
+    'validate-comparables': Command(
+        'Comparable_Sales_Analysis/validate_comparables.py', 'Comparable sales input validation'
+    ),
+    'server': Command('Shared_Utils/calc_server.py', 'JSON-RPC calculation server (Unix socket)'),
+    'benchmark': Command('Benchmarks/benchmark_suite.py', 'Calculator benchmark suite and regression report'),
+    'synthetic-data': Command(
+        'Shared_Utils/synthetic_data.py', 'Seeded synthetic inputs for load testing (JSONL / Parquet)'
+    )
+}
+
+# Long-running commands: always run in this process, never in the warm worker
+LOCAL_COMMANDS = {'server'}
+
+# Imported by the warm worker before it accepts commands
+WORKER_PRELOAD = [
+    'numpy',
+    'numpy_financial',
+    'pandas',
+    'scipy.optimize',
+    'scipy.stats',
+    'Shared_Utils.financial_utils',
+    'Shared_Utils.discount_curve',
+    'Shared_Utils.progress',
+    'Shared_Utils.tracing'
+]
+
+WORKER_START_TIMEOUT = 30.0   # Seconds to wait for a started worker to accept
+WORKER_ENV = 'REALESTATE_WORKER'
+RUNTIME_DIR_ENV = 'XDG_RUNTIME_DIR'
+
+
+def user_socket_path(name: str) -> Path:
+    """
+    Per-user socket path: in $XDG_RUNTIME_DIR (owner-only) when set, else
+    in the shared temp directory, where check_socket_owner() guards clients.
+    """
+    runtime_dir = os.environ.get(RUNTIME_DIR_ENV)
+    directory = Path(runtime_dir) if runtime_dir and os.path.isdir(runtime_dir) else Path(tempfile.gettempdir())
+    return directory / f"{name}-{os.getuid()}.sock"
+
+
+def check_socket_owner(path: Path):
+    """
+    Refuse a socket this user does not own before sending anything to it.
+
+    In a shared directory another user can create the socket first and
+    would receive the commands, working directory and calculator inputs.
+
+    Raises:
+        ValueError: If path exists and is not a socket owned by this user
+    """
+    try:
+        info = os.stat(path)
+    except FileNotFoundError:
+        return
+    if info.st_uid != os.getuid() or not stat.S_ISSOCK(info.st_mode):
+        raise ValueError(f"{path} is not a socket owned by this user")
+
+
+def default_socket_path() -> Path:
+    """Worker socket: $REALESTATE_WORKER or a per-user path (see user_socket_path())"""
+    if os.environ.get(WORKER_ENV):
+        return Path(os.environ[WORKER_ENV])
+    return user_socket_path('realestate')
+
+
+def _exit_code(exc: SystemExit) -> int:
+    if exc.code is None:
+        return 0
+    if isinstance(exc.code, int):
+        return exc.code
+    print(exc.code, file=sys.stderr)
+    return 1
+
+
+def run_command(name: str, args: List[str]) -> int:
+    """
+    Run a calculator command in this process.
+
+    Args:
+        name: Key of COMMANDS
+        args: Arguments passed to the calculator script
+
+    Returns:
+        Exit code
+    """
+    if name not in COMMANDS:
+        raise ValueError(f"Unknown command '{name}'")
+    script = REPO_ROOT / COMMANDS[name].script
+    saved_argv, saved_path = sys.argv[:], sys.path[:]
+    sys.argv = [str(script), *args]
+    sys.path[:0] = [str(script.parent), str(REPO_ROOT)]
+    try:
+        runpy.run_path(str(script), run_name='__main__')
+    except SystemExit as exc:
+        return _exit_code(exc)
+    finally:
+        sys.argv, sys.path[:] = saved_argv, saved_path
+    return 0
+
+
+# ============================================================================
+# WARM WORKER
+# ============================================================================
+
+def _send(connection: socket.socket, message: Dict):
+    connection.sendall(json.dumps(message).encode() + b'\n')
+
+
+def _receive(connection: socket.socket) -> Optional[Dict]:
+    with connection.makefile('rb') as stream:
+        line = stream.readline()
+    return json.loads(line) if line else None
+
+
+def _apply_environment(environment: Optional[Dict[str, str]]):
+    """
+    Child process: switch to the client's environment variables.
+
+    Modules the worker preloaded read theirs at import, so the progress
+    reporter is rebuilt here and tracing is set up by _run_forked().
+    """
+    if environment is None:
+        return
+    os.environ.clear()
+    os.environ.update(environment)
+    from Shared_Utils.progress import reporter_from_environment, set_reporter
+    set_reporter(reporter_from_environment())
+
+
+def _run_forked(connection: socket.socket, request: Dict):
+    """Child process: run one command and reply with its output and exit code"""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    try:
+        os.chdir(request.get('cwd') or os.getcwd())
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                _apply_environment(request.get('env'))
+                # os._exit() below skips atexit, where REALESTATE_TRACE is written
+                from Shared_Utils.tracing import environment_tracing
+                with environment_tracing():
+                    code = run_command(request['command'], request.get('args', []))
+            except Exception as exc:
+                print(f"{type(exc).__name__}: {exc}", file=sys.stderr)
+                code = 1
+        _send(connection, {'exit_code': code, 'stdout': stdout.getvalue(), 'stderr': stderr.getvalue()})
+    finally:
+        connection.close()
+        os._exit(0)
+
+
+def _connect(path: Path, timeout: Optional[float] = None) -> Optional[socket.socket]:
+    check_socket_owner(path)
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    connection.settimeout(timeout)
+    try:
+        connection.connect(str(path))
+    except OSError:
+        connection.close()
+        return None
+    connection.settimeout(None)
+    return connection
+
+
+def serve_worker(path: Optional[Path] = None, preload: Optional[List[str]] = None):
+    """
+    Run the warm worker in the foreground until a shutdown request.
+
+    Args:
+        path: Unix socket path (default: default_socket_path())
+        preload: Modules to import up front (default: WORKER_PRELOAD)
+    """
+    path = Path(path or default_socket_path())
+    existing = _connect(path, timeout=1.0)
+    if existing is not None:
+        existing.close()
+        raise ValueError(f"A worker is already listening on {path}")
+    path.unlink(missing_ok=True)   # Stale socket from a worker that did not shut down
+
+    sys.path.insert(0, str(REPO_ROOT))
+    for module in WORKER_PRELOAD if preload is None else preload:
+        importlib.import_module(module)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    umask = os.umask(0o177)   # Owner-only socket: it runs commands as this user
+    try:
+        server.bind(str(path))
+    finally:
+        os.umask(umask)
+    server.listen()
+    previous = signal.signal(signal.SIGCHLD, signal.SIG_IGN)   # Reap finished children
+
+    try:
+        while True:
+            connection, _ = server.accept()
+            try:
+                request = _receive(connection)
+            except ValueError:
+                request = {'command': None}
+            if not request:
+                connection.close()
+                continue
+            if request.get('command') not in (*COMMANDS, 'shutdown', 'ping'):
+                _send(connection, {'exit_code': 2, 'stdout': '',
+                                   'stderr': f"realestate: unknown command '{request.get('command')}'\n"})
+                connection.close()
+                continue
+            if request.get('command') == 'shutdown':
+                path.unlink(missing_ok=True)   # Gone before the client hears back
+                _send(connection, {'exit_code': 0, 'stdout': '', 'stderr': ''})
+                connection.close()
+                break
+            if request.get('command') == 'ping':
+                _send(connection, {'exit_code': 0, 'stdout': f"{os.getpid()}\n", 'stderr': ''})
+                connection.close()
+                continue
+            if os.fork() == 0:
+                server.close()
+                signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                _run_forked(connection, request)
+            connection.close()
+    finally:
+        signal.signal(signal.SIGCHLD, previous)
+        server.close()
+        path.unlink(missing_ok=True)
+
+
+def worker_request(path: Path, command: str, args: Optional[List[str]] = None) -> Optional[Dict]:
+    """
+    Send one command to a running worker.
+
+    Returns:
+        Reply dict (exit_code, stdout, stderr), or None if no worker is listening
+
+    Raises:
+        ValueError: If the socket belongs to another user
+    """
+    connection = _connect(Path(path))
+    if connection is None:
+        return None
+    with connection:
+        _send(connection, {'command': command, 'args': list(args or []), 'cwd': os.getcwd(),
+                           'env': dict(os.environ)})
+        return _receive(connection)
+
+
+def start_worker(path: Optional[Path] = None, timeout: float = WORKER_START_TIMEOUT) -> int:
+    """
+    Start a detached worker and wait until it accepts commands.
+
+    Returns:
+        Worker process id
+    """
+    path = Path(path or default_socket_path())
+    if worker_request(path, 'ping') is not None:
+        raise RuntimeError(f"A worker is already listening on {path}")
+    process = subprocess.Popen(
+        [sys.executable, str(REPO_ROOT / 'realestate.py'), 'worker', 'serve', '--socket', str(path)],
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Worker exited with code {process.returncode}")
+        reply = worker_request(path, 'ping')
+        if reply is not None:
+            return process.pid
+        time.sleep(0.05)
+    process.kill()
+    raise RuntimeError(f"Worker did not start within {timeout:.0f}s")
+
+
+# ============================================================================
+# ENTRY POINT
+# ============================================================================
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='realestate',
+        description='Unified command line for the lease and valuation calculators',
+        epilog="Run 'realestate list' for the available commands."
+    )
+    parser.add_argument('--worker', type=Path, default=None,
+                        help=f'Worker socket (default: ${WORKER_ENV} or a per-user runtime/temp path)')
+    parser.add_argument('--no-worker', action='store_true', help='Always run in this process')
+    parser.add_argument('--trace', type=Path, default=None,
+                        help='Trace the command (in this process) and write the trace here')
+    parser.add_argument('--trace-format', choices=['json', 'chrome'], default='json',
+                        help='Trace file format (default json; chrome for chrome://tracing / Perfetto)')
+    parser.add_argument('--trace-memory', action='store_true', help='Record allocation stats per traced span')
+    parser.add_argument('command', help="Calculator command, 'list' or 'worker'")
+    parser.add_argument('args', nargs=argparse.REMAINDER, help='Arguments for the calculator')
+    return parser
+
+
+def _worker_main(args: List[str], path: Path) -> int:
+    parser = argparse.ArgumentParser(prog='realestate worker')
+    parser.add_argument('action', choices=['start', 'stop', 'status', 'serve'])
+    parser.add_argument('--socket', type=Path, default=path)
+    options = parser.parse_args(args)
+
+    if options.action == 'serve':
+        serve_worker(options.socket)
+        return 0
+    if options.action == 'start':
+        print(f"Worker {start_worker(options.socket)} listening on {options.socket}")
+        return 0
+    try:
+        reply = worker_request(options.socket, 'shutdown' if options.action == 'stop' else 'ping')
+    except ValueError as exc:
+        print(f"realestate: {exc}", file=sys.stderr)
+        return 1
+    if reply is None:
+        print(f"No worker on {options.socket}")
+        return 1
+    print(f"Worker stopped ({options.socket})" if options.action == 'stop'
+          else f"Worker {reply['stdout'].strip()} listening on {options.socket}")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """realestate entry point; returns the exit code"""
+    options = _parser().parse_args(argv)
+    path = options.worker or default_socket_path()
+
+    if options.command == 'list':
+        width = max(len(name) for name in COMMANDS)
+        for name, command in COMMANDS.items():
+            print(f"  {name:<{width}}  {command.description}")
+        return 0
+    if options.command == 'worker':
+        return _worker_main(options.args, path)
+    if options.command not in COMMANDS:
+        print(f"realestate: unknown command '{options.command}' (see 'realestate list')", file=sys.stderr)
+        return 2
+
+    if options.trace:
+        from Shared_Utils.tracing import span, tracing
+        with tracing(options.trace, format=options.trace_format, memory=options.trace_memory):
+            with span(f'command.{options.command}', category='command'):
+                exit_code = run_command(options.command, options.args)
+        print(f"✓ Trace written to: {options.trace}", file=sys.stderr)
+        return exit_code
+
+    if not options.no_worker and options.command not in LOCAL_COMMANDS:
+        try:
+            reply = worker_request(path, options.command, options.args)
+        except ValueError as exc:
+            print(f"realestate: {exc}; running in this process", file=sys.stderr)
+            reply = None
+        if reply is not None:
+            sys.stdout.write(reply['stdout'])
+            sys.stderr.write(reply['stderr'])
+            return reply['exit_code']
+    return run_command(options.command, options.args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,246 @@
+"""
+Shared Discount Curve Cache
+
+Memoized discount-factor and cumulative-annuity tables shared by every
+calculator that discounts periodic rent:
+- DiscountCurve holds v^t and cumulative annuity factors for one periodic
+  rate, extended on demand (doubling) and never recomputed
+- discount_curve() returns the cached curve per (rate, compounding, timing)
+  with bounded LRU eviction, so sensitivity sweeps that revisit the same
+  rates reuse the same arrays instead of re-exponentiating
+
+Compounding conventions:
+- 'periodic':         rate is already per period
+- 'annual_effective': monthly periods, (1 + rate)^(1/12) - 1
+                      (annual_to_monthly_rate)
+- 'annual_nominal':   monthly periods, rate / 12
+
+Timing follows pv_annuity(): 'end' (ordinary annuity, rent in arrears)
+or 'beginning' (annuity due, rent in advance).
+
+Whole period counts are read from the tables; fractional counts and offsets
+(e.g. 12.5-month rent steps) use the closed forms (1 + r)^-t and
+(1 - v^n) / r instead.
+
+Author: Claude Code
+Created: 2026-10-18
+"""
+
+from functools import lru_cache
+from typing import Literal, Tuple, Union
+
+import numpy as np
+
+
+# Maximum number of distinct (rate, compounding, timing) curves kept
+DISCOUNT_CURVE_CACHE_SIZE = 256
+
+# Initial table length; tables double until they cover the requested horizon
+_INITIAL_PERIODS = 128
+
+Compounding = Literal['periodic', 'annual_effective', 'annual_nominal']
+Timing = Literal['beginning', 'end']
+
+
+def periodic_rate(rate: float, compounding: Compounding = 'periodic') -> float:
+    """
+    Convert a quoted rate to the per-period rate used by DiscountCurve.
+
+    Raises:
+        ValueError: If compounding is unknown or the resulting rate is <= -100%
+    """
+    if compounding == 'periodic':
+        period_rate = rate
+    elif compounding == 'annual_effective':
+        if rate < -1:
+            raise ValueError(f"annual_rate must be > -1 (got {rate})")
+        period_rate = (1 + rate) ** (1 / 12) - 1
+    elif compounding == 'annual_nominal':
+        period_rate = rate / 12
+    else:
+        raise ValueError(f"Unknown compounding: {compounding}")
+
+    if period_rate <= -1:
+        raise ValueError(f"Periodic rate must be > -1 (got {period_rate})")
+    return period_rate
+
+
+def _split_periods(periods) -> Tuple[np.ndarray, bool]:
+    """
+    Validate non-negative period count(s).
+
+    Returns:
+        (periods, whole): an int array for table lookup when every count is
+        a whole number, otherwise a float array for the closed forms
+    """
+    periods = np.asarray(periods)
+    if periods.size and periods.min() < 0:
+        raise ValueError(f"periods must be non-negative, got {periods}")
+    if periods.dtype.kind in 'iu':
+        return periods, True
+    as_int = periods.astype(int)
+    if np.array_equal(as_int, periods):
+        return as_int, True
+    return periods.astype(float), False
+
+
+def _as_periods(periods) -> np.ndarray:
+    """Validate integer, non-negative period count(s) for table lookup"""
+    periods, whole = _split_periods(periods)
+    if not whole:
+        raise ValueError(f"periods must be whole numbers, got {periods}")
+    return periods
+
+
+class DiscountCurve:
+    """
+    Discount factors and cumulative annuity factors for one periodic rate
+
+    Usage:
+        curve = discount_curve(0.06, 'annual_effective', 'beginning')
+        pv = curve.pv(payment=1000, periods=60)
+    """
+
+    def __init__(self, rate: float, timing: Timing = 'end'):
+        if timing not in ('beginning', 'end'):
+            raise ValueError(f"timing must be 'beginning' or 'end', got {timing}")
+
+        self.rate = rate
+        self.timing = timing
+        self._factors = np.empty(0)
+        self._annuities = np.empty(0)
+        self._extend(_INITIAL_PERIODS)
+
+    def __repr__(self) -> str:
+        return f"DiscountCurve(rate={self.rate!r}, timing={self.timing!r}, periods={self.periods})"
+
+    @property
+    def periods(self) -> int:
+        """Number of periods currently tabulated"""
+        return len(self._factors) - 1
+
+    def _extend(self, periods: int) -> None:
+        """Grow tables to cover at least `periods` periods"""
+        size = max(self.periods, _INITIAL_PERIODS)
+        while size < periods:
+            size *= 2
+        if size <= self.periods:
+            return
+
+        # v^t for t = 0..size
+        factors = (1 + self.rate) ** -np.arange(size + 1, dtype=float)
+
+        # annuities[n] = PV of 1 per period for n periods
+        if self.timing == 'beginning':
+            paid = factors[:-1]      # t = 0..n-1
+        else:
+            paid = factors[1:]       # t = 1..n
+        annuities = np.concatenate(([0.0], np.cumsum(paid)))
+
+        factors.setflags(write=False)
+        annuities.setflags(write=False)
+        self._factors = factors
+        self._annuities = annuities
+
+    def discount_factors(self, periods: int) -> np.ndarray:
+        """Read-only array of v^t for t = 0..periods"""
+        periods = int(_as_periods(periods))
+        self._extend(periods)
+        return self._factors[:periods + 1]
+
+    def annuity_factors(self, periods: int) -> np.ndarray:
+        """Read-only array a[n] (PV of 1 per period for n periods), n = 0..periods"""
+        periods = int(_as_periods(periods))
+        self._extend(periods)
+        return self._annuities[:periods + 1]
+
+    def discount_factor(self, t: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """v^t for period(s) t >= 0 (closed form when any t is fractional)"""
+        t, whole = _split_periods(t)
+        if whole:
+            self._extend(int(t.max()) if t.size else 0)
+            result = self._factors[t]
+        else:
+            result = (1 + self.rate) ** -t
+        return float(result) if result.ndim == 0 else result
+
+    def annuity(self, periods: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """Cumulative annuity factor for period count(s) >= 0 (closed form when any is fractional)"""
+        periods, whole = _split_periods(periods)
+        if whole:
+            self._extend(int(periods.max()) if periods.size else 0)
+            result = self._annuities[periods]
+        else:
+            if self.rate == 0:
+                result = periods
+            else:
+                result = (1 - (1 + self.rate) ** -periods) / self.rate
+                if self.timing == 'beginning':
+                    result = result * (1 + self.rate)
+        return float(result) if result.ndim == 0 else result
+
+    def pv(self, payment: float, periods: float, offset: float = 0) -> float:
+        """
+        PV of a level payment stream, discounted a further `offset` periods
+
+        Args:
+            payment: Periodic payment
+            periods: Number of payments (fractional counts use the closed form)
+            offset: Periods before the stream starts
+
+        Returns:
+            Present value
+        """
+        if periods <= 0:
+            return 0.0
+        pv = payment * self.annuity(periods)
+        if offset > 0:
+            pv *= self.discount_factor(offset)
+        return pv
+
+    def npv(self, cash_flows) -> float:
+        """NPV of cash flows at t = 0, 1, 2, ... (first flow undiscounted)"""
+        cash_flows = np.asarray(cash_flows, dtype=float)
+        return float(np.dot(cash_flows, self.discount_factors(len(cash_flows) - 1)))
+
+
+@lru_cache(maxsize=DISCOUNT_CURVE_CACHE_SIZE)
+def _cached_curve(period_rate: float, timing: Timing) -> DiscountCurve:
+    return DiscountCurve(period_rate, timing)
+
+
+def discount_curve(
+    rate: float,
+    compounding: Compounding = 'periodic',
+    timing: Timing = 'end'
+) -> DiscountCurve:
+    """
+    Shared, memoized discount curve.
+
+    Curves are cached per (periodic rate, timing) with LRU eviction beyond
+    DISCOUNT_CURVE_CACHE_SIZE entries. Returned tables are read-only.
+
+    Args:
+        rate: Discount rate as quoted
+        compounding: 'periodic', 'annual_effective' or 'annual_nominal'
+        timing: 'end' (ordinary annuity) or 'beginning' (annuity due)
+
+    Returns:
+        DiscountCurve
+
+    Example:
+        >>> curve = discount_curve(0.06, 'annual_effective', 'beginning')
+        >>> print(f"${curve.pv(1000, 60):,.2f}")
+        $52,107.09
+    """
+    return _cached_curve(float(periodic_rate(rate, compounding)), timing)
+
+
+def clear_discount_curve_cache() -> None:
+    """Drop all cached curves"""
+    _cached_curve.cache_clear()
+
+
+def discount_curve_cache_info():
+    """functools cache statistics (hits, misses, maxsize, currsize)"""
+    return _cached_curve.cache_info()
@@ -16,9 +16,19 @@ import numpy as np
 import numpy_financial as npf
 import pandas as pd
 from typing import List, Dict, Optional, Union, Literal
-from scipy.optimize import newton
 from datetime import datetime, timedelta
 
+try:
+    from .discount_curve import discount_curve
+except ImportError:  # Imported as a top-level module (Shared_Utils on sys.path)
+    from discount_curve import discount_curve
+
+
+def newton(*args, **kwargs):
+    """scipy.optimize.newton, imported on first use (scipy.optimize takes ~0.4 s to import)"""
+    from scipy.optimize import newton as scipy_newton
+    return scipy_newton(*args, **kwargs)
+
 
 # ============================================================================
 # PRESENT VALUE CALCULATIONS
@@ -55,22 +65,16 @@ def present_value(
     if discount_rate < 0:
         raise ValueError(f"discount_rate must be non-negative, got {discount_rate}")
 
-    # Convert annual rate to periodic rate
-    if periods == 'monthly':
-        period_rate = annual_to_monthly_rate(discount_rate)
-    else:
-        period_rate = discount_rate
+    # Discount factors come from the shared curve cache (annual rate converted
+    # to monthly for monthly cash flows)
+    compounding = 'annual_effective' if periods == 'monthly' else 'periodic'
+    curve = discount_curve(discount_rate, compounding)
 
-    # Calculate PV for each cash flow
     # First cash flow (index 0) occurs at t=0 (present), so is not discounted
     # This is appropriate for NPV calculations where first cash flow is typically
     # the initial investment. For annuities where all payments are in the future,
     # use pv_annuity() instead.
-    pv = 0.0
-    for t, cf in enumerate(cash_flows):
-        pv += cf / ((1 + period_rate) ** t)
-
-    return pv
+    return curve.npv(cash_flows)
 
 
 def pv_annuity(
@@ -221,6 +225,188 @@ def irr(
         return float(fallback)
 
 
+# Rates scanned for a sign change when Newton fails on a row
+_IRR_BRACKET_GRID = np.array([
+    -0.99, -0.9, -0.75, -0.5, -0.25, -0.1, 0.0, 0.05, 0.1, 0.2,
+    0.35, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0
+])
+
+
+def _cash_flow_matrix(cash_flows) -> np.ndarray:
+    """
+    Convert cash-flow streams to a zero-padded 2-D float matrix.
+
+    Accepts a 2-D array (NaN treated as padding) or a ragged sequence of
+    sequences. Trailing zero padding does not change NPV or IRR.
+    """
+    if isinstance(cash_flows, np.ndarray):
+        matrix = np.atleast_2d(cash_flows).astype(float)
+    else:
+        rows = [np.asarray(row, dtype=float).ravel() for row in cash_flows]
+        width = max((len(row) for row in rows), default=0)
+        matrix = np.zeros((len(rows), width))
+        for i, row in enumerate(rows):
+            matrix[i, :len(row)] = row
+
+    if matrix.ndim != 2 or matrix.size == 0:
+        raise ValueError("cash_flows cannot be empty")
+
+    return np.nan_to_num(matrix, nan=0.0)
+
+
+def _horner_rows(matrix: np.ndarray, x: np.ndarray):
+    """
+    Evaluate each row as a polynomial in x: sum(c_t * x^t), and its derivative.
+
+    Horner's scheme over columns avoids computing (1 + r)^t for every cell.
+    """
+    value = np.zeros(len(matrix))
+    derivative = np.zeros(len(matrix))
+    for t in range(matrix.shape[1] - 1, -1, -1):
+        derivative = derivative * x + value
+        value = value * x + matrix[:, t]
+    return value, derivative
+
+
+def npv_many(
+    cash_flows: Union[np.ndarray, List[List[float]]],
+    discount_rates: Union[float, np.ndarray]
+) -> np.ndarray:
+    """
+    Calculate NPV of many cash-flow streams at once.
+
+    Array counterpart of npv(): row i is discounted at discount_rates[i]
+    (or a single shared rate), first cash flow at t=0.
+
+    Args:
+        cash_flows: 2-D array (rows = streams, NaN/zero padded) or ragged
+                   list of lists
+        discount_rates: Annual discount rate, scalar or one per row
+
+    Returns:
+        Array of NPVs, one per row
+
+    Raises:
+        ValueError: If cash_flows is empty or rates are <= -100%
+
+    Example:
+        >>> npv_many([[-100000, 30000, 30000, 30000, 30000, 30000],
+        ...           [-50000, 20000, 20000, 20000]], 0.10)
+        array([13723.60, -262.96])
+    """
+    matrix = _cash_flow_matrix(cash_flows)
+    rates = np.broadcast_to(np.asarray(discount_rates, dtype=float), (len(matrix),))
+
+    if np.any(rates <= -1.0):
+        raise ValueError("discount_rates must be greater than -100%")
+
+    value, _ = _horner_rows(matrix, 1.0 / (1.0 + rates))
+    return value
+
+
+def irr_many(
+    cash_flows: Union[np.ndarray, List[List[float]]],
+    guess: Union[float, np.ndarray] = 0.10,
+    max_iterations: int = 100,
+    tol: float = 1e-6
+) -> np.ndarray:
+    """
+    Calculate IRR of many cash-flow streams at once.
+
+    Array counterpart of irr(). All rows iterate Newton's method together,
+    with a per-row mask so converged rows drop out of later iterations.
+    Rows where Newton fails (zero derivative, rate <= -100%, no convergence)
+    are bracketed on a rate grid and solved by vectorized bisection.
+
+    Args:
+        cash_flows: 2-D array (rows = streams, NaN/zero padded) or ragged
+                   list of lists
+        guess: Initial guess, scalar or one per row (e.g. a monthly rate for
+               monthly streams; a close guess cuts iterations)
+        max_iterations: Maximum Newton iterations
+        tol: Convergence tolerance on the rate
+
+    Returns:
+        Array of IRRs, one per row; NaN where a row has fewer than two
+        cash flows or no IRR exists (irr() raises ValueError instead)
+
+    Raises:
+        ValueError: If cash_flows is empty
+
+    Example:
+        >>> irr_many([[-100000, 30000, 30000, 30000, 30000, 30000],
+        ...           [100, 100, 100]])
+        array([0.1524, nan])
+    """
+    matrix = _cash_flow_matrix(cash_flows)
+    n_rows = len(matrix)
+
+    # Rows with fewer than two cash flows (ignoring trailing padding) have no IRR
+    nonzero = matrix != 0
+    last_flow = np.where(nonzero.any(axis=1), matrix.shape[1] - 1 - np.argmax(nonzero[:, ::-1], axis=1), 0)
+    solvable = last_flow >= 1
+
+    rates = np.broadcast_to(np.asarray(guess, dtype=float), (n_rows,)).copy()
+    result = np.full(n_rows, np.nan)
+    active = np.flatnonzero(solvable)
+
+    # Newton in rate space; NPV(r) = P(x), x = 1/(1+r), dNPV/dr = -x^2 P'(x)
+    with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+        for _ in range(max_iterations):
+            if active.size == 0:
+                break
+            r = rates[active]
+            x = 1.0 / (1.0 + r)
+            value, derivative = _horner_rows(matrix[active], x)
+            slope = -x * x * derivative
+            step = value / slope
+            new_rate = r - step
+
+            failed = ~np.isfinite(new_rate) | (slope == 0) | (new_rate <= -1.0)
+            converged = ~failed & (np.abs(step) < tol)
+
+            rates[active] = new_rate
+            result[active[converged]] = new_rate[converged]
+            active = active[~(failed | converged)]
+            # Failed rows leave Newton; they are picked up by the bracket search
+        newton_failed = solvable & np.isnan(result)
+
+    failed_rows = np.flatnonzero(newton_failed)
+    if failed_rows.size:
+        result[failed_rows] = _irr_bisect(matrix[failed_rows], tol)
+
+    return result
+
+
+def _irr_bisect(matrix: np.ndarray, tol: float, max_iterations: int = 200) -> np.ndarray:
+    """Bracket each row's IRR on _IRR_BRACKET_GRID and bisect (NaN if no sign change)."""
+    grid_values = np.column_stack([
+        _horner_rows(matrix, np.full(len(matrix), 1.0 / (1.0 + rate)))[0]
+        for rate in _IRR_BRACKET_GRID
+    ])
+
+    signs = np.sign(grid_values)
+    change = signs[:, :-1] * signs[:, 1:] <= 0
+    has_root = change.any(axis=1)
+    first = np.argmax(change, axis=1)
+
+    low = _IRR_BRACKET_GRID[first]
+    high = _IRR_BRACKET_GRID[first + 1]
+    low_value = grid_values[np.arange(len(matrix)), first]
+
+    for _ in range(max_iterations):
+        if np.all(high - low < tol):
+            break
+        mid = 0.5 * (low + high)
+        mid_value, _ = _horner_rows(matrix, 1.0 / (1.0 + mid))
+        same_side = np.sign(mid_value) == np.sign(low_value)
+        low = np.where(same_side, mid, low)
+        low_value = np.where(same_side, mid_value, low_value)
+        high = np.where(same_side, high, mid)
+
+    return np.where(has_root, 0.5 * (low + high), np.nan)
+
+
 # ============================================================================
 # DISCOUNT RATE CONVERSIONS
 # ============================================================================
@@ -629,6 +815,74 @@ def calculate_financial_ratios(financial_data: Dict[str, float]) -> Dict[str, Op
     return ratios
 
 
+def _safe_divide_array(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Element-wise safe_divide: NaN where denominator is 0."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(denominator != 0, numerator / denominator, np.nan)
+
+
+def calculate_financial_ratios_frame(financial_data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Calculate financial ratios for many statements at once.
+
+    Columnar counterpart of calculate_financial_ratios(): each row of
+    financial_data is one statement, columns use the same item names
+    (missing columns are treated as 0). Ratios that cannot be calculated
+    are NaN instead of None.
+
+    Args:
+        financial_data: DataFrame of financial statement items
+
+    Returns:
+        DataFrame of ratios with the same index as financial_data
+
+    Example:
+        >>> frame = pd.DataFrame({'current_assets': [150000, 0],
+        ...                       'current_liabilities': [100000, 0]})
+        >>> calculate_financial_ratios_frame(frame)['current_ratio'].tolist()
+        [1.5, nan]
+    """
+    def col(name: str) -> np.ndarray:
+        if name in financial_data:
+            return financial_data[name].to_numpy(dtype=float)
+        return np.zeros(len(financial_data))
+
+    current_assets = col('current_assets')
+    current_liabilities = col('current_liabilities')
+    total_liabilities = col('total_liabilities')
+    equity = col('shareholders_equity')
+    revenue = col('revenue')
+    net_income = col('net_income')
+    annual_rent = col('annual_rent')
+
+    ratios = {
+        # Liquidity Ratios
+        'current_ratio': _safe_divide_array(current_assets, current_liabilities),
+        'quick_ratio': _safe_divide_array(current_assets - col('inventory'), current_liabilities),
+        'cash_ratio': _safe_divide_array(col('cash_and_equivalents'), current_liabilities),
+
+        # Leverage Ratios
+        'debt_to_equity': _safe_divide_array(total_liabilities, equity),
+        'debt_to_assets': _safe_divide_array(total_liabilities, col('total_assets')),
+        'interest_coverage': _safe_divide_array(col('ebit'), col('interest_expense')),
+
+        # Profitability Ratios
+        'net_profit_margin': _safe_divide_array(net_income, revenue),
+        'roa': _safe_divide_array(net_income, col('total_assets')),
+        'roe': _safe_divide_array(net_income, equity),
+        'gross_margin': _safe_divide_array(col('gross_profit'), revenue),
+
+        # Rent Coverage Ratios (lease-specific)
+        'rent_to_revenue': _safe_divide_array(annual_rent, revenue),
+        'ebitda_to_rent': _safe_divide_array(col('ebitda'), annual_rent),
+
+        # Working Capital
+        'working_capital': current_assets - current_liabilities,
+    }
+
+    return pd.DataFrame(ratios, index=financial_data.index)
+
+
 # ============================================================================
 # STATISTICAL FUNCTIONS
 # ============================================================================
@@ -0,0 +1,541 @@
+#!/usr/bin/env python3
+"""
+Injurious Affection Utilities Module
+Provides corridor-wide construction impact (noise, dust, vibration, traffic)
+exposure and damages for thousands of frontage properties at once.
+
+The per-property rules follow the reference injurious affection calculator
+(calculate_injurious_affection() and its MarketParameters in
+docs/skills/injurious-affection-assessment/), generalized to receptor
+coordinates and a time-phased equipment schedule:
+- Noise from every active source is energy-summed with the background
+  level for each receptor and month (not the loudest source only)
+- Dust zone follows the nearest active dust-generating source each month
+- Vibration PPV attenuates with distance from each source's reference PPV
+- Traffic reduction applies to commercial receptors near active works
+
+Exposure is built from receptor × source × month arrays in receptor chunks
+(CORRIDOR_CHUNK_CELLS) so memory stays bounded for long corridors.
+
+Sources may be points or work-zone line segments. WorkZoneIndex (a
+KD-tree over short segment pieces) pairs receptors with the work zones
+within an impact radius without testing every receptor against every zone.
+
+Used by:
+- Shared_Utils/parcel_geometry_utils.py (WorkZoneIndex)
+- Eff_Rent_Calculator/Tests/test_injurious_affection_utils.py
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+
+# Market parameters (MarketParameters defaults in the reference calculator)
+INJURIOUS_AFFECTION_PARAMETERS = {
+    'residential_moderate_threshold_dba': 65.0,
+    'residential_severe_threshold_dba': 75.0,
+    'commercial_moderate_threshold_dba': 70.0,
+    'commercial_severe_threshold_dba': 80.0,
+    'industrial_threshold_dba': 85.0,
+    'residential_moderate_rent_reduction_pct': 0.075,
+    'residential_severe_rent_reduction_pct': 0.20,
+    'commercial_moderate_rent_reduction_pct': 0.055,
+    'commercial_severe_rent_reduction_pct': 0.125,
+    'residential_cleaning_cost': 200.0,
+    'commercial_cleaning_cost': 1000.0,
+    'high_impact_cleaning_frequency_weeks': 1,
+    'moderate_impact_cleaning_frequency_weeks': 2,
+    'low_impact_cleaning_frequency_weeks': 4,
+    'cosmetic_repair_cost_per_incident': 2500.0,
+    'structural_repair_multiplier': 10.0,
+    'sales_conversion_rate': 0.02,
+    'average_transaction_value': 50.0,
+    'gross_margin_pct': 0.40,
+    'capitalization_rate': 0.08
+}
+
+# Fixed rules of calculate_injurious_affection()
+INDUSTRIAL_RENT_REDUCTION_PCT = 0.03
+NIGHT_WORK_MULTIPLIER = 1.5          # Residential only
+MAX_RENT_REDUCTION_PCT = 0.30
+BUSINESS_NOISE_REVENUE_FACTOR = 0.5  # Revenue impact as share of rent reduction
+BUSINESS_GROSS_MARGIN = 0.40
+HEALTH_IMPACT_COST_PER_UNIT = 5000.0
+HEALTH_IMPACT_MIN_MONTHS = 6
+DEFAULT_BASELINE_TRAFFIC_DAILY = 1000.0
+COSMETIC_PPV_MMS = 5.0
+STRUCTURAL_PPV_MMS = 12.0
+WEEKS_PER_MONTH = 4.33
+DAYS_PER_MONTH = 30.42
+
+# Propagation
+NOISE_REFERENCE_DISTANCE_M = 15.0       # Equipment dBA quoted at 15 m; 6 dBA per doubling
+VIBRATION_REFERENCE_DISTANCE_M = 7.62   # PPV quoted at 25 ft
+VIBRATION_ATTENUATION_EXPONENT = 1.5    # PPV ∝ (D_ref / D)^1.5
+MIN_SOURCE_DISTANCE_M = 1.0             # Receptors closer than this are treated as at 1 m
+
+# Dust zone by distance to the nearest active dust-generating source
+DUST_ZONE_DISTANCES_M = {'high': 50.0, 'moderate': 150.0, 'low': 300.0}
+DUST_ZONES = list(DUST_ZONE_DISTANCES_M)
+
+# Commercial receptors within this distance of active works lose traffic
+TRAFFIC_IMPACT_DISTANCE_M = 100.0
+
+# Receptor × source × month cells per chunk
+CORRIDOR_CHUNK_CELLS = 4_000_000
+
+# Work-zone segments are indexed as pieces no longer than this
+SEGMENT_PIECE_M = 25.0
+
+SEGMENT_COLUMNS = ['x0', 'y0', 'x1', 'y1']
+
+RECEPTOR_DEFAULTS = {
+    'property_value': 0.0,
+    'rental_income_monthly': 0.0,
+    'number_of_units': 1,
+    'annual_revenue': 0.0,
+    'background_noise_dba': 50.0,
+    'visual_value_reduction_pct': 0.0
+}
+
+SOURCE_DEFAULTS = {
+    'dba_at_15m': 0.0,
+    'duty_cycle': 1.0,
+    'dust_generating': True,
+    'ppv_at_reference_mms': 0.0,
+    'traffic_reduction_pct': 0.0,
+    'night_work': False
+}
+
+
+def _column(frame: pd.DataFrame, name: str, defaults: Dict, dtype=float) -> np.ndarray:
+    if name in frame:
+        return frame[name].to_numpy(dtype=dtype)
+    if name in defaults:
+        return np.full(len(frame), defaults[name], dtype=dtype)
+    raise ValueError(f"Missing required column '{name}'")
+
+
+def _schedule_months(schedule: pd.DataFrame):
+    """Activity (sources × months, covered fraction) and per-month weights"""
+    start = _column(schedule, 'start_month', {})
+    duration = _column(schedule, 'duration_months', {})
+    if (start < 0).any() or (duration <= 0).any():
+        raise ValueError("start_month must be >= 0 and duration_months > 0")
+    if not np.array_equal(start, np.floor(start)):
+        raise ValueError("start_month must be a whole month")
+
+    months = int(np.ceil((start + duration).max())) if len(schedule) else 0
+    month = np.arange(months)[None, :]
+    end = (start + duration)[:, None]
+    coverage = np.clip(np.minimum(end, month + 1) - np.maximum(start[:, None], month), 0.0, 1.0)
+    # A month counts by the share of it that has any works (partial final months)
+    return coverage > 0, coverage.max(axis=0, initial=0.0)
+
+
+def _segments(frame: pd.DataFrame):
+    """Segment end points (x0, y0, x1, y1); point sources (x, y) are zero-length"""
+    if all(column in frame for column in SEGMENT_COLUMNS):
+        return tuple(frame[column].to_numpy(dtype=float) for column in SEGMENT_COLUMNS)
+    x, y = _column(frame, 'x', {}), _column(frame, 'y', {})
+    return x, y, x, y
+
+
+def _point_segment_distance(px, py, x0, y0, x1, y1) -> np.ndarray:
+    """Distance from points to segments (broadcasting)"""
+    dx, dy = x1 - x0, y1 - y0
+    length2 = dx * dx + dy * dy
+    projection = (px - x0) * dx + (py - y0) * dy
+    t = np.clip(np.divide(projection, length2, out=np.zeros(np.broadcast(projection, length2).shape),
+                          where=length2 > 0), 0.0, 1.0)
+    return np.hypot(px - (x0 + t * dx), py - (y0 + t * dy))
+
+
+class WorkZoneIndex:
+    """
+    Spatial index of work zones for receptor proximity queries.
+
+    Each zone is a line segment (x0, y0, x1, y1) or a point (x, y); several
+    rows may share a zone label to form a polyline. Segments are split into
+    pieces of at most piece_length_m and their midpoints held in a KD-tree:
+    a receptor within radius of a segment is within radius + half a piece of
+    some piece midpoint, so a sparse tree-to-tree query finds every
+    candidate pair and the exact point-to-segment distance filters them.
+    """
+
+    def __init__(
+        self,
+        zones: pd.DataFrame,
+        zone_column: Optional[str] = None,
+        piece_length_m: float = SEGMENT_PIECE_M
+    ):
+        """
+        Args:
+            zones: One row per segment or point
+            zone_column: Column labelling the zone of each row (default:
+                each row is its own zone, labelled by the index)
+            piece_length_m: Maximum indexed piece length (metres)
+        """
+        if piece_length_m <= 0:
+            raise ValueError(f"piece_length_m must be positive, got {piece_length_m}")
+        labels = zones[zone_column] if zone_column else zones.index.to_series()
+        self.zone_codes, self.zone_labels = pd.factorize(labels, sort=False)
+
+        x0, y0, x1, y1 = _segments(zones)
+        pieces = np.maximum(1, np.ceil(np.hypot(x1 - x0, y1 - y0) / piece_length_m)).astype(int)
+        segment = np.repeat(np.arange(len(zones)), pieces)
+        step = np.arange(len(segment)) - np.repeat(np.cumsum(pieces) - pieces, pieces)
+        t0, t1 = step / pieces[segment], (step + 1) / pieces[segment]
+
+        dx, dy = (x1 - x0)[segment], (y1 - y0)[segment]
+        self._pieces = (
+            x0[segment] + t0 * dx, y0[segment] + t0 * dy,
+            x0[segment] + t1 * dx, y0[segment] + t1 * dy
+        )
+        self._piece_zone = self.zone_codes[segment]
+        self._half_piece = float(np.hypot(dx / pieces[segment], dy / pieces[segment]).max(initial=0.0)) / 2
+        midpoints = np.column_stack([
+            (self._pieces[0] + self._pieces[2]) / 2, (self._pieces[1] + self._pieces[3]) / 2
+        ])
+        self._tree = cKDTree(midpoints) if len(midpoints) else None
+
+    def query(self, x, y, radius_m: float) -> pd.DataFrame:
+        """
+        Receptor-zone pairs within radius_m.
+
+        Args:
+            x, y: Receptor coordinates (metres, projected)
+            radius_m: Impact radius (metres)
+
+        Returns:
+            DataFrame with receptor (position), zone (code into zone_labels)
+            and distance_m (to the nearest point of the zone), sorted by
+            receptor then distance
+        """
+        x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        empty = pd.DataFrame({'receptor': np.array([], dtype=int), 'zone': np.array([], dtype=int),
+                              'distance_m': np.array([], dtype=float)})
+        if self._tree is None or not len(x):
+            return empty
+
+        pairs = cKDTree(np.column_stack([x, y])).sparse_distance_matrix(
+            self._tree, radius_m + self._half_piece, output_type='ndarray'
+        )
+        receptor, piece = pairs['i'].astype(int), pairs['j'].astype(int)
+        distance = _point_segment_distance(
+            x[receptor], y[receptor], *(coordinate[piece] for coordinate in self._pieces)
+        )
+        keep = distance <= radius_m
+        receptor, zone, distance = receptor[keep], self._piece_zone[piece[keep]], distance[keep]
+
+        # Nearest piece per receptor-zone pair
+        order = np.lexsort((distance, zone, receptor))
+        receptor, zone, distance = receptor[order], zone[order], distance[order]
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = (receptor[1:] != receptor[:-1]) | (zone[1:] != zone[:-1])
+        table = pd.DataFrame({'receptor': receptor[first], 'zone': zone[first], 'distance_m': distance[first]})
+        return table.sort_values(['receptor', 'distance_m'], kind='stable', ignore_index=True)
+
+
+def receptor_work_zone_distances(
+    receptors: pd.DataFrame,
+    zones: pd.DataFrame,
+    radius_m: float,
+    zone_column: Optional[str] = None,
+    nearest_only: bool = False
+) -> pd.DataFrame:
+    """
+    Per-receptor distance table to the work zones within an impact radius.
+
+    Args:
+        receptors: One row per property with x, y (metres, projected)
+        zones: Work zones (see WorkZoneIndex)
+        radius_m: Impact radius (metres)
+        zone_column: Column labelling the zone of each row
+        nearest_only: Keep only each receptor's nearest zone (e.g. as
+            distance_to_construction_m for calculate_injurious_affection())
+
+    Returns:
+        DataFrame with receptor and zone labels and distance_m, sorted by
+        receptor then distance; receptors with no zone in range are absent
+    """
+    index = WorkZoneIndex(zones, zone_column)
+    table = index.query(_column(receptors, 'x', {}), _column(receptors, 'y', {}), radius_m)
+    if nearest_only:
+        table = table.drop_duplicates('receptor', ignore_index=True)
+    return pd.DataFrame({
+        'receptor': receptors.index[table['receptor'].to_numpy()],
+        'zone': index.zone_labels[table['zone'].to_numpy()],
+        'distance_m': table['distance_m'].to_numpy()
+    })
+
+
+def corridor_exposure(
+    receptors: pd.DataFrame,
+    schedule: pd.DataFrame,
+    chunk_cells: int = CORRIDOR_CHUNK_CELLS,
+    impact_radius_m: Optional[float] = None
+) -> Dict:
+    """
+    Monthly noise, dust, vibration and traffic exposure for every receptor.
+
+    Args:
+        receptors: One row per property with x, y (metres, projected) and
+            optional background_noise_dba (default 50)
+        schedule: One row per source (equipment at a location or along a
+            work-zone segment for a period) with x, y (or x0, y0, x1, y1),
+            start_month (whole months from corridor start),
+            duration_months and optional dba_at_15m, duty_cycle (share of
+            the working day, weights noise energy), dust_generating,
+            ppv_at_reference_mms (at 7.62 m), traffic_reduction_pct and
+            night_work
+        chunk_cells: Receptor × source × month cells per chunk
+        impact_radius_m: Ignore sources farther than this; receptor-source
+            pairs then come from a WorkZoneIndex instead of all pairs
+
+    Returns:
+        Dict with (receptors × months) arrays noise_dba (energy sum of the
+        background and all active sources), dust_zone (index into
+        DUST_ZONES; len(DUST_ZONES) = no dust), traffic_reduction_pct and
+        night_work (residential night multiplier applies), the peak_ppv_mms
+        array (receptors) and month_weights (months)
+    """
+    active, month_weights = _schedule_months(schedule)
+    n_sources, months = active.shape
+    rx, ry = _column(receptors, 'x', {}), _column(receptors, 'y', {})
+    segments = _segments(schedule)
+    background = _column(receptors, 'background_noise_dba', RECEPTOR_DEFAULTS)
+
+    duty = np.clip(_column(schedule, 'duty_cycle', SOURCE_DEFAULTS), 0.0, 1.0)
+    dba_at_15m = _column(schedule, 'dba_at_15m', SOURCE_DEFAULTS)
+    ppv_reference = _column(schedule, 'ppv_at_reference_mms', SOURCE_DEFAULTS)
+    traffic = _column(schedule, 'traffic_reduction_pct', SOURCE_DEFAULTS)
+    dust_sources = _column(schedule, 'dust_generating', SOURCE_DEFAULTS, dtype=bool)
+    night = _column(schedule, 'night_work', SOURCE_DEFAULTS, dtype=bool)
+    active_f = active.astype(float)
+
+    n = len(receptors)
+    noise_dba = np.empty((n, months))
+    dust_zone = np.empty((n, months), dtype=np.int8)
+    traffic_reduction = np.empty((n, months))
+    night_work = np.empty((n, months), dtype=bool)
+    peak_ppv = np.empty(n)
+    zone_limits = np.array(list(DUST_ZONE_DISTANCES_M.values()))
+    moderate = INJURIOUS_AFFECTION_PARAMETERS['residential_moderate_threshold_dba']
+
+    if impact_radius_m is not None:
+        # Only receptor-source pairs within range, from the spatial index
+        pairs = WorkZoneIndex(schedule.reset_index(drop=True)).query(rx, ry, impact_radius_m)
+        receptor = pairs['receptor'].to_numpy()
+        source = pairs['zone'].to_numpy()
+        distance = np.maximum(pairs['distance_m'].to_numpy(), MIN_SOURCE_DISTANCE_M)
+
+        # Peak PPV over all sources in range
+        ppv = ppv_reference[source] * (VIBRATION_REFERENCE_DISTANCE_M / distance) ** VIBRATION_ATTENUATION_EXPONENT
+        peak_ppv[:] = 0.0
+        np.maximum.at(peak_ppv, receptor, ppv)
+
+        # Expand pairs over their sources' active months, in chunks of chunk_cells
+        source_months = [np.flatnonzero(row) for row in active]
+        month_counts = active.sum(axis=1)
+        month_offsets = np.concatenate([[0], np.cumsum(month_counts)])
+        all_months = np.concatenate(source_months) if n_sources else np.array([], dtype=int)
+        pair_cells = month_counts[source]
+
+        energy = np.zeros(n * months)
+        night_flags = np.zeros(n * months, dtype=bool)
+        dust_distance = np.full(n * months, np.inf)
+        traffic_flat = np.zeros(n * months)
+        bounds = np.searchsorted(np.cumsum(pair_cells), np.arange(0, pair_cells.sum(), chunk_cells), side='right')
+        for lo, hi in zip(bounds, list(bounds[1:]) + [len(source)]):
+            counts = pair_cells[lo:hi]
+            r = np.repeat(receptor[lo:hi], counts)
+            src = np.repeat(source[lo:hi], counts)
+            d = np.repeat(distance[lo:hi], counts)
+            within = np.arange(len(r)) - np.repeat(np.cumsum(counts) - counts, counts)
+            cell = r * months + all_months[month_offsets[src] + within]
+
+            level = np.maximum(0.0, dba_at_15m[src] - 6.0 * np.log2(d / NOISE_REFERENCE_DISTANCE_M))
+            energy += np.bincount(cell, weights=10.0 ** (level / 10.0) * duty[src], minlength=n * months)
+            night_flags[cell[(level >= moderate) & night[src]]] = True
+            dusty = dust_sources[src]
+            np.minimum.at(dust_distance, cell[dusty], d[dusty])
+            near = d <= TRAFFIC_IMPACT_DISTANCE_M
+            np.maximum.at(traffic_flat, cell[near], traffic[src[near]])
+
+        noise_dba[:] = 10.0 * np.log10(energy.reshape(n, months) + 10.0 ** (background[:, None] / 10.0))
+        night_work[:] = night_flags.reshape(n, months)
+        dust_zone[:] = np.searchsorted(zone_limits, dust_distance.reshape(n, months), side='left')
+        traffic_reduction[:] = traffic_flat.reshape(n, months)
+    else:
+        chunk = max(1, chunk_cells // max(n_sources * months, 1))
+        for lo in range(0, n, chunk):
+            rows = slice(lo, min(lo + chunk, n))
+            distance = np.maximum(_point_segment_distance(
+                rx[rows, None], ry[rows, None], *(coordinate[None, :] for coordinate in segments)
+            ), MIN_SOURCE_DISTANCE_M)
+
+            # Noise: 6 dBA per doubling from 15 m, energy-summed over active sources
+            level = np.maximum(0.0, dba_at_15m - 6.0 * np.log2(distance / NOISE_REFERENCE_DISTANCE_M))
+            energy = (10.0 ** (level / 10.0) * duty) @ active_f
+            noise_dba[rows] = 10.0 * np.log10(energy + 10.0 ** (background[rows, None] / 10.0))
+            # Night work counts where a night source alone reaches the moderate threshold
+            night_work[rows] = ((level >= moderate) & night) @ active_f > 0
+
+            # Dust / traffic: nearest active source per month (receptor × source × month)
+            near = np.where(active[None, :, :], distance[:, :, None], np.inf)
+            dust_distance = np.where(dust_sources[None, :, None], near, np.inf).min(axis=1)
+            dust_zone[rows] = np.searchsorted(zone_limits, dust_distance, side='left')
+            traffic_reduction[rows] = np.where(
+                near <= TRAFFIC_IMPACT_DISTANCE_M, traffic[None, :, None], 0.0
+            ).max(axis=1, initial=0.0)
+
+            # Vibration: peak PPV over all sources
+            ppv = ppv_reference * (VIBRATION_REFERENCE_DISTANCE_M / distance) ** VIBRATION_ATTENUATION_EXPONENT
+            peak_ppv[rows] = ppv.max(axis=1, initial=0.0)
+
+    return {
+        'noise_dba': noise_dba,
+        'dust_zone': dust_zone,
+        'traffic_reduction_pct': traffic_reduction,
+        'night_work': night_work,
+        'peak_ppv_mms': peak_ppv,
+        'month_weights': month_weights
+    }
+
+
+def corridor_injurious_affection(
+    receptors: pd.DataFrame,
+    schedule: pd.DataFrame,
+    params: Optional[Dict] = None,
+    chunk_cells: int = CORRIDOR_CHUNK_CELLS,
+    impact_radius_m: Optional[float] = None
+) -> pd.DataFrame:
+    """
+    Injurious affection damages for every property along a corridor.
+
+    Vectorized corridor mode of calculate_injurious_affection(): the same
+    rent-reduction, cleaning, repair, lost-traffic and business-loss rules
+    applied month by month to corridor_exposure().
+
+    Args:
+        receptors: One row per property with x, y, property_type
+            ('residential', 'commercial', 'industrial') and optional
+            property_value, rental_income_monthly, number_of_units,
+            annual_revenue, background_noise_dba and
+            visual_value_reduction_pct (permanent)
+        schedule: Time-phased equipment schedule (see corridor_exposure())
+        params: Overrides of INJURIOUS_AFFECTION_PARAMETERS
+            (e.g. asdict(MarketParameters(...)))
+        chunk_cells: Receptor × source × month cells per chunk
+        impact_radius_m: Ignore sources farther than this (see corridor_exposure())
+
+    Returns:
+        DataFrame on the receptors index with peak_noise_dba, noise_months,
+        noise_damage, dust_cleanings, dust_damage, peak_ppv_mms,
+        vibration_threshold, vibration_damage, traffic_damage,
+        business_loss, total_temporary_damages, total_permanent_damages and
+        total_injurious_affection
+    """
+    p = {**INJURIOUS_AFFECTION_PARAMETERS, **(params or {})}
+    exposure = corridor_exposure(receptors, schedule, chunk_cells, impact_radius_m)
+    noise, weights = exposure['noise_dba'], exposure['month_weights']
+
+    property_type = receptors['property_type'].to_numpy() if 'property_type' in receptors else None
+    if property_type is None:
+        raise ValueError("Missing required column 'property_type'")
+    unknown = set(property_type) - {'residential', 'commercial', 'industrial'}
+    if unknown:
+        raise ValueError(f"Unknown property_type: {sorted(unknown)}")
+    residential = (property_type == 'residential')[:, None]
+    commercial = (property_type == 'commercial')[:, None]
+    industrial = (property_type == 'industrial')[:, None]
+
+    units = _column(receptors, 'number_of_units', RECEPTOR_DEFAULTS)
+    rent = _column(receptors, 'rental_income_monthly', RECEPTOR_DEFAULTS)
+    revenue = _column(receptors, 'annual_revenue', RECEPTOR_DEFAULTS)
+
+    # Noise: rent reduction per receptor-month by property type
+    night = np.where(exposure['night_work'], NIGHT_WORK_MULTIPLIER, 1.0)
+    rent_reduction = np.select(
+        [
+            residential & (noise >= p['residential_severe_threshold_dba']),
+            residential & (noise >= p['residential_moderate_threshold_dba']),
+            commercial & (noise >= p['commercial_severe_threshold_dba']),
+            commercial & (noise >= p['commercial_moderate_threshold_dba']),
+            industrial & (noise >= p['industrial_threshold_dba'])
+        ],
+        [
+            p['residential_severe_rent_reduction_pct'] * night,
+            p['residential_moderate_rent_reduction_pct'] * night,
+            p['commercial_severe_rent_reduction_pct'],
+            p['commercial_moderate_rent_reduction_pct'],
+            INDUSTRIAL_RENT_REDUCTION_PCT
+        ],
+        0.0
+    )
+    rent_reduction = np.minimum(rent_reduction, MAX_RENT_REDUCTION_PCT)
+    noise_damage = rent * units * (rent_reduction @ weights)
+    business_loss = (
+        revenue / 12 * BUSINESS_NOISE_REVENUE_FACTOR * BUSINESS_GROSS_MARGIN * (rent_reduction @ weights)
+    )
+
+    # Dust: cleanings per zone over the months spent in it
+    frequency = np.array([p[f'{zone}_impact_cleaning_frequency_weeks'] for zone in DUST_ZONES], dtype=float)
+    zone_months = np.stack(
+        [(exposure['dust_zone'] == z) @ weights for z in range(len(DUST_ZONES))], axis=1
+    )
+    cleanings = np.floor(zone_months * WEEKS_PER_MONTH / frequency + 1e-9).astype(int).sum(axis=1)
+    cleaning_cost = np.where(residential[:, 0], p['residential_cleaning_cost'], p['commercial_cleaning_cost'])
+    health = np.where(
+        residential[:, 0] & (zone_months[:, 0] >= HEALTH_IMPACT_MIN_MONTHS), HEALTH_IMPACT_COST_PER_UNIT * units, 0.0
+    )
+    dust_damage = cleaning_cost * cleanings * units + health
+
+    # Vibration: one repair per receptor at its peak PPV
+    ppv = exposure['peak_ppv_mms']
+    cosmetic = p['cosmetic_repair_cost_per_incident']
+    vibration_damage = np.select(
+        [ppv >= STRUCTURAL_PPV_MMS, ppv >= COSMETIC_PPV_MMS],
+        [cosmetic * p['structural_repair_multiplier'], cosmetic], 0.0
+    )
+
+    # Traffic: lost profit for commercial receptors
+    baseline_traffic = np.where(
+        revenue > 0,
+        revenue / 365 / p['average_transaction_value'] / p['sales_conversion_rate'],
+        DEFAULT_BASELINE_TRAFFIC_DAILY
+    )
+    lost_profit_daily = (
+        baseline_traffic * p['sales_conversion_rate'] * p['average_transaction_value'] * p['gross_margin_pct']
+    )
+    traffic_damage = np.where(
+        commercial[:, 0], lost_profit_daily * DAYS_PER_MONTH * (exposure['traffic_reduction_pct'] @ weights), 0.0
+    )
+
+    temporary = noise_damage + dust_damage + vibration_damage + traffic_damage + business_loss
+    permanent = (
+        _column(receptors, 'property_value', RECEPTOR_DEFAULTS)
+        * _column(receptors, 'visual_value_reduction_pct', RECEPTOR_DEFAULTS)
+    )
+
+    return pd.DataFrame({
+        'peak_noise_dba': noise.max(axis=1, initial=0.0),
+        'noise_months': (rent_reduction > 0) @ weights,
+        'noise_damage': noise_damage,
+        'dust_cleanings': cleanings,
+        'dust_damage': dust_damage,
+        'peak_ppv_mms': ppv,
+        'vibration_threshold': np.select(
+            [ppv >= STRUCTURAL_PPV_MMS, ppv >= COSMETIC_PPV_MMS], ['structural', 'cosmetic'], 'none'
+        ),
+        'vibration_damage': vibration_damage,
+        'traffic_damage': traffic_damage,
+        'business_loss': business_loss,
+        'total_temporary_damages': temporary,
+        'total_permanent_damages': permanent,
+        'total_injurious_affection': temporary + permanent
+    }, index=receptors.index)
@@ -4,6 +4,10 @@ Land Assembly Utilities Module
 Provides shared functions for multi-parcel corridor acquisition budgeting,
 phasing strategy, cost of delay analysis, and resource allocation.
 
+LandAssemblyOptimizer jointly schedules parcels onto negotiator capacity
+and phases (priority-queue list scheduler minimizing cost of delay plus
+holdout risk) and re-plans incrementally as parcels close.
+
 Used by:
 - land_assembly_calculator.py
 - negotiation_strategy_planner.py
@@ -12,8 +16,17 @@ Used by:
 
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
+from collections import defaultdict
+from bisect import bisect_right
+import heapq
 import statistics
 
+import numpy as np
+
+
+# Negotiation duration multipliers by parcel complexity
+COMPLEXITY_DURATION_FACTORS = {'low': 0.75, 'medium': 1.0, 'high': 1.5}
+
 
 def calculate_phasing_strategy(
     parcels: List[Dict],
@@ -22,6 +35,9 @@ def calculate_phasing_strategy(
     """
     Determine acquisition phasing (critical parcels first, parallel tracks).
 
+    Fixed-percentage phases without capacity limits; LandAssemblyOptimizer
+    schedules phases against negotiator capacity and delay cost.
+
     Args:
         parcels: List of parcel dicts
             [
@@ -496,3 +512,380 @@ def contingency_budget(
         'contingency_percentage': round((total_contingency / base_value) * 100, 1) if base_value > 0 else 0,
         'expected_litigation_parcels': round(expected_litigation_parcels, 1)
     }
+
+
+class _BudgetQueue:
+    """
+    Pending parcels by priority key, popped under a value cap.
+
+    A min segment tree over the parcels sorted by value: pop(cap) returns
+    the highest-priority parcel with value <= cap in O(log n), so parcels
+    that do not fit a phase's remaining budget are never rescanned.
+    """
+
+    _EMPTY = (2, 0.0, -1)
+
+    def __init__(self, entries: List[Tuple], values: np.ndarray):
+        entries = sorted(entries, key=lambda entry: values[entry[2]])
+        self.values = [float(values[entry[2]]) for entry in entries]
+        self.size = len(entries)
+        self.count = len(entries)
+        self.tree = [self._EMPTY] * self.size + entries
+        for node in range(self.size - 1, 0, -1):
+            self.tree[node] = min(self.tree[2 * node], self.tree[2 * node + 1])
+
+    def __len__(self) -> int:
+        return self.count
+
+    def pop(self, cap: float) -> Optional[int]:
+        """Remove and return the best parcel index with value <= cap (None if none fits)"""
+        tree = self.tree
+        best, best_node = self._EMPTY, 0
+        lo, hi = self.size, self.size + bisect_right(self.values, cap)
+        while lo < hi:
+            if lo & 1:
+                if tree[lo] < best:
+                    best, best_node = tree[lo], lo
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                if tree[hi] < best:
+                    best, best_node = tree[hi], hi
+            lo >>= 1
+            hi >>= 1
+        if best is self._EMPTY:
+            return None
+
+        node = best_node
+        while node < self.size:
+            node = 2 * node if tree[2 * node] == best else 2 * node + 1
+        tree[node] = self._EMPTY
+        node >>= 1
+        while node:
+            tree[node] = min(tree[2 * node], tree[2 * node + 1])
+            node >>= 1
+        self.count -= 1
+        return best[2]
+
+
+class LandAssemblyOptimizer:
+    """
+    Joint parcel phasing and negotiator assignment for corridor assemblies.
+
+    Each parcel accrues a daily delay cost until it closes:
+
+        value × (interest_rate + holdout_risk × holdout_escalation) / 365
+
+    (carrying cost plus the expected growth of a holdout premium), and
+    construction cannot start until every critical parcel has closed, so
+    each day past target_completion_days costs construction_cost_per_day +
+    revenue_loss_per_day.
+
+    Negotiator capacity is negotiators × parcels_per_negotiator concurrent
+    cases. A list scheduler assigns the next free case slot to the
+    highest-priority pending parcel: critical parcels first, then by delay
+    cost per negotiation day (Smith's rule, optimal for a single
+    negotiator). Phases are phase_days windows of negotiation start, with
+    an optional cap on the estimated value committed per phase.
+
+    close_parcel() records an actual closing and re-plans only parcels that
+    have not started; closed and in-progress parcels keep their slots and
+    budget. Scheduling is O(n log n), plus one slot-heap push per slot and
+    phase skipped when nothing pending fits that phase's budget, so
+    thousands of parcels re-plan in milliseconds.
+
+    Usage:
+        optimizer = LandAssemblyOptimizer(parcels, resources, project_impact)
+        plan = optimizer.plan()
+        plan = optimizer.close_parcel('P014', day=75)
+    """
+
+    def __init__(
+        self,
+        parcels: List[Dict],
+        resources: Dict,
+        project_impact: Dict,
+        phase_days: float = 90,
+        budget_per_phase: Optional[float] = None
+    ):
+        """
+        Args:
+            parcels: List of parcel dicts (calculate_phasing_strategy() format)
+                [
+                    {
+                        'id': 'P001',
+                        'estimated_value': 500000,
+                        'criticality': 'critical',   # critical/high/medium/low
+                        'complexity': 'medium',      # low/medium/high
+                        'holdout_risk': 0.4,
+                        'negotiation_days': 45       # optional override
+                    },
+                    ...
+                ]
+            resources: Dict with negotiator capacity
+                {
+                    'negotiators': 5,
+                    'parcels_per_negotiator': 2,        # concurrent caseload
+                    'negotiation_days_per_parcel': 30   # scaled by complexity
+                }
+            project_impact: Dict with delay cost parameters (cost_of_delay() format)
+                {
+                    'interest_rate': 0.05,
+                    'holdout_escalation': 0.10,         # annual holdout premium growth
+                    'construction_cost_per_day': 50000,
+                    'revenue_loss_per_day': 25000,
+                    'target_completion_days': 180       # critical parcels due
+                }
+            phase_days: Length of each acquisition phase in days (default 90)
+            budget_per_phase: Max estimated value committed per phase (optional)
+
+        Raises:
+            ValueError: If capacity, durations or the phase budget are invalid
+        """
+        if phase_days <= 0:
+            raise ValueError(f"phase_days must be positive, got {phase_days}")
+        negotiators = resources.get('negotiators', 1)
+        caseload = resources.get('parcels_per_negotiator', 1)
+        if negotiators < 1 or caseload < 1:
+            raise ValueError("negotiators and parcels_per_negotiator must be >= 1")
+
+        self.parcel_ids = [parcel['id'] for parcel in parcels]
+        self.index = {parcel_id: i for i, parcel_id in enumerate(self.parcel_ids)}
+        if len(self.index) != len(self.parcel_ids):
+            raise ValueError("Parcel ids must be unique")
+        self.n_parcels = len(parcels)
+        self.caseload = int(caseload)
+        self.n_slots = int(negotiators) * self.caseload
+        self.phase_days = float(phase_days)
+        self.budget_per_phase = budget_per_phase
+
+        default_days = resources.get('negotiation_days_per_parcel', 30)
+        self.values = np.array([p.get('estimated_value', 0) for p in parcels], dtype=float)
+        self.durations = np.array([
+            p.get('negotiation_days', default_days * COMPLEXITY_DURATION_FACTORS.get(p.get('complexity', 'medium'), 1.0))
+            for p in parcels
+        ], dtype=float)
+        if np.any(self.durations <= 0):
+            raise ValueError("Negotiation durations must be positive")
+        if budget_per_phase is not None and np.any(self.values > budget_per_phase):
+            too_large = [self.parcel_ids[i] for i in np.flatnonzero(self.values > budget_per_phase)][:5]
+            raise ValueError(f"Parcels {too_large} exceed budget_per_phase on their own")
+
+        holdout_risk = np.array([p.get('holdout_risk', 0.3) for p in parcels], dtype=float)
+        self.daily_cost = self.values * (
+            project_impact.get('interest_rate', 0.05) +
+            holdout_risk * project_impact.get('holdout_escalation', 0.10)
+        ) / 365
+        self.critical = np.array([p.get('criticality') == 'critical' for p in parcels], dtype=bool)
+        self.gate_cost_per_day = (
+            project_impact.get('construction_cost_per_day', 50000) +
+            project_impact.get('revenue_loss_per_day', 0)
+        )
+        self.target_completion_days = project_impact.get('target_completion_days', 0)
+
+        # Heap keys: critical first, then highest delay cost per negotiation day
+        ratio = self.daily_cost / self.durations
+        self._priority = [
+            (0 if critical else 1, -r, i)
+            for i, (critical, r) in enumerate(zip(self.critical.tolist(), ratio.tolist()))
+        ]
+
+        self.start_day = np.full(self.n_parcels, np.nan)
+        self.finish_day = np.full(self.n_parcels, np.nan)
+        self.slot = np.full(self.n_parcels, -1, dtype=np.int64)
+        self.closed = np.zeros(self.n_parcels, dtype=bool)
+        self.current_day = 0.0
+        self._schedule(0.0)
+
+    def _schedule(self, day: float) -> None:
+        """List-schedule every parcel not closed or in progress at day"""
+        in_progress = ~self.closed & (self.start_day < day)
+        self.finish_day[in_progress] = np.maximum(self.finish_day[in_progress], day)
+
+        spend = defaultdict(float)
+        committed = self.closed | in_progress
+        for i in np.flatnonzero(committed):
+            spend[int(self.start_day[i] // self.phase_days)] += self.values[i]
+
+        slot_free = np.full(self.n_slots, day)
+        busy = in_progress & (self.slot >= 0)
+        np.maximum.at(slot_free, self.slot[busy], self.finish_day[busy])
+        slots = [(free, s) for s, free in enumerate(slot_free.tolist())]
+        heapq.heapify(slots)
+
+        values = self.values
+        pending = _BudgetQueue([self._priority[i] for i in np.flatnonzero(~committed)], values)
+        budget = np.inf if self.budget_per_phase is None else self.budget_per_phase
+
+        while pending:
+            time, s = heapq.heappop(slots)
+            phase = int(time // self.phase_days)
+            i = pending.pop(budget - spend[phase])
+            if i is None:
+                # Nothing fits this phase's budget: wait for the next phase
+                heapq.heappush(slots, ((phase + 1) * self.phase_days, s))
+                continue
+
+            self.start_day[i] = time
+            self.finish_day[i] = time + self.durations[i]
+            self.slot[i] = s
+            spend[phase] += values[i]
+            heapq.heappush(slots, (self.finish_day[i], s))
+
+    def close_parcel(self, parcel_id: str, day: float) -> Dict:
+        """
+        Record a parcel closing on day and re-plan parcels not yet started.
+
+        Parcels still in progress whose planned finish has passed are
+        assumed to close no earlier than day.
+
+        Returns:
+            Updated plan (see plan())
+
+        Raises:
+            ValueError: If the parcel is unknown or already closed, or day is
+                before the last recorded closing
+        """
+        if parcel_id not in self.index:
+            raise ValueError(f"Unknown parcel {parcel_id!r}")
+        i = self.index[parcel_id]
+        if self.closed[i]:
+            raise ValueError(f"Parcel {parcel_id!r} is already closed")
+        if day < self.current_day:
+            raise ValueError(f"Closing day {day} is before the last recorded closing ({self.current_day})")
+
+        if not self.start_day[i] < day:
+            # Closed without negotiation (e.g. voluntary sale)
+            self.start_day[i] = day
+            self.slot[i] = -1
+        self.finish_day[i] = day
+        self.closed[i] = True
+        self.current_day = float(day)
+        self._schedule(self.current_day)
+        return self.plan()
+
+    @property
+    def makespan(self) -> float:
+        return float(self.finish_day.max()) if self.n_parcels else 0.0
+
+    @property
+    def critical_completion_day(self) -> float:
+        return float(self.finish_day[self.critical].max()) if self.critical.any() else 0.0
+
+    def delay_cost(self) -> Dict:
+        """Cost of delay of the current plan (carrying + holdout, critical gate)"""
+        parcel_cost = float(self.daily_cost @ self.finish_day) if self.n_parcels else 0.0
+        gate_days = max(self.critical_completion_day - self.target_completion_days, 0.0)
+        gate_cost = gate_days * self.gate_cost_per_day
+        return {
+            'carrying_and_holdout_cost': round(parcel_cost, 2),
+            'critical_delay_days': round(gate_days, 1),
+            'critical_delay_cost': round(gate_cost, 2),
+            'total_delay_cost': round(parcel_cost + gate_cost, 2)
+        }
+
+    def plan(self) -> Dict:
+        """
+        Current acquisition plan.
+
+        Returns:
+            Dict containing the plan
+                {
+                    'assignments': {
+                        'P001': {'negotiator': 0, 'start_day': 0, 'finish_day': 30,
+                                 'phase': 1, 'status': 'in_progress'},
+                        ...
+                    },
+                    'phases': [
+                        {'phase': 1, 'start_day': 0, 'end_day': 90, 'parcels': [...],
+                         'count': 24, 'committed_value': 9800000, 'critical_count': 6},
+                        ...
+                    ],
+                    'negotiator_workload': {0: {'parcels': 12, 'busy_days': 410, 'utilization': 0.82}, ...},
+                    'makespan_days': 540,
+                    'critical_completion_day': 150,
+                    'cost': {...},          # delay_cost()
+                    'num_parcels': 800,
+                    'num_closed': 12
+                }
+        """
+        phase = (self.start_day // self.phase_days).astype(np.int64)
+        status = np.where(
+            self.closed, 'closed',
+            np.where(self.start_day < self.current_day, 'in_progress', 'planned')
+        )
+        negotiator = np.where(self.slot >= 0, self.slot // self.caseload, -1)
+
+        assignments = {}
+        columns = zip(
+            self.parcel_ids, negotiator.tolist(), self.start_day.tolist(),
+            self.finish_day.tolist(), phase.tolist(), status.tolist()
+        )
+        for parcel_id, neg, start, finish, ph, st in columns:
+            assignments[parcel_id] = {
+                'negotiator': neg if neg >= 0 else None,
+                'start_day': round(start, 1),
+                'finish_day': round(finish, 1),
+                'phase': ph + 1,
+                'status': st
+            }
+
+        phases = []
+        order = np.lexsort((self.start_day, phase))
+        bounds = np.flatnonzero(np.concatenate(([True], np.diff(phase[order]) != 0, [True])))
+        for lo, hi in zip(bounds[:-1], bounds[1:]) if self.n_parcels else ():
+            members = order[lo:hi]
+            ph = int(phase[members[0]])
+            phases.append({
+                'phase': ph + 1,
+                'start_day': round(ph * self.phase_days, 1),
+                'end_day': round((ph + 1) * self.phase_days, 1),
+                'parcels': [self.parcel_ids[i] for i in members],
+                'count': len(members),
+                'committed_value': round(float(self.values[members].sum()), 2),
+                'critical_count': int(self.critical[members].sum())
+            })
+
+        makespan = self.makespan
+        busy = np.bincount(negotiator[negotiator >= 0], weights=(self.finish_day - self.start_day)[negotiator >= 0],
+                           minlength=self.n_slots // self.caseload)
+        count = np.bincount(negotiator[negotiator >= 0], minlength=self.n_slots // self.caseload)
+        workload = {
+            n: {
+                'parcels': int(count[n]),
+                'busy_days': round(float(busy[n]), 1),
+                'utilization': round(float(busy[n]) / (self.caseload * makespan), 3) if makespan > 0 else 0
+            }
+            for n in range(len(count))
+        }
+
+        return {
+            'assignments': assignments,
+            'phases': phases,
+            'negotiator_workload': workload,
+            'makespan_days': round(makespan, 1),
+            'critical_completion_day': round(self.critical_completion_day, 1),
+            'cost': self.delay_cost(),
+            'num_parcels': self.n_parcels,
+            'num_closed': int(self.closed.sum())
+        }
+
+
+def optimize_land_assembly(
+    parcels: List[Dict],
+    resources: Dict,
+    project_impact: Dict,
+    phase_days: float = 90,
+    budget_per_phase: Optional[float] = None
+) -> Dict:
+    """
+    Jointly assign parcels to phases and negotiator capacity.
+
+    Convenience wrapper around LandAssemblyOptimizer (use the class directly
+    to re-plan as parcels close). See LandAssemblyOptimizer for the cost
+    model and argument formats.
+
+    Returns:
+        Dict containing the acquisition plan (LandAssemblyOptimizer.plan())
+    """
+    return LandAssemblyOptimizer(parcels, resources, project_impact, phase_days, budget_per_phase).plan()
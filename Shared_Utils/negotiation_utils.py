@@ -4,15 +4,35 @@ Negotiation Utilities Module
 Provides shared functions for negotiation analysis, BATNA/ZOPA calculations,
 and settlement strategy optimization.
 
+calculate_batna_frame(), probability_weighted_ev_frame() and
+optimal_settlement_range_frame() are columnar counterparts for whole parcel
+portfolios (e.g. scored with risk_utils.score_risk_portfolio()).
+SettlementTree evaluates offer → counter → hearing decision trees for every
+parcel at once.
+
 Used by:
 - negotiation_settlement_calculator.py
 - settlement_analyzer.py
 - negotiation_strategy_planner.py
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 import statistics
 
+import numpy as np
+import pandas as pd
+
+from .risk_utils import monte_carlo_samples
+
+
+# Hearing award outcomes and cost items used by calculate_batna()
+HEARING_OUTCOMES = ['low_award', 'mid_award', 'high_award']
+HEARING_COST_ITEMS = ['legal_fees', 'expert_fees', 'time_cost']
+
+# Monte Carlo defaults for SettlementTree (samples per leaf; cells per chunk)
+TREE_ITERATIONS = 2000
+TREE_CHUNK_CELLS = 2_000_000
+
 
 def calculate_batna(
     hearing_probabilities: Dict[str, float],
@@ -54,13 +74,13 @@ def calculate_batna(
     # Calculate expected award
     expected_award = sum(
         hearing_probabilities.get(outcome, 0) * hearing_costs.get(f"{outcome}_amount", 0)
-        for outcome in ['low_award', 'mid_award', 'high_award']
+        for outcome in HEARING_OUTCOMES
     )
 
     # Calculate total costs
     total_costs = sum(
         hearing_costs.get(cost, 0)
-        for cost in ['legal_fees', 'expert_fees', 'time_cost']
+        for cost in HEARING_COST_ITEMS
     )
 
     # Net BATNA is total expected cost to buyer (award + costs)
@@ -69,11 +89,11 @@ def calculate_batna(
     # Calculate variance (risk measure)
     award_amounts = [
         hearing_costs.get(f"{outcome}_amount", 0)
-        for outcome in ['low_award', 'mid_award', 'high_award']
+        for outcome in HEARING_OUTCOMES
     ]
     probabilities = [
         hearing_probabilities.get(outcome, 0)
-        for outcome in ['low_award', 'mid_award', 'high_award']
+        for outcome in HEARING_OUTCOMES
     ]
 
     # Weighted variance
@@ -103,6 +123,44 @@ def calculate_batna(
     }
 
 
+def calculate_batna_frame(hearings: pd.DataFrame) -> pd.DataFrame:
+    """
+    BATNA for many parcels at once.
+
+    Columnar counterpart of calculate_batna(): each row is one parcel, with
+    outcome probability columns (low_award, mid_award, high_award), award
+    amount columns (low_award_amount, ...) and cost columns (legal_fees,
+    expert_fees, time_cost). Missing columns are treated as 0.
+
+    Args:
+        hearings: DataFrame of hearing probabilities, awards and costs
+
+    Returns:
+        DataFrame with expected_award, total_costs, net_batna,
+        standard_deviation and coefficient_of_variation, on the same index
+    """
+    def col(name: str) -> np.ndarray:
+        if name in hearings:
+            return hearings[name].to_numpy(dtype=float)
+        return np.zeros(len(hearings))
+
+    probabilities = np.column_stack([col(outcome) for outcome in HEARING_OUTCOMES])
+    awards = np.column_stack([col(f"{outcome}_amount") for outcome in HEARING_OUTCOMES])
+    expected_award = np.einsum('ij,ij->i', probabilities, awards)
+    total_costs = sum(col(item) for item in HEARING_COST_ITEMS)
+    std_dev = np.sqrt(np.einsum('ij,ij->i', probabilities, (awards - expected_award[:, None]) ** 2))
+
+    return pd.DataFrame({
+        'expected_award': expected_award,
+        'total_costs': total_costs,
+        'net_batna': expected_award + total_costs,
+        'standard_deviation': std_dev,
+        'coefficient_of_variation': np.divide(
+            std_dev, expected_award, out=np.zeros(len(hearings)), where=expected_award > 0
+        )
+    }, index=hearings.index)
+
+
 def calculate_zopa(buyer_max: float, seller_min: float) -> Dict:
     """
     Calculate Zone of Possible Agreement.
@@ -226,6 +284,63 @@ def probability_weighted_ev(scenarios: List[Dict]) -> Dict:
     }
 
 
+def probability_weighted_ev_frame(
+    costs: np.ndarray,
+    probabilities: np.ndarray,
+    names: Optional[Sequence[str]] = None,
+    index: Optional[pd.Index] = None
+) -> pd.DataFrame:
+    """
+    Probability-weighted expected cost for many parcels at once.
+
+    Columnar counterpart of probability_weighted_ev(): row i holds parcel
+    i's scenario costs and probabilities (parcels × scenarios).
+
+    Args:
+        costs: (parcels × scenarios) scenario costs
+        probabilities: (parcels × scenarios) scenario probabilities
+        names: Scenario names (default 'scenario_0', ...)
+        index: Index for the result (e.g. the risk portfolio index)
+
+    Returns:
+        DataFrame with expected_value, variance, std_dev,
+        coefficient_of_variation, range, best_case and worst_case
+        (scenario names)
+
+    Raises:
+        ValueError: If shapes differ or a row's probabilities do not sum to 1
+    """
+    costs = np.atleast_2d(np.asarray(costs, dtype=float))
+    probabilities = np.atleast_2d(np.asarray(probabilities, dtype=float))
+    if costs.shape != probabilities.shape:
+        raise ValueError(f"costs {costs.shape} and probabilities {probabilities.shape} must have the same shape")
+    names = list(names) if names is not None else [f'scenario_{j}' for j in range(costs.shape[1])]
+    if len(names) != costs.shape[1]:
+        raise ValueError(f"Expected {costs.shape[1]} scenario names, got {len(names)}")
+
+    total = probabilities.sum(axis=1)
+    invalid = np.flatnonzero(np.abs(total - 1.0) > 0.01)
+    if len(invalid):
+        raise ValueError(
+            f"Probabilities must sum to 1.0; rows {invalid[:5].tolist()} sum to {total[invalid[:5]].round(4).tolist()}"
+        )
+
+    expected = np.einsum('ij,ij->i', costs, probabilities)
+    variance = np.einsum('ij,ij->i', probabilities, (costs - expected[:, None]) ** 2)
+    std_dev = np.sqrt(variance)
+    names = np.array(names, dtype=object)
+
+    return pd.DataFrame({
+        'expected_value': expected,
+        'variance': variance,
+        'std_dev': std_dev,
+        'coefficient_of_variation': np.divide(std_dev, expected, out=np.zeros(len(expected)), where=expected > 0),
+        'range': costs.max(axis=1) - costs.min(axis=1),
+        'best_case': names[costs.argmin(axis=1)],
+        'worst_case': names[costs.argmax(axis=1)]
+    }, index=index)
+
+
 def hearing_cost_benefit(
     settlement_offer: float,
     hearing_ev: float,
@@ -363,6 +478,58 @@ def optimal_settlement_range(
     }
 
 
+def optimal_settlement_range_frame(
+    batna,
+    buyer_max,
+    seller_min,
+    confidence: float = 0.8,
+    index: Optional[pd.Index] = None
+) -> pd.DataFrame:
+    """
+    Optimal settlement ranges for many parcels at once.
+
+    Columnar counterpart of calculate_zopa() + optimal_settlement_range().
+    Parcels without a ZOPA get zopa_exists=False and NaN range values.
+
+    Args:
+        batna: Net BATNA per parcel (array or Series)
+        buyer_max: Buyer maximum per parcel
+        seller_min: Seller minimum per parcel
+        confidence: Confidence level for range (0.0 to 1.0)
+        index: Index for the result (default: batna's index if a Series)
+
+    Returns:
+        DataFrame with zopa_exists, target, floor, ceiling, opening_offer,
+        walkaway and zopa_utilization
+    """
+    if index is None and isinstance(batna, pd.Series):
+        index = batna.index
+    batna, buyer_max, seller_min = np.broadcast_arrays(
+        *(np.asarray(values, dtype=float) for values in (batna, buyer_max, seller_min))
+    )
+    exists = buyer_max >= seller_min
+    zopa_range = buyer_max - seller_min
+    adjustment = zopa_range * (1 - confidence) / 2
+    target = (buyer_max + seller_min) / 2
+    floor = target - adjustment
+    ceiling = target + adjustment
+
+    def where_zopa(values):
+        return np.where(exists, values, np.nan)
+
+    return pd.DataFrame({
+        'zopa_exists': exists,
+        'target': where_zopa(target),
+        'floor': where_zopa(floor),
+        'ceiling': where_zopa(ceiling),
+        'opening_offer': where_zopa(seller_min + (floor - seller_min) * 0.5),
+        'walkaway': where_zopa(np.minimum(batna, buyer_max)),
+        'zopa_utilization': where_zopa(np.divide(
+            ceiling - floor, zopa_range, out=np.zeros(zopa_range.shape), where=zopa_range > 0
+        ))
+    }, index=index)
+
+
 def calculate_concession_strategy(
     opening: float,
     target: float,
@@ -434,3 +601,382 @@ def calculate_concession_strategy(
         })
 
     return rounds
+
+
+def decision_node(name: str, options: Dict[str, Dict]) -> Dict:
+    """
+    Decision node for SettlementTree: the buyer picks the cheapest option.
+
+    Args:
+        name: Unique node name (used for result columns)
+        options: Dict of option label -> child node
+
+    Returns:
+        Node dict
+    """
+    return {'type': 'decision', 'name': name, 'options': dict(options)}
+
+
+def chance_node(name: str, outcomes: Dict[str, Tuple]) -> Dict:
+    """
+    Chance node for SettlementTree.
+
+    Args:
+        name: Node name
+        outcomes: Dict of outcome label -> (probability, child node).
+            Probabilities are values (see SettlementTree); at most one may
+            be None, meaning the remainder 1 - sum(others).
+
+    Returns:
+        Node dict
+    """
+    return {'type': 'chance', 'name': name, 'outcomes': dict(outcomes)}
+
+
+def outcome_node(cost=0.0, simulate: Optional[Dict[str, Dict]] = None) -> Dict:
+    """
+    Leaf node for SettlementTree.
+
+    Args:
+        cost: Deterministic cost value (see SettlementTree)
+        simulate: Optional Monte Carlo variables in
+            risk_utils.monte_carlo_simulation() format, whose parameters
+            may also be values; their samples are added to cost
+
+    Returns:
+        Node dict
+    """
+    return {'type': 'outcome', 'cost': cost, 'simulate': simulate}
+
+
+def _tree_values(spec, parcels: Optional[pd.DataFrame], n: int) -> np.ndarray:
+    """Resolve a tree value spec to one float per parcel"""
+    if isinstance(spec, str):
+        if parcels is None or spec not in parcels:
+            raise ValueError(f"Unknown column '{spec}'")
+        return parcels[spec].to_numpy(dtype=float)
+    if isinstance(spec, (list, tuple)):
+        return sum((_tree_values(term, parcels, n) for term in spec), np.zeros(n))
+    if callable(spec):
+        spec = spec(parcels)
+    return np.broadcast_to(np.asarray(spec, dtype=float), (n,))
+
+
+def _optional_columns(terms: Sequence):
+    """Value summing terms, with missing columns counting as 0 (as in calculate_batna_frame())"""
+    def total(parcels: Optional[pd.DataFrame]):
+        present = [
+            term for term in terms
+            if not (isinstance(term, str) and (parcels is None or term not in parcels))
+        ]
+        return _tree_values(present, parcels, 1 if parcels is None else len(parcels))
+    return total
+
+
+class SettlementTree:
+    """
+    Chance/decision tree evaluated for a whole parcel portfolio at once.
+
+    The tree is built from decision_node(), chance_node() and
+    outcome_node() (see settlement_tree() for the standard offer → counter
+    → hearing tree) and flattened into a node list. Evaluation runs bottom-up
+    with one array per node over parcels (and over Monte Carlo iterations
+    when the tree has simulated leaves), so every parcel is solved together.
+
+    Values (costs, probabilities, distribution parameters) may be numbers,
+    column names of the parcels frame, arrays with one value per parcel,
+    callables taking the parcels frame, or lists of these to be summed. Costs are to the buyer; decision nodes pick
+    the option with the lowest expected cost (ties go to the first option).
+
+    A node object used under several parents is evaluated once and shared,
+    so its Monte Carlo samples (common random numbers) are the same in
+    every branch that reaches it.
+    """
+
+    def __init__(self, root: Dict):
+        self.nodes: List[Dict] = []
+        self._compiled: Dict[int, int] = {}
+        self._compile(root)
+        self.parent_counts = np.bincount(
+            [child for node in self.nodes for child in node.get('children', [])], minlength=len(self.nodes)
+        )
+        names = [node['name'] for node in self.nodes if node['type'] == 'decision']
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Decision node names must be unique: {duplicates}")
+        self.has_simulation = any(node.get('simulate') for node in self.nodes)
+
+    def _compile(self, spec: Dict) -> int:
+        """Append spec's subtree in postorder (children before parents), once per spec object"""
+        if id(spec) in self._compiled:
+            return self._compiled[id(spec)]
+        node_type = spec.get('type')
+        if node_type == 'outcome':
+            return self._append(spec, {'type': 'outcome', 'cost': spec.get('cost', 0.0), 'simulate': spec.get('simulate')})
+
+        if node_type == 'decision':
+            branches = [(label, None, child) for label, child in spec['options'].items()]
+        elif node_type == 'chance':
+            branches = [(label, probability, child) for label, (probability, child) in spec['outcomes'].items()]
+            if sum(probability is None for _, probability, _ in branches) > 1:
+                raise ValueError(f"Chance node '{spec['name']}' has more than one remainder outcome")
+        else:
+            raise ValueError(f"Unknown node type: {node_type}")
+        if not branches:
+            raise ValueError(f"Node '{spec['name']}' has no branches")
+
+        return self._append(spec, {
+            'type': node_type,
+            'name': spec['name'],
+            'labels': [label for label, _, _ in branches],
+            'probabilities': [probability for _, probability, _ in branches],
+            'children': [self._compile(child) for _, _, child in branches]
+        })
+
+    def _append(self, spec: Dict, node: Dict) -> int:
+        """Add a compiled node and remember it for spec"""
+        node_id = len(self.nodes)
+        self.nodes.append(node)
+        self._compiled[id(spec)] = node_id
+        return node_id
+
+    def _probabilities(self, node: Dict, parcels: Optional[pd.DataFrame], n: int) -> np.ndarray:
+        """(branches × parcels) probabilities, with the remainder filled in"""
+        rows = [None if p is None else _tree_values(p, parcels, n) for p in node['probabilities']]
+        known = sum((row for row in rows if row is not None), np.zeros(n))
+        probabilities = np.vstack([1.0 - known if row is None else row for row in rows])
+
+        total = probabilities.sum(axis=0)
+        invalid = np.flatnonzero((np.abs(total - 1.0) > 0.01) | (probabilities < -0.01).any(axis=0))
+        if len(invalid):
+            raise ValueError(
+                f"Probabilities at '{node['name']}' must sum to 1.0 and be non-negative; "
+                f"rows {invalid[:5].tolist()} sum to {total[invalid[:5]].round(4).tolist()}"
+            )
+        return np.clip(probabilities, 0.0, None)
+
+    def evaluate(
+        self,
+        parcels: Optional[pd.DataFrame] = None,
+        iterations: Optional[int] = None,
+        seed: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Solve the tree for every parcel.
+
+        Args:
+            parcels: One row per parcel (None = one parcel with numeric values)
+            iterations: Monte Carlo samples per parcel (default TREE_ITERATIONS
+                if the tree has simulated leaves, else 0 = expected values only)
+            seed: Random seed
+
+        Returns:
+            DataFrame on the parcels index with expected_cost; for each
+            decision node, the chosen option (column = node name) and each
+            option's expected cost ('<node>.<option>'); with iterations,
+            cost_mean, cost_std and cost_p10/p50/p90 of the sampled cost
+            under the chosen policy
+        """
+        n = 1 if parcels is None else len(parcels)
+        if iterations is None:
+            iterations = TREE_ITERATIONS if self.has_simulation else 0
+        if self.has_simulation and iterations < 1:
+            raise ValueError("iterations must be at least 1 for trees with simulated leaves")
+        rng = np.random.default_rng(seed)
+
+        # Resolve values once for the whole portfolio
+        resolved = []
+        for node in self.nodes:
+            if node['type'] == 'outcome':
+                simulate = {
+                    name: {key: (value if key == 'type' else _tree_values(value, parcels, n)) for key, value in dist.items()}
+                    for name, dist in (node['simulate'] or {}).items()
+                }
+                resolved.append((_tree_values(node['cost'], parcels, n), simulate))
+            elif node['type'] == 'chance':
+                resolved.append(self._probabilities(node, parcels, n))
+            else:
+                resolved.append(None)
+
+        chunk = max(n, 1) if not iterations else max(1, TREE_CHUNK_CELLS // iterations)
+        parts = [
+            self._solve(resolved, slice(start, min(start + chunk, n)), iterations, rng)
+            for start in range(0, max(n, 1), chunk)
+        ]
+        columns = {key: np.concatenate([part[key] for part in parts]) for key in parts[0]}
+        return pd.DataFrame(columns, index=parcels.index if parcels is not None else None)
+
+    def _solve(self, resolved: List, rows: slice, iterations: int, rng: np.random.Generator) -> Dict:
+        """Bottom-up pass over one chunk of parcels"""
+        expected = [None] * len(self.nodes)
+        samples = [None] * len(self.nodes)
+        remaining = self.parent_counts.copy()
+        columns = {}
+
+        for node_id in range(len(self.nodes)):
+            node = self.nodes[node_id]
+            if node['type'] == 'outcome':
+                cost, simulate = resolved[node_id]
+                cost = cost[rows]
+                expected[node_id] = cost
+                if iterations:
+                    draws = monte_carlo_samples(
+                        {name: {key: (value if key == 'type' else value[rows]) for key, value in dist.items()}
+                         for name, dist in simulate.items()},
+                        iterations, size=len(cost), rng=rng
+                    )
+                    total = np.broadcast_to(cost, (iterations, len(cost)))
+                    for values in draws.values():
+                        total = total + values
+                    samples[node_id] = total
+                    expected[node_id] = total.mean(axis=0) if draws else cost
+                continue
+
+            children = node['children']
+            child_expected = np.vstack([expected[child] for child in children])
+            if node['type'] == 'chance':
+                probabilities = resolved[node_id][:, rows]
+                expected[node_id] = (probabilities * child_expected).sum(axis=0)
+                if iterations:
+                    # Branch per (iteration, parcel) from the cumulative probabilities
+                    u = rng.random((iterations, child_expected.shape[1]))
+                    cumulative = np.cumsum(probabilities, axis=0)[:-1]
+                    branch = (u[None, :, :] >= cumulative[:, None, :]).sum(axis=0)
+                    samples[node_id] = self._select(samples, children, branch)
+            else:
+                best = child_expected.argmin(axis=0)
+                expected[node_id] = child_expected.min(axis=0)
+                columns[node['name']] = np.array(node['labels'], dtype=object)[best]
+                for label, values in zip(node['labels'], child_expected):
+                    columns[f"{node['name']}.{label}"] = values
+                if iterations:
+                    samples[node_id] = self._select(samples, children, np.broadcast_to(best, (iterations, len(best))))
+            # Free each child once its last parent has used it
+            for child in children:
+                remaining[child] -= 1
+                if not remaining[child]:
+                    expected[child] = samples[child] = None
+
+        result = {'expected_cost': expected[-1], **columns}
+        if iterations:
+            result['cost_mean'] = samples[-1].mean(axis=0)
+            result['cost_std'] = samples[-1].std(axis=0)
+            for q in (10, 50, 90):
+                result[f'cost_p{q}'] = np.percentile(samples[-1], q, axis=0)
+        return result
+
+    @staticmethod
+    def _select(samples: List, children: List[int], branch: np.ndarray) -> np.ndarray:
+        """Pick each cell's sample from the child given by branch"""
+        out = np.array(samples[children[0]], dtype=float)
+        for j, child in enumerate(children[1:], start=1):
+            np.copyto(out, samples[child], where=branch == j)
+        return out
+
+
+def settlement_tree(
+    offer='offer_amount',
+    counter='counter_amount',
+    accept_probability='accept_probability',
+    reject_probability='litigation_probability',
+    settlement_costs='legal_fees_to_settle',
+    hearing_costs: Sequence = tuple(HEARING_COST_ITEMS),
+    hearing_simulation: Optional[Dict[str, Dict]] = None
+) -> SettlementTree:
+    """
+    Standard offer → counter → hearing settlement tree.
+
+        strategy (decision)
+        ├── negotiate → offer_response (chance)
+        │   ├── accept   → offer + settlement costs
+        │   ├── counter  → counter_response (decision)
+        │   │   ├── accept_counter → counter + settlement costs
+        │   │   └── hearing        → hearing
+        │   └── reject   → hearing
+        └── hearing → hearing
+
+    The counter probability is the remainder 1 - accept - reject, so the
+    reject probability can come straight from
+    risk_utils.score_risk_portfolio() (litigation_probability). The hearing
+    is a chance node over calculate_batna() awards (HEARING_OUTCOMES
+    probability and '<outcome>_amount' columns) plus hearing_costs, or a
+    Monte Carlo leaf when hearing_simulation is given, e.g.
+        {'award': {'type': 'triangular', 'min': 'low_award_amount',
+                   'most_likely': 'mid_award_amount', 'max': 'high_award_amount'}}
+    The three hearing branches share one node, so a parcel's hearing is
+    sampled once per iteration and costs the same wherever it is reached.
+
+    Args:
+        offer, counter, accept_probability, reject_probability,
+        settlement_costs: Values (see SettlementTree); a missing
+            settlement_costs column counts as 0
+        hearing_costs: Cost values summed into every hearing outcome
+            (missing columns count as 0)
+        hearing_simulation: Optional Monte Carlo variables for the hearing
+
+    Returns:
+        SettlementTree; the 'strategy.hearing' result column is the BATNA
+    """
+    settlement_costs = _optional_columns([settlement_costs])
+    hearing_costs = _optional_columns(list(hearing_costs))
+
+    if hearing_simulation:
+        hearing = outcome_node(cost=hearing_costs, simulate=hearing_simulation)
+    else:
+        hearing = chance_node('hearing_award', {
+            outcome: (outcome, outcome_node(cost=[f'{outcome}_amount', hearing_costs]))
+            for outcome in HEARING_OUTCOMES
+        })
+
+    return SettlementTree(decision_node('strategy', {
+        'negotiate': chance_node('offer_response', {
+            'accept': (accept_probability, outcome_node(cost=[offer, settlement_costs])),
+            'counter': (None, decision_node('counter_response', {
+                'accept_counter': outcome_node(cost=[counter, settlement_costs]),
+                'hearing': hearing
+            })),
+            'reject': (reject_probability, hearing)
+        }),
+        'hearing': hearing
+    }))
+
+
+def portfolio_settlement_ranges(
+    parcels: pd.DataFrame,
+    tree: Optional[SettlementTree] = None,
+    seller_min='seller_min',
+    batna_column: str = 'strategy.hearing',
+    confidence: float = 0.8,
+    iterations: Optional[int] = None,
+    seed: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Solve a settlement tree and optimal settlement ranges for a portfolio.
+
+    The BATNA is the tree's expected cost of going to hearing
+    (batna_column); the buyer maximum is that BATNA, capped by a buyer_max
+    column when present.
+
+    Args:
+        parcels: One row per parcel
+        tree: SettlementTree (default settlement_tree())
+        seller_min: Seller minimum value (see SettlementTree)
+        batna_column: Result column holding the BATNA
+        confidence: Confidence level for the ranges
+        iterations: Monte Carlo samples (see SettlementTree.evaluate())
+        seed: Random seed
+
+    Returns:
+        SettlementTree.evaluate() columns joined with
+        optimal_settlement_range_frame() columns
+    """
+    tree = tree if tree is not None else settlement_tree()
+    result = tree.evaluate(parcels, iterations=iterations, seed=seed)
+    if batna_column not in result:
+        raise ValueError(f"Unknown BATNA column '{batna_column}'")
+    batna = result[batna_column].to_numpy(dtype=float)
+    buyer_max = np.minimum(batna, parcels['buyer_max'].to_numpy(dtype=float)) if 'buyer_max' in parcels else batna
+    ranges = optimal_settlement_range_frame(
+        batna, buyer_max, _tree_values(seller_min, parcels, len(parcels)), confidence, index=parcels.index
+    )
+    return result.join(ranges)
@@ -0,0 +1,543 @@
+#!/usr/bin/env python3
+"""
+Parcel Geometry Utilities Module
+Provides shape and access measures of parcel polygons for severance
+analysis, replacing the frontage × depth rectangle of
+calculate_shape_efficiency_index() with the actual before/after parcels.
+
+- Readers for GeoJSON and GeoPackage layers (standard library only: json,
+  sqlite3 and a WKB decoder), into a flat GeometryLayer of vertex arrays
+- Area, perimeter, Polsby-Popper compactness and a square-relative
+  efficiency index (4·√A / P, the index calculate_shape_efficiency_index()
+  approximates) computed for all parcels at once
+- Road frontage: parcel boundaries are split into short pieces and paired
+  with road centrelines within the right-of-way half width through
+  WorkZoneIndex (KD-tree). Only pieces roughly parallel to the road count,
+  so side lot lines are not frontage; parcels with none are landlocked
+- severance_geometry_tables() builds the before / taking / remainder
+  columns for severance_damages_frame()
+
+Coordinates are planar metres or feet; lon/lat layers (GeoJSON per
+RFC 7946, GeoPackage with a geographic SRS) are projected onto a local
+equirectangular plane around the parcels, which is accurate to well under
+0.1% across a project corridor.
+
+Used by:
+- Eff_Rent_Calculator/Tests/test_parcel_geometry_utils.py
+"""
+
+import json
+import sqlite3
+import struct
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .injurious_affection_utils import WorkZoneIndex
+from .severance_utils import SQ_M_PER_ACRE
+
+
+FEET_PER_METRE = 1 / 0.3048
+EARTH_RADIUS_M = 6371008.8
+
+# Boundary within this distance of a road centreline fronts it (covers
+# right-of-way half widths up to ~20 m) unless the roads layer carries a
+# per-road frontage_buffer_m column
+ROAD_BUFFER_M = 20.0
+
+# Boundary pieces at a steeper angle to the road (side lot lines) are not frontage
+FRONTAGE_MAX_ANGLE_DEG = 30.0
+
+# Parcel boundaries are measured against roads in pieces no longer than this
+BOUNDARY_PIECE_M = 2.0
+
+POLYGON_TYPES = {'Polygon', 'MultiPolygon'}
+LINE_TYPES = {'LineString', 'MultiLineString'}
+
+# WKB geometry type codes
+_WKB_TYPES = {2: 'LineString', 3: 'Polygon', 5: 'MultiLineString', 6: 'MultiPolygon'}
+_GPKG_ENVELOPE_BYTES = {0: 0, 1: 32, 2: 48, 3: 48, 4: 64}
+
+
+# ============================================================================
+# READERS
+# ============================================================================
+
+def _wkb_geometry(data: bytes, offset: int = 0) -> Tuple[Dict, int]:
+    """Decode one (ISO or EWKB) WKB geometry; coordinates as (n, 2) arrays"""
+    order = '<' if data[offset] == 1 else '>'
+    code, = struct.unpack_from(order + 'I', data, offset + 1)
+    offset += 5
+    dims = 2 + bool(code & 0x80000000) + bool(code & 0x40000000)   # EWKB Z / M flags
+    if code & 0x20000000:                                            # EWKB SRID
+        offset += 4
+    code &= 0x0FFFFFFF
+    dims += {1: 1, 2: 1, 3: 2}.get(code // 1000, 0)                  # ISO Z / M / ZM
+    kind = _WKB_TYPES.get(code % 1000)
+    if kind is None:
+        raise ValueError(f"Unsupported WKB geometry type {code}")
+
+    def points(offset):
+        count, = struct.unpack_from(order + 'I', data, offset)
+        offset += 4
+        values = np.frombuffer(data, dtype=order + 'f8', count=count * dims, offset=offset)
+        return values.reshape(count, dims)[:, :2], offset + 8 * count * dims
+
+    def rings(offset):
+        count, = struct.unpack_from(order + 'I', data, offset)
+        offset += 4
+        result = []
+        for _ in range(count):
+            ring, offset = points(offset)
+            result.append(ring)
+        return result, offset
+
+    if kind == 'LineString':
+        coordinates, offset = points(offset)
+    elif kind == 'Polygon':
+        coordinates, offset = rings(offset)
+    else:
+        count, = struct.unpack_from(order + 'I', data, offset)
+        offset += 4
+        coordinates = []
+        for _ in range(count):
+            part, offset = _wkb_geometry(data, offset)
+            coordinates.append(part['coordinates'])
+    return {'type': kind, 'coordinates': coordinates}, offset
+
+
+def _gpkg_geometry(blob: Optional[bytes]) -> Optional[Dict]:
+    """GeoPackage geometry blob (GP header + WKB)"""
+    if blob is None:
+        return None
+    blob = bytes(blob)
+    if blob[:2] != b'GP':
+        raise ValueError("Not a GeoPackage geometry blob")
+    flags = blob[3]
+    if flags & 0x10:   # Empty geometry
+        return None
+    envelope = _GPKG_ENVELOPE_BYTES.get((flags >> 1) & 0x07)
+    if envelope is None:
+        raise ValueError("Invalid GeoPackage envelope indicator")
+    return _wkb_geometry(blob, 8 + envelope)[0]
+
+
+def _read_geopackage(path: Path, layer: Optional[str]) -> Tuple[List[Dict], bool]:
+    with sqlite3.connect(f"file:{path}?mode=ro", uri=True) as connection:
+        tables = [row[0] for row in connection.execute(
+            "SELECT table_name FROM gpkg_contents WHERE data_type = 'features'"
+        )]
+        if layer is None:
+            if len(tables) != 1:
+                raise ValueError(f"GeoPackage has feature layers {tables}; pass layer=")
+            layer = tables[0]
+        elif layer not in tables:
+            raise ValueError(f"Unknown layer '{layer}'; GeoPackage has {tables}")
+
+        geometry_column, srs_id = connection.execute(
+            "SELECT column_name, srs_id FROM gpkg_geometry_columns WHERE table_name = ?", (layer,)
+        ).fetchone()
+        srs = connection.execute(
+            "SELECT organization, organization_coordsys_id, definition FROM gpkg_spatial_ref_sys WHERE srs_id = ?",
+            (srs_id,)
+        ).fetchone()
+        geographic = srs is not None and (
+            (str(srs[0]).upper() == 'EPSG' and srs[1] == 4326)
+            or str(srs[2]).lstrip().upper().startswith(('GEOGCS', 'GEOGCRS'))
+        )
+
+        info = connection.execute(f'PRAGMA table_info("{layer}")').fetchall()
+        key = next((row[1] for row in info if row[5]), None)
+        cursor = connection.execute(f'SELECT * FROM "{layer}"')
+        columns = [description[0] for description in cursor.description]
+        features = []
+        for row in cursor:
+            record = dict(zip(columns, row))
+            features.append({
+                'id': record.get(key) if key else None,
+                'geometry': _gpkg_geometry(record.pop(geometry_column)),
+                'properties': record
+            })
+    return features, geographic
+
+
+def _read_geojson(path: Path) -> Tuple[List[Dict], bool]:
+    with open(path, 'r') as f:
+        data = json.load(f)
+    if data.get('type') == 'FeatureCollection':
+        features = data.get('features', [])
+    elif data.get('type') == 'Feature':
+        features = [data]
+    else:
+        features = [{'geometry': data, 'properties': {}}]
+
+    # RFC 7946 GeoJSON is lon/lat; legacy files may name a projected CRS
+    crs = str(((data.get('crs') or {}).get('properties') or {}).get('name', 'CRS84')).upper()
+    geographic = crs.endswith(('CRS84', ':4326'))
+    return features, geographic
+
+
+def read_features(path, layer: Optional[str] = None) -> Tuple[List[Dict], bool]:
+    """
+    Read GeoJSON (.geojson/.json) or GeoPackage (.gpkg) features.
+
+    Args:
+        path: Input file
+        layer: GeoPackage feature table (required when there are several)
+
+    Returns:
+        (features, geographic): GeoJSON-like feature dicts (id, geometry,
+        properties) and whether coordinates are lon/lat
+    """
+    path = Path(path)
+    if path.suffix.lower() == '.gpkg':
+        return _read_geopackage(path, layer)
+    if path.suffix.lower() in ('.geojson', '.json'):
+        return _read_geojson(path)
+    raise ValueError(f"Unsupported geometry file '{path.name}' (expected .geojson, .json or .gpkg)")
+
+
+# ============================================================================
+# GEOMETRY LAYER
+# ============================================================================
+
+class GeometryLayer:
+    """
+    Polygons or lines held as flat vertex arrays.
+
+    coords holds every part (polygon ring or line path) back to back;
+    part_offsets delimits them, part_feature maps each part to its feature
+    row and part_hole marks interior rings. Polygon rings are stored without
+    the repeated closing vertex.
+    """
+
+    def __init__(
+        self,
+        features: List[Dict],
+        id_field: Optional[str] = None,
+        geographic: bool = False,
+        linear_unit: str = 'm'
+    ):
+        """
+        Args:
+            features: GeoJSON-like feature dicts (see read_features())
+            id_field: Property holding the feature id (default: feature id,
+                else position)
+            geographic: Coordinates are lon/lat degrees
+            linear_unit: 'm' or 'ft' for planar coordinates
+        """
+        if linear_unit not in ('m', 'ft'):
+            raise ValueError(f"linear_unit must be 'm' or 'ft', got '{linear_unit}'")
+        self.geographic = geographic
+        self.linear_unit = linear_unit
+
+        kinds = {(feature.get('geometry') or {}).get('type') for feature in features} - {None}
+        if kinds <= POLYGON_TYPES:
+            self.kind = 'polygon'
+        elif kinds <= LINE_TYPES:
+            self.kind = 'line'
+        else:
+            raise ValueError(f"Layer must be all polygons or all lines, got {sorted(kinds)}")
+
+        parts, part_feature, part_hole = [], [], []
+        for row, feature in enumerate(features):
+            geometry = feature.get('geometry') or {}
+            coordinates = geometry.get('coordinates') or []
+            if geometry.get('type') == 'Polygon':
+                polygons = [coordinates]
+            elif geometry.get('type') == 'MultiPolygon':
+                polygons = coordinates
+            elif geometry.get('type') == 'LineString':
+                polygons = [[coordinates]]
+            else:
+                polygons = [[path] for path in coordinates]
+            for polygon in polygons:
+                for position, part in enumerate(polygon):
+                    part = np.asarray(part, dtype=float)
+                    if part.ndim != 2:
+                        continue
+                    part = part[:, :2]
+                    if self.kind == 'polygon':
+                        if len(part) > 1 and np.array_equal(part[0], part[-1]):
+                            part = part[:-1]
+                        if len(part) < 3:
+                            continue
+                    elif len(part) < 2:
+                        continue
+                    parts.append(part)
+                    part_feature.append(row)
+                    part_hole.append(self.kind == 'polygon' and position > 0)
+
+        lengths = np.array([len(part) for part in parts], dtype=int)
+        self.coords = np.concatenate(parts) if parts else np.empty((0, 2))
+        self.part_offsets = np.concatenate([[0], np.cumsum(lengths)])
+        self.part_feature = np.array(part_feature, dtype=int)
+        self.part_hole = np.array(part_hole, dtype=bool)
+
+        ids = [
+            (feature.get('properties') or {}).get(id_field) if id_field else feature.get('id')
+            for feature in features
+        ]
+        if id_field is None and any(value is None for value in ids):
+            ids = range(len(features))
+        self.index = pd.Index(list(ids), name=id_field or 'id')
+        if not self.index.is_unique:
+            raise ValueError("Feature ids must be unique")
+        self.properties = pd.DataFrame(
+            [feature.get('properties') or {} for feature in features], index=self.index
+        )
+
+    def __len__(self):
+        return len(self.index)
+
+    def planar(self, origin: Optional[Tuple[float, float]] = None) -> np.ndarray:
+        """
+        Vertex coordinates in metres.
+
+        Args:
+            origin: (lon, lat) of the local projection for geographic layers
+                (default: the layer's mean vertex)
+        """
+        if not self.geographic:
+            return self.coords / FEET_PER_METRE if self.linear_unit == 'ft' else self.coords
+        lon0, lat0 = self.coords.mean(axis=0) if origin is None else origin
+        return np.column_stack([
+            np.radians(self.coords[:, 0] - lon0) * np.cos(np.radians(lat0)) * EARTH_RADIUS_M,
+            np.radians(self.coords[:, 1] - lat0) * EARTH_RADIUS_M
+        ])
+
+    def _edges(self, xy: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Edge start, end and part per vertex (closed for polygons)"""
+        start = self.part_offsets[:-1]
+        lengths = np.diff(self.part_offsets)
+        part = np.repeat(np.arange(len(lengths)), lengths)
+        following = np.arange(len(xy)) + 1
+        last = self.part_offsets[1:] - 1
+        if self.kind == 'polygon':
+            following[last] = start
+            return xy, xy[following], part
+        keep = np.ones(len(xy), dtype=bool)
+        keep[last] = False
+        return xy[keep], xy[following[keep]], part[keep]
+
+    def segments(self, origin: Optional[Tuple[float, float]] = None) -> pd.DataFrame:
+        """Edges as x0, y0, x1, y1 (metres) with the feature properties of each"""
+        a, b, part = self._edges(self.planar(origin))
+        feature = self.part_feature[part]
+        frame = self.properties.iloc[feature].reset_index(drop=True)
+        frame[['x0', 'y0', 'x1', 'y1']] = np.column_stack([a, b])
+        frame['feature'] = feature
+        return frame
+
+
+def read_layer(
+    path,
+    layer: Optional[str] = None,
+    id_field: Optional[str] = None,
+    linear_unit: str = 'm'
+) -> GeometryLayer:
+    """
+    Read a GeoJSON or GeoPackage layer into a GeometryLayer.
+
+    Args:
+        path: .geojson/.json or .gpkg file
+        layer: GeoPackage feature table
+        id_field: Property holding the parcel / road id
+        linear_unit: 'm' or 'ft' for planar coordinates
+
+    Returns:
+        GeometryLayer (lon/lat detected from the file's CRS)
+    """
+    features, geographic = read_features(path, layer)
+    return GeometryLayer(features, id_field=id_field, geographic=geographic, linear_unit=linear_unit)
+
+
+# ============================================================================
+# SHAPE AND FRONTAGE
+# ============================================================================
+
+def _origin(parcels: GeometryLayer) -> Optional[Tuple[float, float]]:
+    if not parcels.geographic or not len(parcels.coords):
+        return None
+    lon, lat = parcels.coords.mean(axis=0)
+    return float(lon), float(lat)
+
+
+def _frontage(
+    parcels: GeometryLayer,
+    xy: np.ndarray,
+    roads: GeometryLayer,
+    origin,
+    road_column: Optional[str],
+    piece_length_m: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Frontage (metres) per parcel and the road label with the most of it"""
+    n = len(parcels)
+    classification = np.full(n, None, dtype=object)
+    if roads.kind != 'line':
+        raise ValueError("roads must be a line layer")
+    if roads.geographic != parcels.geographic:
+        raise ValueError("parcels and roads must both be lon/lat or both be planar")
+    road_segments = roads.segments(origin)
+    if not len(road_segments) or not len(xy):
+        return np.zeros(n), classification
+
+    buffer = (
+        road_segments['frontage_buffer_m'].fillna(ROAD_BUFFER_M).to_numpy(dtype=float)
+        if 'frontage_buffer_m' in road_segments else np.full(len(road_segments), ROAD_BUFFER_M)
+    )
+    index = WorkZoneIndex(road_segments)
+
+    # Boundary pieces (midpoint, length) per parcel
+    a, b, part = parcels._edges(xy)
+    length = np.hypot(*(b - a).T)
+    pieces = np.maximum(1, np.ceil(length / piece_length_m)).astype(int)
+    edge = np.repeat(np.arange(len(length)), pieces)
+    step = np.arange(len(edge)) - np.repeat(np.cumsum(pieces) - pieces, pieces)
+    t = ((step + 0.5) / pieces[edge])[:, None]
+    midpoint = a[edge] + t * (b - a)[edge]
+    piece_length = (length / pieces)[edge]
+    piece_feature = parcels.part_feature[part[edge]]
+
+    pairs = index.query(midpoint[:, 0], midpoint[:, 1], float(buffer.max()))
+    road = pairs['zone'].to_numpy()
+    road_direction = (road_segments[['x1', 'y1']].to_numpy() - road_segments[['x0', 'y0']].to_numpy())[road]
+    edge_direction = (b - a)[edge[pairs['receptor'].to_numpy()]]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cross = edge_direction[:, 0] * road_direction[:, 1] - edge_direction[:, 1] * road_direction[:, 0]
+        sine = np.abs(cross) / (np.hypot(*edge_direction.T) * np.hypot(*road_direction.T))
+    fronting = (pairs['distance_m'].to_numpy() <= buffer[road]) & (
+        sine <= np.sin(np.radians(FRONTAGE_MAX_ANGLE_DEG))
+    )
+    pairs = pairs[fronting].drop_duplicates('receptor')   # Nearest fronting road per piece
+    piece = pairs['receptor'].to_numpy()
+    frontage = np.bincount(piece_feature[piece], weights=piece_length[piece], minlength=n)
+
+    if road_column and road_column in road_segments and len(piece):
+        by_road = pd.DataFrame({
+            'feature': piece_feature[piece],
+            'road': road_segments[road_column].to_numpy()[pairs['zone'].to_numpy()],
+            'length': piece_length[piece]
+        }).groupby(['feature', 'road'], sort=False)['length'].sum()
+        dominant = by_road.sort_values(ascending=False, kind='stable').reset_index().drop_duplicates('feature')
+        classification[dominant['feature'].to_numpy()] = dominant['road'].to_numpy()
+    return frontage, classification
+
+
+def parcel_geometry_frame(
+    parcels: GeometryLayer,
+    roads: Optional[GeometryLayer] = None,
+    road_column: Optional[str] = 'road_classification',
+    piece_length_m: float = BOUNDARY_PIECE_M,
+    origin: Optional[Tuple[float, float]] = None
+) -> pd.DataFrame:
+    """
+    Area, perimeter, compactness, frontage and landlocked status per parcel.
+
+    Args:
+        parcels: Polygon layer
+        roads: Road centreline layer (optional frontage_buffer_m and
+            road_column properties); without roads frontage is not measured
+        road_column: Road property reported for the road with the most frontage
+        piece_length_m: Boundary piece length for frontage measurement (metres)
+        origin: (lon, lat) of the local projection for geographic layers
+            (default: the parcels' mean vertex)
+
+    Returns:
+        DataFrame on the parcel index with acres, perimeter_lf,
+        compactness (4πA/P², 1.0 = circle), efficiency_index (4√A/P,
+        1.0 = square) and, with roads, frontage_lf, road_classification
+        and landlocked
+    """
+    if parcels.kind != 'polygon':
+        raise ValueError("parcels must be a polygon layer")
+    if piece_length_m <= 0:
+        raise ValueError(f"piece_length_m must be positive, got {piece_length_m}")
+    origin = origin if origin is not None else _origin(parcels)
+    xy = parcels.planar(origin)
+    n = len(parcels)
+
+    # Shoelace area and perimeter per ring, then per parcel (holes subtract area)
+    a, b, part = parcels._edges(xy)
+    ring_area = np.abs(np.bincount(part, weights=a[:, 0] * b[:, 1] - b[:, 0] * a[:, 1],
+                                   minlength=len(parcels.part_feature))) / 2
+    ring_perimeter = np.bincount(part, weights=np.hypot(*(b - a).T), minlength=len(parcels.part_feature))
+    area = np.bincount(parcels.part_feature, weights=np.where(parcels.part_hole, -ring_area, ring_area), minlength=n)
+    perimeter = np.bincount(parcels.part_feature, weights=ring_perimeter, minlength=n)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        compactness = np.where(perimeter > 0, 4 * np.pi * area / perimeter ** 2, np.nan)
+        efficiency = np.where(perimeter > 0, 4 * np.sqrt(area) / perimeter, np.nan)
+    result = pd.DataFrame({
+        'acres': area / SQ_M_PER_ACRE,
+        'perimeter_lf': perimeter * FEET_PER_METRE,
+        'compactness': compactness,
+        'efficiency_index': efficiency
+    }, index=parcels.index)
+
+    if roads is not None:
+        frontage, classification = _frontage(parcels, xy, roads, origin, road_column, piece_length_m)
+        result['frontage_lf'] = frontage * FEET_PER_METRE
+        if road_column:
+            result['road_classification'] = classification
+        result['landlocked'] = frontage <= 0
+    return result
+
+
+def severance_geometry_tables(
+    before: GeometryLayer,
+    after: GeometryLayer,
+    roads: GeometryLayer,
+    **kwargs
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Geometric before / taking / remainder columns for severance_damages_frame().
+
+    Join the valuation attributes (value_per_acre, use, taking flags, ...) to
+    these tables; their efficiency_index columns replace the frontage × depth
+    rectangle in the shape damages.
+
+    Args:
+        before: Parcels before the taking
+        after: Remainder parcels (same ids; a split remainder is one
+            MultiPolygon), a subset of before
+        roads: Road centrelines after the project
+        **kwargs: Passed to parcel_geometry_frame()
+
+    Returns:
+        (before, taking, remainder) DataFrames on the remainder ids:
+        before has total_acres, frontage_linear_feet, road_classification,
+        efficiency_index; taking has area_taken_acres,
+        frontage_lost_linear_feet, creates_landlocked; remainder has acres,
+        frontage_remaining_linear_feet, efficiency_index, access_type
+    """
+    missing = after.index.difference(before.index)
+    if len(missing):
+        raise ValueError(f"Remainder parcels without a before parcel: {list(missing[:5])}")
+    # One projection for both layers so areas and frontages are comparable
+    if 'origin' not in kwargs:
+        kwargs['origin'] = _origin(before)
+    geometry_before = parcel_geometry_frame(before, roads, **kwargs).loc[after.index]
+    geometry_after = parcel_geometry_frame(after, roads, **kwargs)
+
+    before_table = pd.DataFrame({
+        'total_acres': geometry_before['acres'],
+        'frontage_linear_feet': geometry_before['frontage_lf'],
+        'efficiency_index': geometry_before['efficiency_index']
+    })
+    if 'road_classification' in geometry_before:
+        before_table.insert(2, 'road_classification', geometry_before['road_classification'])
+    taking_table = pd.DataFrame({
+        'area_taken_acres': (geometry_before['acres'] - geometry_after['acres']).clip(lower=0),
+        'frontage_lost_linear_feet': (geometry_before['frontage_lf'] - geometry_after['frontage_lf']).clip(lower=0),
+        'creates_landlocked': geometry_after['landlocked'] & ~geometry_before['landlocked']
+    })
+    remainder_table = pd.DataFrame({
+        'acres': geometry_after['acres'],
+        'frontage_remaining_linear_feet': geometry_after['frontage_lf'],
+        'efficiency_index': geometry_after['efficiency_index'],
+        'access_type': np.where(geometry_after['landlocked'], 'landlocked', 'direct')
+    })
+    return before_table, taking_table, remainder_table
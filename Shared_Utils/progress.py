@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Progress Events Module
+Structured, silenceable progress reporting for the calculators. Calculators
+emit events (source, name, level, message template and fields) and wrap
+long loops in progress(); the active reporter decides what reaches the
+terminal.
+
+- ConsoleReporter (default): prints events at or above its level to
+  stdout, as the calculators used to, and draws progress bars on stderr
+  when stderr is a terminal (tqdm if installed)
+- Reporter: prints nothing; batch runs, pool workers and benchmarks
+- LoggingReporter: forwards events to the `realestate.<source>` loggers
+- CollectingReporter: keeps the Event objects (tests, services)
+
+Every reporter counts events by `source.name` (and progress items under
+their counter name) whether or not they are shown, so a quiet batch run
+still ends with a summary such as {'relative_valuation.filter_excluded': 12}.
+Message templates are formatted only when an event is shown.
+
+Choosing a reporter:
+- In code: `with quiet(): ...`, `with reporting(CollectingReporter()) as r: ...`
+  or set_reporter()
+- For any script: REALESTATE_LOG_LEVEL=debug|info|warning|error|quiet
+
+Used by:
+- Relative_Valuation/relative_valuation_calculator.py
+- MCDA_Sales_Comparison/mcda_sales_calculator.py
+- Comparable_Sales_Analysis/comparable_sales_calculator.py
+- Comparable_Sales_Analysis/paired_sales_analyzer.py
+- MLS_Extractor/excel_formatter.py
+- Shared_Utils/benchmark_utils.py, Shared_Utils/calc_server.py (quiet)
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, ContextManager, Dict, Iterable, Iterator, List, Optional, TextIO
+
+
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+WARNING = logging.WARNING
+ERROR = logging.ERROR
+QUIET = ERROR + 10   # Above every event level: nothing is shown
+
+LEVELS = {'debug': DEBUG, 'info': INFO, 'warning': WARNING, 'error': ERROR, 'quiet': QUIET}
+LEVEL_ENV = 'REALESTATE_LOG_LEVEL'
+
+BAR_WIDTH = 30
+BAR_REFRESH_SECONDS = 0.1
+
+
+@dataclass
+class Event:
+    """One progress event"""
+    source: str                  # Calculator, e.g. 'relative_valuation'
+    name: str                    # Event name, e.g. 'filter_excluded'
+    level: int
+    message: str                 # str.format template over fields (used as-is without fields)
+    fields: Dict[str, Any] = field(default_factory=dict)
+    time: float = 0.0
+
+    @property
+    def text(self) -> str:
+        """Formatted message"""
+        return self.message.format(**self.fields) if self.fields else self.message
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'source': self.source, 'name': self.name, 'level': logging.getLevelName(self.level),
+            'message': self.text, 'fields': self.fields, 'time': self.time
+        }
+
+
+class Reporter:
+    """
+    Base reporter: counts events and shows nothing.
+
+    Args:
+        level: Lowest level passed to handle() (QUIET = none)
+    """
+
+    def __init__(self, level: int = QUIET):
+        self.level = level
+        self.counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def count(self, key: str, n: int = 1):
+        with self._lock:
+            self.counts[key] = self.counts.get(key, 0) + n
+
+    def handle(self, event: Event):
+        """Show or store one event at or above the reporter's level"""
+
+    def progress_bar(self, description: str, total: Optional[int]) -> Optional['ProgressBar']:
+        """Bar for progress(), or None to iterate without one"""
+        return None
+
+    def summary(self) -> Dict[str, int]:
+        """Event and item counts by key, largest first"""
+        with self._lock:
+            return dict(sorted(self.counts.items(), key=lambda item: -item[1]))
+
+
+class ProgressBar:
+    """
+    Text progress bar redrawn in place at most every BAR_REFRESH_SECONDS.
+
+    Args:
+        description: Label before the bar
+        total: Expected item count (None: show a running count only)
+        stream: Terminal stream
+    """
+
+    def __init__(self, description: str, total: Optional[int], stream: TextIO):
+        self.description = description
+        self.total = total
+        self.stream = stream
+        self.n = 0
+        self._drawn = 0.0
+        self._start = time.monotonic()
+
+    def update(self, n: int = 1):
+        self.n += n
+        now = time.monotonic()
+        if now - self._drawn >= BAR_REFRESH_SECONDS:
+            self._drawn = now
+            self._draw(now)
+
+    def close(self):
+        self._draw(time.monotonic())
+        self.stream.write('\n')
+        self.stream.flush()
+
+    def _draw(self, now: float):
+        elapsed = now - self._start
+        if self.total:
+            done = min(self.n / self.total, 1.0)
+            filled = int(done * BAR_WIDTH)
+            line = (f"{self.description} |{'█' * filled}{' ' * (BAR_WIDTH - filled)}| "
+                    f"{self.n}/{self.total} {done:.0%} [{elapsed:.1f}s]")
+        else:
+            line = f"{self.description} {self.n} [{elapsed:.1f}s]"
+        self.stream.write('\r' + line)
+        self.stream.flush()
+
+
+class _TqdmBar:
+    """ProgressBar interface over tqdm"""
+
+    def __init__(self, description: str, total: Optional[int], stream: TextIO):
+        from tqdm import tqdm
+        self._bar = tqdm(desc=description, total=total, file=stream, leave=False)
+
+    def update(self, n: int = 1):
+        self._bar.update(n)
+
+    def close(self):
+        self._bar.close()
+
+
+class ConsoleReporter(Reporter):
+    """
+    Print events to the terminal; progress bars on an interactive stderr.
+
+    Args:
+        level: Lowest level printed (default INFO)
+        stream: Event stream (default sys.stdout at the time of printing,
+            so contextlib.redirect_stdout still applies)
+        bars: Draw progress bars (default: when stderr is a terminal)
+    """
+
+    def __init__(self, level: int = INFO, stream: Optional[TextIO] = None, bars: Optional[bool] = None):
+        super().__init__(level)
+        self.stream = stream
+        self.bars = bars
+
+    def handle(self, event: Event):
+        print(event.text, file=self.stream or sys.stdout)
+
+    def progress_bar(self, description: str, total: Optional[int]) -> Optional[ProgressBar]:
+        stream = sys.stderr
+        if not (self.bars if self.bars is not None else stream.isatty()):
+            return None
+        try:
+            return _TqdmBar(description, total, stream)
+        except ImportError:
+            return ProgressBar(description, total, stream)
+
+
+class LoggingReporter(Reporter):
+    """
+    Forward events to the standard logging module.
+
+    Args:
+        level: Lowest level forwarded (default DEBUG; the loggers filter further)
+        prefix: Logger name prefix; events go to `<prefix>.<source>`
+    """
+
+    def __init__(self, level: int = DEBUG, prefix: str = 'realestate'):
+        super().__init__(level)
+        self.prefix = prefix
+
+    def handle(self, event: Event):
+        logging.getLogger(f'{self.prefix}.{event.source}').log(
+            event.level, '%s', event.text, extra={'event': event.name, 'fields': event.fields}
+        )
+
+
+class CollectingReporter(Reporter):
+    """
+    Keep events in memory.
+
+    Args:
+        level: Lowest level kept (default DEBUG)
+    """
+
+    def __init__(self, level: int = DEBUG):
+        super().__init__(level)
+        self.events: List[Event] = []
+
+    def handle(self, event: Event):
+        with self._lock:
+            self.events.append(event)
+
+    def messages(self, level: int = DEBUG) -> List[str]:
+        """Formatted messages at or above level"""
+        return [event.text for event in self.events if event.level >= level]
+
+
+def reporter_from_environment() -> Reporter:
+    """Default reporter: console at REALESTATE_LOG_LEVEL (default info)"""
+    name = os.environ.get(LEVEL_ENV, 'info').lower()
+    level = LEVELS.get(name)
+    if level is None:
+        print(f"{LEVEL_ENV} must be one of {', '.join(LEVELS)}; using info", file=sys.stderr)
+        level = INFO
+    return Reporter() if level == QUIET else ConsoleReporter(level=level)
+
+
+_reporter: Reporter = reporter_from_environment()
+
+
+# ============================================================================
+# EVENT API
+# ============================================================================
+
+def emit(source: str, name: str, message: str, level: int = INFO, **fields):
+    """
+    Emit an event to the active reporter.
+
+        emit('relative_valuation', 'loaded', "Loaded {count} properties", count=n)
+
+    Args:
+        source: Calculator emitting the event
+        name: Event name (counted as `source.name`)
+        message: str.format template over fields, or a plain message
+        level: DEBUG, INFO, WARNING or ERROR
+        **fields: Structured values for the message and the event record
+    """
+    reporter = _reporter
+    reporter.count(f'{source}.{name}')
+    if level >= reporter.level:
+        reporter.handle(Event(source, name, level, message, fields, time.time()))
+
+
+def count(source: str, name: str, n: int = 1):
+    """Add to a counter without emitting an event"""
+    _reporter.count(f'{source}.{name}', n)
+
+
+def enabled(level: int = INFO) -> bool:
+    """True if events at this level are shown (skip work that only feeds messages)"""
+    return level >= _reporter.level
+
+
+def progress(
+    iterable: Iterable,
+    description: str,
+    total: Optional[int] = None,
+    counter: Optional[str] = None
+) -> Iterator:
+    """
+    Iterate with a progress bar when the active reporter draws one.
+
+        for prop in progress(properties, 'Writing rows', counter='mls_excel.rows'):
+            ...
+
+    Args:
+        iterable: Items to iterate
+        description: Bar label
+        total: Item count (default len(iterable) when it has one)
+        counter: Count the items under this key
+
+    Yields:
+        The items of iterable
+    """
+    reporter = _reporter
+    if total is None and hasattr(iterable, '__len__'):
+        total = len(iterable)
+    bar = reporter.progress_bar(description, total)
+    n = 0
+    try:
+        if bar is None:
+            for n, item in enumerate(iterable, start=1):
+                yield item
+        else:
+            for n, item in enumerate(iterable, start=1):
+                yield item
+                bar.update(1)
+    finally:
+        if bar is not None:
+            bar.close()
+        if counter:
+            reporter.count(counter, n)
+
+
+def get_reporter() -> Reporter:
+    """The active reporter"""
+    return _reporter
+
+
+def set_reporter(reporter: Reporter) -> Reporter:
+    """
+    Replace the active reporter.
+
+    Returns:
+        The previous reporter
+    """
+    global _reporter
+    previous, _reporter = _reporter, reporter
+    return previous
+
+
+@contextmanager
+def reporting(reporter: Reporter) -> Iterator[Reporter]:
+    """Use a reporter for a block, then restore the previous one"""
+    previous = set_reporter(reporter)
+    try:
+        yield reporter
+    finally:
+        set_reporter(previous)
+
+
+def quiet() -> ContextManager[Reporter]:
+    """Show nothing for a block (events are still counted)"""
+    return reporting(Reporter())
@@ -4,16 +4,55 @@ Risk Assessment Utilities Module
 Provides shared functions for holdout risk assessment, litigation risk analysis,
 probability distributions, Monte Carlo simulation, and sensitivity analysis.
 
+The *_frame() functions score whole owner/case tables with array operations
+on the same scoring tables as the scalar functions; score_risk_portfolio()
+combines them into a ranked parcel DataFrame.
+
 Used by:
 - settlement_analyzer.py
 - negotiation_settlement_calculator.py
 - land_assembly_calculator.py
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 import random
 import statistics
 
+import numpy as np
+import pandas as pd
+
+
+# Holdout sub-score points: field -> (points by level, default level)
+HOLDOUT_MOTIVATION_POINTS = {
+    'financial_need': ({'low': 4, 'medium': 2, 'high': 0}, 'medium'),          # high need = low holdout
+    'emotional_attachment': ({'low': 0, 'medium': 2, 'high': 4}, 'medium'),
+    'business_impact': ({'minimal': 0, 'moderate': 2, 'critical': 4}, 'moderate')
+}
+HOLDOUT_EXPERIENCE_POINTS = ({'low': 1, 'medium': 3, 'high': 5}, 'medium')
+HOLDOUT_ALTERNATIVES_POINTS = {
+    'relocation_options': ({'many': 0, 'some': 2, 'limited': 4, 'none': 6}, 'some'),
+    'financial_flexibility': ({'high': 2, 'medium': 1, 'low': 0}, 'medium'),   # low flexibility = need money
+    'timeline_pressure': ({'low': 2, 'medium': 1, 'high': 0}, 'medium')        # high pressure = need to move
+}
+
+# Holdout risk levels: (minimum total score, level, holdout probability)
+HOLDOUT_RISK_LEVELS = [
+    (20, 'CRITICAL', 0.7),
+    (15, 'HIGH', 0.5),
+    (10, 'MEDIUM', 0.3),
+    (0, 'LOW', 0.15)
+]
+
+# Litigation probability by valuation gap: (gap % upper bound, probability)
+LITIGATION_GAP_PROBABILITIES = [(10, 0.2), (20, 0.4), (30, 0.6), (float('inf'), 0.8)]
+OWNER_RISK_MULTIPLIERS = {'LOW': 0.5, 'MEDIUM': 1.0, 'HIGH': 1.5, 'CRITICAL': 2.0}
+COMPLEXITY_PROBABILITY_ADJ = {'low': -0.1, 'medium': 0, 'high': 0.15}
+PRECEDENT_PROBABILITY_ADJ = {'clear': -0.15, 'mixed': 0, 'unclear': 0.2}
+COMPLEXITY_DURATION_ADJ = {'low': -3, 'medium': 0, 'high': 6}
+PRECEDENT_DURATION_ADJ = {'clear': -2, 'mixed': 0, 'unclear': 4}
+JURISDICTION_DURATION_ADJ = {'buyer_favorable': -2, 'neutral': 0, 'owner_favorable': 3}
+LITIGATION_MONTHLY_COST = {'low': 5000, 'medium': 7500, 'high': 10000}   # legal + expert fees
+
 
 def assess_holdout_risk(owner_profile: Dict) -> Dict:
     """
@@ -58,34 +97,19 @@ def assess_holdout_risk(owner_profile: Dict) -> Dict:
     """
     # Score motivation (0-12)
     motivation = owner_profile.get('motivation', {})
-    motivation_score = 0
-
-    # Financial need (inverse scoring - high need = low holdout)
-    financial_need_scores = {'low': 4, 'medium': 2, 'high': 0}
-    motivation_score += financial_need_scores.get(
-        motivation.get('financial_need', 'medium'), 2
-    )
-
-    # Emotional attachment (high attachment = high holdout)
-    emotional_scores = {'low': 0, 'medium': 2, 'high': 4}
-    motivation_score += emotional_scores.get(
-        motivation.get('emotional_attachment', 'medium'), 2
-    )
-
-    # Business impact (critical impact = high holdout)
-    business_scores = {'minimal': 0, 'moderate': 2, 'critical': 4}
-    motivation_score += business_scores.get(
-        motivation.get('business_impact', 'moderate'), 2
+    motivation_score = sum(
+        points.get(motivation.get(field, default), points[default])
+        for field, (points, default) in HOLDOUT_MOTIVATION_POINTS.items()
     )
 
     # Score sophistication (0-10)
     sophistication = owner_profile.get('sophistication', {})
-    sophistication_score = 0
+    experience_points, experience_default = HOLDOUT_EXPERIENCE_POINTS
 
     # Real estate experience (high experience = higher holdout)
-    experience_scores = {'low': 1, 'medium': 3, 'high': 5}
-    sophistication_score += experience_scores.get(
-        sophistication.get('real_estate_experience', 'medium'), 3
+    sophistication_score = experience_points.get(
+        sophistication.get('real_estate_experience', experience_default),
+        experience_points[experience_default]
     )
 
     # Legal representation (increases holdout)
@@ -99,45 +123,21 @@ def assess_holdout_risk(owner_profile: Dict) -> Dict:
     elif prev_negotiations >= 1:
         sophistication_score += 1
 
-    # Score alternatives (0-8)
+    # Score alternatives (0-8): fewer relocation options, more flexibility
+    # and less timeline pressure all raise holdout risk
     alternatives = owner_profile.get('alternatives', {})
-    alternatives_score = 0
-
-    # Relocation options (fewer options = higher holdout)
-    relocation_scores = {'many': 0, 'some': 2, 'limited': 4, 'none': 6}
-    alternatives_score += relocation_scores.get(
-        alternatives.get('relocation_options', 'some'), 2
-    )
-
-    # Financial flexibility (low flexibility = lower holdout - need money)
-    flexibility_scores = {'high': 2, 'medium': 1, 'low': 0}
-    alternatives_score += flexibility_scores.get(
-        alternatives.get('financial_flexibility', 'medium'), 1
-    )
-
-    # Timeline pressure (high pressure = lower holdout - need to move)
-    # This is inverse scoring
-    timeline_scores = {'low': 2, 'medium': 1, 'high': 0}
-    alternatives_score += timeline_scores.get(
-        alternatives.get('timeline_pressure', 'medium'), 1
+    alternatives_score = sum(
+        points.get(alternatives.get(field, default), points[default])
+        for field, (points, default) in HOLDOUT_ALTERNATIVES_POINTS.items()
     )
 
     # Calculate total (max 30)
     total_score = min(motivation_score + sophistication_score + alternatives_score, 30)
 
     # Determine risk level
-    if total_score >= 20:
-        risk_level = 'CRITICAL'
-        probability = 0.7  # 70% chance of holdout
-    elif total_score >= 15:
-        risk_level = 'HIGH'
-        probability = 0.5  # 50% chance
-    elif total_score >= 10:
-        risk_level = 'MEDIUM'
-        probability = 0.3  # 30% chance
-    else:
-        risk_level = 'LOW'
-        probability = 0.15  # 15% chance
+    risk_level, probability = next(
+        (level, prob) for minimum, level, prob in HOLDOUT_RISK_LEVELS if total_score >= minimum
+    )
 
     # Identify key factors
     factors = []
@@ -204,48 +204,32 @@ def litigation_risk_assessment(case_factors: Dict) -> Dict:
     gap_percentage = (valuation_gap / property_value) * 100 if property_value > 0 else 0
 
     # Probability based on valuation gap
-    if gap_percentage < 10:
-        base_prob = 0.2
-    elif gap_percentage < 20:
-        base_prob = 0.4
-    elif gap_percentage < 30:
-        base_prob = 0.6
-    else:
-        base_prob = 0.8
+    base_prob = next(prob for bound, prob in LITIGATION_GAP_PROBABILITIES if gap_percentage < bound)
 
     # Adjust for owner risk profile
     risk_profile = case_factors.get('owner_risk_profile', 'MEDIUM')
-    risk_multipliers = {'LOW': 0.5, 'MEDIUM': 1.0, 'HIGH': 1.5, 'CRITICAL': 2.0}
-    base_prob *= risk_multipliers.get(risk_profile, 1.0)
+    base_prob *= OWNER_RISK_MULTIPLIERS.get(risk_profile, 1.0)
 
     # Adjust for legal complexity
     complexity = case_factors.get('legal_complexity', 'medium')
-    complexity_adj = {'low': -0.1, 'medium': 0, 'high': 0.15}
-    base_prob += complexity_adj.get(complexity, 0)
+    base_prob += COMPLEXITY_PROBABILITY_ADJ.get(complexity, 0)
 
     # Adjust for precedent clarity
     precedent = case_factors.get('precedent_clarity', 'clear')
-    precedent_adj = {'clear': -0.15, 'mixed': 0, 'unclear': 0.2}
-    base_prob += precedent_adj.get(precedent, 0)
-
-    # Cap at 0.95
-    litigation_probability = min(base_prob, 0.95)
+    base_prob += PRECEDENT_PROBABILITY_ADJ.get(precedent, 0)
 
-    # Estimate duration (months)
-    base_duration = 12  # Base case
+    # Cap at 0.95 (floor at 0: favourable adjustments can exceed the base)
+    litigation_probability = min(max(base_prob, 0.0), 0.95)
 
-    # Adjust for complexity
-    complexity_duration = {'low': -3, 'medium': 0, 'high': 6}
-    base_duration += complexity_duration.get(complexity, 0)
-
-    # Adjust for precedent clarity
-    precedent_duration = {'clear': -2, 'mixed': 0, 'unclear': 4}
-    base_duration += precedent_duration.get(precedent, 0)
-
-    # Adjust for jurisdiction
+    # Estimate duration (months): base case adjusted for complexity,
+    # precedent clarity and jurisdiction
     jurisdiction = case_factors.get('jurisdiction_history', 'neutral')
-    jurisdiction_duration = {'buyer_favorable': -2, 'neutral': 0, 'owner_favorable': 3}
-    base_duration += jurisdiction_duration.get(jurisdiction, 0)
+    base_duration = (
+        12 +
+        COMPLEXITY_DURATION_ADJ.get(complexity, 0) +
+        PRECEDENT_DURATION_ADJ.get(precedent, 0) +
+        JURISDICTION_DURATION_ADJ.get(jurisdiction, 0)
+    )
 
     expected_duration = max(base_duration, 6)  # Minimum 6 months
 
@@ -258,8 +242,7 @@ def litigation_risk_assessment(case_factors: Dict) -> Dict:
 
     # Estimate costs (legal + expert fees)
     # $5k-10k per month depending on complexity
-    cost_per_month = {'low': 5000, 'medium': 7500, 'high': 10000}
-    monthly_cost = cost_per_month.get(complexity, 7500)
+    monthly_cost = LITIGATION_MONTHLY_COST.get(complexity, 7500)
     expected_cost = monthly_cost * expected_duration
 
     # Identify risk factors
@@ -293,6 +276,207 @@ def litigation_risk_assessment(case_factors: Dict) -> Dict:
     }
 
 
+def _flat_frame(table: Union[pd.DataFrame, List[Dict]]) -> pd.DataFrame:
+    """
+    DataFrame with one flat column per field.
+
+    Lists of (possibly nested) dicts, e.g. assess_holdout_risk() owner
+    profiles, are flattened with pd.json_normalize; nested keys keep only
+    their last component ('motivation.financial_need' -> 'financial_need').
+    """
+    if isinstance(table, pd.DataFrame):
+        return table
+    frame = pd.json_normalize(list(table))
+    return frame.rename(columns=lambda column: column.rsplit('.', 1)[-1])
+
+
+def _column_points(
+    frame: pd.DataFrame,
+    field: str,
+    points: Dict,
+    default,
+    unknown: Optional[float] = None
+) -> np.ndarray:
+    """
+    Points per row for a categorical column: missing columns / NaN use the
+    default level, unknown levels score `unknown` (default level points if
+    None), matching the scalar dict.get() lookups.
+    """
+    if field not in frame:
+        return np.full(len(frame), points[default], dtype=float)
+    levels = frame[field].where(frame[field].notna(), default)
+    fallback = points[default] if unknown is None else unknown
+    return levels.map(points).fillna(fallback).to_numpy(dtype=float)
+
+
+def _column_values(frame: pd.DataFrame, field: str, default: float) -> np.ndarray:
+    if field not in frame:
+        return np.full(len(frame), default, dtype=float)
+    return frame[field].fillna(default).to_numpy(dtype=float)
+
+
+def assess_holdout_risk_frame(owner_profiles: Union[pd.DataFrame, List[Dict]]) -> pd.DataFrame:
+    """
+    Holdout risk scores for many owners at once.
+
+    Columnar counterpart of assess_holdout_risk(): each row is one owner
+    with flat columns named like the owner_profile fields
+    (financial_need, emotional_attachment, business_impact,
+    real_estate_experience, legal_representation, previous_negotiations,
+    relocation_options, financial_flexibility, timeline_pressure).
+    Missing columns or NaN use the scalar defaults. A list of nested
+    owner_profile dicts is flattened first.
+
+    Args:
+        owner_profiles: DataFrame (or list of owner_profile dicts)
+
+    Returns:
+        DataFrame with motivation_score, sophistication_score,
+        alternatives_score, total_score, risk_level and holdout_probability,
+        on the same index as owner_profiles
+    """
+    profiles = _flat_frame(owner_profiles)
+
+    motivation = sum(
+        _column_points(profiles, field, points, default)
+        for field, (points, default) in HOLDOUT_MOTIVATION_POINTS.items()
+    )
+
+    experience_points, experience_default = HOLDOUT_EXPERIENCE_POINTS
+    legal = _column_values(profiles, 'legal_representation', False).astype(bool)
+    previous = _column_values(profiles, 'previous_negotiations', 0)
+    sophistication = (
+        _column_points(profiles, 'real_estate_experience', experience_points, experience_default) +
+        np.where(legal, 3, 0) +
+        np.select([previous >= 3, previous >= 1], [2, 1], 0)
+    )
+
+    alternatives = sum(
+        _column_points(profiles, field, points, default)
+        for field, (points, default) in HOLDOUT_ALTERNATIVES_POINTS.items()
+    )
+
+    total = np.minimum(motivation + sophistication + alternatives, 30)
+
+    # Levels are listed from the highest threshold down
+    thresholds = [minimum for minimum, _, _ in reversed(HOLDOUT_RISK_LEVELS)]
+    band = np.searchsorted(thresholds, total, side='right') - 1
+    levels = np.array([level for _, level, _ in reversed(HOLDOUT_RISK_LEVELS)])
+    probabilities = np.array([prob for _, _, prob in reversed(HOLDOUT_RISK_LEVELS)])
+
+    return pd.DataFrame({
+        'motivation_score': motivation,
+        'sophistication_score': sophistication,
+        'alternatives_score': alternatives,
+        'total_score': total,
+        'risk_level': levels[band],
+        'holdout_probability': probabilities[band]
+    }, index=profiles.index)
+
+
+def litigation_risk_assessment_frame(case_factors: Union[pd.DataFrame, List[Dict]]) -> pd.DataFrame:
+    """
+    Litigation probability, duration and cost for many cases at once.
+
+    Columnar counterpart of litigation_risk_assessment(): each row is one
+    case with columns named like the case_factors fields. Missing columns
+    or NaN use the scalar defaults.
+
+    Args:
+        case_factors: DataFrame (or list of case_factors dicts)
+
+    Returns:
+        DataFrame with gap_percentage, litigation_probability,
+        expected_duration_months, duration_best/duration_worst,
+        expected_cost and cost_best/cost_worst, on the same index as
+        case_factors
+    """
+    cases = _flat_frame(case_factors)
+
+    gap = _column_values(cases, 'valuation_gap', 0)
+    value = _column_values(cases, 'property_value', 1)
+    gap_percentage = np.divide(gap * 100, value, out=np.zeros(len(cases)), where=value > 0)
+
+    bounds = [bound for bound, _ in LITIGATION_GAP_PROBABILITIES]
+    gap_probabilities = np.array([prob for _, prob in LITIGATION_GAP_PROBABILITIES])
+    probability = gap_probabilities[np.searchsorted(bounds, gap_percentage, side='right')]
+    probability = probability * _column_points(cases, 'owner_risk_profile', OWNER_RISK_MULTIPLIERS, 'MEDIUM')
+    probability += _column_points(cases, 'legal_complexity', COMPLEXITY_PROBABILITY_ADJ, 'medium')
+    probability += _column_points(cases, 'precedent_clarity', PRECEDENT_PROBABILITY_ADJ, 'clear', unknown=0)
+    probability = np.clip(probability, 0.0, 0.95)
+
+    duration = np.maximum(
+        12 +
+        _column_points(cases, 'legal_complexity', COMPLEXITY_DURATION_ADJ, 'medium') +
+        _column_points(cases, 'precedent_clarity', PRECEDENT_DURATION_ADJ, 'clear', unknown=0) +
+        _column_points(cases, 'jurisdiction_history', JURISDICTION_DURATION_ADJ, 'neutral'),
+        6
+    )
+    monthly_cost = _column_points(cases, 'legal_complexity', LITIGATION_MONTHLY_COST, 'medium')
+    best = np.maximum(duration * 0.7, 6)
+    worst = duration * 1.5
+
+    return pd.DataFrame({
+        'gap_percentage': gap_percentage,
+        'litigation_probability': probability,
+        'expected_duration_months': duration,
+        'duration_best': best,
+        'duration_worst': worst,
+        'expected_cost': monthly_cost * duration,
+        'cost_best': monthly_cost * best,
+        'cost_worst': monthly_cost * worst
+    }, index=cases.index)
+
+
+def score_risk_portfolio(parcels: Union[pd.DataFrame, List[Dict]]) -> pd.DataFrame:
+    """
+    Score holdout and litigation risk for a whole parcel portfolio.
+
+    Each row combines an owner profile and case factors (flat columns, see
+    assess_holdout_risk_frame() and litigation_risk_assessment_frame()).
+    Where owner_risk_profile is missing it is taken from the row's holdout
+    risk level, as a caller of the scalar functions would chain them.
+
+    The result is ranked by litigation probability, then holdout score, then
+    expected litigation cost (probability × expected cost), and feeds the
+    batch negotiation functions directly, e.g.:
+
+        risk = score_risk_portfolio(parcels)
+        batna = calculate_batna_frame(hearing_inputs.join(risk['expected_cost'].rename('legal_fees')))
+        ev = probability_weighted_ev_frame(
+            np.column_stack([offers, batna['net_batna']]),
+            np.column_stack([1 - risk['litigation_probability'], risk['litigation_probability']])
+        )
+
+    Args:
+        parcels: DataFrame (or list of dicts) of owner profiles and case factors
+
+    Returns:
+        DataFrame of the input columns plus holdout and litigation scores,
+        expected_litigation_cost and risk_rank (1 = highest risk), sorted by
+        risk_rank and keeping the input index
+    """
+    table = _flat_frame(parcels)
+    holdout = assess_holdout_risk_frame(table)
+
+    if 'owner_risk_profile' in table:
+        owner_risk = table['owner_risk_profile'].fillna(holdout['risk_level'])
+    else:
+        owner_risk = holdout['risk_level']
+    litigation = litigation_risk_assessment_frame(table.assign(owner_risk_profile=owner_risk))
+
+    scored = pd.concat([table.drop(columns=holdout.columns.intersection(table.columns)), holdout, litigation], axis=1)
+    scored['owner_risk_profile'] = owner_risk
+    scored['expected_litigation_cost'] = scored['litigation_probability'] * scored['expected_cost']
+
+    ranked = scored.sort_values(
+        ['litigation_probability', 'total_score', 'expected_litigation_cost'],
+        ascending=False, kind='stable'
+    )
+    ranked.insert(0, 'risk_rank', np.arange(1, len(ranked) + 1))
+    return ranked
+
+
 def probability_distribution(
     scenarios: List[Dict],
     distribution_type: str = 'discrete'
@@ -443,6 +627,59 @@ def monte_carlo_simulation(
     }
 
 
+def monte_carlo_samples(
+    variables: Dict[str, Dict],
+    iterations: int = 1000,
+    size: int = 1,
+    rng: Optional[np.random.Generator] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized Monte Carlo samples for many cases at once.
+
+    Array counterpart of monte_carlo_simulation() using the same
+    distribution specs (triangular / normal / uniform; other types are
+    deterministic at 'mean'). Parameters may be scalars or arrays of
+    length size (one value per case, e.g. per parcel).
+
+    Args:
+        variables: Dict of variable distributions (monte_carlo_simulation() format)
+        iterations: Number of samples per case
+        size: Number of cases
+        rng: numpy Generator (default: fresh unseeded generator)
+
+    Returns:
+        Dict mapping variable name to an (iterations × size) sample array
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    samples = {}
+    for name, dist in variables.items():
+        dist_type = dist.get('type', 'normal')
+
+        def param(key, default):
+            return np.broadcast_to(np.asarray(dist.get(key, default), dtype=float), (size,))
+
+        if dist_type == 'triangular':
+            # Inverse CDF (also valid for degenerate min == max)
+            low, mode, high = param('min', 0), param('most_likely', 50), param('max', 100)
+            u = rng.random((iterations, size))
+            spread = high - low
+            split = np.divide(mode - low, spread, out=np.zeros(size), where=spread > 0)
+            values = np.where(
+                u < split,
+                low + np.sqrt(u * spread * (mode - low)),
+                high - np.sqrt((1 - u) * spread * (high - mode))
+            )
+        elif dist_type == 'normal':
+            values = param('mean', 0) + param('std_dev', 1) * rng.standard_normal((iterations, size))
+        elif dist_type == 'uniform':
+            low, high = param('min', 0), param('max', 100)
+            values = low + (high - low) * rng.random((iterations, size))
+        else:
+            values = np.repeat(param('mean', 0)[None, :], iterations, axis=0)
+        samples[name] = values
+    return samples
+
+
 def sensitivity_analysis(
     base_case: Dict,
     variables: Dict[str, List[float]],
@@ -0,0 +1,591 @@
+#!/usr/bin/env python3
+"""
+Severance Utilities Module
+Provides batch severance damages for the partial takings of a linear
+project (highway widening, transit corridors) at once.
+
+The rules follow the reference severance calculator
+(calculate_severance_damages() and its MarketParameters in
+docs/skills/severance-damages-quantification/), applied as array
+operations over columnar tables instead of one PropertyBefore / Taking /
+Remainder at a time:
+- Access: frontage loss ($/LF by road class and use), capitalized
+  circuitous-access time cost and landlocked easement remedy
+- Shape: efficiency index before/after, category discount, buildable area
+  and development yield loss
+- Utility: site servicing and development potential reduction
+- Farm: field division, equipment access and irrigation (agricultural only)
+
+severance_damages_frame() returns one register row per taking with every
+component, total and before/after reconciliation. Per-taking JSON reports
+(the save_to_json() layout with analysis notes) are rendered in a process
+pool by render_severance_reports(), and write_damages_register() writes the
+consolidated register with optional per-taking reports.
+
+Used by:
+- Shared_Utils/parcel_geometry_utils.py (SQ_M_PER_ACRE)
+- Eff_Rent_Calculator/Tests/test_severance_utils.py
+- Eff_Rent_Calculator/Tests/test_parcel_geometry_utils.py
+"""
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# Market parameters (MarketParameters / load_from_json() defaults in the reference calculator)
+SEVERANCE_PARAMETERS = {
+    'cap_rate': 0.07,
+    'travel_time_value_per_hour': 40.0,
+    'trips_per_day': 20,
+    'business_days_per_year': 250
+}
+
+# Frontage value by road classification and use ($/linear foot, low-high)
+FRONTAGE_VALUES = {
+    'highway': {
+        'commercial': (500, 1500),
+        'industrial': (300, 800),
+        'residential': (150, 400),
+        'agricultural': (50, 150)
+    },
+    'arterial': {
+        'commercial': (300, 800),
+        'industrial': (200, 500),
+        'residential': (100, 250),
+        'agricultural': (30, 100)
+    },
+    'collector': {
+        'commercial': (150, 400),
+        'industrial': (100, 300),
+        'residential': (50, 150),
+        'agricultural': (20, 60)
+    },
+    'local': {
+        'residential': (25, 75),
+        'agricultural': (10, 30),
+        'commercial': (50, 150),
+        'industrial': (40, 120)
+    }
+}
+DEFAULT_FRONTAGE_RATE = 50.0   # Road class / use combination not listed
+
+# Shape efficiency categories (lower bound of index) and value discounts
+SHAPE_EFFICIENCY_BREAKS = {'high': 0.8, 'moderate': 0.6, 'low': 0.4, 'very_low': -np.inf}
+SHAPE_EFFICIENCY_DISCOUNTS = {'high': 0.02, 'moderate': 0.08, 'low': 0.15, 'very_low': 0.30}
+SHAPE_CATEGORIES = list(SHAPE_EFFICIENCY_BREAKS)
+LANDLOCKED_EFFICIENCY_INDEX = 0.2   # No frontage to measure
+
+SQ_FT_PER_ACRE = 43560.0
+SQ_M_PER_ACRE = 4046.86
+
+# Capitalization multiple when cap_rate <= 0
+NO_CAP_RATE_MULTIPLE = 10.0
+
+# Landlocked remedy: easement at a share of fee value plus transaction costs
+EASEMENT_WIDTH_M = 20.0
+EASEMENT_LENGTH_M = 200.0
+EASEMENT_VALUE_PCT = 0.12
+EASEMENT_LEGAL_COSTS = 25000.0
+EASEMENT_SURVEY_COSTS = 8000.0
+
+# Lost buildable area ($/sf) and development yield ($/unit)
+BUILDABLE_SF_VALUE_COMMERCIAL = 250.0   # Commercial / industrial
+BUILDABLE_SF_VALUE_OTHER = 150.0
+UNIT_VALUE_INDUSTRIAL = 500000.0
+UNIT_VALUE_OTHER = 150000.0
+
+# Utility servicing (severed water/sewer relocation plus drainage)
+UTILITY_RELOCATION_LENGTH_M = 400.0
+WATER_COST_PER_M = 500.0
+SEWER_COST_PER_M = 800.0
+DRAINAGE_COST = 195000.0
+DEVELOPMENT_POTENTIAL_DISCOUNT = 0.10
+
+# Farm operation disruption
+FENCING_COST_PER_M = 20.0
+DRAINAGE_ENGINEERING_COST = 8000.0
+TILE_INSTALLATION_LENGTH_M = 1500.0
+TILE_COST_PER_M = 15.0
+EQUIPMENT_CROSSINGS_PER_YEAR = 30
+EQUIPMENT_OPERATOR_COST_PER_HOUR = 150.0
+IRRIGATION_REPAIR_COST = 180000.0
+IRRIGATION_PREMIUM_PER_ACRE = 2000.0
+
+# Optional columns of the before / taking / remainder tables
+BEFORE_DEFAULTS = {
+    'development_potential_units': 0,
+    'buildable_area_sf': 0
+}
+
+TAKING_DEFAULTS = {
+    'eliminates_direct_access': False,
+    'circuitous_access_added_minutes': 0.0,
+    'creates_irregular_shape': False,
+    'severs_utilities': False,
+    'reduces_development_potential': False,
+    'bisects_farm': False,
+    'disrupts_irrigation': False
+}
+
+REMAINDER_DEFAULTS = {
+    'buildable_area_sf': 0,
+    'development_potential_units': 0,
+    'requires_new_fencing_linear_meters': 0.0,
+    'irrigation_acres_affected': 0.0
+}
+
+
+def _column(frame: pd.DataFrame, name: str, defaults: Dict, dtype=float) -> np.ndarray:
+    if name in frame:
+        values = frame[name]
+        if name in defaults:
+            # Optional fields may be None / NaN per row
+            values = values.fillna(defaults[name])
+        return values.to_numpy(dtype=dtype)
+    if name in defaults:
+        return np.full(len(frame), defaults[name], dtype=dtype)
+    raise ValueError(f"Missing required column '{name}'")
+
+
+def _capitalize(annual: np.ndarray, cap_rate: float) -> np.ndarray:
+    if cap_rate <= 0:
+        return annual * NO_CAP_RATE_MULTIPLE
+    return annual / cap_rate
+
+
+def frontage_rate_array(
+    road_classification,
+    use,
+    frontage_values: Optional[Dict] = None
+) -> np.ndarray:
+    """
+    Midpoint frontage value ($/LF) for each road classification and use.
+
+    Args:
+        road_classification: 'highway', 'arterial', 'collector', 'local' per row
+        use: 'industrial', 'commercial', 'residential', 'agricultural' per row
+        frontage_values: Overrides FRONTAGE_VALUES
+
+    Returns:
+        Array of rates; DEFAULT_FRONTAGE_RATE for unlisted combinations
+    """
+    table = FRONTAGE_VALUES if frontage_values is None else frontage_values
+    keys = pd.MultiIndex.from_arrays([np.asarray(road_classification), np.asarray(use)])
+    rates = pd.Series({
+        (road, property_use): (low + high) / 2
+        for road, uses in table.items()
+        for property_use, (low, high) in uses.items()
+    }, dtype=float)
+    return rates.reindex(keys).fillna(DEFAULT_FRONTAGE_RATE).to_numpy()
+
+
+def shape_efficiency_index_array(acres, frontage_lf, frontage_depth_ratio=None) -> np.ndarray:
+    """
+    Shape efficiency index (1.0 = square) for many parcels.
+
+    Vectorized calculate_shape_efficiency_index(): the area-to-perimeter
+    ratio of a frontage × depth rectangle relative to a square of the same
+    area. Depth is frontage / frontage_depth_ratio, or area / frontage where
+    the ratio is missing (NaN).
+
+    Args:
+        acres: Parcel area
+        frontage_lf: Road frontage (0 = landlocked)
+        frontage_depth_ratio: Frontage:depth ratio (e.g. 1:4 = 0.25)
+
+    Returns:
+        Array of efficiency indices; LANDLOCKED_EFFICIENCY_INDEX where
+        frontage or ratio is 0
+    """
+    area_sf = np.asarray(acres, dtype=float) * SQ_FT_PER_ACRE
+    frontage = np.broadcast_to(np.asarray(frontage_lf, dtype=float), area_sf.shape)
+    ratio = np.full(area_sf.shape, np.nan) if frontage_depth_ratio is None else np.broadcast_to(
+        np.asarray(frontage_depth_ratio, dtype=float), area_sf.shape
+    )
+
+    landlocked = (frontage == 0) | (ratio == 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        depth = np.where(np.isnan(ratio), area_sf / frontage, frontage / ratio)
+        efficiency = 4 * np.sqrt(area_sf) / (2 * (frontage + depth))
+    return np.where(landlocked, LANDLOCKED_EFFICIENCY_INDEX, efficiency)
+
+
+def categorize_shape_efficiency_array(efficiency_index) -> np.ndarray:
+    """Shape efficiency category ('high', 'moderate', 'low', 'very_low') per index"""
+    efficiency_index = np.asarray(efficiency_index, dtype=float)
+    return np.select(
+        [efficiency_index >= SHAPE_EFFICIENCY_BREAKS[category] for category in SHAPE_CATEGORIES[:-1]],
+        SHAPE_CATEGORIES[:-1],
+        SHAPE_CATEGORIES[-1]
+    )
+
+
+def _efficiency_index(frame: pd.DataFrame, acres: np.ndarray, frontage_column: str) -> np.ndarray:
+    """Measured efficiency_index column (parcel geometry) or the frontage × depth rectangle"""
+    if 'efficiency_index' in frame:
+        return _column(frame, 'efficiency_index', {})
+    return shape_efficiency_index_array(
+        acres, _column(frame, frontage_column, {}), _column(frame, 'shape_ratio_frontage_depth', {})
+    )
+
+
+def severance_damages_frame(
+    before: pd.DataFrame,
+    taking: pd.DataFrame,
+    remainder: pd.DataFrame,
+    params: Optional[Dict] = None
+) -> pd.DataFrame:
+    """
+    Severance damages register for many partial takings.
+
+    Batch mode of calculate_severance_damages(): the access, shape, utility
+    and farm rules evaluated as arrays over all takings.
+
+    Args:
+        before: One row per taking with PropertyBefore columns (total_acres,
+            frontage_linear_feet, road_classification,
+            shape_ratio_frontage_depth, value_per_acre, use and optional
+            development_potential_units, buildable_area_sf)
+        taking: Taking columns (area_taken_acres, frontage_lost_linear_feet,
+            creates_landlocked and optional flags / added minutes)
+        remainder: Remainder columns (acres, frontage_remaining_linear_feet,
+            shape_ratio_frontage_depth, access_type and optional
+            buildable_area_sf, development_potential_units,
+            requires_new_fencing_linear_meters, irrigation_acres_affected)
+            An efficiency_index column in before / remainder (e.g. from
+            parcel_geometry_utils.severance_geometry_tables()) replaces
+            the shape_ratio_frontage_depth rectangle.
+        params: Overrides of SEVERANCE_PARAMETERS, plus optional
+            frontage_values / shape_efficiency_discounts tables
+
+    Returns:
+        DataFrame on the shared index with the identifying inputs, every
+        damage component, category totals, total_severance_damages and the
+        before/after reconciliation (before_value_total, before_value_taken,
+        before_value_remainder_proportionate, after_value_remainder,
+        total_compensation)
+    """
+    if not (before.index.equals(taking.index) and before.index.equals(remainder.index)):
+        raise ValueError("before, taking and remainder must share the same index")
+    p = {**SEVERANCE_PARAMETERS, **(params or {})}
+    discounts = {**SHAPE_EFFICIENCY_DISCOUNTS, **p.get('shape_efficiency_discounts', {})}
+    cap_rate = float(p['cap_rate'])
+
+    total_acres = _column(before, 'total_acres', {})
+    if (total_acres <= 0).any():
+        raise ValueError("total_acres must be > 0")
+    value_per_acre = _column(before, 'value_per_acre', {})
+    use = _column(before, 'use', {}, dtype=object)
+    road = _column(before, 'road_classification', {}, dtype=object)
+    remainder_acres = _column(remainder, 'acres', {})
+    area_taken = _column(taking, 'area_taken_acres', {})
+    access_type = _column(remainder, 'access_type', {}, dtype=object)
+    minutes = _column(taking, 'circuitous_access_added_minutes', TAKING_DEFAULTS)
+    remainder_base_value = remainder_acres * value_per_acre
+
+    def flag(name):
+        return _column(taking, name, TAKING_DEFAULTS, dtype=bool)
+
+    # Access: frontage loss, circuitous access, landlocked remedy
+    frontage_lost = _column(taking, 'frontage_lost_linear_feet', {})
+    lost = frontage_lost > 0
+    frontage_rate = np.where(lost, frontage_rate_array(road, use, p.get('frontage_values')), 0.0)
+    frontage_loss_value = np.where(lost, frontage_lost * frontage_rate, 0.0)
+
+    circuitous = flag('eliminates_direct_access') & (minutes > 0)
+    annual_trips = p['trips_per_day'] * p['business_days_per_year']
+    annual_time_cost = np.where(
+        circuitous, annual_trips * minutes / 60.0 * p['travel_time_value_per_hour'], 0.0
+    )
+    circuitous_access_cost = _capitalize(annual_time_cost, cap_rate)
+
+    landlocked = flag('creates_landlocked') | (access_type == 'landlocked')
+    easement_acres = EASEMENT_WIDTH_M * EASEMENT_LENGTH_M / SQ_M_PER_ACRE
+    landlocked_remedy_cost = np.where(
+        landlocked,
+        easement_acres * value_per_acre * EASEMENT_VALUE_PCT + EASEMENT_LEGAL_COSTS + EASEMENT_SURVEY_COSTS,
+        0.0
+    )
+    total_access = frontage_loss_value + circuitous_access_cost + landlocked_remedy_cost
+
+    # Shape: efficiency discount, buildable area, development yield
+    efficiency_before = _efficiency_index(before, total_acres, 'frontage_linear_feet')
+    efficiency_after = _efficiency_index(remainder, remainder_acres, 'frontage_remaining_linear_feet')
+    category = categorize_shape_efficiency_array(efficiency_after)
+    discount = pd.Series(category).map(discounts).to_numpy(dtype=float)
+    geometric = np.where(flag('creates_irregular_shape'), remainder_base_value * discount, 0.0)
+
+    share = remainder_acres / total_acres
+    commercial = np.isin(use, ['commercial', 'industrial'])
+    buildable_before = _column(before, 'buildable_area_sf', BEFORE_DEFAULTS)
+    buildable_after = _column(remainder, 'buildable_area_sf', REMAINDER_DEFAULTS)
+    buildable_reduced = (buildable_before != 0) & (buildable_after != 0) & (buildable_after < buildable_before)
+    buildable_value = np.where(
+        buildable_reduced,
+        (buildable_before * share - buildable_after)
+        * np.where(commercial, BUILDABLE_SF_VALUE_COMMERCIAL, BUILDABLE_SF_VALUE_OTHER),
+        0.0
+    )
+
+    units_before = _column(before, 'development_potential_units', BEFORE_DEFAULTS)
+    units_after = _column(remainder, 'development_potential_units', REMAINDER_DEFAULTS)
+    unit_reduction = np.trunc(units_before * share) - units_after
+    yield_loss = np.where(
+        (units_before != 0) & (units_after != 0) & (unit_reduction > 0),
+        unit_reduction * np.where(use == 'industrial', UNIT_VALUE_INDUSTRIAL, UNIT_VALUE_OTHER),
+        0.0
+    )
+    total_shape = geometric + buildable_value + yield_loss
+
+    # Utility: servicing and development potential (unless captured in shape)
+    servicing = UTILITY_RELOCATION_LENGTH_M * (WATER_COST_PER_M + SEWER_COST_PER_M) + DRAINAGE_COST
+    site_servicing = np.where(flag('severs_utilities'), servicing, 0.0)
+    development_reduction = np.where(
+        flag('reduces_development_potential') & ~flag('creates_irregular_shape'),
+        remainder_base_value * DEVELOPMENT_POTENTIAL_DISCOUNT,
+        0.0
+    )
+    total_utility = site_servicing + development_reduction
+
+    # Farm: agricultural takings only
+    agricultural = use == 'agricultural'
+    bisects = agricultural & flag('bisects_farm')
+    fencing_m = _column(remainder, 'requires_new_fencing_linear_meters', REMAINDER_DEFAULTS)
+    divided = bisects & (fencing_m > 0)
+    fencing_cost = np.where(divided, fencing_m * FENCING_COST_PER_M, 0.0)
+    drainage = np.where(divided, DRAINAGE_ENGINEERING_COST + TILE_INSTALLATION_LENGTH_M * TILE_COST_PER_M, 0.0)
+    field_division = fencing_cost + drainage
+
+    annual_equipment = np.where(
+        bisects & (minutes > 0),
+        EQUIPMENT_CROSSINGS_PER_YEAR * (minutes * 2 / 60.0) * EQUIPMENT_OPERATOR_COST_PER_HOUR,
+        0.0
+    )
+    equipment = _capitalize(annual_equipment, cap_rate)
+
+    irrigation_acres = _column(remainder, 'irrigation_acres_affected', REMAINDER_DEFAULTS)
+    irrigated = agricultural & flag('disrupts_irrigation') & (irrigation_acres > 0)
+    irrigation_repair = np.where(irrigated, IRRIGATION_REPAIR_COST, 0.0)
+    # Lower of cost to cure and value loss
+    irrigation = np.where(
+        irrigated, np.minimum(IRRIGATION_REPAIR_COST, irrigation_acres * IRRIGATION_PREMIUM_PER_ACRE), 0.0
+    )
+    total_farm = field_division + equipment + irrigation
+
+    total = total_access + total_shape + total_utility + total_farm
+    before_value_taken = area_taken * value_per_acre
+
+    return pd.DataFrame({
+        'use': use,
+        'road_classification': road,
+        'total_acres': total_acres,
+        'frontage_linear_feet': _column(before, 'frontage_linear_feet', {}),
+        'value_per_acre': value_per_acre,
+        'area_taken_acres': area_taken,
+        'frontage_lost_linear_feet': frontage_lost,
+        'remainder_acres': remainder_acres,
+        'frontage_remaining_linear_feet': _column(remainder, 'frontage_remaining_linear_feet', {}),
+        'access_type': access_type,
+        'frontage_loss_value': frontage_loss_value,
+        'frontage_rate_per_lf': frontage_rate,
+        'circuitous_access_cost': circuitous_access_cost,
+        'annual_time_cost': annual_time_cost,
+        'landlocked_remedy_cost': landlocked_remedy_cost,
+        'total_access_damages': total_access,
+        'efficiency_index_before': efficiency_before,
+        'efficiency_index_after': efficiency_after,
+        'efficiency_category': category,
+        'value_discount_pct': discount,
+        'geometric_inefficiency_value': geometric,
+        'buildable_area_reduction_value': buildable_value,
+        'development_yield_loss': yield_loss,
+        'total_shape_damages': total_shape,
+        'site_servicing_costs': site_servicing,
+        'development_potential_reduction': development_reduction,
+        'total_utility_damages': total_utility,
+        'fencing_cost': fencing_cost,
+        'drainage_modifications': drainage,
+        'field_division_costs': field_division,
+        'annual_equipment_time_cost': annual_equipment,
+        'equipment_access_complications': equipment,
+        'irrigation_repair_cost': irrigation_repair,
+        'irrigation_system_impacts': irrigation,
+        'total_farm_damages': total_farm,
+        'total_severance_damages': total,
+        'before_value_total': total_acres * value_per_acre,
+        'before_value_taken': before_value_taken,
+        'before_value_remainder_proportionate': remainder_base_value,
+        'after_value_remainder': remainder_base_value - total,
+        'total_compensation': before_value_taken + total
+    }, index=before.index)
+
+
+# ============================================================================
+# PARALLEL REPORT RENDERING
+# ============================================================================
+
+def _severance_report(task) -> Dict:
+    """One register row as the save_to_json() report layout."""
+    r, analysis_date = task
+    return {
+        'analysis_date': analysis_date,
+        'property_before': {
+            'total_acres': r['total_acres'],
+            'frontage_linear_feet': r['frontage_linear_feet'],
+            'road_classification': r['road_classification'],
+            'use': r['use'],
+            'value_per_acre': r['value_per_acre'],
+            'total_value': r['before_value_total']
+        },
+        'taking': {
+            'area_taken_acres': r['area_taken_acres'],
+            'frontage_lost_linear_feet': r['frontage_lost_linear_feet'],
+            'value_of_land_taken': r['before_value_taken']
+        },
+        'remainder': {
+            'acres': r['remainder_acres'],
+            'frontage_remaining_linear_feet': r['frontage_remaining_linear_feet'],
+            'access_type': r['access_type'],
+            'proportionate_value': r['before_value_remainder_proportionate'],
+            'actual_value_after_severance': r['after_value_remainder']
+        },
+        'severance_damages': {
+            'access_impairment': {
+                'frontage_loss_value': r['frontage_loss_value'],
+                'frontage_rate_per_lf': r['frontage_rate_per_lf'],
+                'circuitous_access_cost': r['circuitous_access_cost'],
+                'annual_time_cost': r['annual_time_cost'],
+                'landlocked_remedy_cost': r['landlocked_remedy_cost'],
+                'total': r['total_access_damages']
+            },
+            'shape_irregularity': {
+                'efficiency_index_before': r['efficiency_index_before'],
+                'efficiency_index_after': r['efficiency_index_after'],
+                'efficiency_category': r['efficiency_category'],
+                'value_discount_pct': r['value_discount_pct'],
+                'geometric_inefficiency_value': r['geometric_inefficiency_value'],
+                'buildable_area_reduction': r['buildable_area_reduction_value'],
+                'development_yield_loss': r['development_yield_loss'],
+                'total': r['total_shape_damages']
+            },
+            'utility_impairment': {
+                'site_servicing_costs': r['site_servicing_costs'],
+                'development_potential_reduction': r['development_potential_reduction'],
+                'total': r['total_utility_damages']
+            },
+            'farm_operation_disruption': {
+                'fencing_cost': r['fencing_cost'],
+                'drainage_modifications': r['drainage_modifications'],
+                'field_division_costs': r['field_division_costs'],
+                'equipment_access_complications': r['equipment_access_complications'],
+                'irrigation_system_impacts': r['irrigation_system_impacts'],
+                'total': r['total_farm_damages']
+            },
+            'total_severance_damages': r['total_severance_damages']
+        },
+        'reconciliation': {
+            'before_total_value': r['before_value_total'],
+            'land_taken_value': r['before_value_taken'],
+            'remainder_proportionate_value': r['before_value_remainder_proportionate'],
+            'severance_damages': r['total_severance_damages'],
+            'remainder_value_after_severance': r['after_value_remainder'],
+            'total_compensation': r['total_compensation']
+        },
+        'analysis_notes': [
+            f"Property: {r['total_acres']:.1f} acres, {r['use']} use",
+            f"Taking: {r['area_taken_acres']:.1f} acres "
+            f"({r['area_taken_acres'] / r['total_acres'] * 100:.1f}%)",
+            f"Remainder: {r['remainder_acres']:.1f} acres with {r['access_type']} access",
+            f"Total severance damages: ${r['total_severance_damages']:,.2f}"
+        ]
+    }
+
+
+def render_severance_reports(
+    register: pd.DataFrame,
+    max_workers: Optional[int] = None,
+    chunksize: int = 64,
+    analysis_date: Optional[date] = None
+) -> Dict[object, Dict]:
+    """
+    Render per-taking JSON reports from a damages register in a process pool.
+
+    Args:
+        register: Output of severance_damages_frame()
+        max_workers: Worker processes (None = CPU count; 1 = run in-process)
+        chunksize: Takings per task sent to each worker
+        analysis_date: Report date (default today)
+
+    Returns:
+        Report dict (save_to_json() layout) per register index
+    """
+    stamp = (analysis_date or date.today()).isoformat()
+    # Plain Python scalars so reports serialize with json
+    rows = json.loads(register.to_json(orient='records', double_precision=15))
+    tasks = [(row, stamp) for row in rows]
+
+    if max_workers == 1:
+        reports = [_severance_report(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            reports = list(executor.map(_severance_report, tasks, chunksize=chunksize))
+
+    return dict(zip(register.index, reports))
+
+
+def write_damages_register(
+    register: pd.DataFrame,
+    output_dir: str = ".",
+    name: str = "severance_damages_register",
+    reports: bool = False,
+    max_workers: Optional[int] = None
+) -> Dict[str, str]:
+    """
+    Write the consolidated damages register (and optional per-taking reports).
+
+    Args:
+        register: Output of severance_damages_frame()
+        output_dir: Directory to write into
+        name: Register file stem
+        reports: Also write one <index>.json report per taking under
+            <output_dir>/<name>_reports/
+        max_workers: Report rendering workers (see render_severance_reports())
+
+    Returns:
+        Dict of files created ('register', 'summary' and, with reports,
+        'reports' directory)
+    """
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+    files = {}
+
+    register_file = output / f"{name}.csv"
+    register.to_csv(register_file, index_label='taking_id')
+    files['register'] = str(register_file)
+
+    categories = [
+        'total_access_damages', 'total_shape_damages', 'total_utility_damages',
+        'total_farm_damages', 'total_severance_damages', 'before_value_taken', 'total_compensation'
+    ]
+    summary = register.groupby('use')[categories].sum()
+    summary.insert(0, 'takings', register.groupby('use').size())
+    summary.loc['total'] = summary.sum()
+    summary_file = output / f"{name}_summary.csv"
+    summary.to_csv(summary_file)
+    files['summary'] = str(summary_file)
+
+    if reports:
+        report_dir = output / f"{name}_reports"
+        report_dir.mkdir(exist_ok=True)
+        for taking_id, report in render_severance_reports(register, max_workers).items():
+            with open(report_dir / f"{taking_id}.json", 'w') as f:
+                json.dump(report, f, indent=2)
+        files['reports'] = str(report_dir)
+
+    return files
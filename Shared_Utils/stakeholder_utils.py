@@ -4,16 +4,162 @@ Stakeholder Analysis Utilities Module
 Provides shared functions for stakeholder feedback categorization, sentiment analysis,
 frequency weighting, response strategy generation, and commitments tracking.
 
+Keywords are matched on word boundaries by one compiled KeywordMatcher per
+keyword set, so each comment is scanned once. ConsultationAnalyzer /
+analyze_comments() stream large consultations (50k+ comments) through a
+process pool and accumulate theme counts, sentiment and commitments
+incrementally.
+
 Used by:
 - consultation_summarizer.py
 - briefing_note_generator.py
 """
 
-from typing import Dict, List, Set, Optional, Tuple
-from collections import defaultdict, Counter
+from typing import Dict, Hashable, Iterable, Iterator, List, Set, Optional, Sequence, Tuple
+from collections import defaultdict, deque, Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
+import os
 import re
 
 
+# Sentiment keywords used by sentiment_analysis()
+SUPPORT_KEYWORDS = [
+    'support', 'great', 'excellent', 'good', 'approve', 'favor',
+    'positive', 'benefit', 'improve', 'love', 'like', 'excited',
+    'appreciate', 'yes', 'agree'
+]
+
+OPPOSITION_KEYWORDS = [
+    'oppose', 'against', 'no', 'bad', 'terrible', 'concern', 'worried',
+    'negative', 'harm', 'damage', 'destroy', 'ruin', 'hate', 'dislike',
+    'disagree', 'unacceptable', 'unfair'
+]
+
+NEUTRAL_KEYWORDS = [
+    'question', 'clarify', 'understand', 'information', 'detail',
+    'when', 'how', 'what', 'where'
+]
+
+# Inflections accepted after a keyword of at least KEYWORD_INFLECTION_MIN_LENGTH
+# letters ('concern' matches 'concerned'); shorter keywords match only as
+# written ('no' does not match 'nod', 'noes', 'know' or 'north')
+KEYWORD_SUFFIXES = ['s', 'es', 'd', 'ed', 'ing']
+KEYWORD_INFLECTION_MIN_LENGTH = 4
+
+# Explicit inflected forms, replacing KEYWORD_SUFFIXES for keywords whose
+# suffixed forms are different words ('goods', 'whats')
+KEYWORD_INFLECTIONS = {
+    'good': [],
+    'what': [],
+    'when': []
+}
+
+# Commitment phrases extracted by commitments_matrix()
+COMMITMENT_PATTERNS = [
+    r'will\s+([^.]+)',
+    r'commit\s+to\s+([^.]+)',
+    r'ensure\s+([^.]+)',
+    r'guarantee\s+([^.]+)',
+    r'promise\s+([^.]+)'
+]
+_COMMITMENT_REGEXES = [re.compile(pattern, re.IGNORECASE) for pattern in COMMITMENT_PATTERNS]
+_COMMITMENT_TRIGGER = re.compile(r'(?:will|commit\s+to|ensure|guarantee|promise)\s', re.IGNORECASE)
+
+# Comments per process-pool task in ConsultationAnalyzer.update()
+COMMENT_CHUNK_SIZE = 2000
+
+
+_WORD = re.compile(r'\w+')
+
+
+class KeywordMatcher:
+    """
+    Keyword groups compiled into a word-level lookup table.
+
+    Comments are tokenized once into lowercase words; every word is looked
+    up in a table keyed by the first word of each keyword (with its
+    KEYWORD_SUFFIXES inflections precomputed), so matching costs one dict
+    lookup per word however many keywords there are. Multi-word keywords
+    ('property value') match consecutive words; the last word of a keyword
+    may carry an inflection ('concern' matches 'concerned'; 'no' does not
+    match 'know' or 'nod', see _inflections()).
+    """
+
+    def __init__(self, groups: Dict[Hashable, Sequence[str]]):
+        self.groups = list(groups)
+        keywords = defaultdict(list)
+        for group, words in groups.items():
+            for keyword in words:
+                key = tuple(_WORD.findall(keyword.lower()))
+                if key and group not in keywords[key]:
+                    keywords[key].append(group)
+
+        # Entry per keyword, indexed by every accepted form of its first word
+        self._index: Dict[str, List[Tuple]] = defaultdict(list)
+        for key, key_groups in keywords.items():
+            last_forms = frozenset([key[-1]] + _inflections(key[-1]))
+            entry = (key, last_forms, [(group, ' '.join(key)) for group in key_groups])
+            for form in (last_forms if len(key) == 1 else [key[0]]):
+                self._index[form].append(entry)
+        self._index = dict(self._index)
+
+    def match(self, text: str) -> Dict[Hashable, Set[str]]:
+        """
+        Distinct keywords found in text, per group.
+
+        Args:
+            text: Comment text
+
+        Returns:
+            Dict mapping every group to the set of its keywords found
+        """
+        found = {group: set() for group in self.groups}
+        index = self._index
+        tokens = _WORD.findall(text.lower())
+        for i, token in enumerate(tokens):
+            entries = index.get(token)
+            if entries is None:
+                continue
+            for key, last_forms, credits in entries:
+                n = len(key)
+                if n > 1 and not (
+                    tuple(tokens[i + 1:i + n - 1]) == key[1:-1]
+                    and i + n <= len(tokens) and tokens[i + n - 1] in last_forms
+                ):
+                    continue
+                for group, keyword in credits:
+                    found[group].add(keyword)
+        return found
+
+
+def _inflections(word: str) -> List[str]:
+    """Inflected forms accepted for a keyword's last word"""
+    if word in KEYWORD_INFLECTIONS:
+        return list(KEYWORD_INFLECTIONS[word])
+    if len(word) < KEYWORD_INFLECTION_MIN_LENGTH:
+        return []
+    return [word + suffix for suffix in KEYWORD_SUFFIXES]
+
+
+@lru_cache(maxsize=32)
+def _compiled_matcher(groups: Tuple[Tuple[Hashable, Tuple[str, ...]], ...]) -> KeywordMatcher:
+    """KeywordMatcher cached per keyword set (also reused inside pool workers)"""
+    return KeywordMatcher(dict(groups))
+
+
+def _keyword_matcher(groups: Dict[Hashable, Sequence[str]]) -> KeywordMatcher:
+    return _compiled_matcher(tuple((group, tuple(words)) for group, words in groups.items()))
+
+
+_SENTIMENT_GROUPS = {
+    'support': SUPPORT_KEYWORDS,
+    'opposition': OPPOSITION_KEYWORDS,
+    'neutral': NEUTRAL_KEYWORDS
+}
+
+
 def categorize_themes(
     feedback: List[str],
     categories: Dict[str, List[str]]
@@ -53,22 +199,20 @@ def categorize_themes(
                 'statistics': {...}
             }
     """
+    matcher = _keyword_matcher(categories)
     categorized = defaultdict(list)
     uncategorized = []
     multi_category = []
 
     for idx, comment in enumerate(feedback):
-        comment_lower = comment.lower()
-        matched_categories = []
-
-        # Check against each category's keywords
-        for category, keywords in categories.items():
-            if any(keyword.lower() in comment_lower for keyword in keywords):
-                matched_categories.append(category)
-                categorized[category].append({
-                    'text': comment,
-                    'index': idx
-                })
+        # Check against all categories' keywords in one scan
+        found = matcher.match(comment)
+        matched_categories = [category for category in categories if found[category]]
+        for category in matched_categories:
+            categorized[category].append({
+                'text': comment,
+                'index': idx
+            })
 
         # Track uncategorized and multi-category
         if len(matched_categories) == 0:
@@ -105,6 +249,9 @@ def sentiment_analysis(comments: List[str]) -> Dict:
     """
     Analyze sentiment (support, opposition, neutral, mixed) using keyword matching.
 
+    Keywords are SUPPORT_KEYWORDS, OPPOSITION_KEYWORDS and NEUTRAL_KEYWORDS,
+    matched on word boundaries.
+
     Args:
         comments: List of comment strings
 
@@ -124,47 +271,16 @@ def sentiment_analysis(comments: List[str]) -> Dict:
                 ]
             }
     """
-    # Define sentiment keywords
-    support_keywords = [
-        'support', 'great', 'excellent', 'good', 'approve', 'favor',
-        'positive', 'benefit', 'improve', 'love', 'like', 'excited',
-        'appreciate', 'yes', 'agree'
-    ]
-
-    opposition_keywords = [
-        'oppose', 'against', 'no', 'bad', 'terrible', 'concern', 'worried',
-        'negative', 'harm', 'damage', 'destroy', 'ruin', 'hate', 'dislike',
-        'disagree', 'unacceptable', 'unfair'
-    ]
-
-    neutral_keywords = [
-        'question', 'clarify', 'understand', 'information', 'detail',
-        'when', 'how', 'what', 'where'
-    ]
-
+    matcher = _keyword_matcher(_SENTIMENT_GROUPS)
     sentiment_breakdown = []
     sentiment_counts = Counter()
 
     for comment in comments:
-        comment_lower = comment.lower()
-
-        # Count keyword matches
-        support_count = sum(1 for kw in support_keywords if kw in comment_lower)
-        opposition_count = sum(1 for kw in opposition_keywords if kw in comment_lower)
-        neutral_count = sum(1 for kw in neutral_keywords if kw in comment_lower)
-
-        # Determine sentiment
-        if support_count > 0 and opposition_count > 0:
-            sentiment = 'mixed'
-        elif support_count > opposition_count:
-            sentiment = 'support'
-        elif opposition_count > support_count:
-            sentiment = 'opposition'
-        elif neutral_count > 0:
-            sentiment = 'neutral'
-        else:
-            # Default to neutral if no keywords matched
-            sentiment = 'neutral'
+        # Count distinct keyword matches
+        found = matcher.match(comment)
+        support_count = len(found['support'])
+        opposition_count = len(found['opposition'])
+        sentiment = _classify_sentiment(support_count, opposition_count)
 
         sentiment_counts[sentiment] += 1
         sentiment_breakdown.append({
@@ -174,8 +290,26 @@ def sentiment_analysis(comments: List[str]) -> Dict:
             'opposition_keywords': opposition_count
         })
 
-    # Calculate percentages
-    total = len(comments)
+    return {
+        **_sentiment_summary(sentiment_counts, len(comments)),
+        'sentiment_breakdown': sentiment_breakdown
+    }
+
+
+def _classify_sentiment(support_count: int, opposition_count: int) -> str:
+    """Sentiment of one comment from its keyword counts"""
+    if support_count > 0 and opposition_count > 0:
+        return 'mixed'
+    elif support_count > opposition_count:
+        return 'support'
+    elif opposition_count > support_count:
+        return 'opposition'
+    # Neutral keywords or no keywords matched
+    return 'neutral'
+
+
+def _sentiment_summary(sentiment_counts: Counter, total: int) -> Dict:
+    """Counts, percentages and overall sentiment"""
     sentiment_percentages = {
         sentiment: round((count / total) * 100, 1) if total > 0 else 0
         for sentiment, count in sentiment_counts.items()
@@ -196,7 +330,6 @@ def sentiment_analysis(comments: List[str]) -> Dict:
     return {
         'sentiment_counts': dict(sentiment_counts),
         'sentiment_percentages': sentiment_percentages,
-        'sentiment_breakdown': sentiment_breakdown,
         'overall_sentiment': overall,
         'net_sentiment': sentiment_counts['support'] - sentiment_counts['opposition']
     }
@@ -227,7 +360,11 @@ def frequency_weighting(themes: Dict[str, List]) -> Dict:
             }
     """
     # Count frequency of each theme
-    theme_counts = {theme: len(comments) for theme, comments in themes.items()}
+    return _weight_theme_counts({theme: len(comments) for theme, comments in themes.items()})
+
+
+def _weight_theme_counts(theme_counts: Dict[str, int]) -> Dict:
+    """frequency_weighting() from theme comment counts"""
     total_comments = sum(theme_counts.values())
 
     # Calculate weights (frequency proportion)
@@ -387,41 +524,44 @@ def commitments_matrix(feedback: Dict[str, List]) -> List[Dict]:
                 ...
             ]
     """
-    # Extract commitments from feedback using pattern matching
-    commitment_patterns = [
-        r'will\s+([^.]+)',
-        r'commit\s+to\s+([^.]+)',
-        r'ensure\s+([^.]+)',
-        r'guarantee\s+([^.]+)',
-        r'promise\s+([^.]+)'
-    ]
-
     commitments = []
 
     for theme, comments in feedback.items():
         for comment_data in comments:
-            comment = comment_data.get('text', '')
-
-            # Search for commitment patterns
-            for pattern in commitment_patterns:
-                matches = re.findall(pattern, comment, re.IGNORECASE)
-                for match in matches:
-                    # Clean up the matched commitment
-                    commitment_text = match.strip()
-
-                    if len(commitment_text) > 10:  # Minimum length filter
-                        commitments.append({
-                            'theme': theme,
-                            'commitment': commitment_text[:200],  # Cap length
-                            'responsible_party': 'Project Team',  # Default
-                            'deadline': 'TBD',
-                            'status': 'Pending',
-                            'source': f'Comment #{comment_data.get("index", 0) + 1}'
-                        })
+            commitments.extend(
+                _commitment_record(theme, match, comment_data.get('index', 0))
+                for match in _extract_commitments(comment_data.get('text', ''))
+            )
 
     return commitments
 
 
+def _extract_commitments(comment: str) -> List[str]:
+    """Commitment phrases in a comment (COMMITMENT_PATTERNS, pattern order)"""
+    if not _COMMITMENT_TRIGGER.search(comment):
+        return []
+    phrases = []
+    for regex in _COMMITMENT_REGEXES:
+        for match in regex.findall(comment):
+            # Clean up the matched commitment
+            commitment_text = match.strip()
+            if len(commitment_text) > 10:  # Minimum length filter
+                phrases.append(commitment_text[:200])  # Cap length
+    return phrases
+
+
+def _commitment_record(theme: str, commitment: str, index: int) -> Dict:
+    """Commitment tracking record"""
+    return {
+        'theme': theme,
+        'commitment': commitment,
+        'responsible_party': 'Project Team',  # Default
+        'deadline': 'TBD',
+        'status': 'Pending',
+        'source': f'Comment #{index + 1}'
+    }
+
+
 def extract_key_quotes(comments: List[Dict], sentiment_filter: Optional[str] = None, limit: int = 5) -> List[Dict]:
     """
     Extract key representative quotes from comments.
@@ -449,3 +589,192 @@ def extract_key_quotes(comments: List[Dict], sentiment_filter: Optional[str] = N
 
     # Return top N
     return sorted_comments[:limit]
+
+
+def _analyze_chunk(task: Tuple[int, List[str], Dict[str, Sequence[str]]]) -> Dict:
+    """Theme, sentiment and commitment tallies for one chunk of comments"""
+    start, comments, categories = task
+    groups = {('theme', category): keywords for category, keywords in categories.items()}
+    groups.update({('sentiment', name): keywords for name, keywords in _SENTIMENT_GROUPS.items()})
+    matcher = _keyword_matcher(groups)
+
+    theme_counts = {}
+    sentiment_counts = Counter()
+    commitments = defaultdict(list)
+    uncategorized = multi_category = 0
+
+    for idx, comment in enumerate(comments, start=start):
+        found = matcher.match(comment)
+        sentiment_counts[_classify_sentiment(
+            len(found[('sentiment', 'support')]), len(found[('sentiment', 'opposition')])
+        )] += 1
+
+        matched = [category for category in categories if found[('theme', category)]]
+        if not matched:
+            uncategorized += 1
+            continue
+        if len(matched) > 1:
+            multi_category += 1
+        phrases = _extract_commitments(comment)
+        for category in matched:
+            theme_counts[category] = theme_counts.get(category, 0) + 1
+            commitments[category].extend(_commitment_record(category, phrase, idx) for phrase in phrases)
+
+    return {
+        'count': len(comments),
+        'theme_counts': theme_counts,
+        'sentiment_counts': sentiment_counts,
+        'uncategorized': uncategorized,
+        'multi_category': multi_category,
+        'commitments': dict(commitments)
+    }
+
+
+def _chunked(comments: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    iterator = iter(comments)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class ConsultationAnalyzer:
+    """
+    Streaming theme / sentiment / commitment analysis of consultation comments.
+
+    Comments are fed in any number of update() calls; each comment is
+    scanned once for theme and sentiment keywords (see KeywordMatcher) and
+    only aggregates are kept, so results match categorize_themes() +
+    sentiment_analysis() + frequency_weighting() + commitments_matrix() on
+    all comments seen so far without holding them in memory.
+    """
+
+    def __init__(self, categories: Dict[str, List[str]]):
+        """
+        Args:
+            categories: Dict mapping category names to keyword lists
+                (categorize_themes() format)
+        """
+        self.categories = dict(categories)
+        self.total_comments = 0
+        self.theme_counts: Dict[str, int] = {}
+        self.sentiment_counts = Counter()
+        self.uncategorized_count = 0
+        self.multi_category_count = 0
+        self._commitments: Dict[str, List[Dict]] = {}
+
+    def update(
+        self,
+        comments: Iterable[str],
+        max_workers: Optional[int] = 1,
+        chunk_size: int = COMMENT_CHUNK_SIZE
+    ) -> 'ConsultationAnalyzer':
+        """
+        Add a batch (or stream) of comments.
+
+        Args:
+            comments: Comment strings, in order (any iterable)
+            max_workers: Worker processes (None = CPU count; 1 = run in-process)
+            chunk_size: Comments per worker task
+
+        Returns:
+            self, for chaining
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+        tasks = self._tasks(_chunked(comments, chunk_size))
+
+        if max_workers == 1:
+            for task in tasks:
+                self._merge(_analyze_chunk(task))
+            return self
+
+        # Bounded window of in-flight chunks keeps memory flat for long streams
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            window = 4 * (max_workers or os.cpu_count() or 1)
+            pending = deque()
+            for task in tasks:
+                pending.append(executor.submit(_analyze_chunk, task))
+                if len(pending) >= window:
+                    self._merge(pending.popleft().result())
+            while pending:
+                self._merge(pending.popleft().result())
+        return self
+
+    def _tasks(self, chunks: Iterator[List[str]]) -> Iterator[Tuple]:
+        start = self.total_comments
+        for chunk in chunks:
+            yield start, chunk, self.categories
+            start += len(chunk)
+
+    def _merge(self, partial: Dict) -> None:
+        """Fold one chunk's tallies in (chunks must arrive in order)"""
+        self.total_comments += partial['count']
+        for category, count in partial['theme_counts'].items():
+            self.theme_counts[category] = self.theme_counts.get(category, 0) + count
+        self.sentiment_counts.update(partial['sentiment_counts'])
+        self.uncategorized_count += partial['uncategorized']
+        self.multi_category_count += partial['multi_category']
+        for category, records in partial['commitments'].items():
+            self._commitments.setdefault(category, []).extend(records)
+
+    def frequency_weighting(self) -> Dict:
+        """frequency_weighting() of the themes seen so far"""
+        return _weight_theme_counts(self.theme_counts)
+
+    def commitments_matrix(self) -> List[Dict]:
+        """commitments_matrix() of the categorized comments seen so far"""
+        return [
+            record
+            for category in self.theme_counts
+            for record in self._commitments.get(category, [])
+        ]
+
+    def results(self) -> Dict:
+        """
+        Summary of all comments seen so far.
+
+        Returns:
+            Dict with statistics (categorize_themes() format), sentiment
+            (sentiment_analysis() format without the per-comment breakdown),
+            frequency_weighting and commitments
+        """
+        categorized_count = sum(self.theme_counts.values())
+        total = self.total_comments
+        return {
+            'statistics': {
+                'total_feedback': total,
+                'categorized_count': categorized_count,
+                'uncategorized_count': self.uncategorized_count,
+                'multi_category_count': self.multi_category_count,
+                'categories_found': len(self.theme_counts),
+                'categorization_rate': round(
+                    (categorized_count / total) * 100, 1
+                ) if total > 0 else 0
+            },
+            'sentiment': _sentiment_summary(self.sentiment_counts, total),
+            'frequency_weighting': self.frequency_weighting(),
+            'commitments': self.commitments_matrix()
+        }
+
+
+def analyze_comments(
+    comments: Iterable[str],
+    categories: Dict[str, List[str]],
+    max_workers: Optional[int] = None,
+    chunk_size: int = COMMENT_CHUNK_SIZE
+) -> Dict:
+    """
+    Analyze a whole consultation in a process pool.
+
+    Args:
+        comments: Comment strings (any iterable, e.g. lines of a file)
+        categories: Dict mapping category names to keyword lists
+        max_workers: Worker processes (None = CPU count; 1 = run in-process)
+        chunk_size: Comments per worker task
+
+    Returns:
+        ConsultationAnalyzer.results() dict
+    """
+    return ConsultationAnalyzer(categories).update(comments, max_workers, chunk_size).results()
@@ -0,0 +1,724 @@
+#!/usr/bin/env python3
+"""
+Synthetic Data Module
+Seeded, schema-valid input datasets at arbitrary scale for load testing.
+
+Each dataset yields calculator input documents in the layout the
+calculators already read:
+- comparables: subject + comparable sales + market parameters
+  (Shared_Utils/schemas/comparable_sales_input_schema.json; passes MCDA
+  validate_input_data)
+- rollover: lease portfolios (rollover_calculator portfolio_from_dict)
+- ifrs16: one lease per document (run_ifrs16_analysis lease_inputs_from_dict)
+- credit: tenant financials (run_credit_analysis credit_inputs_from_dict)
+- options: lease option portfolios (option_valuation options_from_dict)
+
+Records are generated in blocks of BLOCK_SIZE with one random stream per
+block (seed, dataset, block), so memory stays flat however many records are
+written, and the same dataset / count / seed / options always produce the
+same records whichever format they are written to. Prices, rents and
+financials are drawn from simple hedonic models so the calculators see
+plausible relationships (better condition and location sell for more,
+EBITDA covers interest, and so on), not just values inside the schema
+bounds.
+
+Output is JSONL (gzip when the path ends in .gz, '-' for stdout) or Parquet
+(requires pyarrow; nested fields become Parquet structs and lists).
+
+Usage:
+    python Shared_Utils/synthetic_data.py comparables 100000 -o comps.jsonl.gz
+    python Shared_Utils/synthetic_data.py rollover 100 --size 1000 -o portfolios.parquet
+    python realestate.py synthetic-data ifrs16 1000000 -o leases.jsonl --seed 7
+
+Used by:
+- Benchmarks/benchmark_suite.py
+- realestate.py synthetic-data
+"""
+
+import argparse
+import gzip
+import json
+import sys
+from contextlib import nullcontext
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+import numpy as np
+
+
+DEFAULT_SEED = 42
+BLOCK_SIZE = 1000   # Records per random stream and per write batch
+ANALYSIS_DATE = date(2025, 1, 1)
+
+# Unified comparable sales schema limits (comparable_sales minItems / maxItems
+# is 1-20; MCDA validate_input_data needs at least 3)
+MIN_COMPARABLES = 3
+MAX_COMPARABLES = 20
+
+PROPERTY_TYPES = ('industrial', 'office', 'retail')
+CONDITIONS = ['poor', 'fair', 'average', 'good', 'excellent']
+BUILDING_CLASSES = ['C', 'B-', 'B', 'B+', 'A-', 'A', 'A+']
+CREDIT_RATINGS = ['AA', 'A+', 'A', 'A-', 'BBB+', 'BBB', 'BBB-', 'BB+', 'BB', 'B', 'NR']
+CLEAR_HEIGHTS_FT = [18, 20, 24, 28, 32, 36, 40]
+ELECTRICAL_AMPS = [200, 400, 600, 800, 1200, 2000]
+
+CITIES = ['Mississauga', 'Brampton', 'Vaughan', 'Toronto', 'Hamilton', 'Oakville', 'Burlington', 'Milton']
+STREETS = ['Industrial Parkway', 'Commerce Drive', 'Logistics Way', 'Supply Chain Boulevard', 'Airport Road',
+           'Steeles Avenue', 'Dixie Road', 'Keele Street', 'Heritage Road', 'Mainway']
+INDUSTRIES = [
+    ('Light Manufacturing', 'moderate'), ('Third-Party Logistics', 'moderate'), ('Food Distribution', 'stable'),
+    ('Pharmaceuticals', 'stable'), ('Building Products', 'volatile'), ('E-Commerce Fulfillment', 'volatile'),
+    ('Automotive Parts', 'volatile'), ('Medical Supplies', 'stable'), ('Printing and Packaging', 'moderate')
+]
+
+# Value at the valuation date before adjustments ($/SF), and bounds inside
+# the MCDA typical PSF ranges
+BASE_VALUE_PSF = {'industrial': 160.0, 'office': 320.0, 'retail': 380.0}
+VALUE_PSF_BOUNDS = {'industrial': (40.0, 450.0), 'office': (80.0, 900.0), 'retail': (120.0, 1300.0)}
+
+
+def _days_before(day: date, days: np.ndarray) -> List[str]:
+    return [(day - timedelta(days=int(d))).isoformat() for d in days]
+
+
+def _days_after(day: date, days: np.ndarray) -> List[str]:
+    return [(day + timedelta(days=int(d))).isoformat() for d in days]
+
+
+def _choice(rng: np.random.Generator, values: List, size: int, p: Optional[List[float]] = None) -> List:
+    return [values[i] for i in rng.choice(len(values), size=size, p=p)]
+
+
+def _addresses(rng: np.random.Generator, numbers: Iterable[int]) -> List[str]:
+    numbers = list(numbers)
+    streets = _choice(rng, STREETS, len(numbers))
+    cities = _choice(rng, CITIES, len(numbers))
+    return [f"{number} {street}, {city}, ON" for number, street, city in zip(numbers, streets, cities)]
+
+
+# ============================================================================
+# COMPARABLE SALES (UNIFIED SCHEMA)
+# ============================================================================
+
+def _buildings(rng: np.random.Generator, count: int, property_type: str, valuation_year: int):
+    """
+    Physical characteristics and value per SF at the valuation date.
+
+    Returns:
+        Tuple of (list of property dicts without address / sale fields,
+        value_psf array)
+    """
+    building_sf = rng.integers(20, 500, count) * 500
+    coverage = rng.uniform(0.30, 0.50, count)
+    year_built = rng.integers(1970, valuation_year, count)
+    effective_age = np.maximum(0, valuation_year - year_built - rng.integers(0, 15, count))
+    condition = rng.integers(0, len(CONDITIONS), count)
+    location_score = rng.integers(40, 96, count)
+
+    value_psf = (
+        BASE_VALUE_PSF[property_type]
+        * (1 + 0.05 * (condition - 2))
+        * (1 + 0.004 * (location_score - 70))
+        * (1 - 0.004 * effective_age)
+        * rng.lognormal(0.0, 0.08, count)
+    )
+
+    columns = {
+        'building_sf': building_sf.astype(float),
+        'lot_size_acres': np.round(building_sf / 43560 / coverage, 2),
+        'year_built': year_built,
+        'effective_age_years': effective_age.astype(float),
+        'condition': [CONDITIONS[i] for i in condition],
+        'location_score': location_score.astype(float)
+    }
+
+    if property_type == 'industrial':
+        clear_height = np.asarray(_choice(rng, CLEAR_HEIGHTS_FT, count), dtype=float)
+        dock_high = np.maximum(1, np.round(building_sf / 10000 * rng.uniform(0.5, 1.5, count))).astype(int)
+        grade_level = rng.integers(0, 5, count)
+        office_finish = np.round(rng.uniform(2, 25, count), 1)
+        value_psf *= 1 + 0.01 * (clear_height - 28)
+        columns.update({
+            'clear_height_feet': clear_height,
+            'loading_docks_dock_high': dock_high,
+            'loading_docks_grade_level': grade_level,
+            'loading_docks_total': dock_high + grade_level,
+            'highway_frontage': rng.random(count) < 0.3,
+            'office_finish_percentage': office_finish,
+            'office_finish_pct': office_finish,
+            'electrical_service_amps': np.asarray(_choice(rng, ELECTRICAL_AMPS, count), dtype=float),
+            'zoning': _choice(rng, ['M1', 'M2', 'M3'], count)
+        })
+    elif property_type == 'office':
+        building_class = rng.integers(0, len(BUILDING_CLASSES), count)
+        parking = np.round(rng.uniform(1.5, 5.0, count), 1)
+        efficiency = np.round(rng.uniform(78, 92, count), 1)
+        ceiling = np.round(rng.uniform(8.5, 12.0, count), 1)
+        value_psf *= 1 + 0.04 * (building_class - 3)
+        columns.update({
+            'building_class': [BUILDING_CLASSES[i] for i in building_class],
+            'parking_spaces_per_1000sf': parking,
+            'parking_ratio': parking,
+            'floor_plate_efficiency_pct': efficiency,
+            'floor_plate_efficiency': efficiency,
+            'ceiling_height_feet': ceiling,
+            'ceiling_height': ceiling,
+            'elevator_count': np.maximum(1, building_sf // 40000),
+            'zoning': _choice(rng, ['C1', 'C2', 'E1'], count)
+        })
+    else:
+        frontage = np.round(rng.uniform(80, 600, count), 0)
+        parking = np.round(rng.uniform(3.0, 6.0, count), 1)
+        ceiling = np.round(rng.uniform(12.0, 24.0, count), 1)
+        traffic = rng.integers(5, 60, count) * 1000
+        value_psf *= (1 + 0.0003 * (frontage - 250)) * (1 + 0.003 * (traffic / 1000 - 25))
+        columns.update({
+            'frontage_linear_feet': frontage,
+            'frontage_feet': frontage,
+            'traffic_count': traffic,
+            'parking_spaces_per_1000sf': parking,
+            'parking_ratio': parking,
+            'ceiling_height_feet': ceiling,
+            'ceiling_height': ceiling,
+            'zoning': _choice(rng, ['C2', 'C3', 'CR'], count)
+        })
+
+    lists = {key: value.tolist() if isinstance(value, np.ndarray) else value for key, value in columns.items()}
+    rows = [dict(zip(lists, values)) for values in zip(*lists.values())]
+    return rows, np.clip(value_psf, *VALUE_PSF_BOUNDS[property_type])
+
+
+def generate_comparable_sales_inputs(
+    n: int,
+    rng: np.random.Generator,
+    start: int = 0,
+    comparables_per_input: int = 10,
+    property_type: str = 'industrial',
+    valuation_date: date = ANALYSIS_DATE
+) -> List[Dict]:
+    """
+    Comparable sales input documents (unified schema: subject_property,
+    comparable_sales, market_parameters).
+
+    Sale prices follow the comparables' condition, location, age and
+    type-specific features, deflated from the valuation date at the
+    document's appreciation rate. Sales are arm's length; about one in ten
+    is leased fee and about one in seven has non-cash financing (transaction
+    warnings, not exclusions).
+
+    Args:
+        n: Number of input documents
+        rng: Random generator
+        start: Index of the first document (names and addresses)
+        comparables_per_input: Comparable sales per document (3-20)
+        property_type: 'industrial', 'office' or 'retail'
+        valuation_date: Valuation date of every document
+
+    Returns:
+        List of input documents
+    """
+    if property_type not in PROPERTY_TYPES:
+        raise ValueError(f"property_type must be one of {', '.join(PROPERTY_TYPES)}: {property_type}")
+    if not MIN_COMPARABLES <= comparables_per_input <= MAX_COMPARABLES:
+        raise ValueError(
+            f"comparables_per_input must be {MIN_COMPARABLES}-{MAX_COMPARABLES}: {comparables_per_input}"
+        )
+
+    k = comparables_per_input
+    rows, value_psf = _buildings(rng, n * (k + 1), property_type, valuation_date.year)
+    appreciation = np.round(rng.uniform(0.0, 6.0, n), 2)
+    cap_rates = np.round(rng.uniform(4.0, 8.0, n), 2)
+
+    days_before = rng.integers(30, 3 * 365, n * k)
+    sale_dates = _days_before(valuation_date, days_before)
+    rights = _choice(rng, ['fee_simple', 'leased_fee'], n * k, p=[0.9, 0.1])
+    financing = _choice(rng, ['cash', 'conventional', 'seller_vtb', 'assumable'], n * k, p=[0.55, 0.3, 0.1, 0.05])
+    addresses = _addresses(rng, [10 * (j + 10) for _ in range(n) for j in range(k)])
+    subject_addresses = _addresses(rng, [1] * n)
+
+    documents = []
+    for i in range(n):
+        subject_row = i * (k + 1)
+        subject = {
+            'address': subject_addresses[i],
+            'property_type': property_type,
+            'property_rights': 'fee_simple',
+            **rows[subject_row]
+        }
+        comparables = []
+        for j in range(k):
+            row = subject_row + 1 + j
+            sale = i * k + j
+            deflator = (1 + appreciation[i] / 100) ** (-days_before[sale] / 365.25)
+            comparables.append({
+                'id': f'COMP_{j + 1}',
+                'address': addresses[sale],
+                'property_type': property_type,
+                'sale_price': float(round(value_psf[row] * deflator * rows[row]['building_sf'], -3)),
+                'sale_date': sale_dates[sale],
+                'property_rights': rights[sale],
+                'financing': {'type': financing[sale]},
+                'conditions_of_sale': {'arms_length': True},
+                **rows[row]
+            })
+        documents.append({
+            'subject_property': subject,
+            'comparable_sales': comparables,
+            'market_parameters': {
+                'appreciation_rate_annual': float(appreciation[i]),
+                'valuation_date': valuation_date.isoformat(),
+                'cap_rate': float(cap_rates[i]),
+                'market_area': f'Synthetic Market {start + i}'
+            }
+        })
+    return documents
+
+
+# ============================================================================
+# LEASE PORTFOLIOS, LEASE BOOKS, TENANT FINANCIALS, OPTIONS
+# ============================================================================
+
+def generate_rollover_portfolios(
+    n: int,
+    rng: np.random.Generator,
+    start: int = 0,
+    leases_per_portfolio: int = 100,
+    analysis_date: date = ANALYSIS_DATE
+) -> List[Dict]:
+    """
+    Rollover portfolio documents (rollover_calculator layout), expiries over
+    the next five years and rents around market.
+
+    Args:
+        n: Number of portfolios
+        rng: Random generator
+        start: Index of the first portfolio (names)
+        leases_per_portfolio: Leases in each portfolio
+        analysis_date: Analysis date of every portfolio
+
+    Returns:
+        List of portfolio documents
+    """
+    if leases_per_portfolio < 1:
+        raise ValueError(f"leases_per_portfolio must be >= 1: {leases_per_portfolio}")
+
+    count = n * leases_per_portfolio
+    area = rng.integers(10, 150, count) * 1000
+    market_rent = np.round(rng.uniform(14.0, 19.0, n), 2)
+    below_market = np.round(rng.uniform(-20.0, 10.0, count), 1)
+    rent = np.round(area * np.repeat(market_rent, leases_per_portfolio) * (1 + below_market / 100), 2)
+    expiry_days = rng.integers(0, 5 * 365, count)
+    expiries = _days_after(analysis_date, expiry_days)
+    renewals = _days_after(analysis_date, expiry_days + 5 * 365)
+    has_renewal = rng.random(count) < 0.5
+    ratings = _choice(rng, CREDIT_RATINGS, count)
+    addresses = _addresses(rng, rng.integers(1, 9999, count))
+
+    portfolios = []
+    for i in range(n):
+        leases = []
+        for j in range(i * leases_per_portfolio, (i + 1) * leases_per_portfolio):
+            leases.append({
+                'property_address': addresses[j],
+                'tenant_name': f'Tenant {j - i * leases_per_portfolio + 1}',
+                'rentable_area_sf': float(area[j]),
+                'current_annual_rent': float(rent[j]),
+                'lease_expiry_date': expiries[j],
+                'renewal_options': [renewals[j]] if has_renewal[j] else [],
+                'tenant_credit_rating': ratings[j],
+                'below_market_pct': float(below_market[j])
+            })
+        portfolios.append({
+            'portfolio_name': f'Synthetic Portfolio {start + i}',
+            'analysis_date': analysis_date.isoformat(),
+            'leases': leases,
+            'assumptions': {'market_rent_sf': float(market_rent[i])}
+        })
+    return portfolios
+
+
+def generate_ifrs16_leases(n: int, rng: np.random.Generator, start: int = 0) -> List[Dict]:
+    """IFRS 16 input documents (run_ifrs16_analysis layout), 3-15 year terms with annual steps"""
+    leases = []
+    for i in range(n):
+        term = int(rng.integers(36, 181))
+        base_rent = float(rng.integers(5, 200)) * 1000 * rng.uniform(8, 18) / 12
+        steps = (1 + rng.uniform(0.0, 0.04)) ** (np.arange(term) // 12)
+        leases.append({
+            'tenant_name': f'Tenant {start + i}',
+            'property_address': f'{start + i} Synthetic Way',
+            'commencement_date': (date(2023, 1, 1) + timedelta(days=int(rng.integers(0, 730)))).isoformat(),
+            'monthly_payments': np.round(base_rent * steps, 2).tolist(),
+            'annual_discount_rate': round(float(rng.uniform(0.04, 0.09)), 4),
+            'initial_direct_costs': round(float(rng.uniform(0, 25000)), 2),
+            'lease_incentives': round(float(rng.uniform(0, 50000)), 2),
+            'payment_timing': 'beginning' if rng.random() < 0.8 else 'end'
+        })
+    return leases
+
+
+def generate_credit_inputs(
+    n: int,
+    rng: np.random.Generator,
+    start: int = 0,
+    years: int = 3,
+    latest_year: int = ANALYSIS_DATE.year - 1
+) -> List[Dict]:
+    """
+    Tenant credit input documents (run_credit_analysis layout).
+
+    Balance sheets balance (equity = assets - liabilities), current items
+    sit inside the totals, EBIT <= EBITDA < gross profit < revenue, and
+    earlier years are deflated by the tenant's growth rate, so leverage,
+    coverage and trend ratios are all meaningful.
+
+    Args:
+        n: Number of tenants
+        rng: Random generator
+        start: Index of the first tenant (names)
+        years: Years of financial statements per tenant (latest first)
+        latest_year: Fiscal year of the latest statements
+
+    Returns:
+        List of credit input documents
+    """
+    if years < 1:
+        raise ValueError(f"years must be >= 1: {years}")
+
+    shape = (n, years)
+    total_assets = rng.lognormal(np.log(3e6), 1.0, n)
+    growth = rng.normal(0.04, 0.06, n)
+    scale = total_assets[:, None] * (1 + growth[:, None]) ** -np.arange(years) * rng.lognormal(0, 0.03, shape)
+
+    statements = {
+        'total_assets': scale,
+        'current_assets': scale * rng.uniform(0.25, 0.50, shape),
+        'total_liabilities': scale * rng.uniform(0.30, 0.90, shape),
+        'revenue': scale * rng.uniform(0.8, 3.0, shape)
+    }
+    statements['inventory'] = statements['current_assets'] * rng.uniform(0.10, 0.40, shape)
+    statements['cash_and_equivalents'] = statements['current_assets'] * rng.uniform(0.05, 0.30, shape)
+    statements['current_liabilities'] = statements['total_liabilities'] * rng.uniform(0.30, 0.60, shape)
+    statements['shareholders_equity'] = statements['total_assets'] - statements['total_liabilities']
+    statements['gross_profit'] = statements['revenue'] * rng.uniform(0.20, 0.50, shape)
+    statements['ebitda'] = statements['revenue'] * rng.uniform(-0.02, 0.18, shape)
+    statements['ebit'] = statements['ebitda'] - statements['revenue'] * rng.uniform(0.01, 0.04, shape)
+    statements['interest_expense'] = statements['total_liabilities'] * rng.uniform(0.02, 0.04, shape)
+    statements['net_income'] = (statements['ebit'] - statements['interest_expense']) * 0.74
+    rent = statements['revenue'][:, 0] * rng.uniform(0.02, 0.06, n)
+    statements['annual_rent'] = np.repeat(rent[:, None], years, axis=1)
+    statements = {key: np.round(value, -3).tolist() for key, value in statements.items()}
+
+    industries = [INDUSTRIES[i] for i in rng.integers(0, len(INDUSTRIES), n)]
+    years_in_business = rng.integers(1, 60, n)
+    credit_score = rng.integers(520, 850, n)
+    payment_history = _choice(rng, ['excellent', 'good', 'fair', 'poor'], n, p=[0.35, 0.45, 0.15, 0.05])
+    lease_term = _choice(rng, [3, 5, 7, 10], n)
+    criticality = _choice(rng, ['mission-critical', 'important', 'discretionary'], n, p=[0.3, 0.5, 0.2])
+    deposit_months = _choice(rng, [0, 0, 2, 3, 6], n)
+
+    documents = []
+    for i in range(n):
+        months = deposit_months[i]
+        documents.append({
+            'tenant_name': f'Synthetic Tenant {start + i}',
+            'industry': industries[i][0],
+            'years_in_business': int(years_in_business[i]),
+            'credit_score': int(credit_score[i]),
+            'payment_history': payment_history[i],
+            'lease_term_years': lease_term[i],
+            'use_criticality': criticality[i],
+            'industry_stability': industries[i][1],
+            'current_security': float(round(rent[i] / 12 * months, -2)),
+            'security_type': 'Rent Deposit' if months else 'None',
+            'financial_data': [
+                {'year': latest_year - y, **{key: statements[key][i][y] for key in statements}}
+                for y in range(years)
+            ]
+        })
+    return documents
+
+
+def generate_option_portfolios(
+    n: int,
+    rng: np.random.Generator,
+    start: int = 0,
+    options_per_portfolio: int = 4
+) -> List[Dict]:
+    """
+    Lease option documents (option_valuation layout): renewal and expansion
+    calls and early termination puts priced off the lease's market and
+    contract rents.
+
+    Args:
+        n: Number of option portfolios (one lease each)
+        rng: Random generator
+        start: Index of the first portfolio (addresses)
+        options_per_portfolio: Options per lease
+
+    Returns:
+        List of option input documents
+    """
+    if options_per_portfolio < 1:
+        raise ValueError(f"options_per_portfolio must be >= 1: {options_per_portfolio}")
+
+    count = n * options_per_portfolio
+    area = rng.integers(10, 200, n) * 1000
+    market_rent = np.round(rng.uniform(12.0, 22.0, n), 2)
+    base_rent = np.round(market_rent * rng.uniform(0.85, 1.10, n), 2)
+    kinds = rng.choice(['renewal', 'expansion', 'termination'], count, p=[0.5, 0.25, 0.25])
+    option_term = np.asarray(_choice(rng, [3.0, 5.0, 10.0], count))
+    expiration = np.round(rng.uniform(1.0, 10.0, count), 1)
+    strike_discount = rng.uniform(0.90, 1.05, count)
+    expansion_share = rng.uniform(0.10, 0.30, count)
+    volatility = np.round(rng.uniform(0.08, 0.25, count), 3)
+    risk_free = np.round(rng.uniform(0.02, 0.06, count), 4)
+    utilization = np.round(rng.uniform(0.3, 0.9, count), 2)
+    fee_months = rng.integers(3, 13, count)
+    addresses = _addresses(rng, range(start + 1, start + n + 1))
+
+    documents = []
+    for i in range(n):
+        options = []
+        for j in range(i * options_per_portfolio, (i + 1) * options_per_portfolio):
+            kind = kinds[j]
+            sf = float(area[i]) * (float(expansion_share[j]) if kind == 'expansion' else 1.0)
+            market_value = float(market_rent[i]) * sf * float(option_term[j])
+            option = {
+                'option_type': 'put' if kind == 'termination' else 'call',
+                'option_name': f"{kind.title()} Option {j - i * options_per_portfolio + 1}",
+                'underlying_value': round(market_value, -2),
+                'strike_price': round(market_value * float(strike_discount[j]), -2),
+                'time_to_expiration': float(expiration[j]),
+                'volatility': float(volatility[j]),
+                'risk_free_rate': float(risk_free[j]),
+                'utilization_probability': float(utilization[j]) if kind == 'expansion' else 1.0,
+                'termination_fee': (round(float(base_rent[i] * area[i]) / 12 * int(fee_months[j]), -2)
+                                    if kind == 'termination' else 0.0),
+                'option_term_years': float(option_term[j])
+            }
+            options.append(option)
+        documents.append({
+            'property_address': addresses[i],
+            'rentable_area_sf': float(area[i]),
+            'market_rent_psf': float(market_rent[i]),
+            'base_rent_psf': float(base_rent[i]),
+            'options': options
+        })
+    return documents
+
+
+# ============================================================================
+# DATASETS AND STREAMING
+# ============================================================================
+
+class Dataset(NamedTuple):
+    generate: Callable[..., List[Dict]]   # (n, rng, start=0, **options) -> documents
+    size_option: Optional[str]            # Keyword for the per-document size (--size)
+    description: str
+
+
+DATASETS: Dict[str, Dataset] = {
+    'comparables': Dataset(generate_comparable_sales_inputs, 'comparables_per_input',
+                           'Comparable sales inputs (unified schema; MCDA / DCA)'),
+    'rollover': Dataset(generate_rollover_portfolios, 'leases_per_portfolio', 'Rollover lease portfolios'),
+    'ifrs16': Dataset(generate_ifrs16_leases, None, 'IFRS 16 leases'),
+    'credit': Dataset(generate_credit_inputs, 'years', 'Tenant credit financials'),
+    'options': Dataset(generate_option_portfolios, 'options_per_portfolio', 'Lease option portfolios')
+}
+
+
+def iter_records(
+    dataset: str,
+    n: int,
+    seed: int = DEFAULT_SEED,
+    size: Optional[int] = None,
+    **options
+) -> Iterator[Dict]:
+    """
+    Stream n documents of a dataset, BLOCK_SIZE at a time.
+
+    Args:
+        dataset: Key of DATASETS
+        n: Number of documents
+        seed: Seed; block b of dataset d uses default_rng([seed, d, b])
+        size: Per-document size (comparables, leases, years or options;
+            see Dataset.size_option), default the generator's
+        **options: Further generator keyword arguments
+
+    Yields:
+        Input documents
+    """
+    if dataset not in DATASETS:
+        raise ValueError(f"Unknown dataset: {dataset} (choose from {', '.join(DATASETS)})")
+    if n < 0:
+        raise ValueError(f"n must be >= 0: {n}")
+    spec = DATASETS[dataset]
+    if size is not None:
+        if spec.size_option is None:
+            raise ValueError(f"Dataset '{dataset}' has no per-document size")
+        options[spec.size_option] = size
+
+    index = list(DATASETS).index(dataset)
+    for block, block_start in enumerate(range(0, n, BLOCK_SIZE)):
+        rng = np.random.default_rng([seed, index, block])
+        yield from spec.generate(min(BLOCK_SIZE, n - block_start), rng, start=block_start, **options)
+
+
+def _batches(records: Iterable[Dict], batch_size: int) -> Iterator[List[Dict]]:
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def write_jsonl(records: Iterable[Dict], path: str) -> int:
+    """
+    Write records as JSON Lines.
+
+    Args:
+        records: Documents (any iterable; consumed lazily)
+        path: Output path; gzip-compressed if it ends in .gz, stdout if '-'
+
+    Returns:
+        Number of records written
+    """
+    path = str(path)
+    if path == '-':
+        context = nullcontext(sys.stdout)
+    elif path.endswith('.gz'):
+        context = gzip.open(path, 'wt', encoding='utf-8')
+    else:
+        context = open(path, 'w', encoding='utf-8')
+
+    count = 0
+    with context as f:
+        for batch in _batches(records, BLOCK_SIZE):
+            f.write(''.join(json.dumps(record, separators=(',', ':')) + '\n' for record in batch))
+            count += len(batch)
+    return count
+
+
+def read_jsonl(path: str) -> Iterator[Dict]:
+    """Stream records from a JSON Lines file (gzip if it ends in .gz)"""
+    opener = gzip.open if str(path).endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def write_parquet(records: Iterable[Dict], path: str, batch_size: int = BLOCK_SIZE) -> int:
+    """
+    Write records to Parquet, one row group per batch.
+
+    Nested fields become structs and lists; the schema is taken from the
+    first batch (every generator emits the same keys and types in every
+    record).
+
+    Args:
+        records: Documents (any iterable; consumed lazily)
+        path: Output path
+        batch_size: Records per row group
+
+    Returns:
+        Number of records written
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet output requires pyarrow: pip install pyarrow") from e
+
+    count = 0
+    writer = None
+    try:
+        for batch in _batches(records, batch_size):
+            if writer is None:
+                table = pa.Table.from_pylist(batch)
+                writer = pq.ParquetWriter(str(path), table.schema)
+            else:
+                table = pa.Table.from_pylist(batch, schema=writer.schema)
+            writer.write_table(table)
+            count += len(batch)
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
+
+
+def write_dataset(
+    dataset: str,
+    n: int,
+    path: str,
+    seed: int = DEFAULT_SEED,
+    format: Optional[str] = None,
+    size: Optional[int] = None,
+    **options
+) -> int:
+    """
+    Generate a dataset and stream it to a file.
+
+    Args:
+        dataset: Key of DATASETS
+        n: Number of documents
+        path: Output path ('-' for JSONL on stdout)
+        seed: Seed
+        format: 'jsonl' or 'parquet' (default from the extension: .parquet /
+            .pq are Parquet, anything else JSONL)
+        size: Per-document size (see iter_records)
+        **options: Further generator keyword arguments
+
+    Returns:
+        Number of documents written
+    """
+    if format is None:
+        format = 'parquet' if Path(str(path)).suffix in ('.parquet', '.pq') else 'jsonl'
+    if format not in ('jsonl', 'parquet'):
+        raise ValueError(f"format must be 'jsonl' or 'parquet': {format}")
+    records = iter_records(dataset, n, seed=seed, size=size, **options)
+    return write_parquet(records, path) if format == 'parquet' else write_jsonl(records, path)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line interface"""
+    parser = argparse.ArgumentParser(description='Seeded synthetic calculator inputs for load testing')
+    parser.add_argument('dataset', choices=list(DATASETS), help='Dataset to generate')
+    parser.add_argument('count', type=int, help='Number of documents')
+    parser.add_argument('--output', '-o', default='-', help="Output path (.jsonl, .jsonl.gz, .parquet; default stdout)")
+    parser.add_argument('--format', choices=['jsonl', 'parquet'], help='Output format (default from the extension)')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='Random seed')
+    parser.add_argument('--size', type=int,
+                        help='Per-document size: comparables per input, leases per portfolio, '
+                             'years of financials or options per portfolio')
+    parser.add_argument('--property-type', choices=list(PROPERTY_TYPES),
+                        help='Property type (comparables only; default industrial)')
+    args = parser.parse_args(argv)
+
+    options = {}
+    if args.property_type:
+        if args.dataset != 'comparables':
+            parser.error('--property-type applies to the comparables dataset only')
+        options['property_type'] = args.property_type
+
+    try:
+        count = write_dataset(args.dataset, args.count, args.output, seed=args.seed,
+                              format=args.format, size=args.size, **options)
+    except (ValueError, ImportError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    if args.output != '-':
+        print(f"✓ {count:,} {args.dataset} record(s) written to: {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,487 @@
+#!/usr/bin/env python3
+"""
+Tracing Module
+Opt-in spans for profiling calculator hot paths: wall time, self time
+(excluding child spans), call counts and optional allocation stats per
+stage, written as a JSON summary or as a Chrome trace (chrome://tracing or
+https://ui.perfetto.dev).
+
+Tracing is off by default. While it is off, span() returns a shared no-op
+object and @traced functions add one call and a None check; nothing is
+recorded or allocated.
+
+Turning it on:
+- In code: `with tracing('trace.json', format='chrome'): ...`, or
+  enable() / disable() and Tracer.write()
+- For any script: REALESTATE_TRACE=trace.json (REALESTATE_TRACE_FORMAT=json
+  or chrome, REALESTATE_TRACE_MEMORY=1); the trace is written at exit
+  (warm worker children, which skip atexit, use environment_tracing())
+- From the command line: `realestate.py --trace trace.json <command> ...`
+
+Spans nest per thread and per asyncio task (contextvars). With memory=True,
+tracemalloc records the net change and peak of traced memory inside each
+span; tracing memory slows the run down, and spans that overlap other
+spans (concurrent tasks, threads) see each other's allocations and child
+time, so their self time and memory are approximate.
+
+Import this module as Shared_Utils.tracing so that the whole process shares
+one tracer.
+
+Used by:
+- Comparable_Sales_Analysis/comparable_sales_calculator.py
+- Comparable_Sales_Analysis/paired_sales_analyzer.py
+- Location_Overview/aggregator/engine.py
+- Shared_Utils/cli.py (--trace, warm worker children)
+"""
+
+import atexit
+import functools
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Tuple
+
+
+TRACE_ENV = 'REALESTATE_TRACE'
+TRACE_FORMAT_ENV = 'REALESTATE_TRACE_FORMAT'
+TRACE_MEMORY_ENV = 'REALESTATE_TRACE_MEMORY'
+
+FORMATS = ('json', 'chrome')
+MAX_SPANS = 1_000_000   # Individual spans kept for the trace; the summary counts every span
+
+
+class _NullSpan:
+    """Span returned while tracing is off"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **args):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+_tracer: Optional['Tracer'] = None
+_stack: ContextVar[Tuple['Span', ...]] = ContextVar('realestate_trace_stack', default=())
+
+
+def _thread_id() -> Tuple[int, Optional[str]]:
+    """Chrome trace tid and display name: the running asyncio task, else the thread"""
+    asyncio = sys.modules.get('asyncio')
+    if asyncio is not None and asyncio._get_running_loop() is not None:
+        task = asyncio.current_task()
+        if task is not None:
+            return id(task), task.get_name()
+    thread = threading.current_thread()
+    return thread.ident, thread.name
+
+
+class Span:
+    """One timed region; use through span() or @traced"""
+    __slots__ = ('tracer', 'name', 'category', 'args', 'start_ns', 'children_ns',
+                 'memory_start', 'memory_peak', 'parents')
+
+    def __init__(self, tracer: 'Tracer', name: str, category: str, args: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def set(self, **args):
+        """Attach arguments (counts, identifiers) to the span"""
+        self.args.update(args)
+
+    def __enter__(self):
+        self.parents = _stack.get()
+        _stack.set(self.parents + (self,))
+        self.children_ns = 0
+        if self.tracer.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if self.parents:
+                parent = self.parents[-1]
+                parent.memory_peak = max(parent.memory_peak, peak)
+            tracemalloc.reset_peak()
+            self.memory_start = self.memory_peak = current
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end_ns = time.perf_counter_ns()
+        _stack.set(self.parents)
+        duration_ns = end_ns - self.start_ns
+        parent = self.parents[-1] if self.parents else None
+        if parent is not None:
+            parent.children_ns += duration_ns
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+
+        memory = None
+        if self.tracer.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            peak = max(self.memory_peak, peak)
+            if parent is not None:
+                parent.memory_peak = max(parent.memory_peak, peak)
+            memory = (current - self.memory_start, peak - self.memory_start)
+
+        self.tracer._record(self, end_ns, duration_ns, max(0, duration_ns - self.children_ns), memory)
+        return False
+
+
+class Tracer:
+    """
+    Collects spans and per-name statistics.
+
+    Args:
+        memory: Record tracemalloc allocation stats per span (starts
+            tracemalloc if it is not already tracing)
+        max_spans: Individual spans kept for the trace file; the summary
+            counts every span
+    """
+
+    def __init__(self, memory: bool = False, max_spans: int = MAX_SPANS):
+        self.memory = memory
+        self.max_spans = max_spans
+        self.spans: List[Dict[str, Any]] = []
+        self.dropped_spans = 0
+        self.stats: Dict[str, Dict[str, Any]] = {}
+        self.threads: Dict[int, str] = {}
+        self.pid = os.getpid()
+        self.created = datetime.now().isoformat(timespec='seconds')
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns: Optional[int] = None
+        self._lock = threading.Lock()
+        self._started_tracemalloc = memory and not tracemalloc.is_tracing()
+        if self._started_tracemalloc:
+            tracemalloc.start()
+
+    def span(self, name: str, category: str = 'stage', **args) -> Span:
+        """Span recorded by this tracer whether or not it is the active one"""
+        return Span(self, name, category, args)
+
+    def _record(self, span: Span, end_ns: int, duration_ns: int, self_ns: int, memory: Optional[Tuple[int, int]]):
+        tid, thread_name = _thread_id()
+        with self._lock:
+            stats = self.stats.get(span.name)
+            if stats is None:
+                stats = self.stats[span.name] = {
+                    'category': span.category, 'calls': 0, 'total_ns': 0, 'self_ns': 0,
+                    'min_ns': duration_ns, 'max_ns': 0, 'errors': 0
+                }
+                if memory is not None:
+                    stats.update(memory_delta_bytes=0, memory_peak_bytes=0)
+            stats['calls'] += 1
+            stats['total_ns'] += duration_ns
+            stats['self_ns'] += self_ns
+            stats['min_ns'] = min(stats['min_ns'], duration_ns)
+            stats['max_ns'] = max(stats['max_ns'], duration_ns)
+            if 'error' in span.args:
+                stats['errors'] += 1
+            if memory is not None and 'memory_delta_bytes' in stats:
+                stats['memory_delta_bytes'] += memory[0]
+                stats['memory_peak_bytes'] = max(stats['memory_peak_bytes'], memory[1])
+
+            if len(self.spans) >= self.max_spans:
+                self.dropped_spans += 1
+                return
+            self.threads.setdefault(tid, thread_name)
+            record = {
+                'name': span.name,
+                'category': span.category,
+                'start_us': (span.start_ns - self.start_ns) / 1e3,
+                'duration_us': duration_ns / 1e3,
+                'self_us': self_ns / 1e3,
+                'depth': len(span.parents),
+                'tid': tid,
+                'args': span.args
+            }
+            if memory is not None:
+                record['memory_delta_kb'] = memory[0] / 1024
+                record['memory_peak_kb'] = memory[1] / 1024
+            self.spans.append(record)
+
+    def stop(self):
+        """Stop the wall clock (and tracemalloc, if this tracer started it)"""
+        if self.end_ns is None:
+            self.end_ns = time.perf_counter_ns()
+        if self._started_tracemalloc and tracemalloc.is_tracing():
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-name statistics, slowest total first.
+
+        Returns:
+            Dict of span name -> category, calls, total_ms, self_ms, mean_ms,
+            min_ms, max_ms, errors (and memory_delta_kb, memory_peak_kb with
+            memory=True)
+        """
+        with self._lock:
+            stats = {name: dict(values) for name, values in self.stats.items()}
+        summary = {}
+        for name, values in sorted(stats.items(), key=lambda item: -item[1]['total_ns']):
+            entry = {
+                'category': values['category'],
+                'calls': values['calls'],
+                'total_ms': values['total_ns'] / 1e6,
+                'self_ms': values['self_ns'] / 1e6,
+                'mean_ms': values['total_ns'] / values['calls'] / 1e6,
+                'min_ms': values['min_ns'] / 1e6,
+                'max_ms': values['max_ns'] / 1e6,
+                'errors': values['errors']
+            }
+            if 'memory_delta_bytes' in values:
+                entry['memory_delta_kb'] = values['memory_delta_bytes'] / 1024
+                entry['memory_peak_kb'] = values['memory_peak_bytes'] / 1024
+            summary[name] = entry
+        return summary
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON trace: run metadata, per-name summary and individual spans"""
+        end_ns = self.end_ns or time.perf_counter_ns()
+        return {
+            'created': self.created,
+            'pid': self.pid,
+            'wall_ms': (end_ns - self.start_ns) / 1e6,
+            'memory': self.memory,
+            'summary': self.summary(),
+            'spans': list(self.spans),
+            'dropped_spans': self.dropped_spans
+        }
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Chrome trace event format (complete 'X' events; summary under otherData)"""
+        events = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': tid, 'args': {'name': name}}
+            for tid, name in self.threads.items()
+        ]
+        for record in self.spans:
+            args = dict(record['args'], self_ms=record['self_us'] / 1e3)
+            if 'memory_delta_kb' in record:
+                args.update(memory_delta_kb=record['memory_delta_kb'], memory_peak_kb=record['memory_peak_kb'])
+            events.append({
+                'name': record['name'], 'cat': record['category'], 'ph': 'X',
+                'ts': record['start_us'], 'dur': record['duration_us'],
+                'pid': self.pid, 'tid': record['tid'], 'args': args
+            })
+        document = self.to_dict()
+        other = {key: value for key, value in document.items() if key != 'spans'}
+        return {'traceEvents': events, 'displayTimeUnit': 'ms', 'otherData': other}
+
+    def write(self, path: str, format: str = 'json') -> str:
+        """
+        Write the trace to a file.
+
+        Args:
+            path: Output path
+            format: 'json' (summary and spans) or 'chrome' (Chrome trace events)
+
+        Returns:
+            The path written
+        """
+        if format not in FORMATS:
+            raise ValueError(f"format must be one of {', '.join(FORMATS)}: {format}")
+        document = self.to_chrome_trace() if format == 'chrome' else self.to_dict()
+        with open(path, 'w') as f:
+            json.dump(document, f, indent=1, default=str)
+        return str(path)
+
+
+# ============================================================================
+# INSTRUMENTATION API
+# ============================================================================
+
+def span(name: str, category: str = 'stage', **args):
+    """
+    Time a block as a span of the active tracer.
+
+        with span('comparable_sales.load', path=path) as s:
+            ...
+            s.set(comparables=len(data))
+
+    Args:
+        name: Span name (statistics are aggregated by name)
+        category: Category (stage, function, provider, ...)
+        **args: Arguments recorded with the span
+
+    Returns:
+        Context manager; a shared no-op object when tracing is off
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NULL_SPAN
+    return Span(tracer, name, category, args)
+
+
+def traced(name: Optional[str] = None, category: str = 'function') -> Callable:
+    """
+    Decorator: record each call as a span (sync or async functions).
+
+        @traced
+        def _derive_size_adjustment(self): ...
+
+        @traced('comparable_sales.reconcile', category='stage')
+        def _reconcile(self, results): ...
+
+    Args:
+        name: Span name (default the function's qualified name)
+        category: Span category
+    """
+    if callable(name):
+        return traced()(name)
+
+    def decorate(func: Callable) -> Callable:
+        label = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                tracer = _tracer
+                if tracer is None:
+                    return await func(*args, **kwargs)
+                with Span(tracer, label, category, {}):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            tracer = _tracer
+            if tracer is None:
+                return func(*args, **kwargs)
+            with Span(tracer, label, category, {}):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorate
+
+
+def is_enabled() -> bool:
+    """True while a tracer is active"""
+    return _tracer is not None
+
+
+def active_tracer() -> Optional[Tracer]:
+    """The active tracer, or None while tracing is off"""
+    return _tracer
+
+
+def enable(memory: bool = False, max_spans: int = MAX_SPANS) -> Tracer:
+    """
+    Start tracing with a new tracer (replacing any active one).
+
+    Args:
+        memory: Record allocation stats per span
+        max_spans: Individual spans kept for the trace file
+
+    Returns:
+        The active Tracer
+    """
+    global _tracer
+    if _tracer is not None:
+        _tracer.stop()
+    _tracer = Tracer(memory=memory, max_spans=max_spans)
+    return _tracer
+
+
+def disable() -> Optional[Tracer]:
+    """
+    Stop tracing.
+
+    Returns:
+        The tracer that was active (stopped), or None
+    """
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is not None:
+        tracer.stop()
+    return tracer
+
+
+@contextmanager
+def tracing(
+    path: Optional[str] = None,
+    format: str = 'json',
+    memory: bool = False,
+    max_spans: int = MAX_SPANS
+) -> Iterator[Tracer]:
+    """
+    Trace a block, then restore the previous tracer and optionally write.
+
+        with tracing('trace.json', format='chrome') as tracer:
+            calculator.reconcile_comparables()
+        print(tracer.summary())
+
+    Args:
+        path: Write the trace here when the block exits (also on error)
+        format: 'json' or 'chrome'
+        memory: Record allocation stats per span
+        max_spans: Individual spans kept for the trace file
+
+    Yields:
+        The Tracer
+    """
+    global _tracer
+    if format not in FORMATS:
+        raise ValueError(f"format must be one of {', '.join(FORMATS)}: {format}")
+    previous = _tracer
+    tracer = _tracer = Tracer(memory=memory, max_spans=max_spans)
+    try:
+        yield tracer
+    finally:
+        tracer.stop()
+        _tracer = previous
+        if path:
+            tracer.write(path, format=format)
+
+
+def _environment_settings() -> Optional[Tuple[str, str, bool]]:
+    """(path, format, memory) from REALESTATE_TRACE*, or None when unset"""
+    path = os.environ.get(TRACE_ENV)
+    if not path:
+        return None
+    format = os.environ.get(TRACE_FORMAT_ENV, 'json')
+    if format not in FORMATS:
+        print(f"{TRACE_FORMAT_ENV} must be one of {', '.join(FORMATS)}; writing json", file=sys.stderr)
+        format = 'json'
+    return path, format, os.environ.get(TRACE_MEMORY_ENV, '') not in ('', '0')
+
+
+def environment_tracing() -> ContextManager[Optional[Tracer]]:
+    """
+    tracing() as configured by REALESTATE_TRACE* (does nothing when unset),
+    for a block of a process that exits without running atexit handlers.
+    """
+    settings = _environment_settings()
+    if settings is None:
+        return nullcontext()
+    path, format, memory = settings
+    return tracing(path, format=format, memory=memory)
+
+
+def _enable_from_environment():
+    """REALESTATE_TRACE=path: trace the whole process and write at exit"""
+    settings = _environment_settings()
+    if settings is None:
+        return
+    path, format, memory = settings
+    tracer = enable(memory=memory)
+
+    def write():
+        tracer.stop()
+        tracer.write(path, format=format)
+
+    atexit.register(write)
+
+
+_enable_from_environment()
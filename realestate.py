@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+realestate - unified command line for the calculators
+
+    python realestate.py list
+    python realestate.py eff-rent Eff_Rent_Calculator/baf_input_simple.json
+    python realestate.py worker start      # keep modules loaded between calls
+
+See Shared_Utils/cli.py.
+"""
+
+import sys
+
+from Shared_Utils.cli import main
+
+
+if __name__ == '__main__':
+    sys.exit(main())